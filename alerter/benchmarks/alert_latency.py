@@ -0,0 +1,143 @@
+"""
+Measures how long alerts take from being queued for publishing to being
+consumed from the alert router's queue, while the same publisher has a heavy
+backlog of data to send to the store. The backlog is queued before publishing
+starts, so an alert's latency is measured from when it was queued or from
+when publishing started, whichever is later. The publishing queue is either
+a FIFO queue, as before, or a LaneQueue, which sends the alert path messages
+first. The local bus is used as the broker so that the benchmark does not
+need RabbitMQ.
+
+Run from the alerter directory with: python -m benchmarks.alert_latency
+"""
+import logging
+import statistics
+import threading
+import time
+from queue import Queue
+from typing import Dict, List
+
+import pika
+
+from benchmarks.message_codecs import _system_alert, _system_transformed_data
+from src.message_broker.local_bus.broker import LocalBroker
+from src.message_broker.local_bus.connection import LocalBusConnection
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+from src.message_broker.rabbitmq.lane_queue import LaneQueue
+from src.utils.constants.rabbitmq import (
+    ALERT_EXCHANGE, STORE_EXCHANGE, TOPIC, ALERT_ROUTER_INPUT_QUEUE_NAME,
+    ALERT_ROUTER_INPUT_ROUTING_KEY, SYSTEM_ALERT_ROUTING_KEY,
+    SYSTEM_TRANSFORMED_DATA_ROUTING_KEY)
+
+BULK_MESSAGES = 5000
+ALERTS = 50
+STORE_QUEUE_NAME = 'benchmark_store_queue'
+QUEUED_AT_HEADER = 'queued_at'
+
+
+def _declare(broker: LocalBroker) -> None:
+    channel = LocalBusConnection(broker).channel()
+    channel.exchange_declare(ALERT_EXCHANGE, TOPIC)
+    channel.exchange_declare(STORE_EXCHANGE, TOPIC)
+    channel.queue_declare(ALERT_ROUTER_INPUT_QUEUE_NAME)
+    channel.queue_bind(ALERT_ROUTER_INPUT_QUEUE_NAME, ALERT_EXCHANGE,
+                       ALERT_ROUTER_INPUT_ROUTING_KEY)
+    channel.queue_declare(STORE_QUEUE_NAME)
+    channel.queue_bind(STORE_QUEUE_NAME, STORE_EXCHANGE, '#')
+    channel.close()
+
+
+def _fill_queue(rabbitmq: RabbitMQApi, publishing_queue: Queue,
+                bulk_data: Dict, alert: Dict) -> None:
+    # Alerts are spread evenly among the store messages, as if the alerts
+    # were raised while the publisher was busy sending store data.
+    alert_every = BULK_MESSAGES // ALERTS
+    for index in range(BULK_MESSAGES):
+        if index % alert_every == 0:
+            properties = pika.BasicProperties(
+                delivery_mode=2,
+                headers={QUEUED_AT_HEADER: time.perf_counter()})
+            body, properties = rabbitmq.encode_body(alert, properties)
+            publishing_queue.put(PublishingEnvelope(
+                ALERT_EXCHANGE, SYSTEM_ALERT_ROUTING_KEY, body, properties,
+                True))
+        body, properties = rabbitmq.encode_body(
+            bulk_data, pika.BasicProperties(delivery_mode=2))
+        publishing_queue.put(PublishingEnvelope(
+            STORE_EXCHANGE, SYSTEM_TRANSFORMED_DATA_ROUTING_KEY, body,
+            properties, True))
+
+
+def _consume_alerts(broker: LocalBroker, latencies: List[float],
+                    ready: threading.Event,
+                    publishing_started: List[float]) -> None:
+    channel = LocalBusConnection(broker).channel()
+
+    def callback(ch, method, properties, body) -> None:
+        latencies.append(time.perf_counter() - max(
+            properties.headers[QUEUED_AT_HEADER], publishing_started[0]))
+        ch.basic_ack(method.delivery_tag)
+        if len(latencies) == ALERTS:
+            ch.stop_consuming()
+
+    channel.basic_consume(ALERT_ROUTER_INPUT_QUEUE_NAME, callback)
+    ready.set()
+    channel.start_consuming()
+    channel.close()
+
+
+def _measure(rabbitmq: RabbitMQApi, publishing_queue: Queue,
+             bulk_data: Dict, alert: Dict) -> List[float]:
+    broker = LocalBroker()
+    _declare(broker)
+    latencies = []
+    ready = threading.Event()
+    publishing_started = [0.0]
+    consumer = threading.Thread(
+        target=_consume_alerts,
+        args=(broker, latencies, ready, publishing_started))
+    consumer.start()
+    ready.wait()
+
+    # Like QueuingPublisherComponent._send_data, the queue is drained in
+    # order by a single publisher.
+    channel = LocalBusConnection(broker).channel()
+    _fill_queue(rabbitmq, publishing_queue, bulk_data, alert)
+    publishing_started[0] = time.perf_counter()
+    while not publishing_queue.empty():
+        envelope = publishing_queue.get()
+        channel.basic_publish(envelope.exchange, envelope.routing_key,
+                              envelope.body, envelope.properties,
+                              envelope.mandatory)
+    consumer.join()
+    channel.close()
+    return latencies
+
+
+def main() -> None:
+    logger = logging.getLogger('benchmark')
+    logger.disabled = True
+    rabbitmq = RabbitMQApi(logger)
+    bulk_data = _system_transformed_data()
+    alert = _system_alert()
+    publishing_queues = {
+        'fifo': lambda: Queue(),
+        'lanes': lambda: LaneQueue(0, [ALERT_EXCHANGE]),
+    }
+
+    print("{} store messages and {} alerts per run".format(BULK_MESSAGES,
+                                                         ALERTS))
+    print("{:<7} {:>12} {:>12} {:>12}".format(
+        'queue', 'median (ms)', 'p95 (ms)', 'max (ms)'))
+    for queue_name, create_queue in publishing_queues.items():
+        latencies = sorted(
+            latency * 1000 for latency in
+            _measure(rabbitmq, create_queue(), bulk_data, alert))
+        print("{:<7} {:>12.2f} {:>12.2f} {:>12.2f}".format(
+            queue_name, statistics.median(latencies),
+            latencies[int(len(latencies) * 0.95) - 1], latencies[-1]))
+
+
+if __name__ == '__main__':
+    main()
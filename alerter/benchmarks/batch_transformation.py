@@ -0,0 +1,73 @@
+"""
+Compares transforming the results of 5000 systems one by one with
+_transform_data against transforming them together with
+_transform_data_batch, as done for coalesced batches. Every system was
+monitored in a previous round, so that the metrics derived from the previous
+round are computed as well.
+
+Run from the alerter directory with: python -m benchmarks.batch_transformation
+"""
+import copy
+import timeit
+from typing import Dict, List
+
+from benchmarks.transform_allocations import (_create_transformer,
+                                              _system_raw_data)
+from src.data_transformers.system import SystemDataTransformer
+from src.monitorables.system import System
+
+SYSTEMS = 5000
+REPEATS = 5
+
+
+def _system_results() -> List[Dict]:
+    results = []
+    for index in range(SYSTEMS):
+        raw_data = _system_raw_data()
+        meta_data = raw_data['result']['meta_data']
+        meta_data['system_name'] = 'system_{}'.format(index)
+        meta_data['system_id'] = 'system_id_{}'.format(index)
+        results.append(raw_data)
+    return results
+
+
+def _transformer_after_previous_round(
+        results: List[Dict]) -> SystemDataTransformer:
+    transformer = _create_transformer(SystemDataTransformer)
+    for raw_data in results:
+        meta_data = raw_data['result']['meta_data']
+        transformer.state[meta_data['system_id']] = System(
+            meta_data['system_name'], meta_data['system_id'],
+            meta_data['system_parent_id'])
+        transformer._update_state(transformer._transform_data(raw_data)[0])
+        meta_data['time'] += 60
+    return transformer
+
+
+def main() -> None:
+    results = _system_results()
+    transformer = _transformer_after_previous_round(results)
+    state = copy.deepcopy(transformer.state)
+
+    scalar = min(timeit.repeat(
+        lambda: [transformer._transform_data(raw_data)
+                 for raw_data in results], number=1, repeat=REPEATS))
+    batch = min(timeit.repeat(
+        lambda: transformer._transform_data_batch(results), number=1,
+        repeat=REPEATS))
+
+    # Both paths must give the same output from the same state
+    outputs = [transformer._transform_data(raw_data) for raw_data in results]
+    transformer._state = state
+    assert outputs == transformer._transform_data_batch(results)
+
+    print("{:<10} {:>12} {:>18}".format('path', 'total (ms)',
+                                        'per system (us)'))
+    for path_name, total in [('scalar', scalar), ('batch', batch)]:
+        print("{:<10} {:>12.1f} {:>18.2f}".format(
+            path_name, total * 1e3, total / SYSTEMS * 1e6))
+    print("speed-up: {:.2f}x".format(scalar / batch))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmarks the message codecs on messages shaped like those published by the
+monitors, data transformers and alerters. For every message and available
+codec it reports the encoded size and the CPU time needed to encode and decode
+the message.
+
+Run from the alerter directory with: python -m benchmarks.message_codecs
+"""
+import time
+import timeit
+from typing import Dict, List, Callable
+
+import pika
+
+from src.alerter.alert_severities import Severity
+from src.alerter.alerts.system_alerts import SystemWentDownAtAlert
+from src.message_broker.rabbitmq.codecs import (
+    JSON_CODEC, ORJSON_CODEC, MSGPACK_CODEC, get_codec, encode_message,
+    decode_message)
+
+ITERATIONS = 2000
+COSMOS_HISTORICAL_BLOCKS = 100
+DOCKERHUB_TAGS = 100
+
+
+def _cosmos_node_raw_data() -> Dict:
+    # Raw Cometbft RPC data of a validator which was monitored over many blocks
+    timestamp = time.time()
+    return {
+        'cometbft_rpc': {
+            'result': {
+                'meta_data': {
+                    'monitor_name': 'Cosmos node monitor (validator_1)',
+                    'node_name': 'validator_1',
+                    'node_id': 'node_id_1',
+                    'node_parent_id': 'chain_id_1',
+                    'time': timestamp,
+                    'is_mev_cometbft_node': False,
+                    'is_validator': True,
+                    'operator_address': 'cosmosvaloper1qwl879nx9t6kef4supyazay'
+                                        'f7vjhennyh568ys',
+                },
+                'data': {
+                    'consensus_hex_address':
+                        '7B3D01F754DFF8474ED0E358812FD437E09389DC',
+                    'is_syncing': False,
+                    'historical': [
+                        {
+                            'height': 9000000 + height,
+                            'active_in_prev_block': True,
+                            'signed_prev_block': height % 10 != 0,
+                            'slashed': False,
+                            'slashed_amount': None,
+                        } for height in range(COSMOS_HISTORICAL_BLOCKS)
+                    ],
+                },
+            }
+        }
+    }
+
+
+def _dockerhub_raw_data() -> Dict:
+    timestamp = time.time()
+    return {
+        'result': {
+            'meta_data': {
+                'monitor_name': 'DockerHub monitor (simplyvc/panic)',
+                'repo_namespace': 'simplyvc',
+                'repo_name': 'panic',
+                'repo_id': 'repo_id_1',
+                'repo_parent_id': 'chain_id_1',
+                'time': timestamp,
+            },
+            'data': {
+                str(i): {
+                    'tag_name': '1.{}.0'.format(i),
+                    'last_updated': timestamp - i * 3600,
+                } for i in range(DOCKERHUB_TAGS)
+            },
+        }
+    }
+
+
+def _system_transformed_data() -> Dict:
+    return {
+        'result': {
+            'meta_data': {
+                'system_name': 'system_1',
+                'system_id': 'system_id_1',
+                'system_parent_id': 'chain_id_1',
+                'last_monitored': time.time(),
+            },
+            'data': {
+                'process_cpu_seconds_total': 2786.82,
+                'process_memory_usage': 56,
+                'virtual_memory_usage': 118513664.0,
+                'open_file_descriptors': 0.78125,
+                'system_cpu_usage': 7.85,
+                'system_ram_usage': 34.09,
+                'system_storage_usage': 44.37,
+                'network_transmit_bytes_total': 1011572205557.0,
+                'network_receive_bytes_total': 722359147027.0,
+                'disk_io_time_seconds_total': 76647.0,
+                'went_down_at': None,
+                'network_transmit_bytes_per_second': 16103476165.4,
+                'network_receive_bytes_per_second': 12039243041.0,
+                'disk_io_time_seconds_in_interval': 70300,
+            },
+        }
+    }
+
+
+def _system_alert() -> Dict:
+    return SystemWentDownAtAlert(
+        'system_1', Severity.CRITICAL.value, time.time(), 'chain_id_1',
+        'system_id_1').alert_data
+
+
+def _time_per_call(function: Callable) -> float:
+    return timeit.timeit(function, number=ITERATIONS) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    messages = {
+        'cosmos node raw data': _cosmos_node_raw_data(),
+        'dockerhub raw data': _dockerhub_raw_data(),
+        'system transformed data': _system_transformed_data(),
+        'system alert': _system_alert(),
+    }
+    codecs = [get_codec(name) for name in
+              [JSON_CODEC, ORJSON_CODEC, MSGPACK_CODEC]]
+    unavailable: List[str] = [
+        name for name, codec in
+        zip([JSON_CODEC, ORJSON_CODEC, MSGPACK_CODEC], codecs)
+        if codec is None
+    ]
+
+    print("{:<25} {:<8} {:>10} {:>12} {:>12}".format(
+        'message', 'codec', 'bytes', 'encode (us)', 'decode (us)'))
+    for message_name, message in messages.items():
+        for codec in filter(None, codecs):
+            encoded, content_type = encode_message(message, codec)
+            properties = pika.BasicProperties(content_type=content_type)
+            encode_time = _time_per_call(
+                lambda: encode_message(message, codec))
+            decode_time = _time_per_call(
+                lambda: decode_message(encoded, properties))
+            print("{:<25} {:<8} {:>10} {:>12.1f} {:>12.1f}".format(
+                message_name, codec.name, len(encoded), encode_time,
+                decode_time))
+
+    if unavailable:
+        print("Not benchmarked since their library is not installed: "
+              "{}".format(', '.join(unavailable)))
+
+
+if __name__ == '__main__':
+    main()
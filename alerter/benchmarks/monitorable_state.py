@@ -0,0 +1,98 @@
+"""
+Measures the memory held by the state of a data transformer which keeps
+10,000 monitorables, for every type of monitorable. The monitorables declare
+__slots__, and their memory is compared with that of the same attributes kept
+in a per-instance __dict__, which is how the monitorables were stored before.
+
+Run from the alerter directory with: python -m benchmarks.monitorable_state
+"""
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from src.monitorables.contracts.chainlink.v3 import V3ChainlinkContract
+from src.monitorables.networks.cosmos import CosmosNetwork
+from src.monitorables.networks.substrate import SubstrateNetwork
+from src.monitorables.nodes.chainlink_node import ChainlinkNode
+from src.monitorables.nodes.cosmos_node import CosmosNode
+from src.monitorables.nodes.evm_node import EVMNode
+from src.monitorables.nodes.substrate_node import SubstrateNode
+from src.monitorables.repo import DockerHubRepo, GitHubRepo
+from src.monitorables.slots import get_slot_values
+from src.monitorables.system import System
+
+MONITORABLES = 10000
+
+
+class _UnslottedMonitorable:
+    """
+    Keeps the attributes of a monitorable in a per-instance __dict__
+    """
+
+    def __init__(self, attributes: Dict[str, Any]) -> None:
+        self.__dict__.update(attributes)
+
+
+def _populate(monitorable: Any, index: int) -> Any:
+    # Metrics which are not set yet are given a value, as they would have
+    # once the monitorable was monitored
+    for attribute, value in get_slot_values(monitorable).items():
+        if value is None:
+            setattr(monitorable, attribute, float(index))
+    return monitorable
+
+
+def _unslotted(monitorable: Any) -> _UnslottedMonitorable:
+    return _UnslottedMonitorable(get_slot_values(monitorable))
+
+
+def _state_memory(create: Callable[[int], Any]) -> int:
+    tracemalloc.start()
+    state = {'monitorable_id_{}'.format(index): create(index)
+             for index in range(MONITORABLES)}
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del state
+    return memory
+
+
+def main() -> None:
+    monitorables = {
+        'system': lambda index: System(
+            'system_{}'.format(index), 'system_id_{}'.format(index),
+            'parent_id'),
+        'github repo': lambda index: GitHubRepo(
+            'repo_{}'.format(index), 'repo_id_{}'.format(index), 'parent_id'),
+        'dockerhub repo': lambda index: DockerHubRepo(
+            'namespace', 'repo_{}'.format(index), 'repo_id_{}'.format(index),
+            'parent_id'),
+        'evm node': lambda index: EVMNode(
+            'node_{}'.format(index), 'node_id_{}'.format(index), 'parent_id'),
+        'chainlink node': lambda index: ChainlinkNode(
+            'node_{}'.format(index), 'node_id_{}'.format(index), 'parent_id'),
+        'chainlink contract': lambda index: V3ChainlinkContract(
+            'proxy_{}'.format(index), 'aggregator_{}'.format(index),
+            'parent_id', 'node_id_{}'.format(index)),
+        'cosmos node': lambda index: CosmosNode(
+            'node_{}'.format(index), 'node_id_{}'.format(index), 'parent_id'),
+        'cosmos network': lambda index: CosmosNetwork(
+            'parent_id_{}'.format(index), 'chain_{}'.format(index)),
+        'substrate node': lambda index: SubstrateNode(
+            'node_{}'.format(index), 'node_id_{}'.format(index), 'parent_id'),
+        'substrate network': lambda index: SubstrateNetwork(
+            'parent_id_{}'.format(index), 'chain_{}'.format(index)),
+    }
+
+    print("{:<20} {:>15} {:>15} {:>10}".format(
+        'monitorable', '__dict__ (KiB)', '__slots__ (KiB)', 'saving'))
+    for monitorable_name, create in monitorables.items():
+        dict_memory = _state_memory(
+            lambda index: _unslotted(_populate(create(index), index)))
+        slots_memory = _state_memory(
+            lambda index: _populate(create(index), index))
+        print("{:<20} {:>15.1f} {:>15.1f} {:>9.0f}%".format(
+            monitorable_name, dict_memory / 1024, slots_memory / 1024,
+            (1 - slots_memory / dict_memory) * 100))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Compares the cost of placing messages on a publishing queue and publishing
+them using the previous approach, where the data was deep-copied into a dict
+and encoded when published, with the current approach, where the data is
+encoded once into an immutable envelope. For every message it reports the CPU
+time per message and the memory held by a full queue.
+
+Run from the alerter directory with: python -m benchmarks.publishing_queue
+"""
+import copy
+import logging
+import timeit
+import tracemalloc
+from queue import Queue
+from typing import Dict, Callable
+
+import pika
+
+from benchmarks.message_codecs import (
+    _cosmos_node_raw_data, _dockerhub_raw_data, _system_transformed_data,
+    _system_alert)
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import encode_message
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+
+ITERATIONS = 2000
+QUEUE_SIZE = 1000
+EXCHANGE = 'exchange'
+ROUTING_KEY = 'routing_key'
+
+
+def _enqueue_dict(queue: Queue, data: Dict,
+                  properties: pika.spec.BasicProperties) -> None:
+    queue.put({'exchange': EXCHANGE, 'routing_key': ROUTING_KEY,
+               'data': copy.deepcopy(data), 'properties': properties,
+               'mandatory': True})
+
+
+def _publish_dict(rabbitmq: RabbitMQApi, queue: Queue) -> None:
+    data = queue.get()
+    encode_message(data['data'], rabbitmq.codec)
+
+
+def _enqueue_envelope(rabbitmq: RabbitMQApi, queue: Queue, data: Dict,
+                      properties: pika.spec.BasicProperties) -> None:
+    body, encoded_properties = rabbitmq.encode_body(data, properties)
+    queue.put(PublishingEnvelope(EXCHANGE, ROUTING_KEY, body,
+                                 encoded_properties, True))
+
+
+def _publish_envelope(queue: Queue) -> None:
+    # The body is published as is
+    queue.get()
+
+
+def _time_per_message(enqueue: Callable, publish: Callable) -> float:
+    queue = Queue()
+
+    def round_trip() -> None:
+        enqueue(queue)
+        publish(queue)
+
+    return timeit.timeit(round_trip, number=ITERATIONS) / ITERATIONS * 1e6
+
+
+def _full_queue_memory(enqueue: Callable) -> int:
+    queue = Queue()
+    tracemalloc.start()
+    for _ in range(QUEUE_SIZE):
+        enqueue(queue)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory
+
+
+def main() -> None:
+    logger = logging.getLogger('benchmark')
+    logger.disabled = True
+    rabbitmq = RabbitMQApi(logger)
+    properties = pika.BasicProperties(delivery_mode=2)
+    messages = {
+        'cosmos node raw data': _cosmos_node_raw_data(),
+        'dockerhub raw data': _dockerhub_raw_data(),
+        'system transformed data': _system_transformed_data(),
+        'system alert': _system_alert(),
+    }
+
+    print("{:<25} {:<9} {:>10} {:>16}".format(
+        'message', 'queue', 'time (us)', 'full queue (KiB)'))
+    for message_name, message in messages.items():
+        approaches = {
+            'dict': (
+                lambda queue: _enqueue_dict(queue, message, properties),
+                lambda queue: _publish_dict(rabbitmq, queue)),
+            'envelope': (
+                lambda queue: _enqueue_envelope(rabbitmq, queue, message,
+                                                properties),
+                _publish_envelope),
+        }
+        for approach_name, (enqueue, publish) in approaches.items():
+            print("{:<25} {:<9} {:>10.1f} {:>16.1f}".format(
+                message_name, approach_name,
+                _time_per_message(enqueue, publish),
+                _full_queue_memory(enqueue) / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Counts the memory allocated by the data transformers for every message they
+transform, that is, the memory blocks which are still held by the transformed
+data and by the data sent to the alerters and to the store once a raw message
+has been transformed. The time it takes to transform a message is also
+reported.
+
+Run from the alerter directory with: python -m benchmarks.transform_allocations
+"""
+import logging
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+from benchmarks.message_codecs import (_cosmos_node_raw_data,
+                                       _dockerhub_raw_data)
+from src.data_store.redis import RedisApi
+from src.data_transformers.data_transformer import DataTransformer
+from src.data_transformers.dockerhub import DockerHubDataTransformer
+from src.data_transformers.node.cosmos import CosmosNodeDataTransformer
+from src.data_transformers.system import SystemDataTransformer
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitorables.nodes.cosmos_node import CosmosNode
+from src.monitorables.repo import DockerHubRepo
+from src.monitorables.system import System
+
+ITERATIONS = 1000
+
+
+def _system_raw_data() -> Dict:
+    return {
+        'result': {
+            'meta_data': {
+                'monitor_name': 'System monitor (system_1)',
+                'system_name': 'system_1',
+                'system_id': 'system_id_1',
+                'system_parent_id': 'chain_id_1',
+                'time': time.time(),
+            },
+            'data': {
+                'process_cpu_seconds_total': 2786.82,
+                'process_memory_usage': 56,
+                'virtual_memory_usage': 118513664.0,
+                'open_file_descriptors': 0.78125,
+                'system_cpu_usage': 7.85,
+                'system_ram_usage': 34.09,
+                'system_storage_usage': 44.37,
+                'network_transmit_bytes_total': 1011572205557.0,
+                'network_receive_bytes_total': 722359147027.0,
+                'disk_io_time_seconds_total': 76647.0,
+            },
+        }
+    }
+
+
+def _create_transformer(transformer_type: type) -> DataTransformer:
+    logger = logging.getLogger('benchmark')
+    logger.disabled = True
+    return transformer_type(
+        'benchmark_transformer', logger,
+        RedisApi(logger, 0, 'localhost', 6379),
+        RabbitMQApi(logger, 'localhost'))
+
+
+def _system_transformer() -> DataTransformer:
+    transformer = _create_transformer(SystemDataTransformer)
+    transformer.state['system_id_1'] = System(
+        'system_1', 'system_id_1', 'chain_id_1')
+    return transformer
+
+
+def _cosmos_node_transformer() -> DataTransformer:
+    transformer = _create_transformer(CosmosNodeDataTransformer)
+    transformer.state['node_id_1'] = CosmosNode(
+        'validator_1', 'node_id_1', 'chain_id_1')
+    return transformer
+
+
+def _dockerhub_transformer() -> DataTransformer:
+    transformer = _create_transformer(DockerHubDataTransformer)
+    transformer.state['repo_id_1'] = DockerHubRepo(
+        'simplyvc', 'panic', 'repo_id_1', 'chain_id_1')
+    return transformer
+
+
+def _allocations_per_message(transformer: DataTransformer,
+                             raw_data: Dict) -> Tuple[int, int]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    outputs = transformer._transform_data(raw_data)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocations = [statistic for statistic in after.compare_to(
+        before, 'traceback') if statistic.count_diff > 0]
+    del outputs
+    return (sum(statistic.count_diff for statistic in allocations),
+            sum(statistic.size_diff for statistic in allocations))
+
+
+def main() -> None:
+    transformers: Dict[str, Tuple[Callable, Callable]] = {
+        'system': (_system_transformer, _system_raw_data),
+        'cosmos node': (_cosmos_node_transformer, _cosmos_node_raw_data),
+        'dockerhub': (_dockerhub_transformer, _dockerhub_raw_data),
+    }
+
+    print("{:<15} {:>12} {:>12} {:>15}".format(
+        'transformer', 'blocks', 'KiB', 'transform (us)'))
+    for transformer_name, (create, raw_data) in transformers.items():
+        transformer = create()
+        data = raw_data()
+        blocks, size = _allocations_per_message(transformer, data)
+        transform_time = timeit.timeit(
+            lambda: transformer._transform_data(data),
+            number=ITERATIONS) / ITERATIONS * 1e6
+        print("{:<15} {:>12} {:>12.1f} {:>15.1f}".format(
+            transformer_name, blocks, size / 1024, transform_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Compares decoding and transforming the results of 5000 systems in the
+transformer process against doing so in a pool of worker processes, as done
+when TRANSFORMER_WORKERS is set. Every system was monitored in a previous
+round. The time of the workers includes sending the raw data and the state of
+the systems to the workers, and receiving the outputs.
+
+Run from the alerter directory with:
+python -m benchmarks.transformation_workers
+"""
+import json
+import timeit
+
+import pika
+
+from benchmarks.batch_transformation import (
+    _system_results, _transformer_after_previous_round)
+from src.data_transformers.system import SystemDataTransformer
+from src.data_transformers.workers import TransformationWorkerPool
+from src.message_broker.rabbitmq.codecs import decode_message
+
+SYSTEMS = 5000
+REPEATS = 5
+WORKERS = [2, 4]
+
+
+def main() -> None:
+    results = _system_results()
+    transformer = _transformer_after_previous_round(results)
+    properties = pika.spec.BasicProperties()
+    messages = [(json.dumps(raw_data).encode('utf-8'), properties)
+                for raw_data in results]
+    jobs = [(raw_data['result']['meta_data']['system_id'], raw_data)
+            for raw_data in results]
+
+    def process_here() -> list:
+        decoded = [decode_message(body, properties)
+                   for body, properties in messages]
+        return [transformer._transform_data(raw_data) for raw_data in decoded]
+
+    timings = [('here', min(timeit.repeat(process_here, number=1,
+                                          repeat=REPEATS)))]
+    for workers in WORKERS:
+        pool = TransformationWorkerPool(SystemDataTransformer,
+                                        'benchmark', workers)
+        try:
+            # The workers are started, and their replicas created, before
+            # timing
+            pool.transform(jobs, transformer.state)
+            timings.append(('{} workers'.format(workers), min(timeit.repeat(
+                lambda: (pool.decode(messages),
+                         pool.transform(jobs, transformer.state)),
+                number=1, repeat=REPEATS))))
+        finally:
+            pool.shutdown()
+
+    print("{:<12} {:>12} {:>18}".format('mode', 'total (ms)',
+                                        'per system (us)'))
+    for mode, total in timings:
+        print("{:<12} {:>12.1f} {:>18.2f}".format(
+            mode, total * 1e3, total / SYSTEMS * 1e6))
+
+
+if __name__ == '__main__':
+    main()
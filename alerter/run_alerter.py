@@ -21,7 +21,9 @@ from src.channels_manager.manager import ChannelsManager
 from src.config_manager.change_stream.config_manager import ConfigsManager
 from src.data_store.stores.manager import StoreManager
 from src.data_transformers.manager import DataTransformersManager
+from src.message_broker.local_bus.manager import start_local_bus
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.rabbitmq_api import LOCAL_TRANSPORT
 from src.monitors.managers.contracts import ContractMonitorsManager
 from src.monitors.managers.dockerhub import DockerHubMonitorsManager
 from src.monitors.managers.github import GitHubMonitorsManager
@@ -1426,6 +1428,16 @@ def _initialise_and_declare_monitorable_queues() -> None:
 
 
 if __name__ == '__main__':
+    # If the components communicate through the local bus, it must be served
+    # before any queue is declared. The bus is stopped when the alerter exits.
+    if env.RABBIT_TRANSPORT == LOCAL_TRANSPORT:
+        local_bus = start_local_bus(env.LOCAL_BUS_HOST, env.LOCAL_BUS_PORT,
+                                    env.LOCAL_BUS_AUTHKEY,
+                                    env.LOCAL_BUS_DATA_DIRECTORY)
+        log_and_print("Started the local message bus on {}:{}.".format(
+            env.LOCAL_BUS_HOST, env.LOCAL_BUS_PORT),
+            logging.getLogger('Dummy'))
+
     # First initialise the config queues so that no config is lost when sending
     # the configs and the components are not ready yet.
     _initialise_and_declare_config_queues()
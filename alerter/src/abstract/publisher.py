@@ -1,13 +1,17 @@
-import copy
 import logging
 from abc import ABC, abstractmethod
 from queue import Queue
-from typing import Dict
+from typing import Dict, Optional
 
 from pika import BasicProperties
 
 from src.abstract import Component
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.alerter.alert_severities import get_alert_priority
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+from src.message_broker.rabbitmq.lane_queue import discard_oldest
+from src.message_broker.rabbitmq.spill_queue import create_publishing_queue
+from src.utils.constants.rabbitmq import ALERT_EXCHANGE
 
 
 class PublisherComponent(Component, ABC):
@@ -60,14 +64,19 @@ class QueuingPublisherComponent(PublisherComponent, ABC):
     """
 
     def __init__(self, logger: logging.Logger, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0):
+                 max_queue_size: int = 0,
+                 spill_queue_name: Optional[str] = None):
         """
         Initialises the queue needed for publishing.
         :param logger: The logger object to log with
         :param rabbitmq: The rabbit MQ connection to use
         :param max_queue_size: The max queue size, defaults to 0 for infinite
+        :param spill_queue_name: The name of the directory the queue spills to
+        when a spill directory is configured, defaults to None for a queue
+        which is only kept in memory
         """
-        self._publishing_queue = Queue(max_queue_size)
+        self._publishing_queue = create_publishing_queue(
+            max_queue_size, spill_queue_name)
 
         super().__init__(logger, rabbitmq)
 
@@ -92,15 +101,23 @@ class QueuingPublisherComponent(PublisherComponent, ABC):
         self._logger.debug("Adding data to the publishing queue ...")
 
         # Place the data on the publishing queue. If the queue is full,
-        # remove old data.
+        # remove old data. The data is encoded now so that it is neither
+        # copied nor affected by later modifications.
         if self._publishing_queue.full():
-            self._logger.debug("The queue is full, clearing the first item.")
-            self._publishing_queue.get()
-        data_dict = {'exchange': exchange, 'routing_key': routing_key,
-                     'data': copy.deepcopy(data), 'properties': properties,
-                     'mandatory': mandatory}
-        self._logger.debug("Adding %s to the queue", data_dict)
-        self._publishing_queue.put(data_dict)
+            self._logger.debug("The queue is full, clearing the oldest item.")
+            discard_oldest(self._publishing_queue)
+        body, encoded_properties = self._rabbitmq.encode_body(data, properties)
+
+        # Alerts are published with a priority derived from their severity,
+        # so that severe alerts overtake the others in the alert queues.
+        if exchange == ALERT_EXCHANGE and isinstance(data, dict) \
+                and encoded_properties.priority is None \
+                and 'severity' in data:
+            encoded_properties.priority = get_alert_priority(data['severity'])
+        envelope = PublishingEnvelope(exchange, routing_key, body,
+                                      encoded_properties, mandatory)
+        self._logger.debug("Adding %s to the queue", envelope)
+        self._publishing_queue.put(envelope)
 
         self._logger.debug("Data added to the publishing queue successfully.")
 
@@ -115,23 +132,15 @@ class QueuingPublisherComponent(PublisherComponent, ABC):
         # remove an item from the queue only if the sending was successful, so
         # that if an exception is raised, that message is not popped
         while not self._publishing_queue.empty():
-            data = self._publishing_queue.queue[0]
-            try:
-                self._rabbitmq.basic_publish_confirm(
-                    exchange=data['exchange'], routing_key=data['routing_key'],
-                    body=data['data'], is_body_dict=True,
-                    properties=data['properties'], mandatory=data['mandatory'])
-                self._logger.debug(
-                    "Sent %s to '%s' exchange", data['data'], data['exchange']
-                )
-                self._publishing_queue.get()
-                self._publishing_queue.task_done()
-            except KeyError as ke:
-                self._logger.error("Enqueued datum %s was incomplete", data)
-                self._logger.exception(ke)
-                self._logger.warning("Discarding this datum")
-                self._publishing_queue.get()
-                self._publishing_queue.task_done()
+            envelope = self._publishing_queue.queue[0]
+            self._rabbitmq.basic_publish_confirm(
+                exchange=envelope.exchange, routing_key=envelope.routing_key,
+                body=envelope.body, is_body_dict=False,
+                properties=envelope.properties, mandatory=envelope.mandatory)
+            self._logger.debug("Sent %s to '%s' exchange", envelope,
+                               envelope.exchange)
+            self._publishing_queue.get()
+            self._publishing_queue.task_done()
 
         if not empty:
             self._logger.debug("Successfully sent all data from the publishing "
@@ -1,13 +1,23 @@
-import copy
 import logging
+import time
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from queue import Queue
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 from pika import BasicProperties
 
 from src.abstract import Component
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.alerter.alert_severities import get_alert_priority
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+from src.message_broker.rabbitmq.lane_queue import discard_oldest
+from src.message_broker.rabbitmq.prefetch import PrefetchTuner
+from src.message_broker.rabbitmq.spill_queue import (
+    SpillQueue, create_publishing_queue)
+from src.utils import env
+from src.utils.constants.rabbitmq import ALERT_EXCHANGE
+from src.utils.heartbeat import HeartbeatAggregator
 
 
 class PublisherSubscriberComponent(Component, ABC):
@@ -23,6 +33,8 @@ class PublisherSubscriberComponent(Component, ABC):
         """
         self._logger = logger
         self._rabbitmq = rabbitmq
+        self._heartbeat_aggregator = HeartbeatAggregator(
+            timedelta(seconds=env.HEARTBEAT_INTERVAL_SECONDS))
 
         super().__init__()
 
@@ -34,6 +46,10 @@ class PublisherSubscriberComponent(Component, ABC):
     def rabbitmq(self) -> RabbitMQApi:
         return self._rabbitmq
 
+    @property
+    def heartbeat_aggregator(self) -> HeartbeatAggregator:
+        return self._heartbeat_aggregator
+
     @abstractmethod
     def _initialise_rabbitmq(self) -> None:
         pass
@@ -57,6 +73,23 @@ class PublisherSubscriberComponent(Component, ABC):
     def _send_heartbeat(self, data_to_send: dict) -> None:
         pass
 
+    def _send_heartbeat_if_due(self, processing_error: bool) -> None:
+        """
+        Counts a processed message, and sends a heartbeat with the counts of
+        the messages processed since the previous heartbeat if the heartbeat
+        interval has elapsed. Heartbeats are not sent after messages which
+        could not be processed.
+        :param processing_error: Whether the message could not be processed
+        :return: None
+        """
+        self._heartbeat_aggregator.record_message(processing_error)
+        if processing_error or not self._heartbeat_aggregator.heartbeat_due():
+            return
+
+        self._send_heartbeat(
+            self._heartbeat_aggregator.create_heartbeat(str(self)))
+        self._heartbeat_aggregator.heartbeat_sent()
+
 
 class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
     """
@@ -65,21 +98,167 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
     """
 
     def __init__(self, logger: logging.Logger, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0):
+                 max_queue_size: int = 0,
+                 spill_queue_name: Optional[str] = None):
         """
         Initializes the queue needed for publishing.
         :param logger: The logger object to log with
         :param rabbitmq: The rabbit MQ connection to use
         :param max_queue_size: The max queue size, defaults to 0 for infinite
+        :param spill_queue_name: The name of the directory the queue spills to
+        when a spill directory is configured, defaults to None for a queue
+        which is only kept in memory
         """
-        self._publishing_queue = Queue(max_queue_size)
+        self._publishing_queue = create_publishing_queue(
+            max_queue_size, spill_queue_name)
+
+        # If enabled, the prefetch count of the consuming queue is tuned at
+        # runtime. Otherwise, it is fixed to 5 times less the maximum queue
+        # size. The maximum queue size is the in-memory bound, since a spill
+        # queue holds many more envelopes on disk.
+        self._prefetch_tuner = PrefetchTuner(
+            round(max_queue_size / 5), env.PREFETCH_MIN_COUNT,
+            env.PREFETCH_MAX_COUNT, env.PREFETCH_TARGET_BUFFER_SECONDS) \
+            if env.PREFETCH_TUNING else None
+        self._prefetch_queue = None
+        self._last_prefetch_tuning = None
 
         super().__init__(logger, rabbitmq)
 
+    @property
+    def max_queue_size(self) -> int:
+        """
+        :return: The maximum number of envelopes kept in memory by the
+               : publishing queue, which is less than its maxsize if it
+               : spills to disk
+        """
+        if isinstance(self._publishing_queue, SpillQueue):
+            return self._publishing_queue.memory_size
+        return self._publishing_queue.maxsize
+
     @property
     def publishing_queue(self) -> Queue:
         return self._publishing_queue
 
+    @property
+    def prefetch_tuner(self) -> Optional[PrefetchTuner]:
+        return self._prefetch_tuner
+
+    @property
+    def prefetch_count(self) -> int:
+        if self._prefetch_tuner is None:
+            return round(self.max_queue_size / 5)
+        return self._prefetch_tuner.prefetch_count
+
+    def _consume_with_prefetch(self, queue: str,
+                               on_message_callback: Callable,
+                               measured: bool = False) -> None:
+        """
+        Sets the prefetch count and declares the consuming intentions on the
+        given queue. If prefetch tuning is enabled, the processing time of the
+        callback is measured so that the prefetch count can be tuned.
+        :param queue: The queue to consume from
+        :param on_message_callback: The callback which processes a message
+        :param measured: Whether the callback measures the processing of each
+                       : message itself with _measure_processing, for example
+                       : because it holds messages and processes them later
+        :return: None
+        """
+        self.rabbitmq.basic_qos(prefetch_count=self.prefetch_count)
+        if self._prefetch_tuner is None:
+            self.rabbitmq.basic_consume(queue, on_message_callback, False,
+                                        False, None)
+            return
+
+        def timed_callback(ch, method, properties, body) -> None:
+            try:
+                if measured:
+                    on_message_callback(ch, method, properties, body)
+                else:
+                    self._measure_processing(on_message_callback, ch, method,
+                                             properties, body)
+            finally:
+                self._tune_prefetch()
+
+        self._prefetch_queue = queue
+        self._last_prefetch_tuning = time.monotonic()
+        self.rabbitmq.basic_consume(queue, timed_callback, False, False, None)
+
+    def _measure_processing(self, process: Callable, *args) -> None:
+        """
+        Calls process with the given arguments, and records how long it took
+        with the prefetch tuner if prefetch tuning is enabled.
+        :param process: The function which processes a message
+        :param args: The arguments to call process with
+        :return: None
+        """
+        if self._prefetch_tuner is None:
+            process(*args)
+            return
+
+        started = time.perf_counter()
+        try:
+            process(*args)
+        finally:
+            self._prefetch_tuner.record_processing_time(
+                time.perf_counter() - started)
+
+    def _measure_batch_processing(self, process: Callable, count: int,
+                                  *args) -> None:
+        """
+        Calls process with the given arguments to process a batch of messages
+        together, and records an equal share of the time it took for each
+        message with the prefetch tuner if prefetch tuning is enabled.
+        :param process: The function which processes the batch
+        :param count: The number of messages in the batch
+        :param args: The arguments to call process with
+        :return: None
+        """
+        if self._prefetch_tuner is None or count == 0:
+            process(*args)
+            return
+
+        started = time.perf_counter()
+        try:
+            process(*args)
+        finally:
+            processing_time = (time.perf_counter() - started) / count
+            for _ in range(count):
+                self._prefetch_tuner.record_processing_time(processing_time)
+
+    def _tune_prefetch(self) -> None:
+        """
+        Re-tunes the prefetch count if the tuning interval has elapsed, and
+        applies it with basic_qos if it changed.
+        :return: None
+        """
+        now = time.monotonic()
+        if now - self._last_prefetch_tuning < env.PREFETCH_TUNING_INTERVAL:
+            return
+        self._last_prefetch_tuning = now
+
+        declare_ok = self.rabbitmq.queue_declare(self._prefetch_queue, True)
+        queue_depth = declare_ok.method.message_count \
+            if hasattr(declare_ok, 'method') else None
+        # The fill is relative to the in-memory bound, so that a spill queue
+        # holding envelopes on disk counts as full.
+        publishing_queue_fill = min(
+            1.0, self._publishing_queue.qsize() / self.max_queue_size) \
+            if self.max_queue_size else 0.0
+
+        previous_prefetch_count = self._prefetch_tuner.prefetch_count
+        prefetch_count = self._prefetch_tuner.tune(queue_depth,
+                                                   publishing_queue_fill)
+        if prefetch_count != previous_prefetch_count:
+            self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+            self._logger.info(
+                "Changed the prefetch count of '%s' from %s to %s. Average "
+                "processing time: %.4fs, queue depth: %s, publishing queue "
+                "fill: %.0f%%.", self._prefetch_queue,
+                previous_prefetch_count, prefetch_count,
+                self._prefetch_tuner.average_processing_time, queue_depth,
+                publishing_queue_fill * 100)
+
     def _push_to_queue(self, data: Dict, exchange: str, routing_key: str,
                        properties: BasicProperties = BasicProperties(
                            delivery_mode=2), mandatory: bool = True) -> None:
@@ -97,15 +276,23 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         self._logger.debug("Adding data to the publishing queue ...")
 
         # Place the data on the publishing queue. If the queue is full,
-        # remove old data.
+        # remove old data. The data is encoded now so that it is neither
+        # copied nor affected by later modifications.
         if self._publishing_queue.full():
-            self._logger.debug("The queue is full, clearing the first item.")
-            self._publishing_queue.get()
-        data_dict = {'exchange': exchange, 'routing_key': routing_key,
-                     'data': copy.deepcopy(data), 'properties': properties,
-                     'mandatory': mandatory}
-        self._logger.debug("Adding %s to the queue", data_dict)
-        self._publishing_queue.put(data_dict)
+            self._logger.debug("The queue is full, clearing the oldest item.")
+            discard_oldest(self._publishing_queue)
+        body, encoded_properties = self._rabbitmq.encode_body(data, properties)
+
+        # Alerts are published with a priority derived from their severity,
+        # so that severe alerts overtake the others in the alert queues.
+        if exchange == ALERT_EXCHANGE and isinstance(data, dict) \
+                and encoded_properties.priority is None \
+                and 'severity' in data:
+            encoded_properties.priority = get_alert_priority(data['severity'])
+        envelope = PublishingEnvelope(exchange, routing_key, body,
+                                      encoded_properties, mandatory)
+        self._logger.debug("Adding %s to the queue", envelope)
+        self._publishing_queue.put(envelope)
 
         self._logger.debug("Data added to the publishing queue successfully.")
 
@@ -120,23 +307,15 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         # remove an item from the queue only if the sending was successful, so
         # that if an exception is raised, that message is not popped
         while not self._publishing_queue.empty():
-            data = self._publishing_queue.queue[0]
-            try:
-                self._rabbitmq.basic_publish_confirm(
-                    exchange=data['exchange'], routing_key=data['routing_key'],
-                    body=data['data'], is_body_dict=True,
-                    properties=data['properties'], mandatory=data['mandatory'])
-                self._logger.debug(
-                    "Sent %s to '%s' exchange", data['data'], data['exchange']
-                )
-                self._publishing_queue.get()
-                self._publishing_queue.task_done()
-            except KeyError as ke:
-                self._logger.error("Enqueued datum %s was incomplete", data)
-                self._logger.exception(ke)
-                self._logger.warning("Discarding this datum")
-                self._publishing_queue.get()
-                self._publishing_queue.task_done()
+            envelope = self._publishing_queue.queue[0]
+            self._rabbitmq.basic_publish_confirm(
+                exchange=envelope.exchange, routing_key=envelope.routing_key,
+                body=envelope.body, is_body_dict=False,
+                properties=envelope.properties, mandatory=envelope.mandatory)
+            self._logger.debug("Sent %s to '%s' exchange", envelope,
+                               envelope.exchange)
+            self._publishing_queue.get()
+            self._publishing_queue.task_done()
 
         if not empty:
             self._logger.debug("Successfully sent all data from the publishing "
@@ -6,7 +6,7 @@ from datetime import datetime
 from json import JSONDecodeError
 from logging import Logger
 from types import FrameType
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -18,6 +18,7 @@ from src.abstract.publisher_subscriber import (
 from src.alerter.alert_severities import Severity
 from src.data_store.redis import Keys, RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils import env
 from src.utils.constants.rabbitmq import (
     ALERT_ROUTER_CONFIGS_QUEUE_NAME, ALERT_ROUTER_CONFIGS_ROUTING_KEY,
@@ -26,7 +27,8 @@ from src.utils.constants.rabbitmq import (
     ALERT_ROUTER_HEARTBEAT_QUEUE_NAME, PING_ROUTING_KEY, HEALTH_CHECK_EXCHANGE,
     CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE,
     CONSOLE_HANDLER_INPUT_ROUTING_KEY, LOG_HANDLER_INPUT_ROUTING_KEY,
-    ALERT_STORE_INPUT_ROUTING_KEY, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+    ALERT_STORE_INPUT_ROUTING_KEY, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
+    ALERT_QUEUE_ARGUMENTS)
 from src.utils.exceptions import (
     MessageWasNotDeliveredException, MissingKeyInConfigException
 )
@@ -51,7 +53,7 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
 
         super().__init__(logger, RabbitMQApi(
             logger=logger.getChild(RabbitMQApi.__name__), host=rabbit_ip),
-                         env.ALERT_ROUTER_PUBLISHING_QUEUE_SIZE)
+                         env.ALERT_ROUTER_PUBLISHING_QUEUE_SIZE, name)
 
     def __str__(self) -> str:
         return self.name
@@ -71,7 +73,7 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         self._rabbitmq.confirm_delivery()
 
         # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self._publishing_queue.maxsize / 5)
+        prefetch_count = round(self.max_queue_size / 5)
         self._rabbitmq.basic_qos(prefetch_count=prefetch_count)
 
         self._declare_exchange_and_bind_queue(
@@ -85,7 +87,7 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
 
         self._declare_exchange_and_bind_queue(
             ALERT_ROUTER_INPUT_QUEUE_NAME, ALERT_EXCHANGE, TOPIC,
-            ALERT_ROUTER_INPUT_ROUTING_KEY
+            ALERT_ROUTER_INPUT_ROUTING_KEY, ALERT_QUEUE_ARGUMENTS
         )
         self._rabbitmq.basic_consume(
             queue=ALERT_ROUTER_INPUT_QUEUE_NAME,
@@ -109,15 +111,17 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         self._rabbitmq.basic_consume(ALERT_ROUTER_HEARTBEAT_QUEUE_NAME,
                                      self._process_ping, True, False, None)
 
-    def _declare_exchange_and_bind_queue(self, queue_name: str,
-                                         exchange_name: str, exchange_type: str,
-                                         routing_key: str) -> None:
+    def _declare_exchange_and_bind_queue(
+            self, queue_name: str, exchange_name: str, exchange_type: str,
+            routing_key: str, queue_arguments: Optional[Dict] = None) -> None:
         """
         Declare the specified exchange and queue and binds that queue to the
         exchange
         :param exchange_type:
         :param queue_name: The queue to declare and bind to the exchange
         :param exchange_name: The exchange to declare and bind the queue to
+        :param queue_arguments: The optional arguments of the queue, such as
+                              : its maximum priority
         :return: None
         """
         self._logger.info("Creating %s exchange", exchange_name)
@@ -127,7 +131,8 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         self._logger.info("Creating and binding queue for %s exchange",
                           exchange_name)
         self._logger.debug("Creating queue %s", queue_name)
-        self._rabbitmq.queue_declare(queue_name, False, True, False, False)
+        self._rabbitmq.queue_declare(queue_name, False, True, False, False,
+                                     queue_arguments)
         self._logger.debug("Binding queue %s to %s exchange", queue_name,
                            exchange_name)
         self._rabbitmq.queue_bind(queue_name, exchange_name, routing_key)
@@ -138,7 +143,7 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
                          body: bytes) -> None:
 
         recv_config = ConfigParser()
-        recv_config.read_dict(json.loads(body))
+        recv_config.read_dict(decode_message(body, properties))
         config_filename = method.routing_key
 
         self._logger.info("Received a new configuration from %s",
@@ -185,7 +190,7 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         send_to_ids: List[str] = []
         try:
             # Placed in try-except in case of malformed JSON
-            recv_alert = json.loads(body)
+            recv_alert = decode_message(body, properties)
 
             if recv_alert and 'severity' in recv_alert:
                 self._logger.debug("Received an alert to route")
@@ -1,2 +1,3 @@
 from src.alerter.alert_severities.severity import Severity
 from src.alerter.alert_severities.severity_code import SeverityCode
+from src.alerter.alert_severities.priority import get_alert_priority
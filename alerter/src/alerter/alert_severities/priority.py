@@ -0,0 +1,22 @@
+from typing import Optional
+
+from .severity import Severity
+
+# The RabbitMQ priority of the alerts of each severity. Alerts with a higher
+# priority are delivered first by the alert queues.
+_SEVERITY_PRIORITIES = {
+    Severity.CRITICAL.value: 10,
+    Severity.ERROR.value: 8,
+    Severity.WARNING.value: 6,
+    Severity.INTERNAL.value: 4,
+    Severity.INFO.value: 2,
+}
+
+
+def get_alert_priority(severity: Optional[str]) -> int:
+    """
+    :param severity: The severity of the alert
+    :return: The priority the alert must be published with, 0 if the
+           : severity is not known
+    """
+    return _SEVERITY_PRIORITIES.get(severity, 0)
@@ -1,28 +1,35 @@
 import logging
 import sys
 from abc import abstractmethod
+from datetime import timedelta
 from types import FrameType
-from typing import Any
+from typing import Any, Dict
 
 import pika.exceptions
 
 from src.abstract.publisher_subscriber import (
     QueuingPublisherSubscriberComponent)
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.utils import env
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.snapshot import create_state_snapshotter
 
 
 class Alerter(QueuingPublisherSubscriberComponent):
 
     def __init__(self, alerter_name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi, max_queue_size: int = 0) -> None:
-        super().__init__(logger, rabbitmq, max_queue_size)
+        super().__init__(logger, rabbitmq, max_queue_size, alerter_name)
 
         self._alerter_name = alerter_name
 
+        # If a snapshot directory is configured, the alerting state is saved
+        # locally so that timers and occurrence trackers survive a restart.
+        self._snapshotter = create_state_snapshotter(alerter_name)
+
     def __str__(self) -> str:
         return self.alerter_name
 
@@ -54,6 +61,61 @@ class Alerter(QueuingPublisherSubscriberComponent):
     def _true_fn() -> bool:
         return True
 
+    def _get_snapshot_state(self) -> Dict[str, Dict]:
+        """
+        :return: The dicts making up the in-memory state of the alerter keyed
+               : by name. When a snapshot is restored these dicts are updated
+               : in place.
+        """
+        return {}
+
+    def _restore_state_snapshot(self) -> None:
+        """
+        This function restores the in-memory state from the latest snapshot.
+        The state is only restored when the alerter starts without any state
+        in memory, since otherwise the snapshot is older than the state.
+        :return: None
+        """
+        state = self._get_snapshot_state()
+        if self._snapshotter is None or any(state.values()):
+            return
+
+        try:
+            snapshot = self._snapshotter.load(
+                timedelta(seconds=env.STATE_SNAPSHOT_MAX_AGE_SECONDS))
+        except Exception as e:
+            self.logger.error("Could not load the state snapshot of %s.", self)
+            self.logger.exception(e)
+            return
+
+        if snapshot is None:
+            return
+
+        _, saved_state = snapshot
+        for name, state_dict in state.items():
+            state_dict.update(saved_state.get(name, {}))
+        self.logger.info("Restored the state of %s from its state snapshot.",
+                         self)
+
+    def _save_state_snapshot(self) -> None:
+        try:
+            self._snapshotter.save(self._get_snapshot_state())
+        except Exception as e:
+            self.logger.error("Could not save the state snapshot of %s.", self)
+            self.logger.exception(e)
+
+    def _send_heartbeat_if_due(self, processing_error: bool) -> None:
+        """
+        Apart from sending heartbeats, the state is saved to a snapshot after
+        processing a message if the snapshot interval has elapsed.
+        :param processing_error: Whether the message could not be processed
+        :return: None
+        """
+        super()._send_heartbeat_if_due(processing_error)
+        if self._snapshotter is not None and \
+                self._snapshotter.snapshot_due():
+            self._save_state_snapshot()
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -66,15 +128,16 @@ class Alerter(QueuingPublisherSubscriberComponent):
         pass
 
     def _send_heartbeat(self, data_to_send: dict) -> None:
-        self.rabbitmq.basic_publish_confirm(
+        self.rabbitmq.basic_publish_on_side_channel(
             exchange=HEALTH_CHECK_EXCHANGE,
             routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=data_to_send,
-            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
-            mandatory=True)
+            is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2))
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
     def start(self) -> None:
+        self._restore_state_snapshot()
         self._initialise_rabbitmq()
         while True:
             try:
@@ -102,6 +165,8 @@ class Alerter(QueuingPublisherSubscriberComponent):
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
                       "closed, and afterwards the process will exit."
                       .format(self), self.logger)
+        if self._snapshotter is not None:
+            self._save_state_snapshot()
         self.disconnect_from_rabbit()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
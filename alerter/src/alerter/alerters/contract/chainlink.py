@@ -1,7 +1,4 @@
-import copy
-import json
 import logging
-from datetime import datetime
 from typing import List, Dict
 
 import pika
@@ -18,6 +15,7 @@ from src.configs.alerts.contract.chainlink import ChainlinkContractAlertsConfig
 from src.configs.factory.alerts.chainlink_alerts import (
     ChainlinkContractAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, TOPIC, CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
     CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY, HEALTH_CHECK_EXCHANGE,
@@ -55,6 +53,12 @@ class ChainlinkContractAlerter(Alerter):
     def alerting_factory(self) -> ChainlinkContractAlertingFactory:
         return self._alerting_factory
 
+    def _get_snapshot_state(self) -> Dict[str, Dict]:
+        return {
+            'alerting_state': self.alerting_factory.alerting_state,
+            'configs': self.alerts_configs_factory.configs,
+        }
+
     def _initialise_rabbitmq(self) -> None:
         # An alerter is both a consumer and producer, therefore we need to
         # initialise both the consuming and producing configurations.
@@ -92,14 +96,11 @@ class ChainlinkContractAlerter(Alerter):
             CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
             CONFIG_EXCHANGE, CL_ALERTS_CONFIGS_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(
-            queue=CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            on_message_callback=self._process_data, auto_ack=False,
-            exclusive=False, consumer_tag=None)
+        self._consume_with_prefetch(
+            CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME, self._process_data)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -122,9 +123,9 @@ class ChainlinkContractAlerter(Alerter):
         :return:
         """
         if method.routing_key == CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY:
-            self._process_transformed_data(method, body)
+            self._process_transformed_data(method, body, properties)
         elif 'alerts_config' in method.routing_key:
-            self._process_configs(method, body)
+            self._process_configs(method, body, properties)
         else:
             self.logger.debug("Received unexpected data %s with routing key %s",
                               body, method.routing_key)
@@ -328,9 +329,10 @@ class ChainlinkContractAlerter(Alerter):
                 data['message'], "Synced EVM data sources found!", data['code']
             )
 
-    def _process_transformed_data(self, method: pika.spec.Basic.Deliver,
-                                  body: bytes) -> None:
-        data_received = json.loads(body)
+    def _process_transformed_data(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        data_received = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -361,13 +363,7 @@ class ChainlinkContractAlerter(Alerter):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.alerter_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise the exception so that the
             # message can be acknowledged and removed from the rabbit queue.
@@ -379,9 +375,10 @@ class ChainlinkContractAlerter(Alerter):
             # reside in the publisher queue
             raise e
 
-    def _process_configs(self, method: pika.spec.Basic.Deliver,
-                         body: bytes) -> None:
-        sent_configs = json.loads(body)
+    def _process_configs(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -429,13 +426,8 @@ class ChainlinkContractAlerter(Alerter):
         # full, remove old data.
         for alert in data_list:
             self.logger.debug("Adding %s to the publishing queue.", alert)
-            if self.publishing_queue.full():
-                self.publishing_queue.get()
-            self.publishing_queue.put({
-                'exchange': ALERT_EXCHANGE,
-                'routing_key': CL_CONTRACT_ALERT_ROUTING_KEY,
-                'data': copy.deepcopy(alert),
-                'properties': pika.BasicProperties(delivery_mode=2),
-                'mandatory': True})
+            self._push_to_queue(
+                alert, ALERT_EXCHANGE, CL_CONTRACT_ALERT_ROUTING_KEY,
+                pika.BasicProperties(delivery_mode=2), True)
             self.logger.debug("%s added to the publishing queue successfully.",
                               alert)
@@ -1,8 +1,5 @@
-import copy
-import json
 import logging
-from datetime import datetime
-from typing import List
+from typing import List, Dict
 
 import pika.exceptions
 
@@ -16,6 +13,7 @@ from src.alerter.alerts.dockerhub_alerts import (
     DockerHubPageNowAccessibleAlert, DockerHubTagsAPICallErrorAlert,
     DockerHubTagsAPICallErrorResolvedAlert)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     DOCKERHUB_ALERTER_INPUT_QUEUE_NAME,
@@ -36,6 +34,12 @@ class DockerhubAlerter(Alerter):
         self._cannot_access_dockerhub_page = {}
         self._tags_api_call_error = {}
 
+    def _get_snapshot_state(self) -> Dict[str, Dict]:
+        return {
+            'cannot_access_dockerhub_page': self._cannot_access_dockerhub_page,
+            'tags_api_call_error': self._tags_api_call_error,
+        }
+
     def _initialise_rabbitmq(self) -> None:
         # An alerter is both a consumer and producer, therefore we need to
         # initialise both the consuming and producing configurations.
@@ -58,15 +62,11 @@ class DockerhubAlerter(Alerter):
         self.rabbitmq.queue_bind(
             queue=DOCKERHUB_ALERTER_INPUT_QUEUE_NAME, exchange=ALERT_EXCHANGE,
             routing_key=DOCKERHUB_TRANSFORMED_DATA_ROUTING_KEY)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(queue=DOCKERHUB_ALERTER_INPUT_QUEUE_NAME,
-                                    on_message_callback=self._process_data,
-                                    auto_ack=False, exclusive=False,
-                                    consumer_tag=None)
-
-        # Pre-fetch count is 10 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        self._consume_with_prefetch(DOCKERHUB_ALERTER_INPUT_QUEUE_NAME,
+                                    self._process_data)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -86,7 +86,7 @@ class DockerhubAlerter(Alerter):
                       method: pika.spec.Basic.Deliver,
                       properties: pika.spec.BasicProperties,
                       body: bytes) -> None:
-        data_received = json.loads(body)
+        data_received = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -269,13 +269,7 @@ class DockerhubAlerter(Alerter):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.alerter_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
@@ -289,13 +283,8 @@ class DockerhubAlerter(Alerter):
         # queue is full, remove old data.
         for alert in data_list:
             self.logger.debug("Adding %s to the publishing queue.", alert)
-            if self.publishing_queue.full():
-                self.publishing_queue.get()
-            self.publishing_queue.put({
-                'exchange': ALERT_EXCHANGE,
-                'routing_key': DOCKERHUB_ALERT_ROUTING_KEY,
-                'data': copy.deepcopy(alert),
-                'properties': pika.BasicProperties(delivery_mode=2),
-                'mandatory': True})
+            self._push_to_queue(
+                alert, ALERT_EXCHANGE, DOCKERHUB_ALERT_ROUTING_KEY,
+                pika.BasicProperties(delivery_mode=2), True)
             self.logger.debug("%s added to the publishing queue successfully.",
                               alert)
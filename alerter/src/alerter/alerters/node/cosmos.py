@@ -1,7 +1,4 @@
-import copy
-import json
 import logging
-from datetime import datetime
 from typing import List, Dict
 
 import pika
@@ -18,6 +15,7 @@ from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
 from src.configs.factory.alerts.cosmos_alerts import (
     CosmosNodeAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils.constants.cosmos import BOND_STATUS_BONDED
 from src.utils.constants.data import VALID_COSMOS_NODE_SOURCES
 from src.utils.constants.rabbitmq import (
@@ -59,6 +57,12 @@ class CosmosNodeAlerter(Alerter):
     def alerting_factory(self) -> CosmosNodeAlertingFactory:
         return self._alerting_factory
 
+    def _get_snapshot_state(self) -> Dict[str, Dict]:
+        return {
+            'alerting_state': self.alerting_factory.alerting_state,
+            'configs': self.alerts_configs_factory.configs,
+        }
+
     def _initialise_rabbitmq(self) -> None:
         # An alerter is both a consumer and producer, therefore we need to
         # initialise both the consuming and producing configurations.
@@ -94,14 +98,11 @@ class CosmosNodeAlerter(Alerter):
             COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, CONFIG_EXCHANGE,
             COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(
-            queue=COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            on_message_callback=self._process_data, auto_ack=False,
-            exclusive=False, consumer_tag=None)
+        self._consume_with_prefetch(
+            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, self._process_data)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -124,9 +125,9 @@ class CosmosNodeAlerter(Alerter):
         :return:
         """
         if method.routing_key == COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY:
-            self._process_transformed_data(method, body)
+            self._process_transformed_data(method, body, properties)
         elif 'alerts_config' in method.routing_key:
-            self._process_configs(method, body)
+            self._process_configs(method, body, properties)
         else:
             self.logger.debug("Received unexpected data %s with routing key %s",
                               body, method.routing_key)
@@ -771,9 +772,10 @@ class CosmosNodeAlerter(Alerter):
                     monitoring_timestamp
                 )
 
-    def _process_transformed_data(self, method: pika.spec.Basic.Deliver,
-                                  body: bytes) -> None:
-        data_received = json.loads(body)
+    def _process_transformed_data(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        data_received = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -814,13 +816,7 @@ class CosmosNodeAlerter(Alerter):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.alerter_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise the exception so that the
             # message can be acknowledged and removed from the rabbit queue.
@@ -832,9 +828,10 @@ class CosmosNodeAlerter(Alerter):
             # reside in the publisher queue
             raise e
 
-    def _process_configs(self, method: pika.spec.Basic.Deliver,
-                         body: bytes) -> None:
-        sent_configs = json.loads(body)
+    def _process_configs(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -883,13 +880,8 @@ class CosmosNodeAlerter(Alerter):
         # full, remove old data.
         for alert in data_list:
             self.logger.debug("Adding %s to the publishing queue.", alert)
-            if self.publishing_queue.full():
-                self.publishing_queue.get()
-            self.publishing_queue.put({
-                'exchange': ALERT_EXCHANGE,
-                'routing_key': COSMOS_NODE_ALERT_ROUTING_KEY,
-                'data': copy.deepcopy(alert),
-                'properties': pika.BasicProperties(delivery_mode=2),
-                'mandatory': True})
+            self._push_to_queue(
+                alert, ALERT_EXCHANGE, COSMOS_NODE_ALERT_ROUTING_KEY,
+                pika.BasicProperties(delivery_mode=2), True)
             self.logger.debug("%s added to the publishing queue successfully.",
                               alert)
@@ -1,7 +1,4 @@
-import copy
-import json
 import logging
-from datetime import datetime
 from typing import Dict, List
 
 import pika.exceptions
@@ -14,11 +11,13 @@ from src.alerter.grouped_alerts_metric_code import \
     GroupedSystemAlertsMetricCode as MetricCode
 from src.configs.factory.alerts.system_alerts import SystemAlertsConfigsFactory
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE, SYSTEM_ALERT_ROUTING_KEY, TOPIC,
     SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME, CONFIG_EXCHANGE,
     SYSTEM_TRANSFORMED_DATA_ROUTING_KEY, ALERTS_CONFIGS_ROUTING_KEY_GEN,
     ALERTS_CONFIGS_ROUTING_KEY_CHAIN)
+from src.utils.deltas import LatestMetrics, is_delta
 from src.utils.exceptions import (MessageWasNotDeliveredException,
                                   ReceivedUnexpectedDataException,
                                   MetricNotFoundException,
@@ -42,6 +41,10 @@ class SystemAlerter(Alerter):
         self._alerts_configs_factory = system_alerts_configs_factory
         self._alerting_factory = SystemAlertingFactory(logger)
 
+        # The latest metrics of each system, from which the full metrics are
+        # obtained when deltas are received
+        self._latest_metrics = LatestMetrics()
+
     @property
     def alerts_configs_factory(self) -> SystemAlertsConfigsFactory:
         return self._alerts_configs_factory
@@ -50,6 +53,12 @@ class SystemAlerter(Alerter):
     def alerting_factory(self) -> SystemAlertingFactory:
         return self._alerting_factory
 
+    def _get_snapshot_state(self) -> Dict[str, Dict]:
+        return {
+            'alerting_state': self.alerting_factory.alerting_state,
+            'configs': self.alerts_configs_factory.configs,
+        }
+
     def _initialise_rabbitmq(self) -> None:
         # An alerter is both a consumer and producer, therefore we need to
         # initialise both the consuming and producing configurations.
@@ -90,14 +99,11 @@ class SystemAlerter(Alerter):
             SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME, CONFIG_EXCHANGE,
             ALERTS_CONFIGS_ROUTING_KEY_GEN)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(
-            queue=SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            on_message_callback=self._process_data, auto_ack=False,
-            exclusive=False, consumer_tag=None)
+        self._consume_with_prefetch(SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                                    self._process_data)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -120,9 +126,9 @@ class SystemAlerter(Alerter):
         :return:
         """
         if method.routing_key == SYSTEM_TRANSFORMED_DATA_ROUTING_KEY:
-            self._process_transformed_data(method, body)
+            self._process_transformed_data(method, body, properties)
         elif 'alerts_config' in method.routing_key:
-            self._process_configs(method, body)
+            self._process_configs(method, body, properties)
         else:
             self.logger.debug("Received unexpected data %s with routing key %s",
                               body, method.routing_key)
@@ -131,7 +137,13 @@ class SystemAlerter(Alerter):
     def _process_result(self, transformer_data: Dict,
                         data_for_alerting: List) -> None:
         meta_data = transformer_data['meta_data']
-        data = transformer_data['data']
+        data = self._latest_metrics.merge(meta_data['system_id'],
+                                          transformer_data['data'],
+                                          is_delta(meta_data))
+        if data is None:
+            # Until a full snapshot of the system is received, only the
+            # metrics in the delta can be alerted on
+            data = transformer_data['data']
 
         # Assert that the alerts_config has been received for the chain.
         chain_name = self.alerts_configs_factory.get_chain_name(
@@ -173,7 +185,8 @@ class SystemAlerter(Alerter):
                     meta_data['system_name'], meta_data['last_monitored']
                 )
 
-            if str_to_bool(configs.open_file_descriptors['enabled']):
+            if str_to_bool(configs.open_file_descriptors['enabled']) \
+                    and 'open_file_descriptors' in data:
                 current = data['open_file_descriptors']['current']
                 sub_config = configs.open_file_descriptors
                 self.alerting_factory.classify_thresholded_alert(
@@ -188,7 +201,8 @@ class SystemAlerter(Alerter):
                     meta_data['system_name'], meta_data['last_monitored']
                 )
 
-            if str_to_bool(configs.system_cpu_usage['enabled']):
+            if str_to_bool(configs.system_cpu_usage['enabled']) \
+                    and 'system_cpu_usage' in data:
                 current = data['system_cpu_usage']['current']
                 sub_config = configs.system_cpu_usage
                 self.alerting_factory.classify_thresholded_alert(
@@ -201,7 +215,8 @@ class SystemAlerter(Alerter):
                     meta_data['system_name'], meta_data['last_monitored']
                 )
 
-            if str_to_bool(configs.system_ram_usage['enabled']):
+            if str_to_bool(configs.system_ram_usage['enabled']) \
+                    and 'system_ram_usage' in data:
                 current = data['system_ram_usage']['current']
                 sub_config = configs.system_ram_usage
                 self.alerting_factory.classify_thresholded_alert(
@@ -214,7 +229,8 @@ class SystemAlerter(Alerter):
                     meta_data['system_name'], meta_data['last_monitored']
                 )
 
-            if str_to_bool(configs.system_storage_usage['enabled']):
+            if str_to_bool(configs.system_storage_usage['enabled']) \
+                    and 'system_storage_usage' in data:
                 current = data['system_storage_usage']['current']
                 sub_config = configs.system_storage_usage
                 self.alerting_factory.classify_thresholded_alert(
@@ -276,9 +292,10 @@ class SystemAlerter(Alerter):
                         meta_data['system_name'], meta_data['time']
                     )
 
-    def _process_transformed_data(self, method: pika.spec.Basic.Deliver,
-                                  body: bytes) -> None:
-        data_received = json.loads(body)
+    def _process_transformed_data(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        data_received = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -310,13 +327,7 @@ class SystemAlerter(Alerter):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.alerter_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise the exception so that the
             # message can be acknowledged and removed from the rabbit queue.
@@ -328,9 +339,10 @@ class SystemAlerter(Alerter):
             # reside in the publisher queue
             raise e
 
-    def _process_configs(self, method: pika.spec.Basic.Deliver,
-                         body: bytes) -> None:
-        sent_configs = json.loads(body)
+    def _process_configs(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -378,13 +390,8 @@ class SystemAlerter(Alerter):
         # full, remove old data.
         for alert in data_list:
             self.logger.debug("Adding %s to the publishing queue.", alert)
-            if self.publishing_queue.full():
-                self.publishing_queue.get()
-            self.publishing_queue.put({
-                'exchange': ALERT_EXCHANGE,
-                'routing_key': SYSTEM_ALERT_ROUTING_KEY,
-                'data': copy.deepcopy(alert),
-                'properties': pika.BasicProperties(delivery_mode=2),
-                'mandatory': True})
+            self._push_to_queue(
+                alert, ALERT_EXCHANGE, SYSTEM_ALERT_ROUTING_KEY,
+                pika.BasicProperties(delivery_mode=2), True)
             self.logger.debug("%s added to the publishing queue successfully.",
                               alert)
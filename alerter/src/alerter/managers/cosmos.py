@@ -1,5 +1,4 @@
 import copy
-import json
 import logging
 import sys
 from datetime import datetime
@@ -22,6 +21,7 @@ from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
 from src.configs.factory.alerts.cosmos_alerts import (
     CosmosNodeAlertsConfigsFactory, CosmosNetworkAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils.constants.names import (
     COSMOS_NODE_ALERTER_NAME, COSMOS_NETWORK_ALERTER_NAME)
 from src.utils.constants.rabbitmq import (
@@ -207,7 +207,7 @@ class CosmosAlertersManager(AlertersManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -1,7 +1,5 @@
-import json
 import logging
 import sys
-from datetime import datetime
 from types import FrameType
 
 import pika.exceptions
@@ -13,7 +11,9 @@ from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.console import ConsoleChannel
 from src.channels_manager.handlers.handler import ChannelHandler
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils.constants.rabbitmq import (
+    ALERT_QUEUE_ARGUMENTS,
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
     HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, CONSOLE_HANDLER_INPUT_ROUTING_KEY,
@@ -48,7 +48,7 @@ class ConsoleAlertsHandler(ChannelHandler):
         self.logger.info("Creating queue '%s'",
                          self._console_alerts_handler_queue)
         self.rabbitmq.queue_declare(self._console_alerts_handler_queue, False,
-                                    True, False, False)
+                                    True, False, False, ALERT_QUEUE_ARGUMENTS)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
                          "'%s'", self._console_alerts_handler_queue,
                          ALERT_EXCHANGE, CONSOLE_HANDLER_INPUT_ROUTING_KEY)
@@ -69,18 +69,18 @@ class ConsoleAlertsHandler(ChannelHandler):
                                        True, False, False)
 
     def _send_heartbeat(self, data_to_send: dict) -> None:
-        self.rabbitmq.basic_publish_confirm(
+        self.rabbitmq.basic_publish_on_side_channel(
             exchange=HEALTH_CHECK_EXCHANGE,
             routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=data_to_send,
-            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
-            mandatory=True)
+            is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2))
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
     def _process_alert(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        alert_json = json.loads(body)
+        alert_json = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this alert.", alert_json)
 
         processing_error = False
@@ -111,20 +111,18 @@ class ConsoleAlertsHandler(ChannelHandler):
         except Exception as e:
             raise e
 
-        if alert_result == RequestStatus.SUCCESS and not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.handler_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                # Log the message and do not raise it as heartbeats must be
-                # real-time.
-                self.logger.exception(e)
-            except Exception as e:
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent when there were no processing errors and when the
+        # alert was sent successfully.
+        try:
+            self._send_heartbeat_if_due(
+                processing_error or alert_result != RequestStatus.SUCCESS)
+        except MessageWasNotDeliveredException as e:
+            # Log the message and do not raise it as heartbeats must be
+            # real-time.
+            self.logger.exception(e)
+        except Exception as e:
+            raise e
 
     def start(self) -> None:
         self._initialise_rabbitmq()
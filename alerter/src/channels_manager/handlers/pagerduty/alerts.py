@@ -1,4 +1,3 @@
-import json
 import logging
 import sys
 from datetime import datetime
@@ -15,7 +14,9 @@ from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels import PagerDutyChannel
 from src.channels_manager.handlers import ChannelHandler
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils.constants.rabbitmq import (
+    ALERT_QUEUE_ARGUMENTS,
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
     HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
@@ -52,18 +53,18 @@ class PagerDutyAlertsHandler(ChannelHandler):
         return self._alerts_queue
 
     def _send_heartbeat(self, data_to_send: dict) -> None:
-        self.rabbitmq.basic_publish_confirm(
+        self.rabbitmq.basic_publish_on_side_channel(
             exchange=HEALTH_CHECK_EXCHANGE,
             routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=data_to_send,
-            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
-            mandatory=True)
+            is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2))
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
     def _process_alert(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        alert_json = json.loads(body)
+        alert_json = decode_message(body, properties)
         self.logger.debug("Received and processing alert: %s", alert_json)
 
         processing_error = False
@@ -100,22 +101,18 @@ class PagerDutyAlertsHandler(ChannelHandler):
         except Exception as e:
             raise e
 
-        # By this condition we are sending heartbeats only when there were no
-        # processing errors and when all alerts have been sent successfully.
-        if self.alerts_queue.empty() and not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.handler_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                # Log the message and do not raise it as heartbeats must be
-                # real-time.
-                self.logger.exception(e)
-            except Exception as e:
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent when there were no processing errors and when all
+        # alerts have been sent successfully.
+        try:
+            self._send_heartbeat_if_due(
+                processing_error or not self.alerts_queue.empty())
+        except MessageWasNotDeliveredException as e:
+            # Log the message and do not raise it as heartbeats must be
+            # real-time.
+            self.logger.exception(e)
+        except Exception as e:
+            raise e
 
     def _place_alert_on_queue(self, alert: Alert) -> None:
         self.logger.debug("Adding %s to the alerts queue ...",
@@ -186,7 +183,7 @@ class PagerDutyAlertsHandler(ChannelHandler):
         self.logger.info("Creating queue '%s'",
                          self._pagerduty_alerts_handler_queue)
         self.rabbitmq.queue_declare(self._pagerduty_alerts_handler_queue, False,
-                                    True, False, False)
+                                    True, False, False, ALERT_QUEUE_ARGUMENTS)
 
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
                          "'%s'", self._pagerduty_alerts_handler_queue,
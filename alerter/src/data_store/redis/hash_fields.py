@@ -0,0 +1,29 @@
+from typing import Dict, Optional
+
+
+class RedisHashFields:
+    """
+    This class holds the values of a number of fields of a Redis hash which
+    were read together in a single round trip. Values are returned in the same
+    way as RedisApi.hget returns them: the default is returned for fields which
+    do not exist, and None for fields which store 'None'.
+    """
+
+    def __init__(self, values: Dict[str, Optional[bytes]]) -> None:
+        # Fields which do not exist in Redis are stored as None
+        self._values = values
+
+    def get(self, key: str, default: Optional[bytes] = None) -> Optional[bytes]:
+        """
+        :param key: The field to return
+        :param default: The value to return if the field does not exist
+        :return: The value of the field
+        :raises KeyError: If the field was not read from Redis
+        """
+        if key not in self._values:
+            raise KeyError("Field {} was not read from Redis".format(key))
+
+        value = self._values[key]
+        if value is None:
+            return default
+        return None if value == b'None' else value
@@ -8,6 +8,9 @@ import redis
 from src.utils.timing import TimedTaskLimiter
 from src.utils.types import RedisType
 
+# The number of keys or fields SCAN and HSCAN are asked to return per call
+_SCAN_BATCH_SIZE = 1000
+
 
 class RedisApi:
 
@@ -145,7 +148,7 @@ class RedisApi:
 
         if self.exists_unsafe(key):
             get_ret = self._redis.get(key)
-            if get_ret.decode('UTF-8') == 'None':
+            if get_ret == b'None':
                 return None
             else:
                 return get_ret
@@ -158,13 +161,23 @@ class RedisApi:
 
         if self.hexists_unsafe(name, key):
             get_ret = self._redis.hget(name, key)
-            if get_ret.decode('UTF-8') == 'None':
+            if get_ret == b'None':
                 return None
             else:
                 return get_ret
         else:
             return default
 
+    def hmget_unsafe(self, name: str, keys: List[str]) \
+            -> List[Optional[bytes]]:
+        # All fields are read in a single round trip. None is returned for the
+        # fields which do not exist.
+        name = self._add_namespace(name)
+
+        if not keys:
+            return []
+        return self._redis.hmget(name, keys)
+
     def get_int_unsafe(self, key: str, default: Optional[int] = None) \
             -> Optional[int]:
         key = self._add_namespace(key)
@@ -229,6 +242,22 @@ class RedisApi:
 
         return keys_list
 
+    def scan_keys_unsafe(self, pattern: str = "*") -> List[str]:
+        # Unlike KEYS, SCAN iterates over the keyspace in batches, so that
+        # Redis is not blocked while the keys are being listed
+        pattern = self._add_namespace(pattern)
+
+        return [self._remove_namespace(key.decode('utf8'))
+                for key in self._redis.scan_iter(match=pattern,
+                                                 count=_SCAN_BATCH_SIZE)]
+
+    def hscan_unsafe(self, name: str, pattern: str = "*") -> Dict[str, bytes]:
+        name = self._add_namespace(name)
+
+        return {key.decode('utf8'): value
+                for key, value in self._redis.hscan_iter(
+                    name, match=pattern, count=_SCAN_BATCH_SIZE)}
+
     def remove_unsafe(self, *keys):
         keys = [self._add_namespace(k) for k in keys]
         return self._redis.delete(*keys)
@@ -280,6 +309,9 @@ class RedisApi:
             -> Optional[bytes]:
         return self._safe(self.hget_unsafe, [name, key, default], default)
 
+    def hmget(self, name: str, keys: List[str]) -> List[Optional[bytes]]:
+        return self._safe(self.hmget_unsafe, [name, keys], [None] * len(keys))
+
     def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
         return self._safe(self.get_int_unsafe, [key, default], default)
 
@@ -304,6 +336,12 @@ class RedisApi:
     def get_keys(self, pattern: str = "*") -> List[str]:
         return self._safe(self.get_keys_unsafe, [pattern], [])
 
+    def scan_keys(self, pattern: str = "*") -> List[str]:
+        return self._safe(self.scan_keys_unsafe, [pattern], [])
+
+    def hscan(self, name: str, pattern: str = "*") -> Dict[str, bytes]:
+        return self._safe(self.hscan_unsafe, [name, pattern], {})
+
     def remove(self, *keys):
         return self._safe(self.remove_unsafe, [*keys], None)
 
@@ -115,10 +115,14 @@ _key_dockerhub_last_monitored = 'dh2'
 
 # cX_<component_name>
 _key_component_heartbeat = 'c1'
+_key_component_last_processed = 'c2'
 
 # chX_<parent_id>
 _key_chain_mute_alerts = 'ch1'
 
+# mpX_<monitorable_id>
+_key_monitor_progress = 'mp1'
+
 # alert_systemX_<origin_id>
 _key_alert_system_open_file_descriptors = 'alert_system1'
 _key_alert_system_cpu_usage = 'alert_system2'
@@ -250,6 +254,52 @@ class Keys:
     def get_hash_parent_raw() -> str:
         return _hash_parent
 
+    @staticmethod
+    def _as_fields_pattern(key: str) -> str:
+        # Matches the fields of all the keys numbered like the given key, for
+        # example s1_<system_id> up to s15_<system_id> given 's1'
+        return key.rstrip('0123456789') + '[0-9]*_*'
+
+    @staticmethod
+    def get_system_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_system_process_cpu_seconds_total)
+
+    @staticmethod
+    def get_cl_node_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_cl_node_current_height)
+
+    @staticmethod
+    def get_evm_node_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_evm_node_current_height)
+
+    @staticmethod
+    def get_cosmos_node_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_cosmos_node_current_height)
+
+    @staticmethod
+    def get_cosmos_network_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_cosmos_network_proposals)
+
+    @staticmethod
+    def get_substrate_node_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_substrate_node_best_height)
+
+    @staticmethod
+    def get_substrate_network_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_substrate_network_grandpa_stalled)
+
+    @staticmethod
+    def get_cl_contract_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_cl_contract_version)
+
+    @staticmethod
+    def get_github_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_github_no_of_releases)
+
+    @staticmethod
+    def get_dockerhub_fields_pattern() -> str:
+        return Keys._as_fields_pattern(_key_dockerhub_last_tags)
+
     @staticmethod
     def get_alerter_mute() -> str:
         return _key_alerter_mute
@@ -685,10 +735,18 @@ class Keys:
     def get_component_heartbeat(component_name: str) -> str:
         return Keys._as_prefix(_key_component_heartbeat) + component_name
 
+    @staticmethod
+    def get_component_last_processed(component_name: str) -> str:
+        return Keys._as_prefix(_key_component_last_processed) + component_name
+
     @staticmethod
     def get_chain_mute_alerts() -> str:
         return _key_chain_mute_alerts
 
+    @staticmethod
+    def get_monitor_progress(monitorable_id: str) -> str:
+        return Keys._as_prefix(_key_monitor_progress) + monitorable_id
+
     @staticmethod
     def get_alert_system_open_file_descriptors(origin_id: str) -> str:
         return Keys._as_prefix(_key_alert_system_open_file_descriptors) + (
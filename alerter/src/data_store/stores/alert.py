@@ -1,6 +1,5 @@
 import json
 import logging
-from datetime import datetime
 from typing import Dict
 
 import pika.exceptions
@@ -20,6 +19,7 @@ from src.alerter.alerters.system import SystemAlerter
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.data import EXPIRE_METRICS
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
@@ -94,7 +94,7 @@ class AlertStore(Store):
         alerts will be stored in mongo, there isn't a need to store them in
         redis. If successful, a heartbeat will be sent.
         """
-        alert_data = json.loads(body)
+        alert_data = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.", alert_data)
 
         processing_error = False
@@ -111,20 +111,15 @@ class AlertStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
-        # Send a heartbeat only if there were no errors
-        if not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                self.logger.exception(e)
-            except Exception as e:
-                # For any other exception raise it.
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent if there were no errors.
+        try:
+            self._send_heartbeat_if_due(processing_error)
+        except MessageWasNotDeliveredException as e:
+            self.logger.exception(e)
+        except Exception as e:
+            # For any other exception raise it.
+            raise e
 
     def _process_mongo_store(self, alert: Dict) -> None:
         """
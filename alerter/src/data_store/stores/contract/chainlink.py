@@ -8,6 +8,7 @@ import pika
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
 from src.utils.constants.rabbitmq import (
@@ -76,7 +77,7 @@ class ChainlinkContractStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        node_data = json.loads(body)
+        node_data = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.", node_data)
 
         processing_error = False
@@ -90,20 +91,15 @@ class ChainlinkContractStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
-        # Send a heartbeat only if there were no errors
-        if not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                self.logger.exception(e)
-            except Exception as e:
-                # For any other exception raise it.
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent if there were no errors.
+        try:
+            self._send_heartbeat_if_due(processing_error)
+        except MessageWasNotDeliveredException as e:
+            self.logger.exception(e)
+        except Exception as e:
+            # For any other exception raise it.
+            raise e
 
     def _process_redis_store(self, data: Dict) -> None:
         if 'result' in data:
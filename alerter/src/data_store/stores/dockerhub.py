@@ -1,12 +1,12 @@
 import json
 import logging
-from datetime import datetime
 from typing import Dict
 
 import pika.exceptions
 
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE, DOCKERHUB_STORE_INPUT_QUEUE_NAME,
@@ -69,7 +69,7 @@ class DockerhubStore(Store):
         Processes the data being received, from the queue. This data will be
         stored in Redis as required. If successful, a heartbeat will be sent.
         """
-        dockerhub_data = json.loads(body)
+        dockerhub_data = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.",
                           dockerhub_data)
 
@@ -90,20 +90,15 @@ class DockerhubStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
-        # Send a heartbeat only if there were no errors
-        if not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                self.logger.exception(e)
-            except Exception as e:
-                # For any other exception raise it.
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent if there were no errors.
+        try:
+            self._send_heartbeat_if_due(processing_error)
+        except MessageWasNotDeliveredException as e:
+            self.logger.exception(e)
+        except Exception as e:
+            # For any other exception raise it.
+            raise e
 
     def _process_redis_store(self, data: Dict) -> None:
         if 'result' in data:
@@ -1,13 +1,12 @@
-import json
 import logging
 from copy import deepcopy
-from datetime import datetime
 from typing import Dict, Tuple
 
 import pika.exceptions
 
 from src.data_store.mongo import MongoApi
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
 from src.utils.constants.monitorables import (
@@ -84,7 +83,7 @@ class MonitorableStore(Store):
         Processes the data being received, from the queue. This data will be
         stored in Mongo as required. If successful, a heartbeat will be sent.
         """
-        monitorable_data = json.loads(body)
+        monitorable_data = decode_message(body, properties)
 
         self.logger.debug("Received %s. Now processing this data.",
                           monitorable_data)
@@ -98,20 +97,15 @@ class MonitorableStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
-        # Send a heartbeat only if there were no errors
-        if not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                self.logger.exception(e)
-            except Exception as e:
-                # For any other exception raise it.
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent if there were no errors.
+        try:
+            self._send_heartbeat_if_due(processing_error)
+        except MessageWasNotDeliveredException as e:
+            self.logger.exception(e)
+        except Exception as e:
+            # For any other exception raise it.
+            raise e
 
     def _process_mongo_store(self, routing_key: str,
                              received_data: Dict) -> None:
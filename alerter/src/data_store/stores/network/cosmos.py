@@ -9,6 +9,7 @@ from src.data_store.mongo import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
 from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, TOPIC, COSMOS_NETWORK_STORE_INPUT_QUEUE_NAME,
@@ -76,7 +77,7 @@ class CosmosNetworkStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        network_data = json.loads(body)
+        network_data = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.",
                           network_data)
 
@@ -91,20 +92,15 @@ class CosmosNetworkStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
-        # Send a heartbeat only if there were no errors
-        if not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                self.logger.exception(e)
-            except Exception as e:
-                # For any other exception raise it.
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent if there were no errors.
+        try:
+            self._send_heartbeat_if_due(processing_error)
+        except MessageWasNotDeliveredException as e:
+            self.logger.exception(e)
+        except Exception as e:
+            # For any other exception raise it.
+            raise e
 
     def _process_redis_store(self, data: Dict) -> None:
         configuration = {
@@ -8,11 +8,13 @@ import pika
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
 from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, TOPIC, COSMOS_NODE_STORE_INPUT_QUEUE_NAME,
     COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY, HEALTH_CHECK_EXCHANGE)
+from src.utils.cosmos import pack_missed_blocks, pack_slashed
 from src.utils.data import transformed_data_processing_helper
 from src.utils.exceptions import (MessageWasNotDeliveredException,
                                   NodeIsDownException)
@@ -75,7 +77,7 @@ class CosmosNodeStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        node_data = json.loads(body)
+        node_data = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.", node_data)
 
         processing_error = False
@@ -89,20 +91,15 @@ class CosmosNodeStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
-        # Send a heartbeat only if there were no errors
-        if not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                self.logger.exception(e)
-            except Exception as e:
-                # For any other exception raise it.
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent if there were no errors.
+        try:
+            self._send_heartbeat_if_due(processing_error)
+        except MessageWasNotDeliveredException as e:
+            self.logger.exception(e)
+        except Exception as e:
+            # For any other exception raise it.
+            raise e
 
     def _process_redis_store(self, data: Dict) -> None:
         configuration = {
@@ -263,10 +260,9 @@ class CosmosNodeStore(Store):
                 Keys.get_cosmos_node_is_peered(node_id):
                     "" if ('is_peered_with_sentinel' not in metrics) else str(metrics['is_peered_with_sentinel']),
                 Keys.get_cosmos_node_slashed(node_id):
-                    json.dumps(metrics['slashed']),
-                Keys.get_cosmos_node_missed_blocks(
-                    node_id):
-                    json.dumps(metrics['missed_blocks']),
+                    pack_slashed(metrics['slashed']),
+                Keys.get_cosmos_node_missed_blocks(node_id):
+                    pack_missed_blocks(metrics['missed_blocks']),
                 Keys.get_cosmos_node_last_monitored_cometbft_rpc(node_id):
                     str(meta_data['last_monitored']),
             })
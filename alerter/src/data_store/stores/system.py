@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime
 from typing import Dict
@@ -8,11 +7,14 @@ import pika.exceptions
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.store import Store
+from src.data_transformers.plans import SYSTEM_PLAN
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
 from src.utils.constants.rabbitmq import (STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                           SYSTEM_STORE_INPUT_QUEUE_NAME, TOPIC,
                                           SYSTEM_TRANSFORMED_DATA_ROUTING_KEY)
+from src.utils.deltas import LatestMetrics, is_delta
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   SystemIsDownException,
                                   MessageWasNotDeliveredException)
@@ -26,6 +28,10 @@ class SystemStore(Store):
                                db_name=self.mongo_db, host=REPLICA_SET_HOSTS,
                                replicaSet=REPLICA_SET_NAME)
 
+        # The latest metrics of each system, from which the full metrics are
+        # obtained when deltas are received
+        self._latest_metrics = LatestMetrics()
+
     def _initialise_rabbitmq(self) -> None:
         """
         Initialise the necessary data for rabbitmq to be able to reach the data
@@ -76,7 +82,7 @@ class SystemStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        system_data = json.loads(body)
+        system_data = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.", system_data)
 
         processing_error = False
@@ -97,20 +103,15 @@ class SystemStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
-        # Send a heartbeat only if there were no errors
-        if not processing_error:
-            try:
-                heartbeat = {
-                    'component_name': self.name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
-            except MessageWasNotDeliveredException as e:
-                self.logger.exception(e)
-            except Exception as e:
-                # For any other exception raise it.
-                raise e
+        # Count the message and send a heartbeat if one is due. Heartbeats
+        # are only sent if there were no errors.
+        try:
+            self._send_heartbeat_if_due(processing_error)
+        except MessageWasNotDeliveredException as e:
+            self.logger.exception(e)
+        except Exception as e:
+            # For any other exception raise it.
+            raise e
 
     def _process_redis_store(self, data: Dict) -> None:
         if 'result' in data:
@@ -122,69 +123,24 @@ class SystemStore(Store):
                 "{}: _process_redis_store".format(self))
 
     def _process_redis_result_store(self, data: Dict) -> None:
+        """
+        Saves the received metrics of a system in its parent hash. If the
+        metrics are a delta, only the metrics which changed are written, apart
+        from the time the system was last monitored.
+        """
         meta_data = data['meta_data']
         system_name = meta_data['system_name']
         system_id = meta_data['system_id']
         parent_id = meta_data['system_parent_id']
         metrics = data['data']
 
-        self.logger.debug(
-            'Saving %s state: _process_cpu_seconds_total=%s, '
-            '_process_memory_usage=%s, _virtual_memory_usage=%s, '
-            '_open_file_descriptors=%s, _system_cpu_usage=%s, '
-            '_system_ram_usage=%s, _system_storage_usage=%s, '
-            '_network_transmit_bytes_per_second=%s, '
-            '_network_receive_bytes_per_second=%s, '
-            '_network_receive_bytes_total=%s, '
-            '_network_transmit_bytes_total=%s, '
-            '_disk_io_time_seconds_total=%s, '
-            '_disk_io_time_seconds_in_interval=%s, _went_down_at=%s, '
-            '_last_monitored=%s', system_name,
-            metrics['process_cpu_seconds_total'],
-            metrics['process_memory_usage'], metrics['virtual_memory_usage'],
-            metrics['open_file_descriptors'], metrics['system_cpu_usage'],
-            metrics['system_ram_usage'], metrics['system_storage_usage'],
-            metrics['network_transmit_bytes_per_second'],
-            metrics['network_receive_bytes_per_second'],
-            metrics['network_receive_bytes_total'],
-            metrics['network_transmit_bytes_total'],
-            metrics['disk_io_time_seconds_total'],
-            metrics['disk_io_time_seconds_in_interval'],
-            metrics['went_down_at'], meta_data['last_monitored']
-        )
+        self.logger.debug("Saving %s state: %s, _last_monitored=%s",
+                          system_name, metrics, meta_data['last_monitored'])
 
-        self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-            Keys.get_system_process_cpu_seconds_total(system_id):
-                str(metrics['process_cpu_seconds_total']),
-            Keys.get_system_process_memory_usage(system_id):
-                str(metrics['process_memory_usage']),
-            Keys.get_system_virtual_memory_usage(system_id):
-                str(metrics['virtual_memory_usage']),
-            Keys.get_system_open_file_descriptors(system_id):
-                str(metrics['open_file_descriptors']),
-            Keys.get_system_system_cpu_usage(system_id):
-                str(metrics['system_cpu_usage']),
-            Keys.get_system_system_ram_usage(system_id):
-                str(metrics['system_ram_usage']),
-            Keys.get_system_system_storage_usage(system_id):
-                str(metrics['system_storage_usage']),
-            Keys.get_system_network_transmit_bytes_per_second(system_id):
-                str(metrics['network_transmit_bytes_per_second']),
-            Keys.get_system_network_receive_bytes_per_second(system_id):
-                str(metrics['network_receive_bytes_per_second']),
-            Keys.get_system_network_receive_bytes_total(system_id):
-                str(metrics['network_receive_bytes_total']),
-            Keys.get_system_network_transmit_bytes_total(system_id):
-                str(metrics['network_transmit_bytes_total']),
-            Keys.get_system_disk_io_time_seconds_total(system_id):
-                str(metrics['disk_io_time_seconds_total']),
-            Keys.get_system_disk_io_time_seconds_in_interval(system_id):
-                str(metrics['disk_io_time_seconds_in_interval']),
-            Keys.get_system_went_down_at(system_id):
-                str(metrics['went_down_at']),
-            Keys.get_system_last_monitored(system_id):
-                str(meta_data['last_monitored']),
-        })
+        fields = SYSTEM_PLAN.get_saving_fields(system_id, metrics)
+        fields[Keys.get_system_last_monitored(system_id)] = str(
+            meta_data['last_monitored'])
+        self.redis.hset_multiple(Keys.get_hash_parent(parent_id), fields)
 
     def _process_redis_error_store(self, data: Dict) -> None:
         meta_data = data['meta_data']
@@ -238,7 +194,17 @@ class SystemStore(Store):
         meta_data = data['meta_data']
         system_id = meta_data['system_id']
         parent_id = meta_data['system_parent_id']
-        metrics = data['data']
+        metrics = self._latest_metrics.merge(system_id, data['data'],
+                                             is_delta(meta_data))
+        if metrics is None:
+            # The metrics which did not change are not known until a full
+            # snapshot of the system is received, and Mongo keeps a record of
+            # all the metrics of each round
+            self.logger.debug("Not saving the metrics of %s in Mongo until "
+                              "a full snapshot is received.",
+                              meta_data['system_name'])
+            return
+
         time_now = datetime.now()
         self.mongo.update_one(
             parent_id,
@@ -0,0 +1,91 @@
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from src.utils.constants.rabbitmq import (
+    SYSTEM_RAW_DATA_ROUTING_KEY, EVM_NODE_RAW_DATA_ROUTING_KEY,
+    CHAINLINK_NODE_RAW_DATA_ROUTING_KEY, COSMOS_NODE_RAW_DATA_ROUTING_KEY)
+
+# The maximum number of raw data messages which are coalesced together
+MAX_COALESCING_BATCH_SIZE = 500
+
+# The sources of raw data which are metric snapshots, per raw data routing
+# key. A snapshot only matters until a newer one of the same monitorable and
+# sources is received. The empty source stands for messages which are not
+# split per source. Sources which carry events, such as historical blocks,
+# governance proposals or releases, must never be listed here.
+SNAPSHOT_SOURCES: Dict[str, FrozenSet[str]] = {
+    SYSTEM_RAW_DATA_ROUTING_KEY: frozenset(['']),
+    EVM_NODE_RAW_DATA_ROUTING_KEY: frozenset(['']),
+    CHAINLINK_NODE_RAW_DATA_ROUTING_KEY: frozenset(['prometheus']),
+    COSMOS_NODE_RAW_DATA_ROUTING_KEY: frozenset(['prometheus', 'cosmos_rest']),
+}
+
+# The meta_data fields which identify the monitorable of a snapshot
+_MONITORABLE_ID_FIELDS = ['system_id', 'node_id']
+
+CoalescingKey = Tuple[str, str, FrozenSet[str]]
+
+
+def _get_monitorable_id(response: Dict) -> str:
+    meta_data = response['meta_data']
+    for field in _MONITORABLE_ID_FIELDS:
+        if field in meta_data:
+            return meta_data[field]
+    raise KeyError('meta_data')
+
+
+def get_coalescing_key(routing_key: str,
+                       raw_data: Any) -> Optional[CoalescingKey]:
+    """
+    Given a raw data message, this function returns the key shared by the
+    messages which it supersedes.
+    :param routing_key: The routing key the message was published with
+    :param raw_data: The decoded message
+    :return: The routing key, the monitorable id and the sources of the
+           : message if it only contains metric snapshots
+           : None if the message must not be coalesced, for example if it
+           : contains an error
+    """
+    snapshot_sources = SNAPSHOT_SOURCES.get(routing_key)
+    if not snapshot_sources or not isinstance(raw_data, dict):
+        return None
+
+    if 'result' in raw_data or 'error' in raw_data:
+        sources = {'': raw_data}
+    else:
+        sources = {source: data for source, data in raw_data.items() if data}
+    if not sources or not snapshot_sources.issuperset(sources):
+        return None
+
+    # Errors are never coalesced, because whether a monitorable went down and
+    # came back up within a batch matters to the alerters
+    if any(not isinstance(data, dict) or 'error' in data
+           for data in sources.values()):
+        return None
+
+    try:
+        monitorable_ids = {
+            _get_monitorable_id(data['result'])
+            for data in sources.values()
+        }
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+    if len(monitorable_ids) != 1:
+        return None
+
+    return routing_key, monitorable_ids.pop(), frozenset(sources)
+
+
+def find_superseded(keys: List[Optional[CoalescingKey]]) -> List[bool]:
+    """
+    Given the coalescing keys of a batch of messages in the order they were
+    received, this function finds the messages which are superseded by a
+    newer message of the batch.
+    :param keys: The coalescing keys of the messages, None for messages which
+               : must not be coalesced
+    :return: For each message, whether it is superseded
+    """
+    newest_index = {key: index for index, key in enumerate(keys)
+                    if key is not None}
+    return [key is not None and newest_index[key] != index
+            for index, key in enumerate(keys)]
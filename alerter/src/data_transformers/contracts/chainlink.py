@@ -1,23 +1,24 @@
-import copy
 import json
 import logging
-from datetime import datetime
-from typing import Union, Type, Dict, Tuple
+from typing import Union, Type, Dict, Tuple, List, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import Keys
+from src.data_store.redis import Keys, RedisHashFields
 from src.data_store.redis.redis_api import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.contracts.chainlink.v3 import V3ChainlinkContract
 from src.monitorables.contracts.chainlink.v4 import V4ChainlinkContract
+from src.monitorables.slots import get_slot_values
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, STORE_EXCHANGE, RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     TOPIC, CL_CONTRACTS_DT_INPUT_QUEUE_NAME,
     CHAINLINK_CONTRACTS_RAW_DATA_ROUTING_KEY,
     CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY)
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   MessageWasNotDeliveredException)
 from src.utils.types import convert_to_int, convert_to_float, ChainlinkContract
@@ -52,12 +53,11 @@ class ChainlinkContractsDataTransformer(DataTransformer):
                                  RAW_DATA_EXCHANGE,
                                  CHAINLINK_CONTRACTS_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(CL_CONTRACTS_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self._consume_with_prefetch(CL_CONTRACTS_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -72,17 +72,32 @@ class ChainlinkContractsDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
+    @staticmethod
+    def _get_state_keys(cl_contract: ChainlinkContract) -> List[str]:
+        """
+        :param cl_contract: The Chainlink contract in question
+        :return: The redis keys of all the metrics making up the contract's
+               : state
+        """
+        metric_attributes = (cl_contract.get_int_metric_attributes()
+                             + cl_contract.get_float_metric_attributes()
+                             + cl_contract.get_list_metric_attributes())
+        return [getattr(Keys, 'get_cl_contract' + attribute)(
+            cl_contract.node_id, cl_contract.proxy_address)
+            for attribute in metric_attributes]
+
     def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           cl_contract: ChainlinkContract) -> None:
+                           cl_contract: ChainlinkContract,
+                           state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a Chainlink contract's number metrics
         from redis. If the data from Redis cannot be obtained, the state won't
         be updated.
         :param state_type: What type of number metrics we want to obtain
         :param cl_contract: The Chainlink contract in question
+        :param state_fields: The contract's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_contract.parent_id)
         node_id = cl_contract.node_id
         proxy_address = cl_contract.proxy_address
         if state_type == int:
@@ -102,21 +117,22 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             redis_key = eval('Keys.get_cl_contract' + attribute +
                              '(node_id, proxy_address)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             processed_redis_value = 'None' if redis_value is None \
                 else redis_value.decode("utf-8")
             new_value = convert_fn(processed_redis_value, None)
             eval("cl_contract.set" + attribute + '(new_value)')
 
-    def _load_list_state(self, cl_contract: ChainlinkContract) -> None:
+    def _load_list_state(self, cl_contract: ChainlinkContract,
+                         state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a Chainlink contract's list metrics
         from redis. If the data from Redis cannot be obtained, the state won't
         be updated.
         :param cl_contract: The Chainlink contract in question
+        :param state_fields: The contract's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_contract.parent_id)
         node_id = cl_contract.node_id
         proxy_address = cl_contract.proxy_address
         metric_attributes = cl_contract.get_list_metric_attributes()
@@ -126,11 +142,15 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             redis_key = eval('Keys.get_cl_contract' + attribute +
                              '(node_id, proxy_address)')
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             new_value = [] if redis_value is None else json.loads(
                 redis_value.decode("utf-8"))
             eval("cl_contract.set" + attribute + '(new_value)')
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_cl_contract_fields_pattern()
+
     def load_state(self, cl_contract: ChainlinkContract) -> ChainlinkContract:
         """
         This function attempts to load the state of a Chainlink contract from
@@ -142,13 +162,16 @@ class ChainlinkContractsDataTransformer(DataTransformer):
         """
         self.logger.debug("Loading the state of %s from Redis", cl_contract)
 
-        self._load_number_state(int, cl_contract)
-        self._load_number_state(float, cl_contract)
-        self._load_list_state(cl_contract)
+        state_fields = self._read_state_fields(
+            Keys.get_hash_parent(cl_contract.parent_id),
+            self._get_state_keys(cl_contract))
+        self._load_number_state(int, cl_contract, state_fields)
+        self._load_number_state(float, cl_contract, state_fields)
+        self._load_list_state(cl_contract, state_fields)
 
         loaded_metrics_list = [
             '{}={}'.format(key, val)
-            for key, val in cl_contract.__dict__.items()
+            for key, val in get_slot_values(cl_contract).items()
         ]
         loaded_metrics_str = ', '.join(loaded_metrics_list)
 
@@ -207,7 +230,7 @@ class ChainlinkContractsDataTransformer(DataTransformer):
         self.logger.debug("Performing further processing for storage ...")
 
         if 'result' in transformed_data or 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
@@ -225,7 +248,7 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             td_metrics = transformed_data['result']['data']
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -265,7 +288,7 @@ class ChainlinkContractsDataTransformer(DataTransformer):
                 processed_data_metrics[proxy_address]['answeredInRound'][
                     'previous'] = cl_contract.answered_in_round
                 processed_data_metrics[proxy_address]['historicalRounds'][
-                    'previous'] = copy.deepcopy(cl_contract.historical_rounds)
+                    'previous'] = cl_contract.historical_rounds
                 processed_data_metrics[proxy_address]['lastRoundObserved'][
                     'previous'] = cl_contract.last_round_observed
 
@@ -277,7 +300,7 @@ class ChainlinkContractsDataTransformer(DataTransformer):
                     processed_data_metrics[proxy_address]['owedPayment'][
                         'previous'] = cl_contract.owed_payment
         elif 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_alerting".format(self))
@@ -291,7 +314,8 @@ class ChainlinkContractsDataTransformer(DataTransformer):
 
         if 'result' in data:
             meta_data = data['result']['meta_data']
-            transformed_data = copy.deepcopy(data)
+            transformed_data = dict_copy_paths(
+                data, ('result', 'meta_data'), ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             td_metrics = transformed_data['result']['data']
 
@@ -301,23 +325,26 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             td_meta_data['last_monitored'] = meta_data['time']
 
             # Calculate the deviation of the node's answer from the consensus
-            # answer for each contract
+            # answer for each contract. The contract data and the rounds are
+            # copied rather than modified, as they belong to the raw data.
             for proxy_address, contract_data in td_metrics.items():
-                historical_rounds = contract_data['historicalRounds']
                 temp_rounds = []
-                for i in range(len(historical_rounds)):
-                    temp_rounds.append(historical_rounds[i])
-                    node_submission = historical_rounds[i]['nodeSubmission']
-                    round_answer = historical_rounds[i]['roundAnswer']
+                for historical_round in contract_data['historicalRounds']:
+                    node_submission = historical_round['nodeSubmission']
+                    round_answer = historical_round['roundAnswer']
                     if None in [node_submission, round_answer]:
-                        temp_rounds[i]['deviation'] = None
+                        deviation = None
                     else:
-                        temp_rounds[i]['deviation'] = convert_to_float(abs(
+                        deviation = convert_to_float(abs(
                             ((round_answer - node_submission) /
                              round_answer) * 100), None)
-                td_metrics[proxy_address]['historicalRounds'] = temp_rounds
+                    temp_rounds.append(
+                        dict(historical_round, deviation=deviation))
+                td_metrics[proxy_address] = dict(
+                    contract_data, historicalRounds=temp_rounds)
         elif 'error' in data:
-            transformed_data = copy.deepcopy(data)
+            # Errors are not transformed
+            transformed_data = data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _transform_data".format(self))
@@ -359,8 +386,8 @@ class ChainlinkContractsDataTransformer(DataTransformer):
         """
         state_created = False
         if node_id in self.state and proxy_address in self.state[node_id]:
-            old_cl_contract: ChainlinkContract = copy.deepcopy(
-                self.state[node_id][proxy_address])
+            old_cl_contract: ChainlinkContract = self.state[node_id][
+                proxy_address]
             if version != old_cl_contract.version:
                 if version == 3:
                     self.state[node_id][proxy_address] = V3ChainlinkContract(
@@ -387,8 +414,10 @@ class ChainlinkContractsDataTransformer(DataTransformer):
 
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
-            properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+            properties: pika.spec.BasicProperties, body: bytes,
+            raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -428,7 +457,7 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -455,13 +484,7 @@ class ChainlinkContractsDataTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
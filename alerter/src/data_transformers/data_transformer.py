@@ -1,22 +1,53 @@
 import logging
 import sys
 from abc import abstractmethod
+from datetime import datetime, timedelta
 from types import FrameType
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 
 from src.abstract.publisher_subscriber import (
     QueuingPublisherSubscriberComponent)
+from src.data_store.redis.hash_fields import RedisHashFields
 from src.data_store.redis.redis_api import RedisApi
+from src.data_store.redis.store_keys import Keys
+from src.data_transformers.coalescing import (
+    MAX_COALESCING_BATCH_SIZE, find_superseded, get_coalescing_key)
+from src.data_transformers.workers import TransformationWorkerPool
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.utils import env
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.snapshot import create_state_snapshotter
+from src.utils.timing import StageTimings, TimedTaskLimiter
 from src.utils.types import Monitorable
 
+# The warmed up state of monitorables which were not seen for this long after
+# the warm-up is discarded, as they are most likely no longer monitored
+_STATE_WARM_UP_LIFETIME = timedelta(minutes=10)
+
+# The stages of processing raw data which are timed if stage timings are
+# enabled, and the functions which perform them. The processing for alerting
+# and saving is done during the transformation, so the time of the transform
+# stage includes theirs. Transformers which transform coalesced batches
+# together time the transformation of every batch as a stage of its own.
+_TIMED_STAGES = [
+    ('decode', '_decode_raw_data'),
+    ('load_state', 'load_state'),
+    ('transform', '_transform_data'),
+    ('transform_batch', '_transform_data_batch'),
+    ('process_for_alerting', '_process_transformed_data_for_alerting'),
+    ('process_for_saving', '_process_transformed_data_for_saving'),
+    ('update_state', '_update_state'),
+    ('ack', '_ack_raw_data'),
+    ('send', '_send_data'),
+]
+
 
 class DataTransformer(QueuingPublisherSubscriberComponent):
     def __init__(self, transformer_name: str, logger: logging.Logger,
@@ -26,7 +57,54 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
         self._redis = redis
         self._state = {}
 
-        super().__init__(logger, rabbitmq, max_queue_size)
+        # The state fields read in bulk from the parent hashes when the
+        # transformer starts, from which the state of each monitorable is
+        # loaded the first time it is seen, instead of reading Redis once per
+        # monitorable.
+        self._state_warm_up: Dict[str, Dict[str, bytes]] = {}
+        self._state_warm_up_expiry: Optional[datetime] = None
+
+        # If enabled, raw data which was received together is coalesced, so
+        # that a metric snapshot is not transformed when a newer snapshot of
+        # the same monitorable is already waiting to be processed.
+        self._coalesce_raw_data = env.RAW_DATA_COALESCING
+        self._pending_raw_data: List[Tuple] = []
+
+        # If a number of workers is configured, raw data which was received
+        # together is decoded by a pool of worker processes when the
+        # transformer starts, and transformers which support it also
+        # transform the data of different monitorables in the workers.
+        self._workers = env.TRANSFORMER_WORKERS
+        self._worker_pool: Optional[TransformationWorkerPool] = None
+
+        # If enabled, transformers which support deltas only send the metrics
+        # which changed since the previous round, apart from a full snapshot
+        # of each monitorable every interval. The time of the latest full
+        # snapshot of each monitorable is kept here.
+        self._send_deltas = env.TRANSFORMED_DATA_DELTAS
+        self._full_snapshot_times: Dict[str, float] = {}
+
+        # If a snapshot directory is configured, the state is saved locally
+        # so that it can be restored quickly when the transformer restarts.
+        self._snapshotter = create_state_snapshotter(transformer_name)
+
+        # Whether the time data was processed after the latest snapshot was
+        # recorded in Redis. It is recorded once after every snapshot, so that
+        # a snapshot is only restored if no data was processed after it.
+        self._recorded_processing_after_snapshot = False
+
+        super().__init__(logger, rabbitmq, max_queue_size, transformer_name)
+
+        # If enabled, the time taken by every stage of processing a sample of
+        # the raw data is recorded, and a summary is logged every interval.
+        self._stage_timings = None
+        self._stage_timings_limiter = TimedTaskLimiter(timedelta(
+            seconds=env.TRANSFORMER_STAGE_TIMINGS_LOG_INTERVAL_SECONDS))
+        if env.TRANSFORMER_STAGE_TIMINGS:
+            self._stage_timings = StageTimings(
+                env.TRANSFORMER_STAGE_TIMINGS_SAMPLE_EVERY)
+            self._stage_timings_limiter.did_task()
+            self._time_stages()
 
     def __str__(self) -> str:
         return self.transformer_name
@@ -43,10 +121,237 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
     def state(self) -> Dict:
         return self._state
 
+    @property
+    def coalesce_raw_data(self) -> bool:
+        return self._coalesce_raw_data
+
+    @property
+    def send_deltas(self) -> bool:
+        return self._send_deltas
+
+    @property
+    def stage_timings(self) -> Optional[StageTimings]:
+        return self._stage_timings
+
+    @property
+    def worker_pool(self) -> Optional[TransformationWorkerPool]:
+        return self._worker_pool
+
+    @classmethod
+    def create_worker_replica(cls, transformer_name: str) -> 'DataTransformer':
+        """
+        Creates a replica of a transformer of this type for the worker
+        processes. A replica has no connections, and only holds what is needed
+        to transform data and update the state of monitorables. It always
+        transforms data into full snapshots, since deltas are decided by the
+        transformer itself.
+        :param transformer_name: The name of the transformer
+        :return: The replica
+        """
+        replica = cls.__new__(cls)
+        replica._transformer_name = transformer_name
+        replica._logger = logging.getLogger(__name__)
+        replica._state = {}
+        replica._send_deltas = False
+        replica._full_snapshot_times = {}
+        replica._stage_timings = None
+        return replica
+
+    @property
+    @abstractmethod
+    def state_fields_pattern(self) -> str:
+        """
+        :return: The pattern matching the fields of the parent hashes which
+               : hold the state of this transformer's monitorables
+        """
+        pass
+
     @abstractmethod
     def load_state(self, monitorable: Monitorable) -> Monitorable:
         pass
 
+    def _restore_state_snapshot(self) -> bool:
+        """
+        This function restores the state from the latest snapshot, provided
+        that the transformer did not process data after the snapshot was
+        taken, as recorded in Redis. Otherwise, Redis holds newer state.
+        :return: True if the state was restored, False otherwise
+        """
+        if self._snapshotter is None:
+            return False
+
+        try:
+            snapshot = self._snapshotter.load(
+                timedelta(seconds=env.STATE_SNAPSHOT_MAX_AGE_SECONDS))
+        except Exception as e:
+            self.logger.error("Could not load the state snapshot of %s.", self)
+            self.logger.exception(e)
+            return False
+
+        if snapshot is None:
+            return False
+
+        timestamp, state = snapshot
+        last_processed = self.redis.get(
+            Keys.get_component_last_processed(self.transformer_name))
+        if last_processed is not None and float(last_processed) > timestamp:
+            self.logger.info("Ignoring the state snapshot of %s as Redis "
+                             "holds newer state.", self)
+            return False
+
+        self._state = state
+        self.logger.info("Restored the state of %s monitorable(s) from the "
+                         "state snapshot of %s", len(self._state), self)
+        return True
+
+    def _record_processing_after_snapshot(self) -> None:
+        if self._recorded_processing_after_snapshot:
+            return
+
+        self.redis.set(
+            Keys.get_component_last_processed(self.transformer_name),
+            datetime.now().timestamp())
+        self._recorded_processing_after_snapshot = True
+
+    def _save_state_snapshot(self) -> None:
+        try:
+            self._snapshotter.save(self.state)
+            self._recorded_processing_after_snapshot = False
+        except Exception as e:
+            self.logger.error("Could not save the state snapshot of %s.", self)
+            self.logger.exception(e)
+
+    def _send_heartbeat_if_due(self, processing_error: bool) -> None:
+        """
+        Apart from sending heartbeats, the state is saved to a snapshot and the
+        stage timings are logged after processing a message if their interval
+        has elapsed. If snapshots are enabled, processing the first message
+        after a snapshot is recorded in Redis.
+        :param processing_error: Whether the message could not be processed
+        :return: None
+        """
+        super()._send_heartbeat_if_due(processing_error)
+        if self._snapshotter is not None:
+            self._record_processing_after_snapshot()
+            if self._snapshotter.snapshot_due():
+                self._save_state_snapshot()
+        self._discard_expired_state_warm_up()
+        self._log_stage_timings_if_due()
+
+    def _time_stages(self) -> None:
+        """
+        This function replaces the functions performing the timed stages of
+        this transformer by wrappers which time them. Only the functions of
+        this transformer are wrapped, not those of its RabbitMQ API.
+        :return: None
+        """
+        for stage, function_name in _TIMED_STAGES:
+            function = getattr(self, function_name, None)
+            if function is not None:
+                setattr(self, function_name,
+                        self._stage_timings.timed(stage, function))
+
+    def _log_stage_timings_if_due(self) -> None:
+        if self._stage_timings is None or \
+                not self._stage_timings_limiter.can_do_task():
+            return
+
+        timings = self._stage_timings
+        self.logger.info("Stage timings of %s over %s message(s), of which %s "
+                         "were sampled:", self, timings.messages,
+                         timings.sampled_messages)
+        for stage, stats in timings.summary().items():
+            self.logger.info(
+                "%s: count=%s, total=%.3fs, mean=%.1fus, p50<=%.0fus, "
+                "p99<=%.0fus", stage, stats['count'], stats['total'],
+                stats['mean'] * 1e6, stats['p50'] * 1e6, stats['p99'] * 1e6)
+        timings.reset()
+        self._stage_timings_limiter.did_task()
+
+    def _warm_up_state(self) -> None:
+        """
+        This function reads the state fields of this transformer's
+        monitorables from the parent hashes in Redis in bulk, so that the
+        state of the monitorables known to Redis does not have to be read
+        lazily once per monitorable. The keys and fields are iterated with
+        SCAN and HSCAN so that Redis is not blocked, and only the fields
+        matching state_fields_pattern are kept.
+        :return: None
+        """
+        parent_hashes = self.redis.scan_keys(
+            Keys.get_hash_parent_raw() + '*')
+        for parent_hash in parent_hashes:
+            state_fields = self.redis.hscan(parent_hash,
+                                            self.state_fields_pattern)
+            if state_fields:
+                self._state_warm_up[parent_hash] = state_fields
+        self._state_warm_up_expiry = datetime.now() + _STATE_WARM_UP_LIFETIME
+
+        self.logger.info("Read %s state field(s) from %s parent hash(es) in "
+                         "Redis to warm up the state of %s",
+                         sum(map(len, self._state_warm_up.values())),
+                         len(self._state_warm_up), self)
+
+    def _discard_expired_state_warm_up(self) -> None:
+        if self._state_warm_up_expiry is None \
+                or datetime.now() < self._state_warm_up_expiry:
+            return
+
+        if self._state_warm_up:
+            self.logger.info("Discarding the warmed up state of %s parent "
+                             "hash(es) which was not used by %s",
+                             len(self._state_warm_up), self)
+        self._state_warm_up = {}
+        self._state_warm_up_expiry = None
+
+    def _read_state_fields(self, redis_hash: str,
+                           redis_keys: List[str]) -> RedisHashFields:
+        """
+        This function reads the fields which make up the state of a
+        monitorable in a single round trip. If all the fields were read during
+        the warm-up they are taken from memory instead. The monitorable's
+        fields are then discarded from the warm-up, as from now on the state
+        is kept in memory.
+        :param redis_hash: The parent hash of the monitorable
+        :param redis_keys: The fields of the monitorable's state
+        :return: The values of the fields
+        """
+        self._discard_expired_state_warm_up()
+        warm_up = self._state_warm_up.get(redis_hash, {})
+        warmed_up_fields = {key: warm_up.pop(key) for key in redis_keys
+                            if key in warm_up}
+        if not warm_up:
+            self._state_warm_up.pop(redis_hash, None)
+        if redis_keys and len(warmed_up_fields) == len(redis_keys):
+            return RedisHashFields(warmed_up_fields)
+
+        return RedisHashFields(dict(zip(
+            redis_keys, self.redis.hmget(redis_hash, redis_keys))))
+
+    def _full_snapshot_due(self, monitorable_id: str,
+                           monitoring_time: float) -> bool:
+        """
+        This function decides whether the full metrics of a monitorable must
+        be sent rather than a delta. A full snapshot is due if deltas are
+        disabled, if no full snapshot of the monitorable was sent since the
+        transformer started, or if the full snapshot interval has elapsed. If
+        so, the full snapshot is assumed to be sent at the given time.
+        :param monitorable_id: The id of the monitorable
+        :param monitoring_time: The time the metrics were monitored
+        :return: True if a full snapshot is due, False otherwise
+        """
+        if not self.send_deltas:
+            return True
+
+        last_full_snapshot = self._full_snapshot_times.get(monitorable_id)
+        if last_full_snapshot is not None and \
+                monitoring_time - last_full_snapshot < \
+                env.TRANSFORMED_DATA_FULL_SNAPSHOT_INTERVAL_SECONDS:
+            return False
+
+        self._full_snapshot_times[monitorable_id] = monitoring_time
+        return True
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -75,19 +380,140 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
     @abstractmethod
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
-            properties: pika.spec.BasicProperties, body: bytes) -> None:
+            properties: pika.spec.BasicProperties, body: bytes,
+            raw_data: Optional[Dict] = None) -> None:
+        """
+        Transforms a raw data message and sends the result to the alerters
+        and to the store.
+        :param raw_data: The message already decoded from the body, if any,
+        otherwise the body is decoded
+        :return: None
+        """
         pass
 
+    def _receive_raw_data(
+            self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
+            properties: pika.spec.BasicProperties, body: bytes) -> None:
+        """
+        The consuming callback of the data transformers. Without coalescing
+        or workers, every message is processed as soon as it is received.
+        Otherwise, messages are held until the messages prefetched from
+        RabbitMQ are all received, and are then processed together. Only the
+        processing of each message is measured for prefetch tuning, not the
+        holding.
+        """
+        if self._stage_timings is not None:
+            self._stage_timings.message_received()
+
+        if not self.coalesce_raw_data and self._worker_pool is None:
+            args = (ch, method, properties, body)
+            if self._stage_timings is not None:
+                # The message is decoded before it is processed so that
+                # decoding is timed as a stage of its own
+                try:
+                    args += (self._decode_raw_data(body, properties),)
+                except Exception:
+                    # Messages which cannot be decoded are left to
+                    # _process_raw_data, which reports the error
+                    pass
+            self._measure_processing(self._process_raw_data, *args)
+            return
+
+        self._pending_raw_data.append((ch, method, properties, body))
+        if ch.get_waiting_message_count() == 0 or len(
+                self._pending_raw_data) >= MAX_COALESCING_BATCH_SIZE:
+            self._process_pending_raw_data()
+
+    def _ack_raw_data(self, method: pika.spec.Basic.Deliver) -> None:
+        self.rabbitmq.basic_ack(method.delivery_tag, False)
+
+    def _decode_raw_data(self, body: bytes,
+                         properties: pika.spec.BasicProperties) -> Dict:
+        return decode_message(body, properties)
+
+    def _process_pending_raw_data(self) -> None:
+        batch = self._pending_raw_data
+        self._pending_raw_data = []
+
+        decoded = None
+        if self._worker_pool is not None:
+            try:
+                decoded = self._worker_pool.decode(
+                    [(body, properties) for _, _, properties, body in batch])
+            except Exception as e:
+                self.logger.error("Could not decode %s messages in the "
+                                  "workers, decoding them here.", len(batch))
+                self.logger.exception(e)
+        if decoded is None:
+            decoded = []
+            for _, _, properties, body in batch:
+                try:
+                    decoded.append(self._decode_raw_data(body, properties))
+                except Exception:
+                    # Messages which cannot be decoded are left to
+                    # _process_raw_data, which reports the error
+                    decoded.append(None)
+
+        if self.coalesce_raw_data:
+            keys = [None if raw_data is None
+                    else get_coalescing_key(method.routing_key, raw_data)
+                    for (_, method, _, _), raw_data in zip(batch, decoded)]
+        else:
+            keys = [None] * len(batch)
+        superseded = find_superseded(keys)
+        remaining = []
+        for (ch, method, properties, body), raw_data, is_superseded in zip(
+                batch, decoded, superseded):
+            if is_superseded:
+                # A newer snapshot of the same monitorable will be processed,
+                # therefore this one can be discarded
+                self._ack_raw_data(method)
+            else:
+                remaining.append((ch, method, properties, body, raw_data))
+
+        if any(superseded):
+            self.logger.debug("Discarded %s superseded raw data messages out "
+                              "of %s.", sum(superseded), len(batch))
+
+        self._process_raw_data_batch(remaining)
+
+    def _process_raw_data_batch(self, batch: List[Tuple]) -> None:
+        """
+        Processes the messages which remain of a held batch. If coalescing is
+        enabled, the superseded snapshots were discarded, therefore the batch
+        holds at most one snapshot of each monitorable. By default, every
+        message is processed on its own. Transformers which can transform
+        snapshots together, or in the workers, override this function.
+        :param batch: The channel, method, properties, body and decoded
+        payload of each message, in delivery order. The payload is None if the
+        message could not be decoded.
+        :return: None
+        """
+        for ch, method, properties, body, raw_data in batch:
+            # The message is not decoded again
+            self._measure_processing(self._process_raw_data, ch, method,
+                                     properties, body, raw_data)
+
     def _send_heartbeat(self, data_to_send: dict) -> None:
-        self.rabbitmq.basic_publish_confirm(
+        self.rabbitmq.basic_publish_on_side_channel(
             exchange=HEALTH_CHECK_EXCHANGE,
             routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=data_to_send,
-            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
-            mandatory=True)
+            is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2))
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
     def start(self) -> None:
+        # The state is only restored when the transformer starts without any
+        # state in memory, and if it was restored from a snapshot there is no
+        # need to read it from Redis
+        if not self.state and not self._restore_state_snapshot():
+            self._warm_up_state()
+        if self._workers > 0 and self._worker_pool is None:
+            self.logger.info("Starting %s transformation workers.",
+                             self._workers)
+            self._worker_pool = TransformationWorkerPool(
+                type(self), self.transformer_name, self._workers)
         self._initialise_rabbitmq()
         while True:
             try:
@@ -115,6 +541,10 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
                       "closed, and afterwards the process will exit."
                       .format(self), self.logger)
+        if self._snapshotter is not None:
+            self._save_state_snapshot()
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
         self.disconnect_from_rabbit()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
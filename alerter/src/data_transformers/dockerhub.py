@@ -1,8 +1,6 @@
-import copy
 import json
 import logging
-from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,11 +9,13 @@ from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.repo import DockerHubRepo
 from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, STORE_EXCHANGE, ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     DOCKERHUB_DT_INPUT_QUEUE_NAME, DOCKERHUB_RAW_DATA_ROUTING_KEY,
     DOCKERHUB_TRANSFORMED_DATA_ROUTING_KEY, TOPIC)
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   MessageWasNotDeliveredException)
 from src.utils.types import convert_to_float
@@ -48,13 +48,11 @@ class DockerHubDataTransformer(DataTransformer):
                                  RAW_DATA_EXCHANGE,
                                  DOCKERHUB_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug('Declaring consuming intentions')
-        self.rabbitmq.basic_consume(DOCKERHUB_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data,
-                                    False, False, None)
+        self._consume_with_prefetch(DOCKERHUB_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -69,6 +67,10 @@ class DockerHubDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_dockerhub_fields_pattern()
+
     def load_state(self, repo: DockerHubRepo) -> DockerHubRepo:
         # Below, we will try and get the data stored in redis and store it
         # in the repo's state. If the data from Redis cannot be obtained, the
@@ -77,22 +79,25 @@ class DockerHubDataTransformer(DataTransformer):
         self.logger.debug("Loading the state of %s from Redis", repo)
         redis_hash = Keys.get_hash_parent(repo.parent_id)
         repo_id = repo.repo_id
+        state_fields = self._read_state_fields(redis_hash, [
+            Keys.get_dockerhub_last_tags(repo_id),
+            Keys.get_dockerhub_last_monitored(repo_id),
+        ])
 
         # Load tags from Redis
         state_tags = repo.tags
         default_state_tags = None if state_tags is None else bytes(json.dumps(
             state_tags), 'utf-8')
-        redis_tags = self.redis.hget(redis_hash,
-                                     Keys.get_dockerhub_last_tags(repo_id),
-                                     default_state_tags)
+        redis_tags = state_fields.get(Keys.get_dockerhub_last_tags(repo_id),
+                                      default_state_tags)
         tags = None if redis_tags is None else json.loads(
             redis_tags.decode('utf-8'))
         repo.set_tags(tags)
 
         # Load last_monitored from Redis
         state_last_monitored = repo.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_dockerhub_last_monitored(repo_id),
+        redis_last_monitored = state_fields.get(
+            Keys.get_dockerhub_last_monitored(repo_id),
             bytes(str(state_last_monitored), 'utf-8'))
         redis_last_monitored = 'None' if redis_last_monitored is None \
             else redis_last_monitored.decode("utf-8")
@@ -148,8 +153,10 @@ class DockerHubDataTransformer(DataTransformer):
                                              transformed_data: Dict) -> Dict:
         self.logger.debug("Performing further processing for storage ...")
 
+        # The data is stored as it was transformed, so it is shared rather
+        # than copied
         if 'result' in transformed_data or 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
@@ -170,7 +177,7 @@ class DockerHubDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -184,11 +191,10 @@ class DockerHubDataTransformer(DataTransformer):
                     processed_data_metrics['current'] = value
 
                     # Add the previous tags state
-                    processed_data_metrics['previous'] = (
-                        copy.deepcopy(repo.tags))
+                    processed_data_metrics['previous'] = repo.tags
 
         elif 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_alerting".format(self))
@@ -206,7 +212,7 @@ class DockerHubDataTransformer(DataTransformer):
 
             transformed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(meta_data),
+                    'meta_data': dict(meta_data),
                     'data': {},
                 }
             }
@@ -218,12 +224,12 @@ class DockerHubDataTransformer(DataTransformer):
             del td_meta_data['monitor_name']
             del td_meta_data['time']
             td_meta_data['last_monitored'] = meta_data['time']
-            td_metrics['tags'] = copy.deepcopy(repo_metrics)
+            td_metrics['tags'] = repo_metrics
 
         elif 'error' in data:
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
+            transformed_data = dict_copy_paths(data, ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
         else:
             raise ReceivedUnexpectedDataException(
@@ -250,8 +256,10 @@ class DockerHubDataTransformer(DataTransformer):
     def _process_raw_data(self, ch: BlockingChannel,
                           method: pika.spec.Basic.Deliver,
                           properties: pika.spec.BasicProperties,
-                          body: bytes) -> None:
-        raw_data = json.loads(body)
+                          body: bytes,
+                          raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -286,7 +294,7 @@ class DockerHubDataTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -312,13 +320,7 @@ class DockerHubDataTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
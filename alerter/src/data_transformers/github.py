@@ -1,8 +1,5 @@
-import copy
-import json
 import logging
-from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,6 +8,7 @@ from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.repo import GitHubRepo
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE, STORE_EXCHANGE,
                                           ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -18,6 +16,7 @@ from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE, STORE_EXCHANGE,
                                           GITHUB_RAW_DATA_ROUTING_KEY,
                                           GITHUB_TRANSFORMED_DATA_ROUTING_KEY,
                                           TOPIC)
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   MessageWasNotDeliveredException)
 from src.utils.types import convert_to_float, convert_to_int
@@ -50,13 +49,11 @@ class GitHubDataTransformer(DataTransformer):
         self.rabbitmq.queue_bind(GITHUB_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
                                  GITHUB_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug('Declaring consuming intentions')
-        self.rabbitmq.basic_consume(GITHUB_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data,
-                                    False, False, None)
+        self._consume_with_prefetch(GITHUB_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -71,6 +68,10 @@ class GitHubDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_github_fields_pattern()
+
     def load_state(self, repo: GitHubRepo) -> GitHubRepo:
         # Below, we will try and get the data stored in redis and store it
         # in the repo's state. If the data from Redis cannot be obtained, the
@@ -79,11 +80,15 @@ class GitHubDataTransformer(DataTransformer):
         self.logger.debug("Loading the state of %s from Redis", repo)
         redis_hash = Keys.get_hash_parent(repo.parent_id)
         repo_id = repo.repo_id
+        state_fields = self._read_state_fields(redis_hash, [
+            Keys.get_github_no_of_releases(repo_id),
+            Keys.get_github_last_monitored(repo_id),
+        ])
 
         # Load no_of_releases from Redis
         state_no_of_releases = repo.no_of_releases
-        redis_no_of_releases = self.redis.hget(
-            redis_hash, Keys.get_github_no_of_releases(repo_id),
+        redis_no_of_releases = state_fields.get(
+            Keys.get_github_no_of_releases(repo_id),
             bytes(str(state_no_of_releases), 'utf-8'))
         redis_no_of_releases = 'None' if redis_no_of_releases is None \
             else redis_no_of_releases.decode("utf-8")
@@ -92,8 +97,8 @@ class GitHubDataTransformer(DataTransformer):
 
         # Load last_monitored from Redis
         state_last_monitored = repo.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_github_last_monitored(repo_id),
+        redis_last_monitored = state_fields.get(
+            Keys.get_github_last_monitored(repo_id),
             bytes(str(state_last_monitored), 'utf-8'))
         redis_last_monitored = 'None' if redis_last_monitored is None \
             else redis_last_monitored.decode("utf-8")
@@ -154,14 +159,14 @@ class GitHubDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {
                         'no_of_releases': no_of_releases
                     }
                 }
             }
         elif 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             # Since the processing function calling this method caters for
             # unexpected data this condition will never be executed. Regardless,
@@ -185,7 +190,7 @@ class GitHubDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -204,10 +209,9 @@ class GitHubDataTransformer(DataTransformer):
                 repo.no_of_releases
 
             # Finally add the list of releases
-            processed_data_metrics['releases'] = \
-                copy.deepcopy(td_metrics['releases'])
+            processed_data_metrics['releases'] = td_metrics['releases']
         elif 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             # Since the processing function calling this method caters for
             # unexpected data this condition will never be executed. Regardless,
@@ -228,7 +232,7 @@ class GitHubDataTransformer(DataTransformer):
 
             transformed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(meta_data),
+                    'meta_data': dict(meta_data),
                     'data': {},
                 }
             }
@@ -244,11 +248,11 @@ class GitHubDataTransformer(DataTransformer):
             # Transform the data by adding the no_of_releases and releases
             # metrics.
             td_metrics['no_of_releases'] = len(repo_metrics)
-            td_metrics['releases'] = copy.deepcopy(repo_metrics)
+            td_metrics['releases'] = repo_metrics
         elif 'error' in data:
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
+            transformed_data = dict_copy_paths(data, ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
         else:
             # Since the processing function calling this method caters for
@@ -277,9 +281,11 @@ class GitHubDataTransformer(DataTransformer):
 
     def _process_raw_data(self, ch: BlockingChannel,
                           method: pika.spec.Basic.Deliver,
-                          properties: pika.spec.BasicProperties, body: bytes) \
-            -> None:
-        raw_data = json.loads(body)
+                          properties: pika.spec.BasicProperties,
+                          body: bytes,
+                          raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -312,7 +318,7 @@ class GitHubDataTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -338,13 +344,7 @@ class GitHubDataTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
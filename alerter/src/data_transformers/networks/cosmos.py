@@ -2,14 +2,15 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, List, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi, Keys, RedisHashFields
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.networks.cosmos import CosmosNetwork
 from src.utils.constants.data import VALID_COSMOS_NETWORK_SOURCES
 from src.utils.constants.rabbitmq import (
@@ -19,6 +20,7 @@ from src.utils.constants.rabbitmq import (
 from src.utils.cosmos import (get_load_number_state_helper_network,
                               get_load_list_of_dicts_state_helper)
 from src.utils.datetime import iso_to_epoch
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   MessageWasNotDeliveredException)
 from src.utils.types import convert_to_float, convert_to_int
@@ -51,12 +53,11 @@ class CosmosNetworkTransformer(DataTransformer):
             COSMOS_NETWORK_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
             COSMOS_NETWORK_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(COSMOS_NETWORK_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self._consume_with_prefetch(COSMOS_NETWORK_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -71,14 +72,29 @@ class CosmosNetworkTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, cosmos_network: CosmosNetwork) -> None:
+    @staticmethod
+    def _get_state_keys(cosmos_network: CosmosNetwork) -> List[str]:
+        """
+        :param cosmos_network: The network in question
+        :return: The redis keys of all the metrics making up the network's
+               : state
+        """
+        loading_helpers = [
+            *get_load_number_state_helper_network(cosmos_network),
+            *get_load_list_of_dicts_state_helper(cosmos_network),
+        ]
+        return [configuration['redis_key']
+                for configuration in loading_helpers]
+
+    def _load_number_state(self, cosmos_network: CosmosNetwork,
+                           state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a network's number metrics from redis
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_network: The network state to load
+        :param state_fields: The network's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_network.parent_id)
         loading_helper = get_load_number_state_helper_network(cosmos_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -92,21 +108,22 @@ class CosmosNetworkTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_list_of_dicts_state(self, cosmos_network: CosmosNetwork) -> None:
+    def _load_list_of_dicts_state(self, cosmos_network: CosmosNetwork,
+                                  state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a network's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_network: The network state to load
+        :param state_fields: The network's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_network.parent_id)
         loading_helper = get_load_list_of_dicts_state_helper(cosmos_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -119,18 +136,25 @@ class CosmosNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
             )
             set_fn(new_value)
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_cosmos_network_fields_pattern()
+
     def load_state(self, cosmos_network: CosmosNetwork) -> CosmosNetwork:
         self.logger.debug("Loading the state of %s from Redis", cosmos_network)
 
-        self._load_number_state(cosmos_network)
-        self._load_list_of_dicts_state(cosmos_network)
+        state_fields = self._read_state_fields(
+            Keys.get_hash_parent(cosmos_network.parent_id),
+            self._get_state_keys(cosmos_network))
+        self._load_number_state(cosmos_network, state_fields)
+        self._load_list_of_dicts_state(cosmos_network, state_fields)
 
         self.logger.debug(
             "Restored %s state: _proposals=%s, _last_monitored_cosmos_rest=%s",
@@ -208,7 +232,7 @@ class CosmosNetworkTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
 
-        return copy.deepcopy(transformed_data)
+        return transformed_data
 
     def _process_transformed_cosmos_rest_data_for_alerting(
             self, transformed_cosmos_network_data: Dict) -> Dict:
@@ -221,7 +245,7 @@ class CosmosNetworkTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -234,9 +258,9 @@ class CosmosNetworkTransformer(DataTransformer):
                 pd_data[metric]['current'] = value
 
             # Add previous for each metric
-            pd_data['proposals']['previous'] = copy.deepcopy(network.proposals)
+            pd_data['proposals']['previous'] = network.proposals
         elif 'error' in transformed_cosmos_network_data:
-            processed_data = copy.deepcopy(transformed_cosmos_network_data)
+            processed_data = transformed_cosmos_network_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_cosmos_rest_data_for_alerting".format(
@@ -275,13 +299,18 @@ class CosmosNetworkTransformer(DataTransformer):
     def _transform_cosmos_rest_data(self, cosmos_network_data: Dict) -> Dict:
         if 'result' in cosmos_network_data:
             meta_data = cosmos_network_data['result']['meta_data']
-            transformed_data = copy.deepcopy(cosmos_network_data)
+            transformed_data = dict_copy_paths(
+                cosmos_network_data, ('result', 'meta_data'),
+                ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             del td_meta_data['monitor_name']
             del td_meta_data['time']
             td_meta_data['last_monitored'] = meta_data['time']
 
+            # Every proposal is converted in place, therefore the proposals
+            # are copied in full
             td_data = transformed_data['result']['data']
+            td_data['proposals'] = copy.deepcopy(td_data['proposals'])
             for proposal in td_data['proposals']:
                 proposal['proposal_id'] = convert_to_int(
                     proposal['proposal_id'], None)
@@ -307,7 +336,8 @@ class CosmosNetworkTransformer(DataTransformer):
                     deposit['amount'] = convert_to_float(
                         deposit['amount'], None)
         elif 'error' in cosmos_network_data:
-            transformed_data = copy.deepcopy(cosmos_network_data)
+            transformed_data = dict_copy_paths(cosmos_network_data,
+                                               ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
         else:
             raise ReceivedUnexpectedDataException(
@@ -417,8 +447,10 @@ class CosmosNetworkTransformer(DataTransformer):
 
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
-            properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+            properties: pika.spec.BasicProperties, body: bytes,
+            raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -443,7 +475,7 @@ class CosmosNetworkTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -471,13 +503,7 @@ class CosmosNetworkTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
@@ -1,16 +1,15 @@
-import copy
 import json
 import logging
 from ast import literal_eval
-from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, List, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi, Keys, RedisHashFields
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.networks.substrate import SubstrateNetwork
 from src.utils.constants.data import VALID_SUBSTRATE_NETWORK_SOURCES
 from src.utils.constants.rabbitmq import (
@@ -18,6 +17,7 @@ from src.utils.constants.rabbitmq import (
     SUBSTRATE_NETWORK_DT_INPUT_QUEUE_NAME,
     SUBSTRATE_NETWORK_RAW_DATA_ROUTING_KEY,
     SUBSTRATE_NETWORK_TRANSFORMED_DATA_ROUTING_KEY)
+from src.utils.dictionaries import dict_copy_paths, dict_remove_key
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   MessageWasNotDeliveredException)
 from src.utils.substrate import (get_load_number_state_helper_network,
@@ -54,12 +54,11 @@ class SubstrateNetworkTransformer(DataTransformer):
             SUBSTRATE_NETWORK_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
             SUBSTRATE_NETWORK_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(SUBSTRATE_NETWORK_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self._consume_with_prefetch(SUBSTRATE_NETWORK_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -74,15 +73,31 @@ class SubstrateNetworkTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_boolean_state(self, substrate_network: SubstrateNetwork) -> None:
+    @staticmethod
+    def _get_state_keys(substrate_network: SubstrateNetwork) -> List[str]:
+        """
+        :param substrate_network: The network in question
+        :return: The redis keys of all the metrics making up the network's
+               : state
+        """
+        loading_helpers = [
+            *get_load_bool_state_helper_network(substrate_network),
+            *get_load_number_state_helper_network(substrate_network),
+            *get_load_list_of_dicts_state_helper_network(substrate_network),
+        ]
+        return [configuration['redis_key']
+                for configuration in loading_helpers]
+
+    def _load_boolean_state(self, substrate_network: SubstrateNetwork,
+                            state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a network's boolean metrics from
         redis. If the data from Redis cannot be obtained, the state won't be
         updated.
         :param substrate_network: The network state to load
+        :param state_fields: The network's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_bool_state_helper_network(substrate_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -95,7 +110,7 @@ class SubstrateNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -105,14 +120,15 @@ class SubstrateNetworkTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_number_state(self, substrate_network: SubstrateNetwork) -> None:
+    def _load_number_state(self, substrate_network: SubstrateNetwork,
+                           state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a network's number metrics from redis
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_network: The network state to load
+        :param state_fields: The network's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_number_state_helper_network(substrate_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -126,22 +142,22 @@ class SubstrateNetworkTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_list_of_dicts_state(
-            self, substrate_network: SubstrateNetwork) -> None:
+    def _load_list_of_dicts_state(self, substrate_network: SubstrateNetwork,
+                                  state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a network's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_network: The network state to load
+        :param state_fields: The network's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_list_of_dicts_state_helper_network(
             substrate_network)
 
@@ -155,21 +171,28 @@ class SubstrateNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
             )
             set_fn(new_value)
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_substrate_network_fields_pattern()
+
     def load_state(
             self, substrate_network: SubstrateNetwork) -> SubstrateNetwork:
         self.logger.debug("Loading the state of %s from Redis",
                           substrate_network)
 
-        self._load_boolean_state(substrate_network)
-        self._load_number_state(substrate_network)
-        self._load_list_of_dicts_state(substrate_network)
+        state_fields = self._read_state_fields(
+            Keys.get_hash_parent(substrate_network.parent_id),
+            self._get_state_keys(substrate_network))
+        self._load_boolean_state(substrate_network, state_fields)
+        self._load_number_state(substrate_network, state_fields)
+        self._load_list_of_dicts_state(substrate_network, state_fields)
 
         self.logger.debug(
             "Restored %s state: _grandpa_stalled=%s, _public_prop_count=%s, "
@@ -257,7 +280,38 @@ class SubstrateNetworkTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
 
-        return copy.deepcopy(transformed_data)
+        return transformed_data
+
+    @staticmethod
+    def _strip_proposal_seconds(
+            proposals: Optional[List[Dict]]) -> Optional[List[Dict]]:
+        """
+        :param proposals: The active proposals, which are not modified as they
+                        : may be shared with the transformed data or the state
+        :return: Copies of the proposals without the seconds
+        """
+        if not proposals:
+            return proposals
+
+        return [dict_remove_key(proposal, 'seconds') for proposal in proposals]
+
+    @staticmethod
+    def _strip_referendum_votes(referendums: List[Dict]) -> List[Dict]:
+        """
+        :param referendums: The referendums, which are not modified as they may
+                          : be shared with the transformed data or the state
+        :return: The referendums, where those with votes are replaced by copies
+               : without the votes
+        """
+        stripped_referendums = []
+        for referendum in referendums:
+            if 'data' in referendum and referendum['data'] and (
+                    'votes' in referendum['data']):
+                referendum = dict(referendum, data=dict_remove_key(
+                    referendum['data'], 'votes'))
+            stripped_referendums.append(referendum)
+
+        return stripped_referendums
 
     def _process_transformed_websocket_data_for_alerting(
             self, transformed_substrate_network_data: Dict) -> Dict:
@@ -270,7 +324,7 @@ class SubstrateNetworkTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -281,39 +335,24 @@ class SubstrateNetworkTransformer(DataTransformer):
             for metric, value in td_metrics.items():
                 pd_data[metric] = {}
                 if metric == 'active_proposals':
-                    active_proposals = copy.deepcopy(value)
-                    for proposal in active_proposals:
-                        if 'seconds' in proposal:
-                            del proposal['seconds']
-                    pd_data[metric]['current'] = active_proposals
+                    pd_data[metric]['current'] = \
+                        self._strip_proposal_seconds(value)
                 elif metric == 'referendums':
-                    referendums = copy.deepcopy(value)
-                    for referendum in referendums:
-                        if 'data' in referendum and referendum['data'] and (
-                                'votes' in referendum['data']):
-                            del referendum['data']['votes']
-                    pd_data[metric]['current'] = referendums
+                    pd_data[metric]['current'] = \
+                        self._strip_referendum_votes(value)
                 else:
                     pd_data[metric]['current'] = value
 
             # Add previous for each metric
             pd_data['grandpa_stalled']['previous'] = network.grandpa_stalled
             pd_data['public_prop_count']['previous'] = network.public_prop_count
-            prev_active_proposals = copy.deepcopy(network.active_proposals)
-            if prev_active_proposals:
-                for proposal in prev_active_proposals:
-                    if 'seconds' in proposal:
-                        del proposal['seconds']
-            pd_data['active_proposals']['previous'] = prev_active_proposals
+            pd_data['active_proposals']['previous'] = \
+                self._strip_proposal_seconds(network.active_proposals)
             pd_data['referendum_count']['previous'] = network.referendum_count
-            prev_referendums = copy.deepcopy(network.referendums)
-            for referendum in prev_referendums:
-                if 'data' in referendum and referendum['data'] and (
-                        'votes' in referendum['data']):
-                    del referendum['data']['votes']
-            pd_data['referendums']['previous'] = prev_referendums
+            pd_data['referendums']['previous'] = \
+                self._strip_referendum_votes(network.referendums)
         elif 'error' in transformed_substrate_network_data:
-            processed_data = copy.deepcopy(transformed_substrate_network_data)
+            processed_data = transformed_substrate_network_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_websocket_data_for_alerting".format(
@@ -351,7 +390,9 @@ class SubstrateNetworkTransformer(DataTransformer):
     def _transform_websocket_data(self, substrate_network_data: Dict) -> Dict:
         if 'result' in substrate_network_data:
             meta_data = substrate_network_data['result']['meta_data']
-            transformed_data = copy.deepcopy(substrate_network_data)
+            transformed_data = dict_copy_paths(
+                substrate_network_data, ('result', 'meta_data'),
+                ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             del td_meta_data['monitor_name']
             del td_meta_data['time']
@@ -499,7 +540,8 @@ class SubstrateNetworkTransformer(DataTransformer):
             del td_data['all_referendums']
             del td_data['active_referendums']
         elif 'error' in substrate_network_data:
-            transformed_data = copy.deepcopy(substrate_network_data)
+            transformed_data = dict_copy_paths(substrate_network_data,
+                                               ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
         else:
             raise ReceivedUnexpectedDataException(
@@ -609,8 +651,10 @@ class SubstrateNetworkTransformer(DataTransformer):
 
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
-            properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+            properties: pika.spec.BasicProperties, body: bytes,
+            raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -635,7 +679,7 @@ class SubstrateNetworkTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -663,13 +707,7 @@ class SubstrateNetworkTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
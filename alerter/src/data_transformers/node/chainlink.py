@@ -1,16 +1,16 @@
-import copy
 import json
 import logging
-from datetime import datetime
-from typing import Dict, Tuple, Union, Type
+from typing import Dict, Tuple, Optional
 
 import pika
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi, Keys, RedisHashFields
 from src.data_transformers.data_transformer import DataTransformer
+from src.data_transformers.plans import CL_NODE_PLAN
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.nodes.chainlink_node import ChainlinkNode
 from src.utils.constants.data import (VALID_CHAINLINK_SOURCES,
                                       RAW_TO_TRANSFORMED_CHAINLINK_METRICS,
@@ -21,10 +21,11 @@ from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           STORE_EXCHANGE, ALERT_EXCHANGE,
                                           HEALTH_CHECK_EXCHANGE, TOPIC,
                                           CL_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   NodeIsDownException,
                                   MessageWasNotDeliveredException)
-from src.utils.types import convert_to_float, convert_to_int, is_mutable
+from src.utils.types import convert_to_float, convert_to_int
 
 
 class ChainlinkNodeDataTransformer(DataTransformer):
@@ -52,12 +53,11 @@ class ChainlinkNodeDataTransformer(DataTransformer):
         self.rabbitmq.queue_bind(CL_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
                                  CHAINLINK_NODE_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(CL_NODE_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self._consume_with_prefetch(CL_NODE_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -72,82 +72,23 @@ class ChainlinkNodeDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
-    def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           cl_node: ChainlinkNode) -> None:
-        """
-        This function will attempt to load a node's number metrics from redis.
-        If the data from Redis cannot be obtained, the state won't be updated.
-        :param state_type: What type of number metrics we want to obtain
-        :param cl_node: The node in question
-        :return: Nothing
-        """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
-        cl_node_id = cl_node.node_id
-        if state_type == int:
-            metric_attributes = cl_node.get_int_metric_attributes()
-            convert_fn = convert_to_int
-        else:
-            metric_attributes = cl_node.get_float_metric_attributes()
-            convert_fn = convert_to_float
-
-        # We iterate over the number metric attributes and attempt to load from
-        # redis. We are saving metrics in the following format b"value", so
-        # first we need to decode, and then convert to int/float. Note, since
-        # an error may occur when obtaining the data, the default value must
-        # also be passed as bytes(str()).
-        for attribute in metric_attributes:
-            state_value = eval('cl_node.' + attribute)
-            redis_key = eval('Keys.get_cl_node_' + attribute + '(cl_node_id)')
-            default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
-            processed_redis_value = 'None' if redis_value is None \
-                else redis_value.decode("utf-8")
-            new_value = convert_fn(processed_redis_value, None)
-            eval("cl_node.set_" + attribute + '(new_value)')
-
-    def _load_str_state(self, cl_node: ChainlinkNode) -> None:
-        """
-        This function will attempt to load a node's str metrics from redis.
-        If the data from Redis cannot be obtained, the state won't be updated.
-        :param cl_node: The node in question
-        :return: Nothing
-        """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
-        cl_node_id = cl_node.node_id
-        str_metric_attributes = cl_node.get_str_metric_attributes()
-
-        # We iterate over the string metric attributes and attempt to load from
-        # redis. We are saving metrics in the following format b"value", so
-        # first we need to decode, and then keep the string if it is not None.
-        # If the value represents a None, we store None immediately because
-        # unlike numbers, there is no conversion taking place. Note, since an
-        # error may occur when obtaining the data, the default value must also
-        # be passed as bytes(str()).
-        for attribute in str_metric_attributes:
-            state_value = eval('cl_node.' + attribute)
-            redis_key = eval('Keys.get_cl_node_' + attribute + '(cl_node_id)')
-            default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
-            new_value = None if redis_value is None or redis_value == b'None' \
-                else redis_value.decode("utf-8")
-            eval("cl_node.set_" + attribute + '(new_value)')
-
-    def _load_dict_state(self, cl_node: ChainlinkNode) -> None:
+    def _load_dict_state(self, cl_node: ChainlinkNode,
+                         state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         Note that since dicts inherit different structures, this function
         cannot be generalised easily
         :param cl_node: The node in question
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
         cl_node_id = cl_node.node_id
 
         # Load current_gas_price_info from Redis
         state_current_gas_price_info = cl_node.current_gas_price_info
-        redis_current_gas_price_info = self.redis.hget(
-            redis_hash, Keys.get_cl_node_current_gas_price_info(cl_node_id),
+        redis_current_gas_price_info = state_fields.get(
+            Keys.get_cl_node_current_gas_price_info(cl_node_id),
             bytes(json.dumps(state_current_gas_price_info), 'utf-8'))
         current_gas_price_info = {
             'percentile': None,
@@ -159,20 +100,28 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
         # Load balance_info from Redis
         state_balance_info = cl_node.balance_info
-        redis_balance_info = self.redis.hget(
-            redis_hash, Keys.get_cl_node_balance_info(cl_node_id),
+        redis_balance_info = state_fields.get(
+            Keys.get_cl_node_balance_info(cl_node_id),
             bytes(json.dumps(state_balance_info), 'utf-8'))
         balance_info = {} if redis_balance_info is None \
             else json.loads(redis_balance_info.decode("utf-8"))
         cl_node.set_balance_info(balance_info)
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_cl_node_fields_pattern()
+
     def load_state(self, cl_node: ChainlinkNode) -> ChainlinkNode:
         self.logger.debug("Loading the state of %s from Redis", cl_node)
 
-        self._load_number_state(int, cl_node)
-        self._load_number_state(float, cl_node)
-        self._load_str_state(cl_node)
-        self._load_dict_state(cl_node)
+        cl_node_id = cl_node.node_id
+        state_keys = CL_NODE_PLAN.get_state_keys(cl_node_id) + [
+            Keys.get_cl_node_current_gas_price_info(cl_node_id),
+            Keys.get_cl_node_balance_info(cl_node_id)]
+        state_fields = self._read_state_fields(
+            Keys.get_hash_parent(cl_node.parent_id), state_keys)
+        CL_NODE_PLAN.load_state(cl_node, cl_node_id, state_fields)
+        self._load_dict_state(cl_node, state_fields)
 
         self.logger.debug(
             "Restored %s state: _current_height=%s, "
@@ -217,8 +166,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
                               'last_prometheus_source_used']
             for attribute in metric_attributes:
                 if attribute not in ignore_metrics:
-                    eval('node.set_' + attribute +
-                         '(metrics["' + attribute + '"])')
+                    getattr(node, 'set_' + attribute)(metrics[attribute])
 
             # If gas_updater_set_gas_price was disabled, set the metrics to None
             if metrics['current_gas_price_info'] is None:
@@ -292,7 +240,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _update_state".format(self))
 
-        return copy.deepcopy(transformed_data)
+        return transformed_data
 
     def _process_transformed_prometheus_data_for_alerting(
             self, transformed_prometheus_data: Dict) -> Dict:
@@ -304,7 +252,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': dict(td_meta_data),
                     'data': {}
                 }
             }
@@ -329,10 +277,9 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             ignore_metrics = ['went_down_at']
             for metric in pd_data:
                 if metric not in ignore_metrics:
-                    metric_value = eval('node.' + metric)
-                    pd_data[metric]['previous'] = (copy.deepcopy(metric_value)
-                                                   if is_mutable(metric_value)
-                                                   else metric_value)
+                    # The node's metrics are replaced rather than modified
+                    # when the state is updated, so they need not be copied
+                    pd_data[metric]['previous'] = getattr(node, metric)
 
             # Add previous for went_down_at because it cannot be generalised
             pd_data['went_down_at']['previous'] = node.went_down_at_prometheus
@@ -344,7 +291,9 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             node: ChainlinkNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_prometheus_data)
+            processed_data = dict_copy_paths(
+                transformed_prometheus_data, ('error', 'meta_data'),
+                ('error', 'data'))
             pd_meta_data = processed_data['error']['meta_data']
 
             # Do current and previous for last_source_used
@@ -397,7 +346,9 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             node_metrics = prometheus_data['result']['data']
             node_id = meta_data['node_id']
             node: ChainlinkNode = self.state[node_id]
-            transformed_data = copy.deepcopy(prometheus_data)
+            transformed_data = dict_copy_paths(
+                prometheus_data, ('result', 'meta_data'),
+                ('result', 'data', 'current_gas_price_info'))
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
 
@@ -465,7 +416,8 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name
             # from the meta data
-            transformed_data = copy.deepcopy(prometheus_data)
+            transformed_data = dict_copy_paths(prometheus_data,
+                                               ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_prometheus to
@@ -587,9 +539,11 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
     def _process_raw_data(self, ch: BlockingChannel,
                           method: pika.spec.Basic.Deliver,
-                          properties: pika.spec.BasicProperties, body: bytes) \
-            -> None:
-        raw_data = json.loads(body)
+                          properties: pika.spec.BasicProperties,
+                          body: bytes,
+                          raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -614,7 +568,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -641,13 +595,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
@@ -1,16 +1,15 @@
-import copy
-import json
 import logging
-from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, List, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi, Keys, RedisHashFields
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.nodes.cosmos_node import CosmosNode
+from src.utils import env
 from src.utils.constants.data import (
     RAW_TO_TRANSFORMED_COSMOS_NODE_PROM_METRICS, INT_COSMOS_NODE_PROM_METRICS,
     VALID_COSMOS_NODE_SOURCES)
@@ -21,6 +20,7 @@ from src.utils.constants.rabbitmq import (
 from src.utils.cosmos import (
     get_load_number_state_helper, get_load_bool_state_helper,
     get_load_str_state_helper, get_load_dict_state_helper)
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (
     ReceivedUnexpectedDataException, NodeIsDownException,
     MessageWasNotDeliveredException)
@@ -53,12 +53,11 @@ class CosmosNodeDataTransformer(DataTransformer):
             COSMOS_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
             COSMOS_NODE_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(COSMOS_NODE_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self._consume_with_prefetch(COSMOS_NODE_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -73,14 +72,30 @@ class CosmosNodeDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, cosmos_node: CosmosNode) -> None:
+    @staticmethod
+    def _get_state_keys(cosmos_node: CosmosNode) -> List[str]:
+        """
+        :param cosmos_node: The node in question
+        :return: The redis keys of all the metrics making up the node's state
+        """
+        loading_helpers = [
+            *get_load_number_state_helper(cosmos_node),
+            *get_load_bool_state_helper(cosmos_node),
+            *get_load_str_state_helper(cosmos_node),
+            *get_load_dict_state_helper(cosmos_node),
+        ]
+        return [configuration['redis_key']
+                for configuration in loading_helpers]
+
+    def _load_number_state(self, cosmos_node: CosmosNode,
+                           state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_number_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -94,21 +109,22 @@ class CosmosNodeDataTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_bool_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_bool_state(self, cosmos_node: CosmosNode,
+                         state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's boolean metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_bool_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -121,7 +137,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -131,14 +147,15 @@ class CosmosNodeDataTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_str_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_str_state(self, cosmos_node: CosmosNode,
+                        state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's string metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_str_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -151,47 +168,53 @@ class CosmosNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             new_value = (
                 None if redis_value is None or redis_value == b'None'
                 else redis_value.decode("utf-8")
             )
             set_fn(new_value)
 
-    def _load_dict_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_dict_state(self, cosmos_node: CosmosNode,
+                         state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_dict_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
-        # redis. We are saving metrics in the following format b"value", so
-        # first we need to decode, and then convert to json. Note, since an
-        # error may occur when obtaining the data, the default value must also
-        # be passed as bytes(json.dumps()).
+        # redis. The metrics are saved packed, so they need to be unpacked. If
+        # the data cannot be obtained from redis, the state is kept.
         for configuration in loading_helper:
             state_value = configuration['state_value']
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
-            default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            unpack_fn = configuration['unpack_fn']
+            redis_value = state_fields.get(redis_key)
             new_value = (
                 state_value if redis_value is None
-                else json.loads(redis_value.decode("utf-8"))
+                else unpack_fn(redis_value)
             )
             set_fn(new_value)
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_cosmos_node_fields_pattern()
+
     def load_state(self, cosmos_node: CosmosNode) -> CosmosNode:
         self.logger.debug("Loading the state of %s from Redis", cosmos_node)
 
-        self._load_number_state(cosmos_node)
-        self._load_bool_state(cosmos_node)
-        self._load_str_state(cosmos_node)
-        self._load_dict_state(cosmos_node)
+        state_fields = self._read_state_fields(
+            Keys.get_hash_parent(cosmos_node.parent_id),
+            self._get_state_keys(cosmos_node))
+        self._load_number_state(cosmos_node, state_fields)
+        self._load_bool_state(cosmos_node, state_fields)
+        self._load_str_state(cosmos_node, state_fields)
+        self._load_dict_state(cosmos_node, state_fields)
 
         self.logger.debug(
             "Restored %s state: _went_down_at_prometheus=%s, "
@@ -376,7 +399,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
 
-        return copy.deepcopy(transformed_data)
+        return transformed_data
 
     def _process_transformed_cometbft_rpc_data_for_alerting(
             self, transformed_cometbft_rpc_data: Dict) -> Dict:
@@ -389,7 +412,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -405,9 +428,8 @@ class CosmosNodeDataTransformer(DataTransformer):
             # Add previous for each metric
             pd_data['went_down_at'][
                 'previous'] = node.went_down_at_cometbft_rpc
-            pd_data['slashed']['previous'] = copy.deepcopy(node.slashed)
-            pd_data['missed_blocks']['previous'] = copy.deepcopy(
-                node.missed_blocks)
+            pd_data['slashed']['previous'] = node.slashed
+            pd_data['missed_blocks']['previous'] = node.missed_blocks
             pd_data['is_syncing']['previous'] = node.is_syncing
             ## Check if the current node is a mev-cometbft node, if so send the previous state of the mev-cometbft metrics
             if td_meta_data['is_mev_cometbft_node']:
@@ -420,7 +442,8 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_cometbft_rpc_data)
+            processed_data = dict_copy_paths(transformed_cometbft_rpc_data,
+                                             ('error', 'data'))
             if td_error_code == downtime_exception.code:
                 td_data = transformed_cometbft_rpc_data['error']['data']
                 pd_data = processed_data['error']['data']
@@ -448,7 +471,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -472,7 +495,8 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_cosmos_rest_data)
+            processed_data = dict_copy_paths(transformed_cosmos_rest_data,
+                                             ('error', 'data'))
             if td_error_code == downtime_exception.code:
                 td_data = transformed_cosmos_rest_data['error']['data']
                 pd_data = processed_data['error']['data']
@@ -500,7 +524,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -524,7 +548,8 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_prometheus_data)
+            processed_data = dict_copy_paths(transformed_prometheus_data,
+                                             ('error', 'data'))
             if td_error_code == downtime_exception.code:
                 td_data = transformed_prometheus_data['error']['data']
                 pd_data = processed_data['error']['data']
@@ -580,7 +605,9 @@ class CosmosNodeDataTransformer(DataTransformer):
         if 'result' in cometbft_rpc_data:
             meta_data = cometbft_rpc_data['result']['meta_data']
             node_metrics = cometbft_rpc_data['result']['data']
-            transformed_data = copy.deepcopy(cometbft_rpc_data)
+            transformed_data = dict_copy_paths(
+                cometbft_rpc_data, ('result', 'meta_data'),
+                ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
             node_id = meta_data['node_id']
@@ -633,6 +660,20 @@ class CosmosNodeDataTransformer(DataTransformer):
                         transformed_missed_blocks['missed_heights'].append(
                             block_height - 1)
 
+                # Only the latest heights are kept, up to the configured
+                # retention, so that the metrics of rounds spanning many blocks
+                # stay bounded. The total count still counts every missed
+                # block.
+                retention = env.COSMOS_NODE_HEIGHTS_RETENTION
+                missed_heights = transformed_missed_blocks['missed_heights']
+                if len(missed_heights) > retention:
+                    transformed_missed_blocks['missed_heights'] = \
+                        missed_heights[-retention:]
+                amount_map = transformed_slashed['amount_map']
+                if len(amount_map) > retention:
+                    transformed_slashed['amount_map'] = dict(
+                        list(amount_map.items())[-retention:])
+
             # Transform the meta_data by deleting the monitor_name and changing
             # the time key to last_monitored key
             del td_meta_data['monitor_name']
@@ -650,7 +691,8 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(cometbft_rpc_data)
+            transformed_data = dict_copy_paths(cometbft_rpc_data,
+                                               ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_cometbft_rpc to
@@ -676,7 +718,8 @@ class CosmosNodeDataTransformer(DataTransformer):
             # meta_data by deleting the monitor_name and changing the time key
             # to last_monitored key
             meta_data = cosmos_rest_data['result']['meta_data']
-            transformed_data = copy.deepcopy(cosmos_rest_data)
+            transformed_data = dict_copy_paths(
+                cosmos_rest_data, ('result', 'meta_data'), ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
             del td_meta_data['monitor_name']
@@ -694,7 +737,8 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(cosmos_rest_data)
+            transformed_data = dict_copy_paths(cosmos_rest_data,
+                                               ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_cosmos_rest to the
@@ -717,7 +761,8 @@ class CosmosNodeDataTransformer(DataTransformer):
         if 'result' in prometheus_data:
             meta_data = prometheus_data['result']['meta_data']
             node_metrics = prometheus_data['result']['data']
-            transformed_data = copy.deepcopy(prometheus_data)
+            transformed_data = dict_copy_paths(
+                prometheus_data, ('result', 'meta_data'), ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
 
@@ -750,7 +795,8 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(prometheus_data)
+            transformed_data = dict_copy_paths(prometheus_data,
+                                               ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_prometheus to
@@ -880,8 +926,10 @@ class CosmosNodeDataTransformer(DataTransformer):
 
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
-            properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+            properties: pika.spec.BasicProperties, body: bytes,
+            raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -906,7 +954,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -934,13 +982,7 @@ class CosmosNodeDataTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
@@ -1,8 +1,5 @@
-import copy
-import json
 import logging
-from datetime import datetime
-from typing import Union, Type, Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,17 +7,18 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.data_store.redis import Keys
 from src.data_store.redis.redis_api import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
+from src.data_transformers.plans import EVM_NODE_PLAN
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.nodes.evm_node import EVMNode
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, STORE_EXCHANGE, RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     TOPIC, EVM_NODE_DT_INPUT_QUEUE_NAME, EVM_NODE_RAW_DATA_ROUTING_KEY,
     EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   NodeIsDownException,
                                   MessageWasNotDeliveredException)
-from src.utils.types import (convert_to_int, convert_to_float,
-                             convert_none_to_bool)
 
 
 class EVMNodeDataTransformer(DataTransformer):
@@ -50,12 +48,11 @@ class EVMNodeDataTransformer(DataTransformer):
                                  RAW_DATA_EXCHANGE,
                                  EVM_NODE_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(EVM_NODE_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self._consume_with_prefetch(EVM_NODE_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -70,40 +67,9 @@ class EVMNodeDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
-    def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           evm_node: EVMNode) -> None:
-        """
-        This function will attempt to load a node's number metrics from redis.
-        If the data from Redis cannot be obtained, the state won't be updated.
-        :param state_type: What type of number metrics we want to obtain
-        :param evm_node: The node in question
-        :return: Nothing
-        """
-        redis_hash = Keys.get_hash_parent(evm_node.parent_id)
-        evm_node_id = evm_node.node_id
-        if state_type == int:
-            metric_attributes = evm_node.get_int_metric_attributes()
-            convert_fn = convert_to_int
-        elif state_type == float:
-            metric_attributes = evm_node.get_float_metric_attributes()
-            convert_fn = convert_to_float
-        else:
-            metric_attributes = evm_node.get_bool_metric_attributes()
-            convert_fn = convert_none_to_bool
-        # We iterate over the number metric attributes and attempt to load from
-        # redis. We are saving metrics in the following format b"value", so
-        # first we need to decode, and then convert to int/float. Note, since
-        # an error may occur when obtaining the data, the default value must
-        # also be passed as bytes(str()).
-        for attribute in metric_attributes:
-            state_value = eval('evm_node.' + attribute)
-            redis_key = eval('Keys.get_evm_node_' + attribute + '(evm_node_id)')
-            default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
-            processed_redis_value = 'None' if redis_value is None \
-                else redis_value.decode("utf-8")
-            new_value = convert_fn(processed_redis_value, None)
-            eval("evm_node.set_" + attribute + '(new_value)')
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_evm_node_fields_pattern()
 
     def load_state(self, evm_node: EVMNode) -> EVMNode:
         """
@@ -114,9 +80,10 @@ class EVMNodeDataTransformer(DataTransformer):
         """
         self.logger.debug("Loading the state of %s from Redis", evm_node)
 
-        self._load_number_state(int, evm_node)
-        self._load_number_state(float, evm_node)
-        self._load_number_state(bool, evm_node)
+        state_fields = self._read_state_fields(
+            Keys.get_hash_parent(evm_node.parent_id),
+            EVM_NODE_PLAN.get_state_keys(evm_node.node_id))
+        EVM_NODE_PLAN.load_state(evm_node, evm_node.node_id, state_fields)
 
         self.logger.debug(
             "Restored %s state: _current_height=%s, _syncing=%s, "
@@ -176,7 +143,7 @@ class EVMNodeDataTransformer(DataTransformer):
         self.logger.debug("Performing further processing for storage ...")
 
         if 'result' in transformed_data or 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             # Since the processing function calling this method caters for
             # unexpected data this condition will never be executed. Regardless,
@@ -198,25 +165,15 @@ class EVMNodeDataTransformer(DataTransformer):
             node: EVMNode = self.state[td_node_id]
             td_metrics = transformed_data['result']['data']
 
+            # Reformat the data in such a way that both the previous and current
+            # states are sent to the alerter
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
-                    'data': {}
+                    'meta_data': td_meta_data,
+                    'data': EVM_NODE_PLAN.get_alerting_metrics(td_metrics,
+                                                               node)
                 }
             }
-
-            # Reformat the data in such a way that both the previous and current
-            # states are sent to the alerter
-            processed_data_metrics = processed_data['result']['data']
-            for metric, value in td_metrics.items():
-                processed_data_metrics[metric] = {}
-                processed_data_metrics[metric]['current'] = value
-
-            processed_data_metrics['current_height'][
-                'previous'] = node.current_height
-            processed_data_metrics['syncing']['previous'] = node.syncing
-            processed_data_metrics['went_down_at'][
-                'previous'] = node.went_down_at
         elif 'error' in transformed_data:
             td_meta_data = transformed_data['error']['meta_data']
             td_error_code = transformed_data['error']['code']
@@ -225,7 +182,8 @@ class EVMNodeDataTransformer(DataTransformer):
             node: EVMNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = dict_copy_paths(transformed_data,
+                                             ('error', 'data'))
 
             if td_error_code == downtime_exception.code:
                 td_metrics = transformed_data['error']['data']
@@ -253,7 +211,8 @@ class EVMNodeDataTransformer(DataTransformer):
 
         if 'result' in data:
             meta_data = data['result']['meta_data']
-            transformed_data = copy.deepcopy(data)
+            transformed_data = dict_copy_paths(
+                data, ('result', 'meta_data'), ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             td_metrics = transformed_data['result']['data']
 
@@ -275,7 +234,7 @@ class EVMNodeDataTransformer(DataTransformer):
 
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
+            transformed_data = dict_copy_paths(data, ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at to the time of error
@@ -315,8 +274,10 @@ class EVMNodeDataTransformer(DataTransformer):
 
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
-            properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+            properties: pika.spec.BasicProperties, body: bytes,
+            raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -349,7 +310,7 @@ class EVMNodeDataTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -376,13 +337,7 @@ class EVMNodeDataTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
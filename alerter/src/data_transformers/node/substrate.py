@@ -2,15 +2,15 @@ import copy
 import json
 import logging
 from ast import literal_eval
-from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Tuple, List, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi, Keys, RedisHashFields
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.nodes.substrate_node import SubstrateNode
 from src.utils.constants.data import (
     VALID_SUBSTRATE_NODE_SOURCES, INT_SUBSTRATE_NODE_WS_METRICS)
@@ -18,6 +18,7 @@ from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, STORE_EXCHANGE, ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY,
     SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (
     ReceivedUnexpectedDataException, NodeIsDownException,
     MessageWasNotDeliveredException)
@@ -55,12 +56,11 @@ class SubstrateNodeDataTransformer(DataTransformer):
             SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
             SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self._consume_with_prefetch(SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -75,14 +75,31 @@ class SubstrateNodeDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, substrate_node: SubstrateNode) -> None:
+    @staticmethod
+    def _get_state_keys(substrate_node: SubstrateNode) -> List[str]:
+        """
+        :param substrate_node: The node in question
+        :return: The redis keys of all the metrics making up the node's state
+        """
+        loading_helpers = [
+            *get_load_number_state_helper(substrate_node),
+            *get_load_bool_state_helper(substrate_node),
+            *get_load_str_state_helper(substrate_node),
+            *get_load_dict_state_helper(substrate_node),
+            *get_load_list_state_helper(substrate_node),
+        ]
+        return [configuration['redis_key']
+                for configuration in loading_helpers]
+
+    def _load_number_state(self, substrate_node: SubstrateNode,
+                           state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_number_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -96,21 +113,22 @@ class SubstrateNodeDataTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_bool_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_bool_state(self, substrate_node: SubstrateNode,
+                         state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's boolean metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_bool_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -123,7 +141,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -133,14 +151,15 @@ class SubstrateNodeDataTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_str_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_str_state(self, substrate_node: SubstrateNode,
+                        state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's string metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_str_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -153,21 +172,22 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             new_value = (
                 None if redis_value is None or redis_value == b'None'
                 else redis_value.decode("utf-8")
             )
             set_fn(new_value)
 
-    def _load_dict_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_dict_state(self, substrate_node: SubstrateNode,
+                         state_fields: RedisHashFields) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param state_fields: The node's state fields as read from redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_dict_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -180,16 +200,16 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
             )
             set_fn(new_value)
 
-    def _load_list_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_list_state(self, substrate_node: SubstrateNode,
+                         state_fields: RedisHashFields) -> None:
 
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_list_state_helper(substrate_node)
 
         for configuration in loading_helper:
@@ -197,19 +217,26 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = state_fields.get(redis_key, default_value)
             new_value = [] if redis_value is None else json.loads(
                 redis_value.decode("utf-8"))
             set_fn(new_value)
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_substrate_node_fields_pattern()
+
     def load_state(self, substrate_node: SubstrateNode) -> SubstrateNode:
         self.logger.debug("Loading the state of %s from Redis", substrate_node)
 
-        self._load_number_state(substrate_node)
-        self._load_bool_state(substrate_node)
-        self._load_str_state(substrate_node)
-        self._load_dict_state(substrate_node)
-        self._load_list_state(substrate_node)
+        state_fields = self._read_state_fields(
+            Keys.get_hash_parent(substrate_node.parent_id),
+            self._get_state_keys(substrate_node))
+        self._load_number_state(substrate_node, state_fields)
+        self._load_bool_state(substrate_node, state_fields)
+        self._load_str_state(substrate_node, state_fields)
+        self._load_dict_state(substrate_node, state_fields)
+        self._load_list_state(substrate_node, state_fields)
 
         self.logger.debug(
             "Restored %s state: _last_monitored_websocket=%s, "
@@ -237,7 +264,8 @@ class SubstrateNodeDataTransformer(DataTransformer):
     def _transform_websocket_data(self, websocket_data: Dict) -> Dict:
         if 'result' in websocket_data:
             meta_data = websocket_data['result']['meta_data']
-            transformed_data = copy.deepcopy(websocket_data)
+            transformed_data = dict_copy_paths(
+                websocket_data, ('result', 'meta_data'), ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             td_node_metrics = transformed_data['result']['data']
 
@@ -260,7 +288,11 @@ class SubstrateNodeDataTransformer(DataTransformer):
                 td_node_metrics[transformed_metric] = literal_eval(
                     str(td_node_metrics[transformed_metric]))
 
+            # The stakers and the historical data are modified in place,
+            # therefore these are the only metrics which are copied in full
             if td_node_metrics['eras_stakers']:
+                td_node_metrics['eras_stakers'] = copy.deepcopy(
+                    td_node_metrics['eras_stakers'])
                 transformed_value = literal_eval(
                     str(td_node_metrics['eras_stakers']['total']))
                 if transformed_value and token_decimals:
@@ -284,6 +316,8 @@ class SubstrateNodeDataTransformer(DataTransformer):
                         entry['value'] = transformed_value
 
             if td_node_metrics['historical'] and token_decimals:
+                td_node_metrics['historical'] = copy.deepcopy(
+                    td_node_metrics['historical'])
                 for block in td_node_metrics['historical']:
                     block['slashed_amount'] = round(block['slashed_amount'] /
                                                     (10 ** token_decimals), 2)
@@ -307,7 +341,8 @@ class SubstrateNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(websocket_data)
+            transformed_data = dict_copy_paths(websocket_data,
+                                               ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at_websocket to
@@ -410,7 +445,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -450,7 +485,8 @@ class SubstrateNodeDataTransformer(DataTransformer):
             node: SubstrateNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_websocket_data)
+            processed_data = dict_copy_paths(transformed_websocket_data,
+                                             ('error', 'data'))
             if td_error_code == downtime_exception.code:
                 td_data = transformed_websocket_data['error']['data']
                 pd_data = processed_data['error']['data']
@@ -489,7 +525,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
 
-        return copy.deepcopy(transformed_data)
+        return transformed_data
 
     def _process_transformed_data_for_alerting(
             self, transformed_data: Dict) -> Dict:
@@ -625,8 +661,10 @@ class SubstrateNodeDataTransformer(DataTransformer):
 
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
-            properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+            properties: pika.spec.BasicProperties, body: bytes,
+            raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -651,7 +689,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
             processing_error = True
 
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -679,13 +717,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
@@ -0,0 +1,219 @@
+import operator
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence
+
+from src.data_store.redis import Keys, RedisHashFields
+from src.monitorables.nodes.chainlink_node import ChainlinkNode
+from src.monitorables.nodes.evm_node import EVMNode
+from src.monitorables.system import System
+from src.utils.types import (convert_to_float, convert_to_int,
+                             convert_none_to_bool)
+
+
+def convert_to_str(value: str, default_return: Any) -> Any:
+    # Converts the string 'None' to None, else returns the string as it is. The
+    # default_return is only there to share the signature of the other
+    # converters.
+    return default_return if value == 'None' else value
+
+
+class MetricSpec(NamedTuple):
+    # The monitorable attribute holding the metric, which is also the name of
+    # the metric in the transformed data. It is set using set_<attribute>.
+    attribute: str
+
+    # Given the id of the monitorable, returns the redis key of the metric
+    get_redis_key: Callable[[str], str]
+
+    # Converts the metric from its string form in redis, as done by
+    # convert_to_float and the like
+    convert_fn: Callable[[str, Any], Any]
+
+
+class TransformationPlan:
+    """
+    A transformation plan describes the metrics of a monitorable type
+    declaratively, and is compiled once into the functions used on every
+    message to load the state of a monitorable, and to build the payloads for
+    alerting and saving. Compared to building the configuration of each metric,
+    or evaluating attribute names, on every message, the attribute getters,
+    setters and redis keys of the metrics are resolved when the plan is
+    created.
+    """
+
+    def __init__(self, monitorable_type: type, metrics: Sequence[MetricSpec],
+                 alerted_metrics: Sequence[str] = ()) -> None:
+        """
+        :param monitorable_type: The class of the monitorables
+        :param metrics: The metrics making up the state of a monitorable
+        :param alerted_metrics: The metrics which are sent for alerting
+               : together with their previous value, i.e. the value of the
+               : monitorable attribute of the same name
+        """
+        self._metrics = tuple(metrics)
+        self._loaders = tuple(
+            (spec.get_redis_key, spec.convert_fn,
+             operator.attrgetter(spec.attribute),
+             getattr(monitorable_type, 'set_' + spec.attribute))
+            for spec in self._metrics)
+        self._redis_keys = {spec.attribute: spec.get_redis_key
+                            for spec in self._metrics}
+
+        self._alerted_metrics = tuple(alerted_metrics)
+        if len(self._alerted_metrics) > 1:
+            self._get_previous_values = operator.attrgetter(
+                *self._alerted_metrics)
+        else:
+            # An attrgetter of a single attribute does not return a tuple
+            self._get_previous_values = lambda monitorable: tuple(
+                getattr(monitorable, metric)
+                for metric in self._alerted_metrics)
+
+    @classmethod
+    def from_attributes(
+            cls, monitorable_type: type, get_redis_key_prefix: str,
+            attributes: Dict[Callable[[str, Any], Any], Sequence[str]],
+            alerted_metrics: Sequence[str] = ()) -> 'TransformationPlan':
+        """
+        Creates a plan from the metric attributes of a monitorable type whose
+        redis keys are obtained using Keys.<get_redis_key_prefix><attribute>.
+        :param monitorable_type: The class of the monitorables
+        :param get_redis_key_prefix: The prefix of the Keys functions
+        :param attributes: The metric attributes mapped by their converter
+        :param alerted_metrics: The metrics which are sent for alerting
+               : together with their previous value
+        :return: The plan
+        """
+        metrics = [
+            MetricSpec(attribute,
+                       getattr(Keys, get_redis_key_prefix + attribute),
+                       convert_fn)
+            for convert_fn, convert_attributes in attributes.items()
+            for attribute in convert_attributes]
+        return cls(monitorable_type, metrics, alerted_metrics)
+
+    @property
+    def metrics(self) -> List[str]:
+        return [spec.attribute for spec in self._metrics]
+
+    @property
+    def alerted_metrics(self) -> List[str]:
+        return list(self._alerted_metrics)
+
+    def get_state_keys(self, monitorable_id: str) -> List[str]:
+        """
+        :param monitorable_id: The id of the monitorable
+        :return: The redis keys of all the metrics of the monitorable
+        """
+        return [spec.get_redis_key(monitorable_id) for spec in self._metrics]
+
+    def get_redis_key(self, metric: str, monitorable_id: str) -> str:
+        return self._redis_keys[metric](monitorable_id)
+
+    def load_state(self, monitorable: Any, monitorable_id: str,
+                   state_fields: RedisHashFields) -> None:
+        """
+        This function loads the metrics of a monitorable from the fields read
+        from redis. Metrics which do not exist in redis keep their value.
+        :param monitorable: The monitorable whose state is loaded
+        :param monitorable_id: The id of the monitorable
+        :param state_fields: The monitorable's state fields as read from redis
+        :return: Nothing
+        """
+        for get_redis_key, convert_fn, get_value, set_value in self._loaders:
+            default_value = bytes(str(get_value(monitorable)), 'utf-8')
+            redis_value = state_fields.get(get_redis_key(monitorable_id),
+                                           default_value)
+            value = 'None' if redis_value is None \
+                else redis_value.decode('utf-8')
+            set_value(monitorable, convert_fn(value, None))
+
+    def get_alerting_metrics(self, metrics: Dict, monitorable: Any) -> Dict:
+        """
+        :param metrics: The transformed metrics of a monitorable, which must
+               : include every alerted metric
+        :param monitorable: The monitorable, whose state is that of the
+               : previous round
+        :return: The metrics in the form {metric: {'current': ...}}, where the
+               : alerted metrics also have the 'previous' value
+        """
+        alerting_metrics = {
+            metric: {'current': metrics[metric], 'previous': previous}
+            for metric, previous in zip(self._alerted_metrics,
+                                        self._get_previous_values(monitorable))
+        }
+        if len(alerting_metrics) != len(metrics):
+            for metric, value in metrics.items():
+                alerting_metrics.setdefault(metric, {'current': value})
+        return alerting_metrics
+
+    def get_saving_fields(self, monitorable_id: str,
+                          metrics: Dict) -> Dict[str, str]:
+        """
+        :param monitorable_id: The id of the monitorable
+        :param metrics: The metrics to save, all of which are in the plan
+        :return: The redis fields holding the metrics, mapped by their key
+        """
+        redis_keys = self._redis_keys
+        return {redis_keys[metric](monitorable_id): str(value)
+                for metric, value in metrics.items()}
+
+
+SYSTEM_PLAN = TransformationPlan(System, [
+    MetricSpec('process_cpu_seconds_total',
+               Keys.get_system_process_cpu_seconds_total, convert_to_float),
+    MetricSpec('process_memory_usage', Keys.get_system_process_memory_usage,
+               convert_to_float),
+    MetricSpec('virtual_memory_usage', Keys.get_system_virtual_memory_usage,
+               convert_to_float),
+    MetricSpec('open_file_descriptors', Keys.get_system_open_file_descriptors,
+               convert_to_float),
+    MetricSpec('system_cpu_usage', Keys.get_system_system_cpu_usage,
+               convert_to_float),
+    MetricSpec('system_ram_usage', Keys.get_system_system_ram_usage,
+               convert_to_float),
+    MetricSpec('system_storage_usage', Keys.get_system_system_storage_usage,
+               convert_to_float),
+    MetricSpec('network_transmit_bytes_per_second',
+               Keys.get_system_network_transmit_bytes_per_second,
+               convert_to_float),
+    MetricSpec('network_receive_bytes_per_second',
+               Keys.get_system_network_receive_bytes_per_second,
+               convert_to_float),
+    MetricSpec('network_transmit_bytes_total',
+               Keys.get_system_network_transmit_bytes_total, convert_to_float),
+    MetricSpec('network_receive_bytes_total',
+               Keys.get_system_network_receive_bytes_total, convert_to_float),
+    MetricSpec('disk_io_time_seconds_in_interval',
+               Keys.get_system_disk_io_time_seconds_in_interval,
+               convert_to_float),
+    MetricSpec('disk_io_time_seconds_total',
+               Keys.get_system_disk_io_time_seconds_total, convert_to_float),
+    MetricSpec('last_monitored', Keys.get_system_last_monitored,
+               convert_to_float),
+    MetricSpec('went_down_at', Keys.get_system_went_down_at,
+               convert_to_float),
+], [
+    'process_cpu_seconds_total', 'process_memory_usage',
+    'virtual_memory_usage', 'open_file_descriptors', 'system_cpu_usage',
+    'system_ram_usage', 'system_storage_usage', 'network_receive_bytes_total',
+    'network_transmit_bytes_total', 'disk_io_time_seconds_total',
+    'network_transmit_bytes_per_second', 'network_receive_bytes_per_second',
+    'disk_io_time_seconds_in_interval', 'went_down_at',
+])
+
+EVM_NODE_PLAN = TransformationPlan.from_attributes(
+    EVMNode, 'get_evm_node_', {
+        convert_to_int: EVMNode.get_int_metric_attributes(),
+        convert_to_float: EVMNode.get_float_metric_attributes(),
+        convert_none_to_bool: EVMNode.get_bool_metric_attributes(),
+    }, ['current_height', 'syncing', 'went_down_at'])
+
+# The previous values of the Chainlink node metrics sent for alerting depend on
+# the source of the data, therefore the plan is only used for the state
+CL_NODE_PLAN = TransformationPlan.from_attributes(
+    ChainlinkNode, 'get_cl_node_', {
+        convert_to_int: ChainlinkNode.get_int_prometheus_metric_attributes(),
+        convert_to_float:
+            ChainlinkNode.get_float_prometheus_metric_attributes(),
+        convert_to_str: ChainlinkNode.get_str_prometheus_metric_attributes(),
+    })
@@ -1,8 +1,5 @@
-import copy
-import json
 import logging
-from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,16 +7,23 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.data_transformers.data_transformer import DataTransformer
+from src.data_transformers.plans import SYSTEM_PLAN
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitorables.system import System
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, STORE_EXCHANGE, RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     SYSTEM_DT_INPUT_QUEUE_NAME, SYSTEM_RAW_DATA_ROUTING_KEY,
     SYSTEM_TRANSFORMED_DATA_ROUTING_KEY, TOPIC)
+from src.utils.deltas import as_delta, changed_metrics
+from src.utils.dictionaries import dict_copy_paths
 from src.utils.exceptions import (ReceivedUnexpectedDataException,
                                   SystemIsDownException,
                                   MessageWasNotDeliveredException)
-from src.utils.types import convert_to_float
+
+
+# The meta_data of raw results which is not part of the transformed data
+_REMOVED_RESULT_META_DATA = frozenset(['monitor_name', 'time'])
 
 
 class SystemDataTransformer(DataTransformer):
@@ -49,12 +53,11 @@ class SystemDataTransformer(DataTransformer):
         self.rabbitmq.queue_bind(SYSTEM_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
                                  SYSTEM_RAW_DATA_ROUTING_KEY)
 
-        # Pre-fetch count is 5 times less the maximum queue size
-        prefetch_count = round(self.publishing_queue.maxsize / 5)
-        self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
+        # The prefetch count is 5 times less the maximum queue size, and is
+        # tuned at runtime if prefetch tuning is enabled
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(SYSTEM_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self._consume_with_prefetch(SYSTEM_DT_INPUT_QUEUE_NAME,
+                                    self._receive_raw_data, measured=True)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -69,6 +72,10 @@ class SystemDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
+    @property
+    def state_fields_pattern(self) -> str:
+        return Keys.get_system_fields_pattern()
+
     def load_state(self, system: System) -> System:
         # Below, we will try and get the data stored in redis and store it
         # in the system's state. If the data from Redis cannot be obtained, the
@@ -77,187 +84,9 @@ class SystemDataTransformer(DataTransformer):
         self.logger.debug("Loading the state of %s from Redis", system)
         redis_hash = Keys.get_hash_parent(system.parent_id)
         system_id = system.system_id
-
-        # Load process_cpu_seconds_total from Redis
-        state_process_cpu_seconds_total = system.process_cpu_seconds_total
-        redis_process_cpu_seconds_total = self.redis.hget(
-            redis_hash, Keys.get_system_process_cpu_seconds_total(system_id),
-            bytes(str(state_process_cpu_seconds_total), 'utf8'))
-        redis_process_cpu_seconds_total = 'None' if \
-            redis_process_cpu_seconds_total is None \
-            else redis_process_cpu_seconds_total.decode("utf-8")
-        process_cpu_seconds_total = convert_to_float(
-            redis_process_cpu_seconds_total, None)
-        system.set_process_cpu_seconds_total(process_cpu_seconds_total)
-
-        # Load process_memory_usage from Redis
-        state_process_memory_usage = system.process_memory_usage
-        redis_process_memory_usage = self.redis.hget(
-            redis_hash, Keys.get_system_process_memory_usage(system_id),
-            bytes(str(state_process_memory_usage), 'utf-8'))
-        redis_process_memory_usage = 'None' if \
-            redis_process_memory_usage is None \
-            else redis_process_memory_usage.decode("utf-8")
-        process_memory_usage = convert_to_float(redis_process_memory_usage,
-                                                None)
-        system.set_process_memory_usage(process_memory_usage)
-
-        # Load virtual_memory_usage from Redis
-        state_virtual_memory_usage = system.virtual_memory_usage
-        redis_virtual_memory_usage = self.redis.hget(
-            redis_hash, Keys.get_system_virtual_memory_usage(system_id),
-            bytes(str(state_virtual_memory_usage), 'utf-8'))
-        redis_virtual_memory_usage = 'None' if \
-            redis_virtual_memory_usage is None \
-            else redis_virtual_memory_usage.decode("utf-8")
-        virtual_memory_usage = convert_to_float(redis_virtual_memory_usage,
-                                                None)
-        system.set_virtual_memory_usage(virtual_memory_usage)
-
-        # Load open_file_descriptors from Redis
-        state_open_file_descriptors = system.open_file_descriptors
-        redis_open_file_descriptors = self.redis.hget(
-            redis_hash, Keys.get_system_open_file_descriptors(system_id),
-            bytes(str(state_open_file_descriptors), 'utf-8'))
-        redis_open_file_descriptors = 'None' if \
-            redis_open_file_descriptors is None \
-            else redis_open_file_descriptors.decode("utf-8")
-        open_file_descriptors = convert_to_float(redis_open_file_descriptors,
-                                                 None)
-        system.set_open_file_descriptors(open_file_descriptors)
-
-        # Load system_cpu_usage from Redis
-        state_system_cpu_usage = system.system_cpu_usage
-        redis_system_cpu_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_cpu_usage(system_id),
-            bytes(str(state_system_cpu_usage), 'utf-8'))
-        redis_system_cpu_usage = 'None' if redis_system_cpu_usage is None \
-            else redis_system_cpu_usage.decode("utf-8")
-        system_cpu_usage = convert_to_float(redis_system_cpu_usage, None)
-        system.set_system_cpu_usage(system_cpu_usage)
-
-        # Load system_ram_usage from Redis
-        state_system_ram_usage = system.system_ram_usage
-        redis_system_ram_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_ram_usage(system_id),
-            bytes(str(state_system_ram_usage), 'utf-8'))
-        redis_system_ram_usage = 'None' if redis_system_ram_usage is None \
-            else redis_system_ram_usage.decode("utf-8")
-        system_ram_usage = convert_to_float(redis_system_ram_usage, None)
-        system.set_system_ram_usage(system_ram_usage)
-
-        # Load system_storage_usage from Redis
-        state_system_storage_usage = system.system_storage_usage
-        redis_system_storage_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_storage_usage(system_id),
-            bytes(str(state_system_storage_usage), 'utf-8'))
-        redis_system_storage_usage = 'None' \
-            if redis_system_storage_usage is None \
-            else redis_system_storage_usage.decode("utf-8")
-        system_storage_usage = convert_to_float(redis_system_storage_usage,
-                                                None)
-        system.set_system_storage_usage(system_storage_usage)
-
-        # Load network_transmit_bytes_per_second from Redis
-        state_network_transmit_bytes_per_second = \
-            system.network_transmit_bytes_per_second
-        redis_network_transmit_bytes_per_second = self.redis.hget(
-            redis_hash,
-            Keys.get_system_network_transmit_bytes_per_second(system_id),
-            bytes(str(state_network_transmit_bytes_per_second), 'utf-8'))
-        redis_network_transmit_bytes_per_second = 'None' if \
-            redis_network_transmit_bytes_per_second is None \
-            else redis_network_transmit_bytes_per_second.decode("utf-8")
-        network_transmit_bytes_per_second = convert_to_float(
-            redis_network_transmit_bytes_per_second, None)
-        system.set_network_transmit_bytes_per_second(
-            network_transmit_bytes_per_second)
-
-        # Load network_receive_bytes_per_second from Redis
-        state_network_receive_bytes_per_second = \
-            system.network_receive_bytes_per_second
-        redis_network_receive_bytes_per_second = self.redis.hget(
-            redis_hash,
-            Keys.get_system_network_receive_bytes_per_second(system_id),
-            bytes(str(state_network_receive_bytes_per_second), 'utf-8'))
-        redis_network_receive_bytes_per_second = 'None' if \
-            redis_network_receive_bytes_per_second is None \
-            else redis_network_receive_bytes_per_second.decode("utf-8")
-        network_receive_bytes_per_second = convert_to_float(
-            redis_network_receive_bytes_per_second, None)
-        system.set_network_receive_bytes_per_second(
-            network_receive_bytes_per_second)
-
-        # Load network_transmit_bytes_total from Redis
-        state_network_transmit_bytes_total = system.network_transmit_bytes_total
-        redis_network_transmit_bytes_total = self.redis.hget(
-            redis_hash, Keys.get_system_network_transmit_bytes_total(system_id),
-            bytes(str(state_network_transmit_bytes_total), 'utf-8'))
-        redis_network_transmit_bytes_total = 'None' if \
-            redis_network_transmit_bytes_total is None \
-            else redis_network_transmit_bytes_total.decode("utf-8")
-        network_transmit_bytes_total = convert_to_float(
-            redis_network_transmit_bytes_total, None)
-        system.set_network_transmit_bytes_total(network_transmit_bytes_total)
-
-        # Load network_receive_bytes_total from Redis
-        state_network_receive_bytes_total = system.network_receive_bytes_total
-        redis_network_receive_bytes_total = self.redis.hget(
-            redis_hash, Keys.get_system_network_receive_bytes_total(system_id),
-            bytes(str(state_network_receive_bytes_total), 'utf-8'))
-        redis_network_receive_bytes_total = 'None' if \
-            redis_network_receive_bytes_total is None \
-            else redis_network_receive_bytes_total.decode("utf-8")
-        network_receive_bytes_total = convert_to_float(
-            redis_network_receive_bytes_total, None)
-        system.set_network_receive_bytes_total(network_receive_bytes_total)
-
-        # Load disk_io_time_seconds_in_interval from Redis
-        state_disk_io_time_seconds_in_interval = \
-            system.disk_io_time_seconds_in_interval
-        redis_disk_io_time_seconds_in_interval = self.redis.hget(
-            redis_hash,
-            Keys.get_system_disk_io_time_seconds_in_interval(system_id),
-            bytes(str(state_disk_io_time_seconds_in_interval), 'utf-8'))
-        redis_disk_io_time_seconds_in_interval = 'None' \
-            if redis_disk_io_time_seconds_in_interval is None \
-            else redis_disk_io_time_seconds_in_interval.decode("utf-8")
-        disk_io_time_seconds_in_interval = convert_to_float(
-            redis_disk_io_time_seconds_in_interval, None)
-        system.set_disk_io_time_seconds_in_interval(
-            disk_io_time_seconds_in_interval)
-
-        # Load disk_io_time_seconds_total from Redis
-        state_disk_io_time_seconds_total = system.disk_io_time_seconds_total
-        redis_disk_io_time_seconds_total = self.redis.hget(
-            redis_hash, Keys.get_system_disk_io_time_seconds_total(system_id),
-            bytes(str(state_disk_io_time_seconds_total), 'utf-8'))
-        redis_disk_io_time_seconds_total = 'None' if \
-            redis_disk_io_time_seconds_total is None \
-            else redis_disk_io_time_seconds_total.decode("utf-8")
-        disk_io_time_seconds_total = convert_to_float(
-            redis_disk_io_time_seconds_total, None)
-        system.set_disk_io_time_seconds_total(disk_io_time_seconds_total)
-
-        # Load last_monitored from Redis
-        state_last_monitored = system.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_system_last_monitored(system_id),
-            bytes(str(state_last_monitored), 'utf-8'))
-        redis_last_monitored = 'None' if redis_last_monitored is None \
-            else redis_last_monitored.decode("utf-8")
-        last_monitored = convert_to_float(redis_last_monitored, None)
-        system.set_last_monitored(last_monitored)
-
-        # Load went_down_at from Redis
-        state_went_down_at = system.went_down_at
-        redis_went_down_at = self.redis.hget(
-            redis_hash, Keys.get_system_went_down_at(system_id),
-            bytes(str(state_went_down_at), 'utf-8'))
-        redis_went_down_at = 'None' if redis_went_down_at is None \
-            else redis_went_down_at.decode("utf-8")
-        went_down_at = convert_to_float(redis_went_down_at, None)
-        system.set_went_down_at(went_down_at)
+        state_fields = self._read_state_fields(
+            redis_hash, SYSTEM_PLAN.get_state_keys(system_id))
+        SYSTEM_PLAN.load_state(system, system_id, state_fields)
 
         self.logger.debug(
             "Restored %s state: _process_cpu_seconds_total=%s, "
@@ -270,13 +99,17 @@ class SystemDataTransformer(DataTransformer):
             "_network_receive_bytes_total=%s, "
             "_disk_io_time_seconds_in_interval=%s, "
             "_disk_io_time_seconds_total=%s, _last_monitored=%s, "
-            "_went_down_at=%s", system, process_cpu_seconds_total,
-            process_memory_usage, virtual_memory_usage, open_file_descriptors,
-            system_cpu_usage, system_ram_usage, system_storage_usage,
-            network_transmit_bytes_per_second, network_receive_bytes_per_second,
-            network_transmit_bytes_total, network_receive_bytes_total,
-            disk_io_time_seconds_in_interval, disk_io_time_seconds_total,
-            last_monitored, went_down_at)
+            "_went_down_at=%s", system, system.process_cpu_seconds_total,
+            system.process_memory_usage, system.virtual_memory_usage,
+            system.open_file_descriptors, system.system_cpu_usage,
+            system.system_ram_usage, system.system_storage_usage,
+            system.network_transmit_bytes_per_second,
+            system.network_receive_bytes_per_second,
+            system.network_transmit_bytes_total,
+            system.network_receive_bytes_total,
+            system.disk_io_time_seconds_in_interval,
+            system.disk_io_time_seconds_total, system.last_monitored,
+            system.went_down_at)
 
         return system
 
@@ -347,8 +180,10 @@ class SystemDataTransformer(DataTransformer):
                                              transformed_data: Dict) -> Dict:
         self.logger.debug("Performing further processing for storage ...")
 
+        # The data is stored as it was transformed, so it is shared rather
+        # than copied
         if 'result' in transformed_data or 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             # Since the processing function calling this method caters for
             # unexpected data this condition will never be executed. Regardless,
@@ -370,48 +205,15 @@ class SystemDataTransformer(DataTransformer):
             system: System = self.state[td_system_id]
             td_metrics = transformed_data['result']['data']
 
+            # Reformat the data in such a way that both the previous and current
+            # states are sent to the alerter
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
-                    'data': {}
+                    'meta_data': td_meta_data,
+                    'data': SYSTEM_PLAN.get_alerting_metrics(td_metrics,
+                                                             system)
                 }
             }
-
-            # Reformat the data in such a way that both the previous and current
-            # states are sent to the alerter
-            processed_data_metrics = processed_data['result']['data']
-            for metric, value in td_metrics.items():
-                processed_data_metrics[metric] = {}
-                processed_data_metrics[metric]['current'] = value
-
-            processed_data_metrics['process_cpu_seconds_total']['previous'] = \
-                system.process_cpu_seconds_total
-            processed_data_metrics['process_memory_usage']['previous'] = \
-                system.process_memory_usage
-            processed_data_metrics['virtual_memory_usage']['previous'] = \
-                system.virtual_memory_usage
-            processed_data_metrics['open_file_descriptors']['previous'] = \
-                system.open_file_descriptors
-            processed_data_metrics['system_cpu_usage']['previous'] = \
-                system.system_cpu_usage
-            processed_data_metrics['system_ram_usage']['previous'] = \
-                system.system_ram_usage
-            processed_data_metrics['system_storage_usage']['previous'] = \
-                system.system_storage_usage
-            processed_data_metrics['network_receive_bytes_total']['previous'] \
-                = system.network_receive_bytes_total
-            processed_data_metrics['network_transmit_bytes_total']['previous'] \
-                = system.network_transmit_bytes_total
-            processed_data_metrics['disk_io_time_seconds_total']['previous'] \
-                = system.disk_io_time_seconds_total
-            processed_data_metrics['network_transmit_bytes_per_second'][
-                'previous'] = system.network_transmit_bytes_per_second
-            processed_data_metrics['network_receive_bytes_per_second'][
-                'previous'] = system.network_receive_bytes_per_second
-            processed_data_metrics['disk_io_time_seconds_in_interval'][
-                'previous'] = system.disk_io_time_seconds_in_interval
-            processed_data_metrics['went_down_at'][
-                'previous'] = system.went_down_at
         elif 'error' in transformed_data:
             td_meta_data = transformed_data['error']['meta_data']
             td_error_code = transformed_data['error']['code']
@@ -420,7 +222,8 @@ class SystemDataTransformer(DataTransformer):
             system: System = self.state[td_system_id]
             downtime_exception = SystemIsDownException(td_system_name)
 
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = dict_copy_paths(transformed_data,
+                                             ('error', 'data'))
 
             if td_error_code == downtime_exception.code:
                 td_metrics = transformed_data['error']['data']
@@ -443,6 +246,22 @@ class SystemDataTransformer(DataTransformer):
 
         return processed_data
 
+    def _as_delta_unless_full(
+            self, system_id: str, monitoring_time: float,
+            data_for_alerting: Dict,
+            data_for_saving: Dict) -> Tuple[Dict, Dict]:
+        """
+        Unless a full snapshot of the system is due, only the metrics which
+        changed since the previous round are sent. The state is still updated
+        in full.
+        """
+        if self._full_snapshot_due(system_id, monitoring_time):
+            return data_for_alerting, data_for_saving
+
+        metrics = changed_metrics(data_for_alerting['result']['data'])
+        return (as_delta(data_for_alerting, metrics),
+                as_delta(data_for_saving, metrics))
+
     def _transform_data(self, data: Dict) -> Tuple[Dict, Dict, Dict]:
         self.logger.debug("Performing data transformation on %s ...", data)
 
@@ -485,7 +304,8 @@ class SystemDataTransformer(DataTransformer):
                     disk_io_time_seconds_total - \
                     system.disk_io_time_seconds_total
 
-            transformed_data = copy.deepcopy(data)
+            transformed_data = dict_copy_paths(
+                data, ('result', 'meta_data'), ('result', 'data'))
             td_meta_data = transformed_data['result']['meta_data']
             td_metrics = transformed_data['result']['data']
 
@@ -514,7 +334,7 @@ class SystemDataTransformer(DataTransformer):
 
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
+            transformed_data = dict_copy_paths(data, ('error', 'meta_data'))
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at to the time of error
@@ -537,10 +357,96 @@ class SystemDataTransformer(DataTransformer):
         data_for_saving = self._process_transformed_data_for_saving(
             transformed_data)
 
+        if 'result' in transformed_data:
+            data_for_alerting, data_for_saving = self._as_delta_unless_full(
+                system_id, meta_data['time'], data_for_alerting,
+                data_for_saving)
+
         self.logger.debug("Data transformation successful")
 
         return transformed_data, data_for_alerting, data_for_saving
 
+    def _transform_data_batch(
+            self, data_list: List[Dict]) -> List[Tuple[Dict, Dict, Dict]]:
+        """
+        This function transforms the results of a batch of systems together,
+        each of a different system, giving the same output as _transform_data
+        for each result. The metrics derived from the previous round are
+        computed for all the systems column by column, and the messages are
+        then built without interpreting each message on its own.
+        :param data_list: The raw results, whose systems are in the state
+        :return: The transformed data, the data for alerting and the data for
+               : saving of each result
+        """
+        meta_data_list = [data['result']['meta_data'] for data in data_list]
+        metrics_list = [data['result']['data'] for data in data_list]
+        systems = [self.state[meta_data['system_id']]
+                   for meta_data in meta_data_list]
+
+        # The derived metrics are only computed for systems which were
+        # monitored before, i.e. which have values to compare to
+        monitored = [system.last_monitored is not None for system in systems]
+        intervals = [
+            meta_data['time'] - system.last_monitored if was_monitored
+            else None
+            for meta_data, system, was_monitored in zip(
+                meta_data_list, systems, monitored)]
+        transmit_bytes_per_second = [
+            (metrics['network_transmit_bytes_total'] -
+             system.network_transmit_bytes_total) / interval
+            if was_monitored else None
+            for metrics, system, interval, was_monitored in zip(
+                metrics_list, systems, intervals, monitored)]
+        receive_bytes_per_second = [
+            (metrics['network_receive_bytes_total'] -
+             system.network_receive_bytes_total) / interval
+            if was_monitored else None
+            for metrics, system, interval, was_monitored in zip(
+                metrics_list, systems, intervals, monitored)]
+        disk_io_time_seconds_in_interval = [
+            metrics['disk_io_time_seconds_total'] -
+            system.disk_io_time_seconds_total if was_monitored else None
+            for metrics, system, was_monitored in zip(
+                metrics_list, systems, monitored)]
+
+        outputs = []
+        for meta_data, metrics, system, transmit, receive, disk_io in zip(
+                meta_data_list, metrics_list, systems,
+                transmit_bytes_per_second, receive_bytes_per_second,
+                disk_io_time_seconds_in_interval):
+            td_meta_data = {key: value for key, value in meta_data.items()
+                            if key not in _REMOVED_RESULT_META_DATA}
+            td_meta_data['last_monitored'] = meta_data['time']
+            td_metrics = dict(metrics)
+            td_metrics['network_transmit_bytes_per_second'] = transmit
+            td_metrics['network_receive_bytes_per_second'] = receive
+            td_metrics['disk_io_time_seconds_in_interval'] = disk_io
+            td_metrics['went_down_at'] = None
+            transformed_data = {
+                'result': {'meta_data': td_meta_data, 'data': td_metrics}
+            }
+
+            data_for_alerting = {
+                'result': {
+                    'meta_data': td_meta_data,
+                    'data': SYSTEM_PLAN.get_alerting_metrics(td_metrics,
+                                                             system)
+                }
+            }
+            outputs.append((transformed_data, data_for_alerting,
+                            transformed_data))
+
+        # Deltas are only decided once all the results were transformed, so
+        # that no full snapshot is assumed to be sent if one of them fails
+        for index, meta_data in enumerate(meta_data_list):
+            transformed_data, data_for_alerting, data_for_saving = \
+                outputs[index]
+            outputs[index] = (transformed_data,) + self._as_delta_unless_full(
+                meta_data['system_id'], meta_data['time'], data_for_alerting,
+                data_for_saving)
+
+        return outputs
+
     def _place_latest_data_on_queue(self, transformed_data: Dict,
                                     data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
@@ -554,9 +460,11 @@ class SystemDataTransformer(DataTransformer):
 
     def _process_raw_data(self, ch: BlockingChannel,
                           method: pika.spec.Basic.Deliver,
-                          properties: pika.spec.BasicProperties, body: bytes) \
-            -> None:
-        raw_data = json.loads(body)
+                          properties: pika.spec.BasicProperties,
+                          body: bytes,
+                          raw_data: Optional[Dict] = None) -> None:
+        if raw_data is None:
+            raw_data = decode_message(body, properties)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -589,8 +497,16 @@ class SystemDataTransformer(DataTransformer):
             self.logger.exception(e)
             processing_error = True
 
+        self._finish_processing(method, raw_data, processing_error,
+                                transformed_data, data_for_alerting,
+                                data_for_saving)
+
+    def _finish_processing(self, method: pika.spec.Basic.Deliver,
+                           raw_data: Dict, processing_error: bool,
+                           transformed_data: Dict, data_for_alerting: Dict,
+                           data_for_saving: Dict) -> None:
         # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_raw_data(method)
 
         # We want to update the state after the data is acknowledged, otherwise
         # if acknowledgement fails the state would be erroneous when processing
@@ -617,13 +533,7 @@ class SystemDataTransformer(DataTransformer):
         try:
             self._send_data()
 
-            if not processing_error:
-                heartbeat = {
-                    'component_name': self.transformer_name,
-                    'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
-                }
-                self._send_heartbeat(heartbeat)
+            self._send_heartbeat_if_due(processing_error)
         except MessageWasNotDeliveredException as e:
             # Log the message and do not raise it as message is residing in the
             # publisher queue.
@@ -631,3 +541,105 @@ class SystemDataTransformer(DataTransformer):
         except Exception as e:
             # For any other exception raise it.
             raise e
+
+    def _process_raw_data_batch(self, batch: List[Tuple]) -> None:
+        """
+        Consecutive results in a held batch are transformed together, or by
+        the workers if there are any, and are then acknowledged and sent one by
+        one in delivery order. Errors, and any message which is not a result,
+        are processed on their own after the results delivered before them,
+        so that the messages of every system are processed in delivery order.
+        If the results cannot be transformed together, they are all processed
+        on their own so that the erroneous results are reported.
+        :param batch: The channel, method, properties, body and decoded
+        payload of each message, in delivery order
+        :return: None
+        """
+        results = []
+        for message in batch:
+            raw_data = message[4]
+            if isinstance(raw_data, dict) and 'result' in raw_data:
+                results.append(message)
+            else:
+                self._process_results(results)
+                results = []
+                super()._process_raw_data_batch([message])
+        self._process_results(results)
+
+    def _process_results(self, results: List[Tuple]) -> None:
+        if len(results) > 1:
+            process_results = self._process_results_batch \
+                if self.worker_pool is None \
+                else self._process_results_in_workers
+            self._measure_batch_processing(process_results, len(results),
+                                           results)
+        else:
+            super()._process_raw_data_batch(results)
+
+    def _process_results_batch(self, results: List[Tuple]) -> None:
+        try:
+            data_list = [raw_data for _, _, _, _, raw_data in results]
+            for data in data_list:
+                meta_data = data['result']['meta_data']
+                system_id = meta_data['system_id']
+                if system_id not in self.state:
+                    new_system = System(meta_data['system_name'], system_id,
+                                        meta_data['system_parent_id'])
+                    self._state[system_id] = self.load_state(new_system)
+            outputs = self._transform_data_batch(data_list)
+        except Exception as e:
+            self.logger.debug("Could not transform %s results together, "
+                              "transforming them one by one: %s",
+                              len(results), e)
+            for ch, method, properties, body, raw_data in results:
+                self._process_raw_data(ch, method, properties, body, raw_data)
+            return
+
+        self.logger.debug("Transformed %s results together.", len(results))
+        for (_, method, _, _, raw_data), output in zip(results, outputs):
+            self._finish_processing(method, raw_data, False, *output)
+
+    def _process_results_in_workers(self, results: List[Tuple]) -> None:
+        """
+        The results are transformed by the workers, where the results of
+        different systems are transformed in parallel. Without coalescing, the
+        batch may hold several results of a system, which are transformed in
+        delivery order. The results are then acknowledged, the state updated,
+        and the data sent here in delivery order. Results which the workers
+        could not transform are processed here so that the error is reported.
+        :param results: The channel, method, properties, body and decoded
+        payload of each result, in delivery order
+        :return: None
+        """
+        try:
+            jobs = []
+            for _, _, _, _, raw_data in results:
+                meta_data = raw_data['result']['meta_data']
+                system_id = meta_data['system_id']
+                if system_id not in self.state:
+                    new_system = System(meta_data['system_name'], system_id,
+                                        meta_data['system_parent_id'])
+                    self._state[system_id] = self.load_state(new_system)
+                jobs.append((system_id, raw_data))
+            outputs = self.worker_pool.transform(jobs, self.state)
+        except Exception as e:
+            self.logger.error("Could not transform %s results in the workers, "
+                              "transforming them one by one.", len(results))
+            self.logger.exception(e)
+            outputs = [None] * len(results)
+
+        for (ch, method, properties, body, raw_data), output in zip(
+                results, outputs):
+            if output is None:
+                self._process_raw_data(ch, method, properties, body, raw_data)
+                continue
+
+            # The workers transform the results into full snapshots, since
+            # the full snapshot times are kept here
+            transformed_data, data_for_alerting, data_for_saving = output
+            data_for_alerting, data_for_saving = self._as_delta_unless_full(
+                raw_data['result']['meta_data']['system_id'],
+                raw_data['result']['meta_data']['time'], data_for_alerting,
+                data_for_saving)
+            self._finish_processing(method, raw_data, False, transformed_data,
+                                    data_for_alerting, data_for_saving)
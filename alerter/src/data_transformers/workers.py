@@ -0,0 +1,154 @@
+import multiprocessing
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import pika
+
+from src.message_broker.rabbitmq.codecs import decode_message
+from src.utils.types import Monitorable
+
+# The replica of the transformer which transforms data in a worker process. It
+# is only created in the worker processes, on their first transformation.
+_replica = None
+_replica_args = None
+
+
+def _initialise_worker(transformer_type: type, transformer_name: str) -> None:
+    global _replica_args
+    _replica_args = (transformer_type, transformer_name)
+
+
+def _decode_messages(
+        messages: List[Tuple[bytes, pika.spec.BasicProperties]]
+) -> List[Optional[Dict]]:
+    decoded = []
+    for body, properties in messages:
+        try:
+            decoded.append(decode_message(body, properties))
+        except Exception:
+            # Messages which cannot be decoded are left to the transformer,
+            # which reports the error
+            decoded.append(None)
+    return decoded
+
+
+def _transform_partition(
+        monitorables: Dict[str, Monitorable],
+        jobs: List[Tuple[int, str, Dict]]
+) -> List[Tuple[int, Optional[Tuple[Dict, Dict, Dict]]]]:
+    global _replica
+    if _replica is None:
+        transformer_type, transformer_name = _replica_args
+        _replica = transformer_type.create_worker_replica(transformer_name)
+
+    # The jobs of a monitorable are transformed in delivery order, each from
+    # the state left by the previous one. Once a job fails, the remaining jobs
+    # of the monitorable are not transformed either, so that they are
+    # transformed again by the transformer in order.
+    _replica.state.clear()
+    _replica.state.update(monitorables)
+    failed = set()
+    outputs = []
+    for index, monitorable_id, raw_data in jobs:
+        output = None
+        if monitorable_id not in failed:
+            try:
+                output = _replica._transform_data(raw_data)
+                _replica._update_state(output[0])
+            except Exception:
+                output = None
+                failed.add(monitorable_id)
+        outputs.append((index, output))
+    return outputs
+
+
+class TransformationWorkerPool:
+    """
+    A pool of worker processes which decode raw data messages, and transform
+    the messages of different monitorables in parallel. The transformer keeps
+    the state of every monitorable, and sends the state of the monitorables
+    to transform together with their messages. The monitorables are
+    partitioned by their id, so that all the messages of a monitorable in a
+    batch are transformed by one worker in delivery order.
+    """
+
+    def __init__(self, transformer_type: type, transformer_name: str,
+                 workers: int) -> None:
+        """
+        :param transformer_type: The class of the transformer, whose worker
+               : replicas transform the data
+        :param transformer_name: The name of the transformer
+        :param workers: The number of worker processes
+        """
+        self._workers = workers
+
+        # The worker processes are spawned rather than forked, so that they do
+        # not inherit the connections of the transformer
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_initialise_worker,
+            initargs=(transformer_type, transformer_name))
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def partition_of(self, monitorable_id: str) -> int:
+        return zlib.crc32(monitorable_id.encode('utf-8')) % self._workers
+
+    def _split(self, items: List[Any]) -> List[List[Any]]:
+        chunk_size = -(-len(items) // self._workers)
+        return [items[start:start + chunk_size]
+                for start in range(0, len(items), chunk_size)]
+
+    def decode(self, messages: List[Tuple[bytes, pika.spec.BasicProperties]]
+               ) -> List[Optional[Dict]]:
+        """
+        :param messages: The body and properties of every message
+        :return: The decoded messages, in the same order. Messages which
+               : cannot be decoded are None.
+        """
+        if not messages:
+            return []
+
+        decoded = []
+        for chunk in self._executor.map(_decode_messages,
+                                        self._split(messages)):
+            decoded.extend(chunk)
+        return decoded
+
+    def transform(self, jobs: List[Tuple[str, Dict]],
+                  state: Dict[str, Monitorable]
+                  ) -> List[Optional[Tuple[Dict, Dict, Dict]]]:
+        """
+        The messages are transformed from the given state, which is not
+        modified, the same way as the transformer would transform them one
+        after the other.
+        :param jobs: The monitorable id and the raw data of every message,
+               : in delivery order
+        :param state: The state of the transformer, which holds the state of
+               : every monitorable in the jobs
+        :return: The output of _transform_data for every message, in the same
+               : order. The output of messages which could not be
+               : transformed is None.
+        """
+        partitions = {}
+        for index, (monitorable_id, raw_data) in enumerate(jobs):
+            monitorables, partition_jobs = partitions.setdefault(
+                self.partition_of(monitorable_id), ({}, []))
+            monitorables[monitorable_id] = state[monitorable_id]
+            partition_jobs.append((index, monitorable_id, raw_data))
+
+        futures = [self._executor.submit(_transform_partition, monitorables,
+                                         partition_jobs)
+                   for monitorables, partition_jobs in partitions.values()]
+        outputs = [None] * len(jobs)
+        for future in futures:
+            for index, output in future.result():
+                outputs[index] = output
+        return outputs
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
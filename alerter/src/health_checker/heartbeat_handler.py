@@ -5,6 +5,7 @@ import signal
 import sys
 from datetime import datetime
 from types import FrameType
+from typing import Dict
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -12,6 +13,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.utils import env
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HB_HANDLER_HEARTBEAT_QUEUE_NAME,
@@ -40,6 +42,11 @@ class HeartbeatHandler:
         # heartbeats are saved eventually redis is back online
         self._unsavable_redis_data = {}
 
+        # Components which process messages report how many messages they
+        # processed since their previous heartbeat. This dict stores the
+        # running totals of these counts per component.
+        self._message_totals = {}
+
         # Handle termination signals by stopping the monitor gracefully
         signal.signal(signal.SIGTERM, self.on_terminate)
         signal.signal(signal.SIGINT, self.on_terminate)
@@ -131,11 +138,55 @@ class HeartbeatHandler:
         else:
             self.logger.debug("Could not save all data to Redis.")
 
+    def _load_message_totals(self, key_heartbeat: str) -> Dict:
+        # The totals are continued from the last stored heartbeat, so that
+        # they are not reset when the heartbeat handler restarts
+        totals = {'total_processed_messages': 0, 'total_errored_messages': 0}
+        stored_heartbeat = self.redis.get(key_heartbeat)
+        if stored_heartbeat is None:
+            return totals
+
+        try:
+            stored_heartbeat = json.loads(stored_heartbeat)
+            for total in totals:
+                totals[total] = int(stored_heartbeat.get(total, 0))
+        except (ValueError, TypeError, AttributeError) as e:
+            self.logger.error("Could not load the message totals from %s",
+                              stored_heartbeat)
+            self.logger.exception(e)
+        return totals
+
+    def _add_message_totals(self, key_heartbeat: str,
+                            heartbeat: Dict) -> Dict:
+        """
+        Adds the message counts of a heartbeat to the running totals of its
+        component, and returns the heartbeat together with these totals.
+        :param key_heartbeat: The Redis key of the component's heartbeat
+        :param heartbeat: The heartbeat received
+        :return: The heartbeat to store
+        """
+        component_name = heartbeat['component_name']
+        if component_name not in self._message_totals:
+            self._message_totals[component_name] = self._load_message_totals(
+                key_heartbeat)
+
+        totals = self._message_totals[component_name]
+        totals['total_processed_messages'] += heartbeat['processed_messages']
+        totals['total_errored_messages'] += heartbeat['errored_messages']
+        if heartbeat['errored_messages'] > 0:
+            self.logger.warning(
+                "%s could not process %s messages out of %s since its previous "
+                "heartbeat.", component_name, heartbeat['errored_messages'],
+                heartbeat['processed_messages'] +
+                heartbeat['errored_messages'])
+
+        return {**heartbeat, **totals}
+
     def _process_heartbeat(self, ch: BlockingChannel,
                            method: pika.spec.Basic.Deliver,
                            properties: pika.spec.BasicProperties, body: bytes) \
             -> None:
-        heartbeat = json.loads(body)
+        heartbeat = decode_message(body, properties)
         self.logger.debug("Received %s. Now processing this data.", heartbeat)
 
         try:
@@ -144,6 +195,9 @@ class HeartbeatHandler:
                 component_name = heartbeat['component_name']
 
                 key_heartbeat = Keys.get_component_heartbeat(component_name)
+                if 'processed_messages' in heartbeat:
+                    heartbeat = self._add_message_totals(key_heartbeat,
+                                                         heartbeat)
                 transformed_heartbeat = json.dumps(heartbeat)
                 self._save_to_redis_and_add_to_state_if_fail(
                     key_heartbeat, transformed_heartbeat)
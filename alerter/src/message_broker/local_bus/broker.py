@@ -0,0 +1,480 @@
+import itertools
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from queue import Queue, Empty
+from typing import Dict, Optional, List, Tuple, Set, Deque
+
+import pika
+import pika.exceptions
+
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+from src.message_broker.rabbitmq.spill_queue import SpillQueue
+from src.utils.constants.rabbitmq import TOPIC, DIRECT
+
+FANOUT = 'fanout'
+DEFAULT_EXCHANGE = ''
+DEFAULT_DURABLE_QUEUE_MEMORY_SIZE = 1000
+
+# consumer tag, delivery tag, redelivered, exchange, routing key, properties,
+# body
+Delivery = Tuple[Optional[str], int, bool, str, str,
+                 pika.spec.BasicProperties, bytes]
+
+
+@lru_cache(maxsize=4096)
+def topic_matches(binding_key: str, routing_key: str) -> bool:
+    """
+    This function checks whether a routing key matches the binding key of a
+    topic exchange binding, where * matches exactly one word and # matches
+    zero or more words.
+    :param binding_key: The binding key
+    :param routing_key: The routing key of the message
+    :return: True if the routing key matches the binding key
+           : False otherwise
+    """
+    return _words_match(tuple(binding_key.split('.')),
+                        tuple(routing_key.split('.')))
+
+
+def _words_match(pattern: Tuple[str, ...], words: Tuple[str, ...]) -> bool:
+    if not pattern:
+        return not words
+
+    if pattern[0] == '#':
+        return any(_words_match(pattern[1:], words[index:])
+                   for index in range(len(words) + 1))
+
+    return bool(words) and pattern[0] in ('*', words[0]) \
+        and _words_match(pattern[1:], words[1:])
+
+
+class _Exchange:
+    def __init__(self, name: str, exchange_type: str) -> None:
+        self.name = name
+        self.exchange_type = exchange_type
+        # Bindings in order of creation, mapping (queue, routing key) to None
+        self.bindings: Dict[Tuple[str, str], None] = OrderedDict()
+
+    def route(self, routing_key: str) -> List[str]:
+        queues = []
+        for queue, binding_key in self.bindings:
+            if self.exchange_type == FANOUT \
+                    or (self.exchange_type == DIRECT
+                        and binding_key == routing_key) \
+                    or (self.exchange_type == TOPIC
+                        and topic_matches(binding_key, routing_key)):
+                if queue not in queues:
+                    queues.append(queue)
+        return queues
+
+
+class _Queue:
+    def __init__(self, name: str, durable: bool,
+                 exclusive_channel: Optional[int], auto_delete: bool,
+                 storage: Queue) -> None:
+        self.name = name
+        self.durable = durable
+        self.exclusive_channel = exclusive_channel
+        self.auto_delete = auto_delete
+        self.storage = storage
+        # Messages which were delivered but not acknowledged are requeued here
+        # so that they are delivered again before the other messages.
+        self.requeued: Deque[PublishingEnvelope] = deque()
+        self.consumers: Set[Tuple[int, str]] = set()
+        self.had_consumers = False
+
+    @property
+    def message_count(self) -> int:
+        return self.storage.qsize() + len(self.requeued)
+
+    def pop(self) -> Tuple[PublishingEnvelope, bool]:
+        if self.requeued:
+            return self.requeued.popleft(), True
+        return self.storage.get_nowait(), False
+
+    def purge(self) -> int:
+        message_count = self.message_count
+        self.requeued.clear()
+        while True:
+            try:
+                self.storage.get_nowait()
+            except Empty:
+                break
+        return message_count
+
+
+class _Channel:
+    def __init__(self) -> None:
+        self.prefetch_count = 0
+        # Consumer tag mapped to the queue name and whether auto ack is used
+        self.consumers: Dict[str, Tuple[str, bool]] = OrderedDict()
+        # Delivery tag mapped to the queue name and the delivered message
+        self.unacked: Dict[int, Tuple[str, PublishingEnvelope]] = \
+            OrderedDict()
+        self.delivery_tags = itertools.count(1)
+        self.consumer_tags = itertools.count(1)
+
+
+class LocalBroker:
+    """
+    An in-process implementation of the subset of AMQP used by PANIC:
+    direct, topic and fanout exchanges, queues, bindings, consumers with
+    prefetch limits, and acknowledgements. All methods are thread safe, and
+    errors are reported using the pika exceptions that RabbitMQ would cause.
+    Queue arguments and message priorities are not supported, so every queue
+    delivers its messages in FIFO order.
+
+    If a data directory is given, the messages of durable queues are stored
+    in spill queues, so that they survive restarts of the broker. Messages
+    which were delivered but not acknowledged when the broker stopped are
+    lost.
+    """
+
+    def __init__(self, data_directory: Optional[str] = None,
+                 durable_queue_memory_size: int =
+                 DEFAULT_DURABLE_QUEUE_MEMORY_SIZE) -> None:
+        self._data_directory = data_directory
+        self._durable_queue_memory_size = durable_queue_memory_size
+        self._condition = threading.Condition()
+        self._exchanges: Dict[str, _Exchange] = {
+            DEFAULT_EXCHANGE: _Exchange(DEFAULT_EXCHANGE, DIRECT)
+        }
+        self._queues: Dict[str, _Queue] = {}
+        self._channels: Dict[int, _Channel] = {}
+        self._channel_ids = itertools.count(1)
+        self._generated_queue_ids = itertools.count(1)
+
+    @property
+    def data_directory(self) -> Optional[str]:
+        return self._data_directory
+
+    def _channel_error(self, channel_id: int, reply_code: int,
+                       reply_text: str) \
+            -> pika.exceptions.ChannelClosedByBroker:
+        # Like RabbitMQ, the channel is closed when an operation fails
+        self._close_channel(channel_id)
+        return pika.exceptions.ChannelClosedByBroker(reply_code, reply_text)
+
+    def _get_channel(self, channel_id: int) -> _Channel:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            raise pika.exceptions.ChannelClosedByBroker(
+                504, "CHANNEL_ERROR - channel {} is closed".format(channel_id))
+        return channel
+
+    def _get_exchange(self, channel_id: int, exchange: str) -> _Exchange:
+        if exchange not in self._exchanges:
+            raise self._channel_error(
+                channel_id, 404, "NOT_FOUND - no exchange '{}' in vhost "
+                                 "'/'".format(exchange))
+        return self._exchanges[exchange]
+
+    def _get_queue(self, channel_id: int, queue: str) -> _Queue:
+        if queue not in self._queues:
+            raise self._channel_error(
+                channel_id, 404, "NOT_FOUND - no queue '{}' in vhost "
+                                 "'/'".format(queue))
+        return self._queues[queue]
+
+    def _create_storage(self, queue: str, durable: bool) -> Queue:
+        if durable and self._data_directory:
+            return SpillQueue(
+                os.path.join(self._data_directory,
+                             re.sub(r'[^\w.-]+', '_', queue)),
+                memory_size=self._durable_queue_memory_size)
+        return Queue()
+
+    def _delete_queue(self, queue: _Queue) -> None:
+        del self._queues[queue.name]
+        for exchange in self._exchanges.values():
+            for binding in [binding for binding in exchange.bindings
+                            if binding[0] == queue.name]:
+                del exchange.bindings[binding]
+        if isinstance(queue.storage, SpillQueue):
+            queue.storage.close()
+            shutil.rmtree(queue.storage.directory, ignore_errors=True)
+
+    def _remove_consumer(self, channel_id: int, consumer_tag: str) -> None:
+        queue_name, _ = self._channels[channel_id].consumers.pop(consumer_tag)
+        queue = self._queues.get(queue_name)
+        if queue is not None:
+            queue.consumers.discard((channel_id, consumer_tag))
+            if queue.auto_delete and queue.had_consumers \
+                    and not queue.consumers:
+                self._delete_queue(queue)
+
+    def _requeue(self, queue_name: str, envelopes: List[PublishingEnvelope]) \
+            -> None:
+        queue = self._queues.get(queue_name)
+        if queue is not None:
+            queue.requeued.extendleft(reversed(envelopes))
+
+    def _close_channel(self, channel_id: int) -> None:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            return
+
+        for consumer_tag in list(channel.consumers):
+            self._remove_consumer(channel_id, consumer_tag)
+        requeued: Dict[str, List[PublishingEnvelope]] = OrderedDict()
+        for queue_name, envelope in channel.unacked.values():
+            requeued.setdefault(queue_name, []).append(envelope)
+        for queue_name, envelopes in requeued.items():
+            self._requeue(queue_name, envelopes)
+        del self._channels[channel_id]
+        for queue in [queue for queue in self._queues.values()
+                      if queue.exclusive_channel == channel_id]:
+            self._delete_queue(queue)
+        self._condition.notify_all()
+
+    def open_channel(self) -> int:
+        with self._condition:
+            channel_id = next(self._channel_ids)
+            self._channels[channel_id] = _Channel()
+            return channel_id
+
+    def close_channel(self, channel_id: int) -> None:
+        with self._condition:
+            self._close_channel(channel_id)
+
+    def exchange_declare(self, channel_id: int, exchange: str,
+                         exchange_type: str = TOPIC, passive: bool = False,
+                         durable: bool = False, auto_delete: bool = False,
+                         internal: bool = False) -> None:
+        with self._condition:
+            self._get_channel(channel_id)
+            existing = self._exchanges.get(exchange)
+            if passive:
+                self._get_exchange(channel_id, exchange)
+            elif existing is None:
+                self._exchanges[exchange] = _Exchange(exchange, exchange_type)
+            elif existing.exchange_type != exchange_type:
+                raise self._channel_error(
+                    channel_id, 406, "PRECONDITION_FAILED - inequivalent arg "
+                                     "'type' for exchange '{}' in vhost "
+                                     "'/'".format(exchange))
+
+    def exchange_delete(self, channel_id: int, exchange: str,
+                        if_unused: bool = False) -> None:
+        with self._condition:
+            self._get_channel(channel_id)
+            existing = self._get_exchange(channel_id, exchange)
+            if if_unused and existing.bindings:
+                raise self._channel_error(
+                    channel_id, 406, "PRECONDITION_FAILED - exchange '{}' in "
+                                     "vhost '/' in use".format(exchange))
+            del self._exchanges[exchange]
+
+    def queue_declare(self, channel_id: int, queue: str,
+                      passive: bool = False, durable: bool = False,
+                      exclusive: bool = False, auto_delete: bool = False) \
+            -> Tuple[str, int, int]:
+        with self._condition:
+            self._get_channel(channel_id)
+            if not queue:
+                queue = 'amq.gen-{}'.format(next(self._generated_queue_ids))
+
+            if passive:
+                existing = self._get_queue(channel_id, queue)
+            elif queue in self._queues:
+                existing = self._queues[queue]
+                if existing.exclusive_channel not in (None, channel_id):
+                    raise self._channel_error(
+                        channel_id, 405, "RESOURCE_LOCKED - cannot obtain "
+                                         "exclusive access to locked queue "
+                                         "'{}' in vhost '/'".format(queue))
+            else:
+                existing = _Queue(queue, durable,
+                                  channel_id if exclusive else None,
+                                  auto_delete,
+                                  self._create_storage(queue, durable))
+                self._queues[queue] = existing
+
+            return queue, existing.message_count, len(existing.consumers)
+
+    def queue_bind(self, channel_id: int, queue: str, exchange: str,
+                   routing_key: Optional[str] = None) -> None:
+        with self._condition:
+            self._get_channel(channel_id)
+            self._get_queue(channel_id, queue)
+            binding_exchange = self._get_exchange(channel_id, exchange)
+            binding_exchange.bindings[
+                (queue, queue if routing_key is None else routing_key)] = None
+
+    def queue_purge(self, channel_id: int, queue: str) -> int:
+        with self._condition:
+            self._get_channel(channel_id)
+            return self._get_queue(channel_id, queue).purge()
+
+    def queue_delete(self, channel_id: int, queue: str,
+                     if_unused: bool = False, if_empty: bool = False) -> int:
+        with self._condition:
+            self._get_channel(channel_id)
+            existing = self._get_queue(channel_id, queue)
+            if if_unused and existing.consumers:
+                raise self._channel_error(
+                    channel_id, 406, "PRECONDITION_FAILED - queue '{}' in "
+                                     "vhost '/' in use".format(queue))
+            if if_empty and existing.message_count:
+                raise self._channel_error(
+                    channel_id, 406, "PRECONDITION_FAILED - queue '{}' in "
+                                     "vhost '/' not empty".format(queue))
+            message_count = existing.message_count
+            for consumer in list(existing.consumers):
+                self._channels[consumer[0]].consumers.pop(consumer[1], None)
+            self._delete_queue(existing)
+            return message_count
+
+    def basic_publish(self, channel_id: int, exchange: str, routing_key: str,
+                      body: bytes,
+                      properties: Optional[pika.spec.BasicProperties] = None,
+                      mandatory: bool = False) -> bool:
+        """
+        Routes a message to the queues bound to the exchange.
+        :return: True if the message was routed to at least one queue
+               : False otherwise
+        """
+        with self._condition:
+            self._get_channel(channel_id)
+            if exchange == DEFAULT_EXCHANGE:
+                queues = [routing_key] if routing_key in self._queues else []
+            else:
+                queues = self._get_exchange(channel_id, exchange).route(
+                    routing_key)
+
+            envelope = PublishingEnvelope(
+                exchange, routing_key, body,
+                properties or pika.BasicProperties(), mandatory)
+            for queue in queues:
+                self._queues[queue].storage.put_nowait(envelope)
+            if queues:
+                self._condition.notify_all()
+
+            return bool(queues)
+
+    def basic_qos(self, channel_id: int, prefetch_count: int = 0) -> None:
+        with self._condition:
+            self._get_channel(channel_id).prefetch_count = prefetch_count
+            self._condition.notify_all()
+
+    def basic_consume(self, channel_id: int, queue: str,
+                      auto_ack: bool = False, exclusive: bool = False,
+                      consumer_tag: Optional[str] = None) -> str:
+        with self._condition:
+            channel = self._get_channel(channel_id)
+            existing = self._get_queue(channel_id, queue)
+            if exclusive and existing.consumers:
+                raise self._channel_error(
+                    channel_id, 403, "ACCESS_REFUSED - queue '{}' in vhost "
+                                     "'/' in exclusive use".format(queue))
+            if consumer_tag is None:
+                consumer_tag = 'ctag{}.{}'.format(
+                    channel_id, next(channel.consumer_tags))
+            channel.consumers[consumer_tag] = (queue, auto_ack)
+            existing.consumers.add((channel_id, consumer_tag))
+            existing.had_consumers = True
+            self._condition.notify_all()
+            return consumer_tag
+
+    def basic_cancel(self, channel_id: int, consumer_tag: str) -> None:
+        with self._condition:
+            channel = self._get_channel(channel_id)
+            if consumer_tag in channel.consumers:
+                self._remove_consumer(channel_id, consumer_tag)
+
+    def _deliver(self, channel_id: int, queue: _Queue,
+                 consumer_tag: Optional[str], auto_ack: bool) -> Delivery:
+        channel = self._channels[channel_id]
+        envelope, redelivered = queue.pop()
+        delivery_tag = next(channel.delivery_tags)
+        if not auto_ack:
+            channel.unacked[delivery_tag] = (queue.name, envelope)
+        return (consumer_tag, delivery_tag, redelivered, envelope.exchange,
+                envelope.routing_key, envelope.properties, envelope.body)
+
+    def _next_consumer_delivery(self, channel_id: int) -> Optional[Delivery]:
+        channel = self._channels[channel_id]
+        if channel.prefetch_count and \
+                len(channel.unacked) >= channel.prefetch_count:
+            return None
+
+        for consumer_tag, (queue_name, auto_ack) in \
+                list(channel.consumers.items()):
+            queue = self._queues[queue_name]
+            if queue.message_count:
+                # Move the consumer to the end so that consumers are served
+                # in turns
+                channel.consumers.move_to_end(consumer_tag)
+                return self._deliver(channel_id, queue, consumer_tag,
+                                     auto_ack)
+        return None
+
+    def next_delivery(self, channel_id: int, timeout: float) \
+            -> Optional[Delivery]:
+        """
+        Waits until a message can be delivered to one of the consumers of the
+        channel, without exceeding its prefetch limit.
+        :param channel_id: The id of the channel
+        :param timeout: The maximum number of seconds to wait
+        :return: The delivery if a message was delivered in time
+               : None otherwise
+        """
+        with self._condition:
+            self._get_channel(channel_id)
+            delivery = self._next_consumer_delivery(channel_id)
+            if delivery is None:
+                self._condition.wait(timeout)
+                if channel_id in self._channels:
+                    delivery = self._next_consumer_delivery(channel_id)
+            return delivery
+
+    def basic_get(self, channel_id: int, queue: str, auto_ack: bool = False) \
+            -> Optional[Tuple[Delivery, int]]:
+        """
+        :return: The delivery and the number of messages left in the queue if
+               : the queue is not empty
+               : None otherwise
+        """
+        with self._condition:
+            self._get_channel(channel_id)
+            existing = self._get_queue(channel_id, queue)
+            if not existing.message_count:
+                return None
+            delivery = self._deliver(channel_id, existing, None, auto_ack)
+            return delivery, existing.message_count
+
+    def _settle(self, channel_id: int, delivery_tag: int,
+                multiple: bool) -> List[Tuple[str, PublishingEnvelope]]:
+        channel = self._get_channel(channel_id)
+        if multiple:
+            tags = [tag for tag in channel.unacked
+                    if delivery_tag == 0 or tag <= delivery_tag]
+        elif delivery_tag in channel.unacked:
+            tags = [delivery_tag]
+        else:
+            raise self._channel_error(
+                channel_id, 406, "PRECONDITION_FAILED - unknown delivery tag "
+                                 "{}".format(delivery_tag))
+        settled = [channel.unacked.pop(tag) for tag in tags]
+        self._condition.notify_all()
+        return settled
+
+    def basic_ack(self, channel_id: int, delivery_tag: int = 0,
+                  multiple: bool = False) -> None:
+        with self._condition:
+            self._settle(channel_id, delivery_tag, multiple)
+
+    def basic_nack(self, channel_id: int, delivery_tag: int = 0,
+                   multiple: bool = False, requeue: bool = True) -> None:
+        with self._condition:
+            settled = self._settle(channel_id, delivery_tag, multiple)
+            if requeue:
+                requeued: Dict[str, List[PublishingEnvelope]] = OrderedDict()
+                for queue_name, envelope in settled:
+                    requeued.setdefault(queue_name, []).append(envelope)
+                for queue_name, envelopes in requeued.items():
+                    self._requeue(queue_name, envelopes)
@@ -0,0 +1,264 @@
+import time
+from typing import Callable, Dict, Optional, Tuple, Union, Any
+
+import pika
+import pika.exceptions
+from pika.adapters.blocking_connection import ReturnedMessage
+from pika.frame import Method
+
+from src.message_broker.local_bus.broker import LocalBroker
+
+# How long a consuming channel waits for a message before checking whether
+# consuming was stopped
+CONSUME_POLL_SECONDS = 1.0
+
+# Errors raised by the broker proxy when the connection with the bus is lost
+_CONNECTION_ERRORS = (OSError, EOFError)
+
+
+class LocalBusChannel:
+    """
+    A channel of a local bus connection. It offers the methods of
+    pika.BlockingChannel used by RabbitMQApi, and forwards them to the local
+    broker.
+    """
+
+    def __init__(self, connection: 'LocalBusConnection',
+                 broker: LocalBroker) -> None:
+        self._connection = connection
+        self._broker = broker
+        self._channel_id = connection.call(broker.open_channel)
+        self._is_open = True
+        self._confirm_delivery = False
+        self._callbacks: Dict[str, Callable] = {}
+        self._consuming = False
+
+    @property
+    def channel_number(self) -> int:
+        return self._channel_id
+
+    @property
+    def is_open(self) -> bool:
+        return self._is_open and self._connection.is_open
+
+    @property
+    def is_closed(self) -> bool:
+        return not self.is_open
+
+    @property
+    def consumer_tags(self) -> list:
+        return list(self._callbacks)
+
+    def _call(self, function: Callable, *args) -> Any:
+        if not self.is_open:
+            raise pika.exceptions.ChannelWrongStateError('Channel is closed.')
+
+        try:
+            return self._connection.call(function, self._channel_id, *args)
+        except pika.exceptions.ChannelClosedByBroker:
+            # The broker closes the channel when an operation fails
+            self._is_open = False
+            self._callbacks.clear()
+            raise
+
+    def close(self) -> None:
+        if self.is_open:
+            self._is_open = False
+            self._callbacks.clear()
+            self._connection.call(self._broker.close_channel, self._channel_id)
+
+    def confirm_delivery(self) -> None:
+        self._confirm_delivery = True
+
+    def exchange_declare(self, exchange: str, exchange_type: str = 'direct',
+                         passive: bool = False, durable: bool = False,
+                         auto_delete: bool = False, internal: bool = False,
+                         arguments: Optional[Dict] = None) -> Method:
+        self._call(self._broker.exchange_declare, exchange, str(exchange_type),
+                   passive, durable, auto_delete, internal)
+        return Method(self._channel_id, pika.spec.Exchange.DeclareOk())
+
+    def exchange_delete(self, exchange: str = None,
+                        if_unused: bool = False) -> Method:
+        self._call(self._broker.exchange_delete, exchange, if_unused)
+        return Method(self._channel_id, pika.spec.Exchange.DeleteOk())
+
+    def queue_declare(self, queue: str, passive: bool = False,
+                      durable: bool = False, exclusive: bool = False,
+                      auto_delete: bool = False,
+                      arguments: Optional[Dict] = None) -> Method:
+        # The queue arguments are accepted but ignored, since the local
+        # broker does not implement them. In particular, queues declared with
+        # x-max-priority deliver messages in FIFO order irrespective of their
+        # priority, so alerts do not overtake other messages on the local bus.
+        queue, message_count, consumer_count = self._call(
+            self._broker.queue_declare, queue, passive, durable, exclusive,
+            auto_delete)
+        return Method(self._channel_id, pika.spec.Queue.DeclareOk(
+            queue, message_count, consumer_count))
+
+    def queue_bind(self, queue: str, exchange: str, routing_key: str = None,
+                   arguments: Optional[Dict] = None) -> Method:
+        self._call(self._broker.queue_bind, queue, exchange, routing_key)
+        return Method(self._channel_id, pika.spec.Queue.BindOk())
+
+    def queue_purge(self, queue: str) -> Method:
+        message_count = self._call(self._broker.queue_purge, queue)
+        return Method(self._channel_id,
+                      pika.spec.Queue.PurgeOk(message_count))
+
+    def queue_delete(self, queue: str, if_unused: bool = False,
+                     if_empty: bool = False) -> Method:
+        message_count = self._call(self._broker.queue_delete, queue,
+                                   if_unused, if_empty)
+        return Method(self._channel_id,
+                      pika.spec.Queue.DeleteOk(message_count))
+
+    def basic_publish(self, exchange: str, routing_key: str,
+                      body: Union[str, bytes],
+                      properties: pika.spec.BasicProperties = None,
+                      mandatory: bool = False) -> None:
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        routed = self._call(self._broker.basic_publish, exchange, routing_key,
+                            body, properties, mandatory)
+
+        # Like RabbitMQ, unroutable mandatory messages are only reported if
+        # publisher confirms are enabled
+        if mandatory and not routed and self._confirm_delivery:
+            raise pika.exceptions.UnroutableError([ReturnedMessage(
+                pika.spec.Basic.Return(312, 'NO_ROUTE', exchange,
+                                       routing_key),
+                properties, body)])
+
+    def basic_qos(self, prefetch_size: int = 0, prefetch_count: int = 0,
+                  global_qos: bool = False) -> None:
+        self._call(self._broker.basic_qos, prefetch_count)
+
+    def basic_consume(self, queue: str, on_message_callback: Callable,
+                      auto_ack: bool = False, exclusive: bool = False,
+                      consumer_tag: str = None,
+                      arguments: Optional[Dict] = None) -> str:
+        consumer_tag = self._call(self._broker.basic_consume, queue, auto_ack,
+                                  exclusive, consumer_tag)
+        self._callbacks[consumer_tag] = on_message_callback
+        return consumer_tag
+
+    def basic_cancel(self, consumer_tag: str = '') -> None:
+        self._callbacks.pop(consumer_tag, None)
+        self._call(self._broker.basic_cancel, consumer_tag)
+
+    def basic_get(self, queue: str, auto_ack: bool = False) \
+            -> Tuple[Optional[pika.spec.Basic.GetOk],
+                     Optional[pika.spec.BasicProperties], Optional[bytes]]:
+        result = self._call(self._broker.basic_get, queue, auto_ack)
+        if result is None:
+            return None, None, None
+
+        (_, delivery_tag, redelivered, exchange, routing_key, properties,
+         body), message_count = result
+        return pika.spec.Basic.GetOk(delivery_tag, redelivered, exchange,
+                                     routing_key, message_count), \
+            properties, body
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False) -> None:
+        self._call(self._broker.basic_ack, delivery_tag, multiple)
+
+    def basic_nack(self, delivery_tag: int = 0, multiple: bool = False,
+                   requeue: bool = True) -> None:
+        self._call(self._broker.basic_nack, delivery_tag, multiple, requeue)
+
+    def get_waiting_message_count(self) -> int:
+        # Messages are pulled from the broker one at a time, so none are
+        # waiting to be delivered on the client side
+        return 0
+
+    def start_consuming(self) -> None:
+        """
+        Delivers messages to the consumers' callbacks until all consumers are
+        cancelled, for example by calling stop_consuming in a callback.
+        """
+        self._consuming = True
+        try:
+            while self._callbacks and self.is_open:
+                delivery = self._call(self._broker.next_delivery,
+                                      CONSUME_POLL_SECONDS)
+                if delivery is None:
+                    continue
+
+                (consumer_tag, delivery_tag, redelivered, exchange,
+                 routing_key, properties, body) = delivery
+                callback = self._callbacks.get(consumer_tag)
+                if callback is None:
+                    # The consumer was cancelled while waiting, so another
+                    # consumer should get the message
+                    self.basic_nack(delivery_tag)
+                    continue
+
+                callback(self, pika.spec.Basic.Deliver(
+                    consumer_tag, delivery_tag, redelivered, exchange,
+                    routing_key), properties, body)
+        finally:
+            self._consuming = False
+
+    def stop_consuming(self, consumer_tag: str = None) -> None:
+        # Like pika, all consumers are cancelled when no tag is given
+        for tag in [consumer_tag] if consumer_tag else list(self._callbacks):
+            self.basic_cancel(tag)
+
+
+class LocalBusConnection:
+    """
+    A connection with a local broker, offering the methods of
+    pika.BlockingConnection used by the components. The broker is either a
+    LocalBroker in the same process, or a proxy of the broker served by the
+    local bus manager.
+    """
+
+    def __init__(self, broker: LocalBroker) -> None:
+        self._broker = broker
+        self._is_open = True
+        self._channels = []
+
+    @property
+    def broker(self) -> LocalBroker:
+        return self._broker
+
+    @property
+    def is_open(self) -> bool:
+        return self._is_open
+
+    @property
+    def is_closed(self) -> bool:
+        return not self._is_open
+
+    def call(self, function: Callable, *args) -> Any:
+        if not self.is_open:
+            raise pika.exceptions.ConnectionWrongStateError(
+                'Connection is closed.')
+
+        try:
+            return function(*args)
+        except _CONNECTION_ERRORS as e:
+            # The local bus stopped, therefore the connection is lost
+            self._is_open = False
+            raise pika.exceptions.AMQPConnectionError(repr(e))
+
+    def channel(self) -> LocalBusChannel:
+        channel = LocalBusChannel(self, self._broker)
+        self._channels.append(channel)
+        return channel
+
+    def close(self) -> None:
+        for channel in self._channels:
+            try:
+                channel.close()
+            except pika.exceptions.AMQPError:
+                pass
+        self._channels.clear()
+        self._is_open = False
+
+    def sleep(self, duration: float) -> None:
+        # Messages are pulled from the broker when consuming, so there are no
+        # events to process while sleeping
+        time.sleep(duration)
@@ -0,0 +1,79 @@
+from multiprocessing.managers import BaseManager
+from typing import Optional
+
+import pika.exceptions
+
+from src.message_broker.local_bus.broker import LocalBroker
+from src.message_broker.local_bus.connection import (LocalBusConnection,
+                                                     _CONNECTION_ERRORS)
+
+# The broker served by the local bus manager process
+_broker: Optional[LocalBroker] = None
+
+
+def _initialise_broker(data_directory: Optional[str]) -> None:
+    global _broker
+    _broker = LocalBroker(data_directory or None)
+
+
+def _get_broker() -> LocalBroker:
+    return _broker
+
+
+class LocalBusManager(BaseManager):
+    """
+    Serves a single LocalBroker to all the processes of a host. The broker
+    runs in the manager's process, and the other processes use it through a
+    proxy.
+    """
+    pass
+
+
+LocalBusManager.register('broker', callable=_get_broker)
+
+
+def _encode_authkey(authkey: str) -> bytes:
+    # The manager unpickles what it receives from the processes which know the
+    # key, therefore the local bus is never served or used without a key
+    if not authkey:
+        raise ValueError("A key must be set for the local bus in "
+                         "LOCAL_BUS_AUTHKEY")
+    return authkey.encode('utf-8')
+
+
+def start_local_bus(host: str, port: int, authkey: str,
+                    data_directory: Optional[str] = None) -> LocalBusManager:
+    """
+    This function starts the local bus in a new process.
+    :param host: The address the local bus listens on
+    :param port: The port the local bus listens on
+    :param authkey: The key that connecting processes must know
+    :param data_directory: The directory to store the messages of durable
+                         : queues in, None to keep them only in memory
+    :return: The manager of the started local bus
+    :raises ValueError: If the key is empty
+    """
+    manager = LocalBusManager(address=(host, port),
+                              authkey=_encode_authkey(authkey))
+    manager.start(initializer=_initialise_broker, initargs=(data_directory,))
+    return manager
+
+
+def connect_to_local_bus(host: str, port: int,
+                         authkey: str) -> LocalBusConnection:
+    """
+    This function connects to the local bus of the host.
+    :param host: The address the local bus listens on
+    :param port: The port the local bus listens on
+    :param authkey: The key of the local bus
+    :return: A connection with the local bus
+    :raises AMQPConnectionError: If the local bus cannot be reached
+    :raises ValueError: If the key is empty
+    """
+    manager = LocalBusManager(address=(host, port),
+                              authkey=_encode_authkey(authkey))
+    try:
+        manager.connect()
+        return LocalBusConnection(manager.broker())
+    except _CONNECTION_ERRORS as e:
+        raise pika.exceptions.AMQPConnectionError(repr(e))
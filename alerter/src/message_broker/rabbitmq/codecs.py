@@ -0,0 +1,220 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple, Union, List
+
+import pika
+
+from src.message_broker.rabbitmq.compression import decompress_body
+from src.utils.exceptions import UnsupportedContentTypeException
+
+# The codec libraries below are optional extras which are not installed by
+# default. A codec whose library is not installed cannot be selected by
+# producers, and messages encoded with it are rejected by consumers.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_CONTENT_TYPE = 'application/json'
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+JSON_CODEC = 'json'
+ORJSON_CODEC = 'orjson'
+MSGPACK_CODEC = 'msgpack'
+
+
+class MessageCodec(ABC):
+    """
+    A codec encodes message bodies before they are published and decodes them
+    when they are consumed. Published messages are tagged with the content
+    type of the codec, so that consumers decode them with the right codec
+    irrespective of the codec they use when publishing.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @property
+    @abstractmethod
+    def content_type(self) -> str:
+        pass
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def encode(self, body: Union[Dict, List]) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, body: bytes) -> Any:
+        pass
+
+
+class JsonCodec(MessageCodec):
+
+    @property
+    def name(self) -> str:
+        return JSON_CODEC
+
+    @property
+    def content_type(self) -> str:
+        return JSON_CONTENT_TYPE
+
+    def encode(self, body: Union[Dict, List]) -> bytes:
+        return json.dumps(body).encode('utf-8')
+
+    def decode(self, body: bytes) -> Any:
+        return json.loads(body)
+
+
+class OrjsonCodec(MessageCodec):
+    """
+    orjson produces standard JSON, therefore messages encoded with this codec
+    can be decoded by consumers which use the standard library. Consumers
+    always decode JSON using the standard library because orjson does not
+    decode NaN and integers larger than 64 bits exactly.
+    """
+
+    @property
+    def name(self) -> str:
+        return ORJSON_CODEC
+
+    @property
+    def content_type(self) -> str:
+        return JSON_CONTENT_TYPE
+
+    @property
+    def available(self) -> bool:
+        return orjson is not None
+
+    def encode(self, body: Union[Dict, List]) -> bytes:
+        return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, body: bytes) -> Any:
+        return orjson.loads(body)
+
+
+def _as_json_object(pairs: List[Tuple[Any, Any]]) -> Dict:
+    # JSON converts non-string keys to strings, for example 5 to '5' and True
+    # to 'true'. The same is done here so that consumers get the same dict
+    # irrespective of the codec of the producer.
+    return {key if isinstance(key, str) else json.dumps(key): value
+            for key, value in pairs}
+
+
+class MsgPackCodec(MessageCodec):
+    """
+    msgpack preserves the type of dict keys, whereas JSON converts them to
+    strings. Decoded keys are converted to strings like JSON does, so that
+    the decoded messages do not depend on the codec.
+    """
+
+    @property
+    def name(self) -> str:
+        return MSGPACK_CODEC
+
+    @property
+    def content_type(self) -> str:
+        return MSGPACK_CONTENT_TYPE
+
+    @property
+    def available(self) -> bool:
+        return msgpack is not None
+
+    def encode(self, body: Union[Dict, List]) -> bytes:
+        return msgpack.packb(body, use_bin_type=True)
+
+    def decode(self, body: bytes) -> Any:
+        return msgpack.unpackb(body, raw=False, strict_map_key=False,
+                               object_pairs_hook=_as_json_object)
+
+
+_CODECS = {
+    codec.name: codec for codec in [JsonCodec(), OrjsonCodec(), MsgPackCodec()]
+}
+_DEFAULT_CODEC = _CODECS[JSON_CODEC]
+
+
+def _get_decoder(content_type: str) -> Optional[MessageCodec]:
+    if content_type == JSON_CONTENT_TYPE:
+        return _CODECS[JSON_CODEC]
+    elif content_type == MSGPACK_CONTENT_TYPE \
+            and _CODECS[MSGPACK_CODEC].available:
+        return _CODECS[MSGPACK_CODEC]
+
+    return None
+
+
+def get_codec(name: str) -> Optional[MessageCodec]:
+    """
+    This function returns the codec with the given name if it exists and its
+    library is installed.
+    :param name: The name of the codec
+    :return: The codec if it exists and is available
+           : None otherwise
+    """
+    codec = _CODECS.get(name)
+    return codec if codec is not None and codec.available else None
+
+
+def get_default_codec() -> MessageCodec:
+    return _DEFAULT_CODEC
+
+
+def encode_message(body: Union[Dict, List],
+                   codec: MessageCodec) -> Tuple[bytes, str]:
+    """
+    This function encodes a message body using the given codec. Some values
+    supported by JSON cannot be encoded by the binary codecs (for example
+    integers larger than 64 bits such as token balances), in which case the
+    body is encoded as JSON instead.
+    :param body: The message body
+    :param codec: The codec to encode the message with
+    :return: The encoded body and its content type
+    """
+    if codec is not _DEFAULT_CODEC:
+        try:
+            return codec.encode(body), codec.content_type
+        except (TypeError, OverflowError, ValueError):
+            pass
+
+    return _DEFAULT_CODEC.encode(body), _DEFAULT_CODEC.content_type
+
+
+def decode_message(body: Union[bytes, str],
+                   properties: Optional[pika.spec.BasicProperties] = None) \
+        -> Any:
+    """
+    This function decompresses a consumed message body according to its
+    content encoding, and decodes it according to its content type. Messages
+    without a content type were published before codecs were introduced,
+    therefore they are decoded as JSON.
+    :param body: The message body
+    :param properties: The pika properties of the message
+    :return: The decoded body
+    :raises UnsupportedContentTypeException: If the content type is not
+                                           : supported
+    :raises UnsupportedContentEncodingException: If the content encoding is
+                                               : not supported
+    """
+    content_type = None if properties is None else properties.content_type
+    content_encoding = None if properties is None \
+        else properties.content_encoding
+    body = decompress_body(body, content_encoding)
+    if content_type is None:
+        content_type = JSON_CONTENT_TYPE
+
+    decoder = _get_decoder(content_type)
+    if decoder is None:
+        raise UnsupportedContentTypeException(content_type)
+
+    return decoder.decode(body)
@@ -0,0 +1,178 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple, Dict
+
+from src.utils.exceptions import UnsupportedContentEncodingException
+
+# The zstd library is optional. If it is not installed, zstd cannot be
+# selected by producers and zstd compressed messages are rejected by
+# consumers.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+NO_COMPRESSION = 'none'
+ZLIB_ENCODING = 'zlib'
+ZSTD_ENCODING = 'zstd'
+
+
+class Compressor(ABC):
+    """
+    A compressor compresses large message bodies before they are published.
+    Compressed messages are tagged with the content encoding of the
+    compressor so that consumers can decompress them.
+    """
+
+    @property
+    @abstractmethod
+    def content_encoding(self) -> str:
+        pass
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def compress(self, body: bytes) -> bytes:
+        pass
+
+    @abstractmethod
+    def decompress(self, body: bytes) -> bytes:
+        pass
+
+
+class ZlibCompressor(Compressor):
+
+    @property
+    def content_encoding(self) -> str:
+        return ZLIB_ENCODING
+
+    def compress(self, body: bytes) -> bytes:
+        return zlib.compress(body)
+
+    def decompress(self, body: bytes) -> bytes:
+        return zlib.decompress(body)
+
+
+class ZstdCompressor(Compressor):
+
+    @property
+    def content_encoding(self) -> str:
+        return ZSTD_ENCODING
+
+    @property
+    def available(self) -> bool:
+        return zstandard is not None
+
+    def compress(self, body: bytes) -> bytes:
+        return zstandard.ZstdCompressor().compress(body)
+
+    def decompress(self, body: bytes) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(body)
+
+
+_COMPRESSORS = {
+    compressor.content_encoding: compressor
+    for compressor in [ZlibCompressor(), ZstdCompressor()]
+}
+
+
+class CompressionMetrics:
+    """
+    This class keeps track of how much the compressed messages were reduced
+    in size.
+    """
+
+    def __init__(self) -> None:
+        self._compressed_messages = 0
+        self._uncompressed_bytes = 0
+        self._compressed_bytes = 0
+
+    @property
+    def compressed_messages(self) -> int:
+        return self._compressed_messages
+
+    @property
+    def uncompressed_bytes(self) -> int:
+        return self._uncompressed_bytes
+
+    @property
+    def compressed_bytes(self) -> int:
+        return self._compressed_bytes
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        if self.compressed_bytes == 0:
+            return None
+
+        return self.uncompressed_bytes / self.compressed_bytes
+
+    @property
+    def metrics(self) -> Dict:
+        return {
+            'compressed_messages': self.compressed_messages,
+            'uncompressed_bytes': self.uncompressed_bytes,
+            'compressed_bytes': self.compressed_bytes,
+            'compression_ratio': self.compression_ratio,
+        }
+
+    def record(self, uncompressed_size: int, compressed_size: int) -> None:
+        self._compressed_messages += 1
+        self._uncompressed_bytes += uncompressed_size
+        self._compressed_bytes += compressed_size
+
+
+def get_compressor(content_encoding: str) -> Optional[Compressor]:
+    """
+    This function returns the compressor of the given content encoding if it
+    exists and its library is installed.
+    :param content_encoding: The content encoding of the compressor
+    :return: The compressor if it exists and is available
+           : None otherwise
+    """
+    compressor = _COMPRESSORS.get(content_encoding)
+    return compressor \
+        if compressor is not None and compressor.available else None
+
+
+def compress_body(body: bytes, compressor: Optional[Compressor],
+                  threshold: int) -> Tuple[bytes, Optional[str]]:
+    """
+    This function compresses a message body if it is larger than the
+    threshold. The body is sent uncompressed if compressing it does not
+    reduce its size.
+    :param body: The encoded message body
+    :param compressor: The compressor to use, None to disable compression
+    :param threshold: The size in bytes above which bodies are compressed
+    :return: The body and its content encoding, which is None if the body was
+           : not compressed
+    """
+    if compressor is None or len(body) <= threshold:
+        return body, None
+
+    compressed_body = compressor.compress(body)
+    if len(compressed_body) >= len(body):
+        return body, None
+
+    return compressed_body, compressor.content_encoding
+
+
+def decompress_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """
+    This function decompresses a consumed message body according to its
+    content encoding.
+    :param body: The message body
+    :param content_encoding: The content encoding of the message
+    :return: The decompressed body
+    :raises UnsupportedContentEncodingException: If the content encoding is
+                                               : not supported
+    """
+    if content_encoding is None:
+        return body
+
+    compressor = get_compressor(content_encoding)
+    if compressor is None:
+        raise UnsupportedContentEncodingException(content_encoding)
+
+    return compressor.decompress(body)
@@ -0,0 +1,63 @@
+from typing import Any
+
+import pika
+
+from src.message_broker.rabbitmq.codecs import decode_message
+
+
+class PublishingEnvelope:
+    """
+    An envelope holds a message waiting in a publishing queue. The body is
+    encoded once when the envelope is created, therefore the data it was
+    created from is never copied and can be modified freely afterwards. The
+    envelope is immutable so that it can be re-sent as is if publishing fails.
+    """
+    __slots__ = ('_exchange', '_routing_key', '_body', '_properties',
+                 '_mandatory')
+
+    def __init__(self, exchange: str, routing_key: str, body: bytes,
+                 properties: pika.spec.BasicProperties,
+                 mandatory: bool) -> None:
+        self._exchange = exchange
+        self._routing_key = routing_key
+        self._body = body
+        self._properties = properties
+        self._mandatory = mandatory
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, PublishingEnvelope) and all(
+            getattr(self, slot) == getattr(other, slot)
+            for slot in self.__slots__)
+
+    def __repr__(self) -> str:
+        return "PublishingEnvelope(exchange={}, routing_key={}, size={})" \
+            .format(self.exchange, self.routing_key, len(self.body))
+
+    @property
+    def exchange(self) -> str:
+        return self._exchange
+
+    @property
+    def routing_key(self) -> str:
+        return self._routing_key
+
+    @property
+    def body(self) -> bytes:
+        return self._body
+
+    @property
+    def properties(self) -> pika.spec.BasicProperties:
+        return self._properties
+
+    @property
+    def mandatory(self) -> bool:
+        return self._mandatory
+
+    @property
+    def data(self) -> Any:
+        """
+        Decodes the body. This is only needed for inspecting the envelope, as
+        the encoded body is what gets published.
+        :return: The decoded body
+        """
+        return decode_message(self.body, self.properties)
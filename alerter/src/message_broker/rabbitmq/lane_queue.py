@@ -0,0 +1,78 @@
+from collections import deque
+from queue import Queue
+from typing import Iterable
+
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+
+
+class LaneQueue(Queue):
+    """
+    A publishing queue with two lanes. Envelopes published to one of the
+    priority exchanges are returned before all the other envelopes, and
+    each lane keeps the order in which its envelopes were put.
+
+    Both lanes are stored in the same deque, with the priority lane first,
+    so that queue[0] is still the next envelope to be sent.
+    """
+
+    def __init__(self, maxsize: int = 0,
+                 priority_exchanges: Iterable[str] = ()) -> None:
+        self._priority_exchanges = frozenset(priority_exchanges)
+        super().__init__(maxsize)
+
+    @property
+    def priority_exchanges(self) -> frozenset:
+        return self._priority_exchanges
+
+    @property
+    def priority_size(self) -> int:
+        with self.mutex:
+            return self._priority_size
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = deque()
+        self._priority_size = 0
+
+    def _put(self, envelope: PublishingEnvelope) -> None:
+        if envelope.exchange in self._priority_exchanges:
+            self.queue.insert(self._priority_size, envelope)
+            self._priority_size += 1
+        else:
+            self.queue.append(envelope)
+
+    def _get(self) -> PublishingEnvelope:
+        if self._priority_size:
+            self._priority_size -= 1
+        return self.queue.popleft()
+
+    def discard_oldest(self) -> PublishingEnvelope:
+        """
+        Removes the oldest envelope of the other lane, or the oldest priority
+        envelope if all the envelopes are priority envelopes. This is used to
+        make space in a full queue without dropping urgent messages.
+        :return: The discarded envelope
+        """
+        with self.not_empty:
+            while not self._qsize():
+                self.not_empty.wait()
+
+            if self._priority_size < len(self.queue):
+                envelope = self.queue[self._priority_size]
+                del self.queue[self._priority_size]
+            else:
+                envelope = self._get()
+            self.not_full.notify()
+            return envelope
+
+
+def discard_oldest(publishing_queue: Queue) -> PublishingEnvelope:
+    """
+    This function makes space in a full publishing queue by discarding its
+    oldest envelope. Lane queues discard the envelopes of the other lane
+    first.
+    :param publishing_queue: The full publishing queue
+    :return: The discarded envelope
+    """
+    if isinstance(publishing_queue, LaneQueue):
+        return publishing_queue.discard_oldest()
+    return publishing_queue.get()
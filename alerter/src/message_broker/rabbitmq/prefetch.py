@@ -0,0 +1,102 @@
+import math
+from typing import Optional
+
+# The weight given to the latest processing time in the moving average
+PROCESSING_TIME_SMOOTHING = 0.2
+
+# The prefetch count is only changed if the new value differs from the current
+# one by at least this fraction, so that basic_qos is not re-issued for small
+# fluctuations in the processing time
+PREFETCH_CHANGE_THRESHOLD = 0.1
+
+
+class PrefetchTuner:
+    """
+    Chooses the prefetch count of a consumer from how long it takes to process
+    a message, how many messages are waiting in its broker queue, and how full
+    its publishing queue is.
+
+    The prefetch count is sized so that the prefetched messages keep the
+    consumer busy for the target buffer time. It is not increased beyond the
+    messages waiting in the broker queue, and it is reduced in proportion to
+    the fill level of the publishing queue, so that a consumer which cannot
+    publish its output does not keep taking work from the broker.
+    """
+
+    def __init__(self, initial_prefetch_count: int, min_prefetch_count: int,
+                 max_prefetch_count: int, target_buffer_time: float) -> None:
+        """
+        :param initial_prefetch_count: The prefetch count to start with
+        :param min_prefetch_count: The smallest prefetch count to choose
+        :param max_prefetch_count: The largest prefetch count to choose
+        :param target_buffer_time: For how many seconds the prefetched messages
+        should keep the consumer busy
+        """
+        self._min_prefetch_count = max(1, min_prefetch_count)
+        self._max_prefetch_count = max(self._min_prefetch_count,
+                                       max_prefetch_count)
+        self._target_buffer_time = target_buffer_time
+        self._prefetch_count = self._bound(initial_prefetch_count)
+        self._average_processing_time: Optional[float] = None
+
+    @property
+    def prefetch_count(self) -> int:
+        return self._prefetch_count
+
+    @property
+    def min_prefetch_count(self) -> int:
+        return self._min_prefetch_count
+
+    @property
+    def max_prefetch_count(self) -> int:
+        return self._max_prefetch_count
+
+    @property
+    def average_processing_time(self) -> Optional[float]:
+        return self._average_processing_time
+
+    def _bound(self, prefetch_count: int) -> int:
+        return min(self._max_prefetch_count,
+                   max(self._min_prefetch_count, prefetch_count))
+
+    def record_processing_time(self, processing_time: float) -> None:
+        """
+        Adds the time taken to process one message to the moving average of
+        the processing time.
+        :param processing_time: The processing time in seconds
+        :return: None
+        """
+        if self._average_processing_time is None:
+            self._average_processing_time = processing_time
+        else:
+            self._average_processing_time += PROCESSING_TIME_SMOOTHING * (
+                    processing_time - self._average_processing_time)
+
+    def tune(self, queue_depth: Optional[int],
+             publishing_queue_fill: float) -> int:
+        """
+        Chooses a new prefetch count from the observations so far. The current
+        prefetch count is kept if no message was processed yet, or if the new
+        value is within the change threshold.
+        :param queue_depth: The number of messages waiting in the broker queue,
+        or None if it is not known
+        :param publishing_queue_fill: The fraction of the publishing queue
+        which is in use, from 0 to 1
+        :return: The chosen prefetch count
+        """
+        if self._average_processing_time is None:
+            return self._prefetch_count
+
+        desired = math.ceil(self._target_buffer_time / max(
+            self._average_processing_time, 1e-6))
+        desired = math.floor(desired * max(0.0, 1.0 - publishing_queue_fill))
+
+        # There is no point in prefetching more messages than are available
+        if queue_depth is not None and desired > self._prefetch_count:
+            desired = min(desired, self._prefetch_count + queue_depth)
+
+        desired = self._bound(desired)
+        if abs(desired - self._prefetch_count) >= max(
+                1, self._prefetch_count * PREFETCH_CHANGE_THRESHOLD):
+            self._prefetch_count = desired
+        return self._prefetch_count
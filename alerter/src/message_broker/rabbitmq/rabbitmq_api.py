@@ -1,20 +1,30 @@
-import json
 import logging
 import time
 from datetime import timedelta
-from typing import List, Optional, Union, Dict, Callable, Any, Sequence
+from typing import (List, Optional, Union, Dict, Callable, Any, Sequence,
+                    Tuple)
 
 import pika
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 
+from src.message_broker.rabbitmq.codecs import (
+    MessageCodec, get_codec, encode_message)
+from src.message_broker.rabbitmq.compression import (
+    Compressor, CompressionMetrics, NO_COMPRESSION, get_compressor,
+    compress_body)
+from src.utils import env
 from src.utils.constants.rabbitmq import TOPIC
 from src.utils.exceptions import (ConnectionNotInitialisedException,
                                   MessageWasNotDeliveredException,
-                                  BlankCredentialException)
+                                  BlankCredentialException,
+                                  UnavailableMessagingOptionException)
 from src.utils.strings import strip_if_not_none
 from src.utils.timing import TimedTaskLimiter
 
+AMQP_TRANSPORT = 'amqp'
+LOCAL_TRANSPORT = 'local'
+_TRANSPORTS = [AMQP_TRANSPORT, LOCAL_TRANSPORT]
 
 # The producer/consumer must perform the error handling himself. For example
 # if a basic_publish fails with a connection error, the user must re-connect
@@ -24,12 +34,18 @@ class RabbitMQApi:
     def __init__(self, logger: logging.Logger, host: str = 'localhost',
                  port: int = 5672, username: str = '', password: str = '',
                  connection_check_time_interval: timedelta = timedelta(
-                     seconds=30)) \
-            -> None:
+                     seconds=30),
+                 codec: Optional[MessageCodec] = None,
+                 compressor: Optional[Compressor] = None,
+                 compression_threshold: Optional[int] = None,
+                 transport: Optional[str] = None) -> None:
         self._logger = logger
         self._host = host
         self._connection = None
         self._channel = None
+        # A second channel of the connection, opened when first used, on
+        # which messages are published without delivery confirmations
+        self._side_channel = None
         self._port = port  # Port used by the AMQP 0-9-1 and 1.0 clients
         self._username = username
         self._password = password
@@ -42,6 +58,23 @@ class RabbitMQApi:
         # A boolean variable which keeps track of the connection status with
         # RabbitMQ
         self._is_connected = False
+        # The codec used to encode dict bodies. Consumers decode messages
+        # according to their content type, so the codec of each producer can
+        # be changed independently.
+        self._codec = codec if codec is not None else self._configured_codec()
+        # Encoded bodies larger than the threshold are compressed to reduce
+        # the disk I/O and memory of the broker when messages pile up.
+        self._compressor = compressor if compressor is not None \
+            else self._configured_compressor()
+        self._compression_threshold = compression_threshold \
+            if compression_threshold is not None \
+            else env.RABBIT_COMPRESSION_THRESHOLD_BYTES
+        self._compression_metrics = CompressionMetrics()
+        # Single-host deployments may use the local bus instead of RabbitMQ.
+        # It offers the same operations, so the transport is transparent to
+        # the components.
+        self._transport = transport if transport is not None \
+            else self._configured_transport()
 
     @property
     def is_connected(self) -> bool:
@@ -63,6 +96,10 @@ class RabbitMQApi:
     def channel(self) -> Optional[BlockingChannel]:
         return self._channel
 
+    @property
+    def side_channel(self) -> Optional[BlockingChannel]:
+        return self._side_channel
+
     @property
     def port(self) -> int:
         return self._port
@@ -83,6 +120,59 @@ class RabbitMQApi:
     def connection_check_time_interval_seconds(self) -> float:
         return self._connection_check_time_interval_seconds
 
+    @property
+    def codec(self) -> MessageCodec:
+        return self._codec
+
+    @property
+    def compressor(self) -> Optional[Compressor]:
+        return self._compressor
+
+    @property
+    def compression_threshold(self) -> int:
+        return self._compression_threshold
+
+    @property
+    def compression_metrics(self) -> CompressionMetrics:
+        return self._compression_metrics
+
+    @property
+    def transport(self) -> str:
+        return self._transport
+
+    def _configured_transport(self) -> str:
+        if env.RABBIT_TRANSPORT not in _TRANSPORTS:
+            self._logger.warning(
+                "Transport %s is not supported. The %s transport will be "
+                "used.", env.RABBIT_TRANSPORT, AMQP_TRANSPORT)
+            return AMQP_TRANSPORT
+
+        return env.RABBIT_TRANSPORT
+
+    @staticmethod
+    def _configured_compressor() -> Optional[Compressor]:
+        # The optional compression libraries are not installed by default, so
+        # a compression which is not available is rejected at startup rather
+        # than silently disabled
+        if env.RABBIT_COMPRESSION == NO_COMPRESSION:
+            return None
+
+        compressor = get_compressor(env.RABBIT_COMPRESSION)
+        if compressor is None:
+            raise UnavailableMessagingOptionException(
+                'RABBIT_COMPRESSION', env.RABBIT_COMPRESSION)
+
+        return compressor
+
+    @staticmethod
+    def _configured_codec() -> MessageCodec:
+        codec = get_codec(env.RABBIT_MESSAGE_CODEC)
+        if codec is None:
+            raise UnavailableMessagingOptionException(
+                'RABBIT_MESSAGE_CODEC', env.RABBIT_MESSAGE_CODEC)
+
+        return codec
+
     def _set_as_connected(self) -> None:
         if not self.is_connected:
             self._logger.info("RabbitMQ connection is live.")
@@ -165,8 +255,19 @@ class RabbitMQApi:
                 'username': strip_if_not_none(self.username),
                 'password': strip_if_not_none(self.password)
             }
-            if not (stripped_credentials['username'] or stripped_credentials[
-                'password']):
+            if self.transport == LOCAL_TRANSPORT:
+                # The local bus is protected by its own key, therefore the
+                # RabbitMQ credentials do not apply. It is imported here
+                # because the local bus stores messages as envelopes of this
+                # package.
+                from src.message_broker.local_bus.manager import \
+                    connect_to_local_bus
+                self._connection = connect_to_local_bus(
+                    env.LOCAL_BUS_HOST, env.LOCAL_BUS_PORT,
+                    env.LOCAL_BUS_AUTHKEY)
+                self._channel = self.connection.channel()
+            elif not (stripped_credentials['username'] or
+                      stripped_credentials['password']):
                 # If both are blank/none/spaces:
                 self._connection = pika.BlockingConnection(
                     pika.ConnectionParameters(host=self.host))
@@ -257,10 +358,14 @@ class RabbitMQApi:
 
     def queue_declare(self, queue: str, passive: bool = False,
                       durable: bool = False, exclusive: bool = False,
-                      auto_delete: bool = False) -> Optional[Union[int, str]]:
+                      auto_delete: bool = False,
+                      arguments: Optional[Dict] = None) \
+            -> Optional[Union[int, str]]:
         # Perform operation only if a connection has been initialised, if not,
         # this function will throw a ConnectionNotInitialised exception
         args = [queue, passive, durable, exclusive, auto_delete]
+        if arguments is not None:
+            args.append(arguments)
         if self._connection_initialised():
             return self._safe(self.channel.queue_declare, args, -1)
 
@@ -272,19 +377,107 @@ class RabbitMQApi:
         if self._connection_initialised():
             return self._safe(self.channel.queue_bind, args, -1)
 
+    def encode_body(self, body: Union[Dict, List],
+                    properties: pika.spec.BasicProperties = None) \
+            -> Tuple[bytes, pika.spec.BasicProperties]:
+        """
+        Encodes a dict body using the codec and compresses it if it is larger
+        than the compression threshold.
+        :param body: The body to encode
+        :param properties: The pika properties the message will be sent with
+        :return: The encoded body, and a copy of the properties with the
+               : content type and encoding set so that consumers can decode
+               : the body
+        """
+        body, content_type = encode_message(body, self.codec)
+        encoded_size = len(body)
+        body, content_encoding = compress_body(
+            body, self.compressor, self.compression_threshold)
+        if content_encoding is not None:
+            self.compression_metrics.record(encoded_size, len(body))
+            self.logger.debug(
+                "Compressed a message of %s bytes to %s bytes using %s. "
+                "Compression metrics: %s", encoded_size, len(body),
+                content_encoding, self.compression_metrics.metrics)
+
+        # The given properties may be shared between messages, therefore they
+        # are copied rather than modified.
+        properties_fields = {} if properties is None else vars(properties)
+        encoded_properties = pika.BasicProperties(**{
+            **properties_fields, 'content_type': content_type,
+            'content_encoding': content_encoding
+        })
+
+        return body, encoded_properties
+
     def basic_publish(self, exchange: str, routing_key: str,
                       body: Union[str, Dict, bytes], is_body_dict: bool = False,
                       properties: pika.spec.BasicProperties = None,
                       mandatory: bool = False) -> Optional[int]:
-        # If the message to be published is a Dict, serialize to json first
-        args = [exchange, routing_key,
-                json.dumps(body) if is_body_dict else body,
-                properties, mandatory]
+        # If the message to be published is a Dict, encode it first
+        if is_body_dict:
+            body, properties = self.encode_body(body, properties)
+        args = [exchange, routing_key, body, properties, mandatory]
         # Perform operation only if a connection has been initialised, if not,
         # this function will throw a ConnectionNotInitialised exception
         if self._connection_initialised():
             return self._safe(self.channel.basic_publish, args, -1)
 
+    def _open_side_channel(self) -> BlockingChannel:
+        # The side channel is re-opened if it was closed, or if it belongs to
+        # a previous connection
+        if self._side_channel is None or self._side_channel.is_closed:
+            self._side_channel = self.connection.channel()
+        return self._side_channel
+
+    def _publish_on_side_channel(
+            self, exchange: str, routing_key: str, body: Union[str, bytes],
+            properties: pika.spec.BasicProperties = None) -> None:
+        self._open_side_channel().basic_publish(exchange, routing_key, body,
+                                                properties, False)
+
+    def _queue_depth_on_side_channel(self, queue: str) -> Optional[int]:
+        try:
+            declare_ok = self._open_side_channel().queue_declare(queue, True)
+        except pika.exceptions.ChannelClosedByBroker:
+            # The queue does not exist. The broker closes the side channel in
+            # this case, and it is re-opened when it is next used.
+            return None
+        return declare_ok.method.message_count
+
+    def queue_depth(self, queue: str) -> Optional[int]:
+        """
+        Returns the number of messages ready in a queue. The queue is declared
+        passively on the side channel, so that the channel used for consuming
+        is not closed by the broker if the queue does not exist.
+        :param queue: The name of the queue
+        :return: The number of messages ready in the queue, or None if the
+               : queue does not exist or RabbitMQ is temporarily unusable
+        """
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        if self._connection_initialised():
+            return self._safe(self._queue_depth_on_side_channel, [queue], None)
+
+    def basic_publish_on_side_channel(
+            self, exchange: str, routing_key: str,
+            body: Union[str, Dict, bytes], is_body_dict: bool = False,
+            properties: pika.spec.BasicProperties = None) -> Optional[int]:
+        """
+        Publishes a message on the side channel. Delivery is not confirmed, so
+        the publisher does not wait for the broker, and messages which cannot
+        be routed are dropped. This is meant for frequent messages whose loss
+        is harmless, such as heartbeats.
+        """
+        # If the message to be published is a Dict, encode it first
+        if is_body_dict:
+            body, properties = self.encode_body(body, properties)
+        args = [exchange, routing_key, body, properties]
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        if self._connection_initialised():
+            return self._safe(self._publish_on_side_channel, args, -1)
+
     def basic_publish_confirm(self, exchange: str, routing_key: str,
                               body: Union[str, Dict, bytes],
                               is_body_dict: bool = False,
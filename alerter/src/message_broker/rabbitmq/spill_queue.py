@@ -0,0 +1,451 @@
+import json
+import os
+import re
+import struct
+from collections import deque
+from queue import Queue
+from typing import Dict, Optional, List, Tuple, BinaryIO
+
+import pika
+
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+from src.message_broker.rabbitmq.lane_queue import LaneQueue
+from src.utils import env
+from src.utils.constants.rabbitmq import ALERT_EXCHANGE
+
+_SEGMENT_PREFIX = 'segment_'
+_SEGMENT_SUFFIX = '.log'
+_ADD_RECORD = b'A'
+_REMOVE_RECORD = b'R'
+# Record type, sequence number, header length, body length
+_ADD_RECORD_HEADER = struct.Struct('>cQII')
+# Record type, sequence number
+_REMOVE_RECORD_STRUCT = struct.Struct('>cQ')
+DEFAULT_SEGMENT_MAX_BYTES = 1024 * 1024
+
+
+class _SpilledEntry:
+    __slots__ = ('routing_key', 'segment', 'offset')
+
+    # The segment and offset are None for envelopes which could not be
+    # written to disk and are therefore only kept in memory.
+    def __init__(self, routing_key: str, segment: Optional[int],
+                 offset: Optional[int]) -> None:
+        self.routing_key = routing_key
+        self.segment = segment
+        self.offset = offset
+
+
+def parse_retention_limits(retention_limits: str) -> Dict[str, int]:
+    """
+    This function parses per routing key retention limits given as comma
+    separated routing_key=limit pairs, for example
+    'alert.system=500,transformed_data.system=100'.
+    :param retention_limits: The retention limits to parse
+    :return: A dict mapping routing keys to the maximum number of messages
+           : with that routing key which are kept in a spill queue
+    :raises ValueError: If a pair is not of the form routing_key=limit
+    """
+    limits = {}
+    for pair in filter(None, [pair.strip()
+                              for pair in retention_limits.split(',')]):
+        routing_key, separator, limit = pair.rpartition('=')
+        if not separator or not routing_key.strip():
+            raise ValueError("Invalid retention limit {}".format(pair))
+        limits[routing_key.strip()] = int(limit)
+
+    return limits
+
+
+class SpillQueue(Queue):
+    """
+    A publishing queue which writes every queued envelope to append-only
+    segment files, and keeps only the oldest envelopes in memory. Therefore
+    memory usage is bounded while the broker is unreachable, and the messages
+    which were not sent are loaded in order when the component restarts.
+
+    Every envelope is appended to the latest segment together with a sequence
+    number, and a removal record is appended when it leaves the queue.
+    Segments are deleted from the oldest once all of their envelopes were
+    removed. A newer segment is never deleted before an older one, since its
+    removal records may refer to envelopes in the older segment.
+
+    If a segment cannot be written, for example because the disk is full or
+    read-only, the envelope is kept in memory only, and like in-memory queues
+    the oldest envelope is discarded once the memory is full. Such envelopes
+    are lost if the component stops.
+    """
+
+    def __init__(self, directory: str, maxsize: int = 0,
+                 memory_size: int = 0,
+                 retention_limits: Optional[Dict[str, int]] = None,
+                 segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES) -> None:
+        """
+        :param directory: The directory to store the segment files in
+        :param maxsize: The maximum number of envelopes in the queue, 0 for
+                      : infinite
+        :param memory_size: The maximum number of envelopes kept in memory, 0
+                          : for infinite
+        :param retention_limits: The maximum number of envelopes kept per
+                               : routing key. The oldest envelope of a
+                               : routing key is discarded when its limit is
+                               : exceeded
+        :param segment_max_bytes: The size after which a new segment is
+                                : started
+        """
+        self._directory = directory
+        self._memory_size = memory_size
+        self._retention_limits = retention_limits or {}
+        self._segment_max_bytes = segment_max_bytes
+
+        # Queue.__init__ calls _init which loads the segments
+        super().__init__(maxsize)
+
+        # The loaded envelopes still need to be acknowledged with task_done
+        self.unfinished_tasks = self._qsize()
+        self._enforce_retention_limits()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def memory_size(self) -> int:
+        return self._memory_size
+
+    @property
+    def retention_limits(self) -> Dict[str, int]:
+        return self._retention_limits
+
+    @property
+    def spilled_size(self) -> int:
+        """
+        :return: The number of envelopes which are only stored on disk
+        """
+        with self.mutex:
+            return len(self._spilled_sequences)
+
+    def close(self) -> None:
+        with self.mutex:
+            self._close_files()
+
+    def _init(self, maxsize: int) -> None:
+        # self.queue holds the oldest envelopes and self._memory_sequences
+        # their sequence numbers, while self._spilled_sequences holds the
+        # sequence numbers of the newer envelopes which are only on disk. All
+        # envelopes are indexed by sequence number in self._index.
+        self.queue = deque()
+        self._memory_sequences = deque()
+        self._spilled_sequences = deque()
+        self._index: Dict[int, _SpilledEntry] = {}
+        self._routing_key_sequences: Dict[str, deque] = {}
+        self._segment_live_counts: Dict[int, int] = {}
+        self._read_files: Dict[int, BinaryIO] = {}
+        self._write_file: Optional[BinaryIO] = None
+        self._write_segment: Optional[int] = None
+        self._next_sequence = 0
+        self._next_segment = 0
+
+        os.makedirs(self._directory, exist_ok=True)
+        for segment in self._list_segments():
+            self._load_segment(segment)
+            self._next_segment = segment + 1
+        self._spilled_sequences.extend(sorted(self._index))
+        self._delete_dead_segments()
+        self._fill_memory()
+
+    def _qsize(self) -> int:
+        return len(self._index)
+
+    def _put(self, envelope: PublishingEnvelope) -> None:
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        try:
+            segment, offset = self._append_envelope(sequence, envelope)
+        except OSError:
+            self._abandon_write_segment()
+            self._put_in_memory_only(sequence, envelope)
+        else:
+            self._add_to_index(sequence, envelope.routing_key, segment,
+                               offset)
+            if self._memory_has_room() and not self._spilled_sequences:
+                self.queue.append(envelope)
+                self._memory_sequences.append(sequence)
+            else:
+                self._spilled_sequences.append(sequence)
+
+        limit = self._retention_limits.get(envelope.routing_key)
+        if limit is not None:
+            sequences = self._routing_key_sequences[envelope.routing_key]
+            while len(sequences) > limit:
+                self._remove(sequences[0])
+                # Discarded envelopes are never acknowledged with task_done
+                self.unfinished_tasks -= 1
+
+    def _put_in_memory_only(self, sequence: int,
+                            envelope: PublishingEnvelope) -> None:
+        # The envelope cannot be read back from disk, so it is kept in memory
+        # even if it is sent before older spilled envelopes.
+        self._add_to_index(sequence, envelope.routing_key, None, None)
+        self.queue.append(envelope)
+        self._memory_sequences.append(sequence)
+        if 0 < self._memory_size < len(self.queue):
+            self._remove(self._memory_sequences[0])
+            # Discarded envelopes are never acknowledged with task_done
+            self.unfinished_tasks -= 1
+
+    def _get(self) -> PublishingEnvelope:
+        if self.queue:
+            envelope = self.queue[0]
+            self._remove(self._memory_sequences[0])
+        else:
+            sequence = self._spilled_sequences[0]
+            envelope = self._read_envelope(self._index[sequence])
+            self._remove(sequence)
+        return envelope
+
+    def _memory_has_room(self) -> bool:
+        return self._memory_size <= 0 or len(self.queue) < self._memory_size
+
+    def _add_to_index(self, sequence: int, routing_key: str,
+                      segment: Optional[int], offset: Optional[int]) -> None:
+        self._index[sequence] = _SpilledEntry(routing_key, segment, offset)
+        self._routing_key_sequences.setdefault(
+            routing_key, deque()).append(sequence)
+        if segment is not None:
+            self._segment_live_counts[segment] = \
+                self._segment_live_counts.get(segment, 0) + 1
+
+    def _remove_from_index(self, sequence: int) -> _SpilledEntry:
+        entry = self._index.pop(sequence)
+        sequences = self._routing_key_sequences[entry.routing_key]
+        # The removed envelope is almost always the oldest of its routing key
+        if sequences[0] == sequence:
+            sequences.popleft()
+        else:
+            sequences.remove(sequence)
+        if not sequences:
+            del self._routing_key_sequences[entry.routing_key]
+        if entry.segment is not None:
+            self._segment_live_counts[entry.segment] -= 1
+        return entry
+
+    def _remove(self, sequence: int) -> None:
+        entry = self._remove_from_index(sequence)
+        if self._memory_sequences and self._memory_sequences[0] == sequence:
+            self._memory_sequences.popleft()
+            self.queue.popleft()
+        elif sequence in self._memory_sequences:
+            position = self._memory_sequences.index(sequence)
+            del self._memory_sequences[position]
+            del self.queue[position]
+        elif self._spilled_sequences[0] == sequence:
+            self._spilled_sequences.popleft()
+        else:
+            self._spilled_sequences.remove(sequence)
+
+        if not self._index:
+            # Nothing is waiting to be sent, so all segments can be deleted
+            # instead of recording the removal.
+            self._close_files()
+            for segment in self._list_segments():
+                os.remove(self._segment_path(segment))
+            self._segment_live_counts.clear()
+            return
+
+        if entry.segment is not None:
+            try:
+                self._append_removal(sequence)
+            except OSError:
+                # The envelope is sent again if the component restarts
+                self._abandon_write_segment()
+        self._delete_dead_segments()
+        self._fill_memory()
+
+    def _fill_memory(self) -> None:
+        while self._memory_has_room() and self._spilled_sequences:
+            sequence = self._spilled_sequences.popleft()
+            self.queue.append(self._read_envelope(self._index[sequence]))
+            self._memory_sequences.append(sequence)
+
+    def _enforce_retention_limits(self) -> None:
+        # The limits may have been lowered since the segments were written
+        with self.mutex:
+            for routing_key, limit in self._retention_limits.items():
+                sequences = self._routing_key_sequences.get(routing_key, [])
+                while len(sequences) > limit:
+                    self._remove(sequences[0])
+                    self.unfinished_tasks -= 1
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self._directory, '{}{:020d}{}'.format(
+            _SEGMENT_PREFIX, segment, _SEGMENT_SUFFIX))
+
+    def _list_segments(self) -> List[int]:
+        pattern = re.compile(r'^{}(\d+){}$'.format(
+            _SEGMENT_PREFIX, re.escape(_SEGMENT_SUFFIX)))
+        segments = []
+        for file_name in os.listdir(self._directory):
+            match = pattern.match(file_name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    def _load_segment(self, segment: int) -> None:
+        self._segment_live_counts.setdefault(segment, 0)
+        with open(self._segment_path(segment), 'rb') as segment_file:
+            data = segment_file.read()
+
+        offset = 0
+        while offset < len(data):
+            record_type = data[offset:offset + 1]
+            if record_type == _ADD_RECORD:
+                if offset + _ADD_RECORD_HEADER.size > len(data):
+                    break
+                _, sequence, header_length, body_length = \
+                    _ADD_RECORD_HEADER.unpack_from(data, offset)
+                end = offset + _ADD_RECORD_HEADER.size + header_length \
+                    + body_length
+                if end > len(data):
+                    break
+                header = json.loads(data[
+                    offset + _ADD_RECORD_HEADER.size:
+                    offset + _ADD_RECORD_HEADER.size + header_length])
+                self._add_to_index(sequence, header['routing_key'], segment,
+                                   offset)
+            elif record_type == _REMOVE_RECORD:
+                end = offset + _REMOVE_RECORD_STRUCT.size
+                if end > len(data):
+                    break
+                _, sequence = _REMOVE_RECORD_STRUCT.unpack_from(data, offset)
+                # The envelope may be in a segment which was already deleted
+                if sequence in self._index:
+                    self._remove_from_index(sequence)
+            else:
+                break
+
+            self._next_sequence = max(self._next_sequence, sequence + 1)
+            offset = end
+
+        if offset < len(data):
+            # The process stopped while writing the last record, therefore
+            # the partial record is discarded.
+            with open(self._segment_path(segment), 'r+b') as segment_file:
+                segment_file.truncate(offset)
+
+    def _delete_dead_segments(self) -> None:
+        for segment in sorted(self._segment_live_counts):
+            if self._segment_live_counts[segment] > 0 \
+                    or segment == self._write_segment:
+                break
+            self._delete_segment(segment)
+
+    def _delete_segment(self, segment: int) -> None:
+        read_file = self._read_files.pop(segment, None)
+        if read_file is not None:
+            read_file.close()
+        del self._segment_live_counts[segment]
+        os.remove(self._segment_path(segment))
+
+    def _writable_segment(self) -> BinaryIO:
+        if self._write_file is not None \
+                and self._write_file.tell() >= self._segment_max_bytes:
+            self._write_file.close()
+            self._write_file = None
+            self._write_segment = None
+            self._delete_dead_segments()
+
+        if self._write_file is None:
+            # Records are never appended to segments written before the
+            # process restarted, which may end with a discarded record.
+            self._write_segment = self._next_segment
+            self._next_segment += 1
+            self._segment_live_counts.setdefault(self._write_segment, 0)
+            self._write_file = open(
+                self._segment_path(self._write_segment), 'ab')
+
+        return self._write_file
+
+    def _abandon_write_segment(self) -> None:
+        # The segment may end with a partially written record, which is
+        # discarded when loading. Since no records may follow it, the next
+        # record is written to a new segment.
+        if self._write_file is not None:
+            try:
+                self._write_file.close()
+            except OSError:
+                pass
+            self._write_file = None
+            self._write_segment = None
+
+    def _append(self, record: bytes) -> Tuple[int, int]:
+        write_file = self._writable_segment()
+        offset = write_file.tell()
+        write_file.write(record)
+        # Flushing hands the record to the operating system, so that it
+        # survives the process stopping.
+        write_file.flush()
+        return self._write_segment, offset
+
+    def _append_envelope(self, sequence: int,
+                         envelope: PublishingEnvelope) -> Tuple[int, int]:
+        header = json.dumps({
+            'exchange': envelope.exchange,
+            'routing_key': envelope.routing_key,
+            'properties': vars(envelope.properties),
+            'mandatory': envelope.mandatory,
+        }).encode('utf-8')
+        return self._append(
+            _ADD_RECORD_HEADER.pack(_ADD_RECORD, sequence, len(header),
+                                    len(envelope.body))
+            + header + envelope.body)
+
+    def _append_removal(self, sequence: int) -> None:
+        self._append(_REMOVE_RECORD_STRUCT.pack(_REMOVE_RECORD, sequence))
+
+    def _read_envelope(self, entry: _SpilledEntry) -> PublishingEnvelope:
+        read_file = self._read_files.get(entry.segment)
+        if read_file is None:
+            read_file = open(self._segment_path(entry.segment), 'rb')
+            self._read_files[entry.segment] = read_file
+
+        read_file.seek(entry.offset)
+        _, _, header_length, body_length = _ADD_RECORD_HEADER.unpack(
+            read_file.read(_ADD_RECORD_HEADER.size))
+        header = json.loads(read_file.read(header_length))
+        body = read_file.read(body_length)
+        return PublishingEnvelope(
+            header['exchange'], header['routing_key'], body,
+            pika.BasicProperties(**header['properties']), header['mandatory'])
+
+    def _close_files(self) -> None:
+        for read_file in self._read_files.values():
+            read_file.close()
+        self._read_files.clear()
+        if self._write_file is not None:
+            self._write_file.close()
+            self._write_file = None
+            self._write_segment = None
+
+
+def create_publishing_queue(max_queue_size: int,
+                            spill_queue_name: Optional[str] = None) -> Queue:
+    """
+    This function creates the publishing queue of a component. If a spill
+    directory is configured, components with a spill queue name get a
+    SpillQueue which keeps max_queue_size envelopes in memory, otherwise they
+    get an in-memory queue of max_queue_size envelopes. In-memory queues send
+    the envelopes on the alert path before the other envelopes.
+    :param max_queue_size: The max queue size, 0 for infinite
+    :param spill_queue_name: The name of the component's spill queue, None if
+                           : the component should not spill to disk
+    :return: The publishing queue
+    """
+    if not env.PUBLISHING_SPILL_DIRECTORY or spill_queue_name is None:
+        return LaneQueue(max_queue_size, [ALERT_EXCHANGE])
+
+    directory = os.path.join(env.PUBLISHING_SPILL_DIRECTORY,
+                             re.sub(r'[^\w.-]+', '_', spill_queue_name))
+    return SpillQueue(
+        directory, env.PUBLISHING_SPILL_MAX_SIZE, max_queue_size,
+        parse_retention_limits(env.PUBLISHING_SPILL_RETENTION_LIMITS))
@@ -1,10 +1,18 @@
 from abc import abstractmethod, ABC
 from typing import Any, Dict, List, Optional
 
+from src.monitorables.slots import get_slot_values
 from src.utils.exceptions import InvalidDictSchemaException
 
 
 class ChainlinkContract(ABC):
+    __slots__ = (
+        '_proxy_address', '_aggregator_address', '_version', '_parent_id',
+        '_node_id', '_latest_round', '_latest_answer', '_latest_timestamp',
+        '_answered_in_round', '_historical_rounds', '_last_round_observed',
+        '_last_monitored'
+    )
+
     def __init__(self, proxy_address: str, aggregator_address: str,
                  version: int, parent_id: str, node_id: str) -> None:
         self._proxy_address = proxy_address
@@ -26,7 +34,7 @@ class ChainlinkContract(ABC):
         return self._proxy_address
 
     def __eq__(self, other: Any) -> bool:
-        return self.__dict__ == other.__dict__
+        return get_slot_values(self) == get_slot_values(other)
 
     @property
     def proxy_address(self) -> str:
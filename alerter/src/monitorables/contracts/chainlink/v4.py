@@ -6,6 +6,8 @@ from src.monitorables.contracts.chainlink.contract import ChainlinkContract
 
 
 class V4ChainlinkContract(ChainlinkContract):
+    __slots__ = ('_owed_payment',)
+
     def __init__(self, proxy_address: str, aggregator_address: str,
                  parent_id: str, node_id: str) -> None:
         super().__init__(proxy_address, aggregator_address, 4, parent_id,
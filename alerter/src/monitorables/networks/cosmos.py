@@ -7,6 +7,8 @@ from src.utils.exceptions import InvalidDictSchemaException
 
 
 class CosmosNetwork(Network):
+    __slots__ = ('_proposals', '_last_monitored_cosmos_rest')
+
     def __init__(self, parent_id: str, chain_name: str) -> None:
         super().__init__(parent_id, chain_name)
 
@@ -1,8 +1,12 @@
 from abc import abstractmethod, ABC
 from typing import Any
 
+from src.monitorables.slots import get_slot_values
+
 
 class Network(ABC):
+    __slots__ = ('_parent_id', '_chain_name')
+
     def __init__(self, parent_id: str, chain_name: str) -> None:
         self._parent_id = parent_id
         self._chain_name = chain_name
@@ -11,7 +15,7 @@ class Network(ABC):
         return self._chain_name
 
     def __eq__(self, other: Any) -> bool:
-        return self.__dict__ == other.__dict__
+        return get_slot_values(self) == get_slot_values(other)
 
     @property
     def parent_id(self) -> str:
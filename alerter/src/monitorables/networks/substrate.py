@@ -7,6 +7,11 @@ from src.utils.exceptions import InvalidDictSchemaException
 
 
 class SubstrateNetwork(Network):
+    __slots__ = (
+        '_grandpa_stalled', '_public_prop_count', '_active_proposals',
+        '_referendum_count', '_referendums', '_last_monitored_websocket'
+    )
+
     def __init__(self, parent_id: str, chain_name: str) -> None:
         super().__init__(parent_id, chain_name)
 
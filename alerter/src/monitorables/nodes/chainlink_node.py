@@ -8,6 +8,15 @@ from src.utils.exceptions import InvalidDictSchemaException
 
 
 class ChainlinkNode(Node):
+    __slots__ = (
+        '_went_down_at_prometheus', '_current_height',
+        '_total_block_headers_received', '_max_pending_tx_delay',
+        '_process_start_time_seconds', '_total_gas_bumps',
+        '_total_gas_bumps_exceeds_limit', '_no_of_unconfirmed_txs',
+        '_total_errored_job_runs', '_current_gas_price_info', '_balance_info',
+        '_last_prometheus_source_used', '_last_monitored_prometheus'
+    )
+
     def __init__(self, node_name: str, node_id: str, parent_id: str) -> None:
         super().__init__(node_name, node_id, parent_id)
 
@@ -252,13 +261,16 @@ class ChainlinkNode(Node):
         """
         This method sets the current_gas_price_info dict based on the new
         percentile and price. This is done in this way to protect the Dict
-        schema.
+        schema. A new dict is stored rather than modifying the current one, as
+        the current one may be shared with data which was already transformed.
         :param new_percentile: The new percentile to be stored
         :param new_price: The new gas to be stored
         :return: None
         """
-        self._current_gas_price_info['percentile'] = new_percentile
-        self._current_gas_price_info['price'] = new_price
+        self._current_gas_price_info = {
+            'percentile': new_percentile,
+            'price': new_price,
+        }
 
     @staticmethod
     def _new_balance_info_valid(new_balance_info: Dict) -> bool:
@@ -9,6 +9,14 @@ from src.utils.exceptions import InvalidDictSchemaException
 
 
 class CosmosNode(Node):
+    __slots__ = (
+        '_went_down_at_prometheus', '_went_down_at_cosmos_rest',
+        '_went_down_at_cometbft_rpc', '_current_height', '_voting_power',
+        '_is_syncing', '_is_peered_with_sentinel', '_bond_status', '_jailed',
+        '_slashed', '_missed_blocks', '_last_monitored_prometheus',
+        '_last_monitored_cometbft_rpc', '_last_monitored_cosmos_rest'
+    )
+
     def __init__(self, node_name: str, node_id: str, parent_id: str) -> None:
         super().__init__(node_name, node_id, parent_id)
 
@@ -5,6 +5,10 @@ from src.monitorables.nodes.node import Node
 
 
 class EVMNode(Node):
+    __slots__ = (
+        '_went_down_at', '_current_height', '_syncing', '_last_monitored'
+    )
+
     def __init__(self, node_name: str, node_id: str, parent_id: str) -> None:
         super().__init__(node_name, node_id, parent_id)
 
@@ -1,8 +1,12 @@
 from abc import abstractmethod, ABC
 from typing import Any
 
+from src.monitorables.slots import get_slot_values
+
 
 class Node(ABC):
+    __slots__ = ('_node_name', '_node_id', '_parent_id')
+
     def __init__(self, node_name: str, node_id: str, parent_id: str) -> None:
         self._node_name = node_name
         self._node_id = node_id
@@ -12,7 +16,7 @@ class Node(ABC):
         return self._node_name
 
     def __eq__(self, other: Any) -> bool:
-        return self.__dict__ == other.__dict__
+        return get_slot_values(self) == get_slot_values(other)
 
     @property
     def node_name(self) -> str:
@@ -8,6 +8,16 @@ from src.utils.exceptions import InvalidDictSchemaException
 
 
 class SubstrateNode(Node):
+    __slots__ = (
+        '_went_down_at_websocket', '_best_height', '_target_height',
+        '_finalized_height', '_current_session', '_current_era',
+        '_authored_blocks', '_active', '_elected', '_disabled',
+        '_eras_stakers', '_sent_heartbeat', '_controller_address',
+        '_history_depth_eras', '_unclaimed_rewards', '_claimed_rewards',
+        '_previous_era_rewards', '_historical', '_token_symbol',
+        '_last_monitored_websocket'
+    )
+
     def __init__(self, node_name: str, node_id: str, parent_id: str) -> None:
         super().__init__(node_name, node_id, parent_id)
 
@@ -2,6 +2,11 @@ from typing import Optional, Dict
 
 
 class GitHubRepo:
+    __slots__ = (
+        '_repo_name', '_repo_id', '_parent_id', '_no_of_releases',
+        '_last_monitored'
+    )
+
     def __init__(self, repo_name: str, repo_id: str, parent_id: str) -> None:
         self._repo_name = repo_name
         self._repo_id = repo_id
@@ -52,6 +57,11 @@ class GitHubRepo:
 
 
 class DockerHubRepo:
+    __slots__ = (
+        '_repo_namespace', '_repo_name', '_repo_id', '_parent_id', '_tags',
+        '_last_monitored'
+    )
+
     def __init__(self, repo_namespace: str, repo_name: str, repo_id: str,
                  parent_id: str) -> None:
         self._repo_namespace = repo_namespace
@@ -0,0 +1,19 @@
+from typing import Any, Dict
+
+
+def get_slot_values(monitorable: Any) -> Dict[str, Any]:
+    """
+    Monitorables declare __slots__ so that their instances do not carry a
+    per-instance __dict__. This function collects the attributes of a
+    monitorable declared in the __slots__ of its class and its base classes.
+    :param monitorable: The monitorable whose attributes are to be returned
+    :return: A dict mapping attribute names to their values. Attributes which
+           : were never set are omitted
+    """
+    values = {}
+    for cls in reversed(type(monitorable).__mro__):
+        for slot in cls.__dict__.get('__slots__', ()):
+            if hasattr(monitorable, slot):
+                values[slot] = getattr(monitorable, slot)
+
+    return values
@@ -3,6 +3,17 @@ from typing import Optional
 
 
 class System:
+    __slots__ = (
+        '_system_name', '_system_id', '_parent_id', '_went_down_at',
+        '_process_cpu_seconds_total', '_process_memory_usage',
+        '_virtual_memory_usage', '_open_file_descriptors', '_system_cpu_usage',
+        '_system_ram_usage', '_system_storage_usage',
+        '_network_transmit_bytes_per_second', '_network_transmit_bytes_total',
+        '_network_receive_bytes_per_second', '_network_receive_bytes_total',
+        '_disk_io_time_seconds_in_interval', '_disk_io_time_seconds_total',
+        '_last_monitored'
+    )
+
     def __init__(self, system_name: str, system_id: str, parent_id: str) \
             -> None:
         self._system_name = system_name
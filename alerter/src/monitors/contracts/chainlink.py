@@ -16,6 +16,7 @@ from web3.exceptions import ContractLogicError
 from web3.middleware import geth_poa_middleware
 
 from src.configs.nodes.chainlink import ChainlinkNodeConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
 from src.utils.constants.abis.v3 import V3_AGGREGATOR, V3_PROXY
@@ -42,7 +43,8 @@ class ChainlinkContractsMonitor(Monitor):
     def __init__(self, monitor_name: str, weiwatchers_url: str,
                  evm_nodes: List[str], node_configs: List[ChainlinkNodeConfig],
                  logger: logging.Logger, monitor_period: int,
-                 rabbitmq: RabbitMQApi, parent_id: str) -> None:
+                 rabbitmq: RabbitMQApi, parent_id: str,
+                 redis: Optional[RedisApi] = None) -> None:
         # An exception is raised if the monitor is not given enough data
         # sources. The callee must also make sure that the given node_configs
         # have valid prometheus urls, and that prometheus and contracts
@@ -52,7 +54,8 @@ class ChainlinkContractsMonitor(Monitor):
             raise ComponentNotGivenEnoughDataSourcesException(
                 monitor_name, field)
 
-        super().__init__(monitor_name, logger, monitor_period, rabbitmq)
+        super().__init__(monitor_name, logger, monitor_period, rabbitmq,
+                         redis)
         self._node_configs = node_configs
         self._contracts_url = weiwatchers_url
         self._parent_id = parent_id
@@ -139,6 +142,34 @@ class ChainlinkContractsMonitor(Monitor):
     def address_retrieval_limiter(self) -> TimedTaskLimiter:
         return self._address_retrieval_limiter
 
+    def _get_progress_id(self) -> str:
+        # The contracts of a chain are monitored by one monitor
+        return self._parent_id
+
+    def _get_progress(self) -> Dict:
+        if not self.last_block_monitored and not self.last_round_observed:
+            return {}
+
+        return {'b': self.last_block_monitored, 'r': self.last_round_observed}
+
+    def _set_progress(self, progress: Dict) -> None:
+        # The stored dicts have the same structure as the in-memory ones,
+        # {<node_id>: {<proxy_contract_address>: <value>}}. Nodes which are no
+        # longer monitored are discarded.
+        node_ids = {node_config.node_id for node_config in self.node_configs}
+        for node_id, last_blocks in progress.get('b', {}).items():
+            if node_id in node_ids and node_id not in self.last_block_monitored:
+                self._last_block_monitored[node_id] = {
+                    proxy_address: int(block)
+                    for proxy_address, block in last_blocks.items()
+                }
+        for node_id, last_rounds in progress.get('r', {}).items():
+            if node_id in node_ids and node_id not in self.last_round_observed:
+                self._last_round_observed[node_id] = {
+                    proxy_address: None if round_id is None else int(round_id)
+                    for proxy_address, round_id in last_rounds.items()
+                }
+
     def _get_chain_contracts(self) -> List[Dict]:
         """
         This functions retrieves all the chain contracts along with some data.
@@ -1,7 +1,7 @@
-import copy
 import json
 import logging
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from http.client import IncompleteRead
 from typing import Dict, List, Optional, Callable, Any
 
@@ -13,8 +13,12 @@ from urllib3.exceptions import ProtocolError
 from src.api_wrappers.cosmos import (
     CosmosRestServerApiWrapper, CometbftRpcApiWrapper)
 from src.configs.nodes.cosmos import CosmosNodeConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
+from src.utils.constants.cosmos import (
+    COSMOS_REST_MAX_PAGE_LIMIT, COMETBFT_MAX_PER_PAGE,
+    MAX_PARALLEL_PAGE_REQUESTS)
 from src.utils.exceptions import (
     IncorrectJSONRetrievedException, CosmosSDKVersionIncompatibleException,
     ComponentNotGivenEnoughDataSourcesException,
@@ -34,14 +38,16 @@ _VERSION_INCOMPATIBILITY_EXCEPTIONS = [
 class CosmosMonitor(Monitor, ABC):
     def __init__(self, monitor_name: str, data_sources: List[CosmosNodeConfig],
                  logger: logging.Logger, monitor_period: int,
-                 rabbitmq: RabbitMQApi) -> None:
+                 rabbitmq: RabbitMQApi,
+                 redis: Optional[RedisApi] = None) -> None:
         # An exception is raised if the monitor is not given enough data
         # sources.
         if len(data_sources) == 0:
             raise ComponentNotGivenEnoughDataSourcesException(monitor_name,
                                                               'data_sources')
 
-        super().__init__(monitor_name, logger, monitor_period, rabbitmq)
+        super().__init__(monitor_name, logger, monitor_period, rabbitmq,
+                         redis)
         self._data_sources = data_sources
         self._cosmos_rest_server_api = CosmosRestServerApiWrapper(self.logger)
         self._cometbft_rpc_api = CometbftRpcApiWrapper(self.logger)
@@ -303,6 +309,39 @@ class CosmosMonitor(Monitor, ABC):
             raise IncorrectJSONRetrievedException('Cosmos Cometbft RPC',
                                                   repr(e))
 
+    @staticmethod
+    def _fetch_pages_in_parallel(fetch_page: Callable[[Dict], Dict],
+                                 pages_params: List[Dict]) -> List[Dict]:
+        """
+        This function retrieves a number of pages concurrently. The pages are
+        returned in the same order as their params, and the first exception
+        raised by a retrieval is propagated to the caller.
+        :param fetch_page: A function which retrieves a page given its params
+        :param pages_params: The params of each page to be retrieved
+        :return: The retrieved pages ordered as pages_params
+        """
+        if len(pages_params) <= 1:
+            return [fetch_page(page_params) for page_params in pages_params]
+
+        max_workers = min(MAX_PARALLEL_PAGE_REQUESTS, len(pages_params))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch_page, pages_params))
+
+    @staticmethod
+    def _get_rest_page_size(page: Dict) -> Optional[int]:
+        """
+        Cosmos REST list endpoints return the page entries in a single list
+        field next to the pagination field. This function returns the number
+        of entries in that list, which is the page size actually used by the
+        server as it may cap the requested limit.
+        :param page: A page returned by a Cosmos REST list endpoint
+        :return: The number of entries in the page
+               : None if the entries could not be identified
+        """
+        lists = [value for key, value in page.items()
+                 if key != 'pagination' and isinstance(value, list)]
+        return len(lists[0]) if len(lists) == 1 else None
+
     def _get_rest_data_with_pagination_keys(
             self, function, args: List[Any], params: Dict, node_name: str,
             sdk_version: str) -> List[Dict]:
@@ -310,6 +349,10 @@ class CosmosMonitor(Monitor, ABC):
         This function caters for endpoints which make use the pagination field.
         This is done by updating the function arguments before passing the
         function to the cosmos_rest_server_api.execute_with_checks function.
+        The first page is requested with the maximum page limit and with
+        pagination.count_total set. If the total is returned, the remaining
+        pages are retrieved in parallel using offsets, otherwise we fall back
+        to traversing the pages sequentially using the pagination keys.
         :param function: The wrapper call to execute
         :param args: The arguments to be passed to the API call
         :param params: The params that should also be passed as arguments. These
@@ -326,17 +369,36 @@ class CosmosMonitor(Monitor, ABC):
         if params is None:
             params = {}
 
-        pagination_key = 'invalid_key'
-        paginated_data = []
+        def fetch_page(page_params: Dict) -> Dict:
+            return self.cosmos_rest_server_api.execute_with_checks(
+                function, args + [page_params], node_name, sdk_version)
+
+        first_page = fetch_page({
+            **params, 'pagination.limit': COSMOS_REST_MAX_PAGE_LIMIT,
+            'pagination.count_total': 'true'
+        })
+        paginated_data = [first_page]
+        pagination_key = first_page['pagination']['next_key']
+        if pagination_key is None:
+            return paginated_data
+
+        total = int(first_page['pagination'].get('total') or 0)
+        page_size = self._get_rest_page_size(first_page)
+        if total > 0 and page_size:
+            # Offsets are supported, therefore retrieve the remaining pages
+            # concurrently using the page size chosen by the server.
+            paginated_data.extend(self._fetch_pages_in_parallel(fetch_page, [
+                {**params, 'pagination.limit': page_size,
+                 'pagination.offset': offset}
+                for offset in range(page_size, total, page_size)
+            ]))
+            return paginated_data
+
         while pagination_key is not None:
-            params = copy.deepcopy(params)  # To avoid side-effects
-            if pagination_key != 'invalid_key':
-                params['pagination.key'] = pagination_key
-            new_args = args + [params]
-            ret = self.cosmos_rest_server_api.execute_with_checks(function,
-                                                                  new_args,
-                                                                  node_name,
-                                                                  sdk_version)
+            ret = fetch_page({
+                **params, 'pagination.limit': COSMOS_REST_MAX_PAGE_LIMIT,
+                'pagination.key': pagination_key
+            })
             paginated_data.append(ret)
             pagination_key = ret['pagination']['next_key']
 
@@ -348,8 +410,9 @@ class CosmosMonitor(Monitor, ABC):
         """
         This function executes a Cometbft RPC API call with pages in mind. For
         Cometbft, some endpoints subdivide the data into a number of pages.
-        These pages can be traversed by counting the number of entries in each
-        page until we reach the total number of entries.
+        The first page is requested with the maximum per_page, and once the
+        total number of entries is known the remaining pages are retrieved in
+        parallel.
         :param function: The Cometbft RPC API call to execute
         :param args: The arguments to pass to the RPC call
         :param params: The params that should also be passed as arguments. These
@@ -365,25 +428,25 @@ class CosmosMonitor(Monitor, ABC):
         if params is None:
             params = {}
 
-        counter = -1
-        total = -1
-        page = 1
-        first_call = True
-        data = []
-        while counter < total or first_call:
-            params = copy.deepcopy(params)  # To avoid side-effects
-            params['page'] = page
-            ret = self.cometbft_rpc_api.execute_with_checks(
-                function, args + [params], node_name)
-            data.append(ret)
-            if first_call:
-                # This check is done just in case an endpoint returns different
-                # totals and for initialisation of both counter and total
-                total = int(ret['result']['total'])
-                counter = 0
-                first_call = False
-            counter += int(ret['result']['count'])
-            page += 1
+        def fetch_page(page_params: Dict) -> Dict:
+            return self.cometbft_rpc_api.execute_with_checks(
+                function, args + [page_params], node_name)
+
+        first_page = fetch_page(
+            {**params, 'page': 1, 'per_page': COMETBFT_MAX_PER_PAGE})
+        data = [first_page]
+        total = int(first_page['result']['total'])
+        page_size = int(first_page['result']['count'])
+        if page_size <= 0 or page_size >= total:
+            return data
+
+        # The node may cap per_page, therefore the number of pages is derived
+        # from the amount of entries actually returned in the first page.
+        number_of_pages = -(-total // page_size)
+        data.extend(self._fetch_pages_in_parallel(fetch_page, [
+            {**params, 'page': page, 'per_page': COMETBFT_MAX_PER_PAGE}
+            for page in range(2, number_of_pages + 1)
+        ]))
 
         return data
 
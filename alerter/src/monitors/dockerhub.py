@@ -25,6 +25,8 @@ from src.utils.exceptions import (DataReadingException, PANICException,
 
 
 class DockerHubMonitor(Monitor):
+    supports_reconfiguration = True
+
     def __init__(self, monitor_name: str, repo_config: DockerHubRepoConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi) -> None:
@@ -35,6 +37,9 @@ class DockerHubMonitor(Monitor):
     def repo_config(self) -> DockerHubRepoConfig:
         return self._repo_config
 
+    def reconfigure(self, config: DockerHubRepoConfig, *args) -> None:
+        self._repo_config = config
+
     def _display_data(self, data: Dict) -> str:
         # To cater for tags with unicode characters we must first encode
         # as utf-8 and then decode
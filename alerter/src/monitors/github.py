@@ -23,6 +23,8 @@ from src.utils.exceptions import (DataReadingException, PANICException,
 
 
 class GitHubMonitor(Monitor):
+    supports_reconfiguration = True
+
     def __init__(self, monitor_name: str, repo_config: GitHubRepoConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi) -> None:
@@ -33,6 +35,9 @@ class GitHubMonitor(Monitor):
     def repo_config(self) -> GitHubRepoConfig:
         return self._repo_config
 
+    def reconfigure(self, config: GitHubRepoConfig, *args) -> None:
+        self._repo_config = config
+
     def _display_data(self, data: Dict) -> str:
         # To cater for releases with unicode characters we must first encode
         # as utf-8 and then decode
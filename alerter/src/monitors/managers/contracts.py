@@ -10,6 +10,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 
 from src.configs.nodes.chainlink import ChainlinkNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitors.managers.manager import MonitorsManager
 from src.monitors.starters import start_chainlink_contracts_monitor
 from src.utils.constants.monitorables import MonitorableType
@@ -286,7 +287,7 @@ class ContractMonitorsManager(MonitorsManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s. Now processing.", sent_configs)
 
@@ -1,15 +1,16 @@
 import copy
-import json
 import logging
 import multiprocessing
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 
 from src.configs.repo import GitHubRepoConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
+from src.monitors.github import GitHubMonitor
 from src.monitors.managers.manager import MonitorsManager
 from src.monitors.starters import start_github_monitor
 from src.utils import env
@@ -21,7 +22,7 @@ from src.utils.constants.rabbitmq import (
     CONFIG_EXCHANGE, HEALTH_CHECK_EXCHANGE, GH_MON_MAN_CONFIGS_QUEUE_NAME,
     GH_MON_MAN_HEARTBEAT_QUEUE_NAME, PING_ROUTING_KEY,
     GH_MON_MAN_CONFIGS_ROUTING_KEY_CHAINS, GH_MON_MAN_CONFIGS_ROUTING_KEY_GEN,
-    TOPIC, MONITORABLE_EXCHANGE)
+    TOPIC, MONITORABLE_EXCHANGE, GITHUB_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
 from src.utils.types import str_to_bool
@@ -93,8 +94,10 @@ class GitHubMonitorsManager(MonitorsManager):
             base_chain: str, sub_chain: str) -> None:
         log_and_print("Creating a new process for the monitor of {}"
                       .format(repo_config.repo_name), self.logger)
-        process = multiprocessing.Process(target=start_github_monitor,
-                                          args=(repo_config,))
+        control_queue = self._create_control_queue()
+        process = multiprocessing.Process(
+            target=start_github_monitor, args=(repo_config,),
+            kwargs={'control_queue': control_queue})
         # Kill children if parent is killed
         process.daemon = True
         process.start()
@@ -103,6 +106,7 @@ class GitHubMonitorsManager(MonitorsManager):
             GITHUB_MONITOR_NAME_TEMPLATE.format(
                 repo_config.repo_name.replace('/', ' ')[:-1]))
         self._config_process_dict[config_id]['process'] = process
+        self._config_process_dict[config_id]['control_queue'] = control_queue
         self._config_process_dict[config_id]['chain'] = chain
         self._config_process_dict[config_id]['parent_id'] = (
             repo_config.parent_id)
@@ -111,10 +115,42 @@ class GitHubMonitorsManager(MonitorsManager):
         self._config_process_dict[config_id]['base_chain'] = base_chain
         self._config_process_dict[config_id]['sub_chain'] = sub_chain
 
+    def _reconfigure_or_restart_monitor_process(
+            self, repo_config: GitHubRepoConfig, config_id: str, chain: str,
+            base_chain: str, sub_chain: str) -> None:
+        """
+        This function applies a modified configuration to the running monitor
+        of config_id without restarting it, so that the monitor keeps its
+        state. The monitor is restarted only if this is not possible, for
+        example if the monitor's name changed or its process is not alive.
+        :param repo_config: The modified configuration
+        :param config_id: The id of the modified configuration
+        :param chain: The chain the configuration belongs to
+        :param base_chain: The name of the base chain
+        :param sub_chain: The name of the sub chain
+        :return: None
+        """
+        if self._reconfigure_monitor_process(
+                config_id, GITHUB_MONITOR_NAME_TEMPLATE.format(
+                    repo_config.repo_name.replace('/', ' ')[:-1]),
+                GitHubMonitor, repo_config):
+            self.config_process_dict[config_id]['parent_id'] = (
+                repo_config.parent_id)
+            log_and_print("Sent the modified configuration of {} to its "
+                          "running monitor".format(repo_config.repo_name),
+                          self.logger)
+            return
+
+        previous_process = self.config_process_dict[config_id]['process']
+        previous_process.terminate()
+        previous_process.join()
+        self._create_and_start_monitor_process(repo_config, config_id, chain,
+                                               base_chain, sub_chain)
+
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -186,10 +222,6 @@ class GitHubMonitorsManager(MonitorsManager):
                 releases_page = env.GITHUB_RELEASES_TEMPLATE.format(repo_name)
                 repo_config = GitHubRepoConfig(repo_id, parent_id, repo_name,
                                                monitor_repo, releases_page)
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
 
                 old_repo_name = modified_configs[config_id]['repo_name']
                 if not old_repo_name.endswith('/'):
@@ -198,7 +230,7 @@ class GitHubMonitorsManager(MonitorsManager):
                 # If we should not monitor the repo, delete the previous
                 # process from the repo and move to the next config
                 if not monitor_repo:
-                    del self.config_process_dict[config_id]
+                    self._kill_monitor_process(config_id)
                     del correct_github_repos_configs[config_id]
 
                     log_and_print("Killed the monitor of {} ".format(
@@ -206,12 +238,12 @@ class GitHubMonitorsManager(MonitorsManager):
                     continue
 
                 log_and_print(
-                    "The configuration for {} was modified. A new monitor with "
-                    "the latest configuration will be started.".format(
+                    "The configuration for {} was modified. It will be applied "
+                    "to the running monitor, or a new monitor with the latest "
+                    "configuration will be started.".format(
                         old_repo_name), self.logger)
-                self._create_and_start_monitor_process(repo_config, config_id,
-                                                       chain, base_chain,
-                                                       sub_chain)
+                self._reconfigure_or_restart_monitor_process(
+                    repo_config, config_id, chain, base_chain, sub_chain)
                 correct_github_repos_configs[config_id] = config
 
             removed_configs = get_removed_configs(sent_configs,
@@ -256,6 +288,9 @@ class GitHubMonitorsManager(MonitorsManager):
         self.process_and_send_monitorable_data_generic(
             base_chain, monitorable_type)
 
+    def _get_monitor_pipeline(self, process_details: Dict) -> Optional[str]:
+        return GITHUB_RAW_DATA_ROUTING_KEY
+
     def _process_ping(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
@@ -296,6 +331,7 @@ class GitHubMonitorsManager(MonitorsManager):
                                                    monitor_repo, releases_page)
                     self._create_and_start_monitor_process(
                         repo_config, config_id, chain, base_chain, sub_chain)
+            self._propagate_backpressure()
             heartbeat['timestamp'] = datetime.now().timestamp()
         except Exception as e:
             # If we encounter an error during processing log the error and
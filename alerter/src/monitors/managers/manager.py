@@ -1,8 +1,9 @@
 import logging
+import multiprocessing
 import sys
 from abc import ABC, abstractmethod
 from types import FrameType
-from typing import Dict
+from typing import Dict, Optional, Type
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,11 +11,16 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.abstract.publisher_subscriber import \
     QueuingPublisherSubscriberComponent
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.monitors.monitor import Monitor
+from src.utils import env
+from src.utils.backpressure import BackpressureGauge, PressureLevel
 from src.utils.constants.monitorables import MonitorableType
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY,
-    MONITORABLE_EXCHANGE)
+    MONITORABLE_EXCHANGE, PIPELINE_INPUT_QUEUES)
+from src.utils.constants.starters import BACKPRESSURE_RELEASE_RATIO
 from src.utils.logging import log_and_print
+from src.utils.types import MonitorableConfig
 
 
 class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
@@ -23,6 +29,10 @@ class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
         self._config_process_dict = {}
         self._name = name
 
+        # The backpressure level of each pipeline, keyed by the routing key
+        # with which the pipeline's monitors publish raw data
+        self._backpressure_gauges = {}
+
         super().__init__(logger, rabbitmq)
 
     def __str__(self) -> str:
@@ -36,6 +46,140 @@ class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
     def name(self) -> str:
         return self._name
 
+    @property
+    def backpressure_gauges(self) -> Dict[str, BackpressureGauge]:
+        return self._backpressure_gauges
+
+    @staticmethod
+    def _create_control_queue() -> multiprocessing.Queue:
+        """
+        This function creates the queue used to send modified configurations to
+        a monitor process
+        :return: The control queue
+        """
+        control_queue = multiprocessing.Queue()
+        # Configurations which were not read by a monitor are of no use once it
+        # is killed, therefore the manager should not wait for them to be
+        # flushed when exiting.
+        control_queue.cancel_join_thread()
+        return control_queue
+
+    def _reconfigure_monitor_process(self, config_id: str,
+                                     component_name: str,
+                                     monitor_type: Type[Monitor],
+                                     config: MonitorableConfig, *args) -> bool:
+        """
+        This function attempts to send a modified configuration to the running
+        monitor of config_id, so that it is applied without restarting the
+        monitor and losing its state. This is only possible if the monitor is
+        alive, it has a control queue, its name does not change, and its type
+        supports reconfiguration and accepts the modified configuration.
+        :param config_id: The id of the modified configuration
+        :param component_name: The name of the monitor given the modified
+                             : configuration
+        :param monitor_type: The type of the running monitor
+        :param config: The modified configuration
+        :param args: Any other arguments the monitor was created with
+        :return: True if the configuration was sent to the running monitor
+               : False if the monitor must be restarted instead
+        """
+        process_details = self.config_process_dict[config_id]
+        control_queue = process_details.get('control_queue')
+        if (control_queue is None
+                or process_details['component_name'] != component_name
+                or not process_details['process'].is_alive()
+                or not monitor_type.supports_reconfiguration):
+            return False
+
+        try:
+            monitor_type.validate_reconfiguration(config, *args)
+        except Exception as e:
+            self.logger.warning("The modified configuration of %s cannot be "
+                                "applied in-place: %s", component_name, e)
+            return False
+
+        control_queue.put({'config': config, 'args': args})
+        return True
+
+    def _get_monitor_pipeline(self, process_details: Dict) -> Optional[str]:
+        """
+        Managers whose monitors can be slowed down under backpressure must
+        override this function.
+        :param process_details: The details of a monitor process, as stored in
+                              : self._config_process_dict
+        :return: The routing key with which the monitor publishes raw data, or
+               : None if the monitor is not subject to backpressure
+        """
+        return None
+
+    def _get_pipeline_pressure(self, pipeline: str) -> PressureLevel:
+        """
+        This function updates the backpressure level of a pipeline from the
+        depth of the most backed-up queue downstream of its monitors.
+        :param pipeline: The routing key of the pipeline
+        :return: The backpressure level of the pipeline
+        """
+        if pipeline not in self.backpressure_gauges:
+            self._backpressure_gauges[pipeline] = BackpressureGauge(
+                env.BACKPRESSURE_ELEVATED_QUEUE_DEPTH,
+                env.BACKPRESSURE_HIGH_QUEUE_DEPTH, BACKPRESSURE_RELEASE_RATIO)
+        gauge = self.backpressure_gauges[pipeline]
+
+        # Queues which do not exist yet are ignored
+        queue_depths = {queue: self.rabbitmq.queue_depth(queue)
+                        for queue in PIPELINE_INPUT_QUEUES[pipeline]}
+        known_depths = [depth for depth in queue_depths.values()
+                        if depth is not None]
+        previous_level = gauge.level
+        level = gauge.update(max(known_depths) if known_depths else None)
+        if level != previous_level:
+            self.logger.warning(
+                "The backpressure on the '%s' pipeline changed from %s to %s. "
+                "Queue depths: %s", pipeline, previous_level.name, level.name,
+                queue_depths)
+
+        return level
+
+    def _propagate_backpressure(self) -> None:
+        """
+        This function sends the backpressure level of each pipeline to the
+        running monitors of the pipeline whose level changed. Monitors without
+        a control queue are not affected.
+        :return: None
+        """
+        if not env.BACKPRESSURE:
+            return
+
+        pipeline_levels = {}
+        for process_details in self.config_process_dict.values():
+            control_queue = process_details.get('control_queue')
+            pipeline = self._get_monitor_pipeline(process_details)
+            if control_queue is None or pipeline is None:
+                continue
+
+            if pipeline not in pipeline_levels:
+                pipeline_levels[pipeline] = self._get_pipeline_pressure(
+                    pipeline)
+            level = pipeline_levels[pipeline]
+
+            # A newly started monitor starts without backpressure
+            if process_details.get('pressure_level',
+                                   PressureLevel.NORMAL) != level:
+                control_queue.put({'pressure_level': level})
+                process_details['pressure_level'] = level
+
+    def _kill_monitor_process(self, config_id: str) -> None:
+        """
+        This function terminates the monitor process of config_id and removes
+        it from self._config_process_dict
+        :param config_id: The id of the configuration being monitored
+        :return: None
+        """
+        process = self.config_process_dict[config_id]['process']
+        process.terminate()
+        process.join()
+        del self.config_process_dict[config_id]
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -12,6 +12,7 @@ from src.configs.nodes.cosmos import CosmosNodeConfig
 from src.configs.nodes.node import NodeConfig
 from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitors.managers.manager import (
     MonitorsManager)
 from src.monitors.starters import (
@@ -356,7 +357,7 @@ class NetworkMonitorsManager(MonitorsManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s. Now processing.", sent_configs)
 
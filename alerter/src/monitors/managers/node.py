@@ -1,9 +1,8 @@
 import copy
-import json
 import logging
 import multiprocessing
 from datetime import datetime
-from typing import Dict, Type, List, Callable
+from typing import Dict, Type, List, Callable, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -12,6 +11,7 @@ from src.configs.nodes.cosmos import CosmosNodeConfig
 from src.configs.nodes.node import NodeConfig
 from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitors.managers.manager import (
     MonitorsManager)
 from src.monitors.monitor import Monitor
@@ -30,11 +30,21 @@ from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, NODE_MON_MAN_HEARTBEAT_QUEUE_NAME, PING_ROUTING_KEY,
     CONFIG_EXCHANGE, NODE_MON_MAN_CONFIGS_QUEUE_NAME,
     NODES_CONFIGS_ROUTING_KEY_CHAINS, EVM_NODES_CONFIGS_ROUTING_KEY_CHAINS,
-    TOPIC, MONITORABLE_EXCHANGE)
+    TOPIC, MONITORABLE_EXCHANGE, CHAINLINK_NODE_RAW_DATA_ROUTING_KEY,
+    COSMOS_NODE_RAW_DATA_ROUTING_KEY, EVM_NODE_RAW_DATA_ROUTING_KEY,
+    SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
 from src.utils.types import CONFIGS_WITH_VALIDATORS
 
+# The routing key with which each type of node monitor publishes raw data
+_NODE_MONITOR_PIPELINES = {
+    ChainlinkNodeMonitor: CHAINLINK_NODE_RAW_DATA_ROUTING_KEY,
+    CosmosNodeMonitor: COSMOS_NODE_RAW_DATA_ROUTING_KEY,
+    EVMNodeMonitor: EVM_NODE_RAW_DATA_ROUTING_KEY,
+    SubstrateNodeMonitor: SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY,
+}
+
 
 class NodeMonitorsManager(MonitorsManager):
 
@@ -117,8 +127,10 @@ class NodeMonitorsManager(MonitorsManager):
         """
         log_and_print("Creating a new process for the monitor of {}".format(
             node_config.node_name), self.logger)
+        control_queue = self._create_control_queue()
         process = multiprocessing.Process(
-            target=start_node_monitor, args=(node_config, monitor_type, *args))
+            target=start_node_monitor, args=(node_config, monitor_type, *args),
+            kwargs={'control_queue': control_queue})
         # Kill children if parent is killed
         process.daemon = True
         process.start()
@@ -126,6 +138,7 @@ class NodeMonitorsManager(MonitorsManager):
         self._config_process_dict[config_id]['component_name'] = (
             NODE_MONITOR_NAME_TEMPLATE.format(node_config.node_name))
         self._config_process_dict[config_id]['process'] = process
+        self._config_process_dict[config_id]['control_queue'] = control_queue
         self._config_process_dict[config_id]['monitor_type'] = monitor_type
         self._config_process_dict[config_id]['node_config'] = node_config
         self._config_process_dict[config_id][
@@ -136,6 +149,43 @@ class NodeMonitorsManager(MonitorsManager):
         self._config_process_dict[config_id]['sub_chain'] = sub_chain
         self._config_process_dict[config_id]['args'] = args
 
+    def _reconfigure_or_restart_monitor_process(
+            self, node_config: NodeConfig, config_id: str, monitor_type:
+            Type[Monitor], base_chain: str, sub_chain: str, *args) -> None:
+        """
+        This function applies a modified node configuration to the running
+        monitor of config_id without restarting it, so that the monitor keeps
+        its state. The monitor is restarted only if this is not possible, for
+        example if the monitor type or the node name changed, if the monitor
+        process is not alive, or if the monitor rejects the configuration.
+        :param node_config: The modified configuration of the node
+        :param config_id: The id of the node configuration
+        :param monitor_type: The type of the monitor
+        :param base_chain: The name of the base chain being monitored
+        :param sub_chain: The name of the sub chain being monitored
+        :param args: Other arguments that need to be passed to the monitor
+        :return: None
+        """
+        process_details = self.config_process_dict[config_id]
+        if (process_details['monitor_type'] == monitor_type
+                and self._reconfigure_monitor_process(
+                    config_id, NODE_MONITOR_NAME_TEMPLATE.format(
+                        node_config.node_name), monitor_type, node_config,
+                    *args)):
+            process_details['node_config'] = node_config
+            process_details['parent_id'] = node_config.parent_id
+            process_details['args'] = args
+            log_and_print("Sent the modified configuration of {} to its "
+                          "running monitor".format(node_config.node_name),
+                          self.logger)
+            return
+
+        previous_process = process_details['process']
+        previous_process.terminate()
+        previous_process.join()
+        self._create_and_start_monitor_process(
+            node_config, config_id, monitor_type, base_chain, sub_chain, *args)
+
     @staticmethod
     def _determine_data_sources_for_monitor(
             node_config: CONFIGS_WITH_VALIDATORS, sent_configs: Dict,
@@ -257,10 +307,6 @@ class NodeMonitorsManager(MonitorsManager):
                 # Get the latest updates
                 config = sent_configs[config_id]
                 node_config = parse_cosmos_node_config(config)
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
 
                 # Check if all `monitor_<source>` are false. If this is the case
                 # or `monitor_node` is disabled do not restart a monitor, but
@@ -272,20 +318,21 @@ class NodeMonitorsManager(MonitorsManager):
                     node_config.monitor_cometbft_rpc
                 ]
                 if not node_config.monitor_node or not any(sources_enabled):
-                    del self.config_process_dict[config_id]
+                    self._kill_monitor_process(config_id)
                     del correct_nodes_configs[config_id]
                     log_and_print("Killed the monitor of {} ".format(
                         modified_configs[config_id]['name']), self.logger)
                     continue
 
                 log_and_print(
-                    "The configuration for {} was modified. A new monitor with "
-                    "the latest configuration will be started.".format(
+                    "The configuration for {} was modified. It will be applied "
+                    "to the running monitor, or a new monitor with the latest "
+                    "configuration will be started.".format(
                         modified_configs[config_id]['name']), self.logger)
 
                 data_sources = self._determine_data_sources_for_cosmos_monitor(
                     node_config, sent_configs)
-                self._create_and_start_monitor_process(
+                self._reconfigure_or_restart_monitor_process(
                     node_config, config_id, CosmosNodeMonitor, base_chain,
                     sub_chain, data_sources)
                 correct_nodes_configs[config_id] = config
@@ -320,14 +367,10 @@ class NodeMonitorsManager(MonitorsManager):
                 if data_sources != previous_data_sources:
                     log_and_print(
                         "The monitor of {} does not have updated data "
-                        "sources. We will restart it with the updated "
+                        "sources. We will update it with the latest "
                         "configurations".format(node_config.node_name),
                         self.logger)
-                    previous_process = self.config_process_dict[config_id][
-                        'process']
-                    previous_process.terminate()
-                    previous_process.join()
-                    self._create_and_start_monitor_process(
+                    self._reconfigure_or_restart_monitor_process(
                         node_config, config_id, CosmosNodeMonitor, base_chain,
                         sub_chain, data_sources)
         except Exception as e:
@@ -386,30 +429,27 @@ class NodeMonitorsManager(MonitorsManager):
                 # Get the latest updates
                 config = sent_configs[config_id]
                 node_config = parse_substrate_node_config(config)
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
 
                 # If `monitor_node` is disabled do not restart a monitor, but
                 # delete the previous process from the system and move to the
                 # next config.
                 if not node_config.monitor_node:
-                    del self.config_process_dict[config_id]
+                    self._kill_monitor_process(config_id)
                     del correct_nodes_configs[config_id]
                     log_and_print("Killed the monitor of {} ".format(
                         modified_configs[config_id]['name']), self.logger)
                     continue
 
                 log_and_print(
-                    "The configuration for {} was modified. A new monitor with "
-                    "the latest configuration will be started.".format(
+                    "The configuration for {} was modified. It will be applied "
+                    "to the running monitor, or a new monitor with the latest "
+                    "configuration will be started.".format(
                         modified_configs[config_id]['name']), self.logger)
 
                 data_sources = \
                     self._determine_data_sources_for_substrate_monitor(
                         node_config, sent_configs)
-                self._create_and_start_monitor_process(
+                self._reconfigure_or_restart_monitor_process(
                     node_config, config_id, SubstrateNodeMonitor, base_chain,
                     sub_chain, data_sources)
                 correct_nodes_configs[config_id] = config
@@ -444,14 +484,10 @@ class NodeMonitorsManager(MonitorsManager):
                 if data_sources != previous_data_sources:
                     log_and_print(
                         "The monitor of {} does not have updated data sources. "
-                        "We will restart it with the updated "
+                        "We will update it with the latest "
                         "configurations".format(node_config.node_name),
                         self.logger)
-                    previous_process = self.config_process_dict[config_id][
-                        'process']
-                    previous_process.terminate()
-                    previous_process.join()
-                    self._create_and_start_monitor_process(
+                    self._reconfigure_or_restart_monitor_process(
                         node_config, config_id, SubstrateNodeMonitor,
                         base_chain, sub_chain, data_sources)
         except Exception as e:
@@ -509,10 +545,6 @@ class NodeMonitorsManager(MonitorsManager):
                 # Get the latest updates
                 config = sent_configs[config_id]
                 node_config = parse_chainlink_node_config(config)
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
 
                 # Check if all `monitor_<source>` are false. If this is the case
                 # or `monitor_node` is disabled do not restart a monitor, but
@@ -520,20 +552,21 @@ class NodeMonitorsManager(MonitorsManager):
                 # next config.
                 sources_enabled = [node_config.monitor_prometheus]
                 if not node_config.monitor_node or not any(sources_enabled):
-                    del self.config_process_dict[config_id]
+                    self._kill_monitor_process(config_id)
                     del correct_nodes_configs[config_id]
                     log_and_print("Killed the monitor of {} ".format(
                         modified_configs[config_id]['name']), self.logger)
                     continue
 
                 log_and_print(
-                    "The configuration for {} was modified. A new monitor with "
-                    "the latest configuration will be started.".format(
+                    "The configuration for {} was modified. It will be applied "
+                    "to the running monitor, or a new monitor with the latest "
+                    "configuration will be started.".format(
                         modified_configs[config_id]['name']), self.logger)
 
-                self._create_and_start_monitor_process(node_config, config_id,
-                                                       ChainlinkNodeMonitor,
-                                                       base_chain, sub_chain)
+                self._reconfigure_or_restart_monitor_process(
+                    node_config, config_id, ChainlinkNodeMonitor, base_chain,
+                    sub_chain)
                 correct_nodes_configs[config_id] = config
 
             removed_configs = get_removed_configs(sent_configs, current_configs)
@@ -600,29 +633,26 @@ class NodeMonitorsManager(MonitorsManager):
                 # Get the latest updates
                 config = sent_configs[config_id]
                 node_config = parse_evm_node_config(config)
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
 
                 # If `monitor_node` is disabled do not restart a monitor, but
                 # delete the previous process from the system and move to the
                 # next config.
                 if not node_config.monitor_node:
-                    del self.config_process_dict[config_id]
+                    self._kill_monitor_process(config_id)
                     del correct_nodes_configs[config_id]
                     log_and_print("Killed the monitor of {} ".format(
                         modified_configs[config_id]['name']), self.logger)
                     continue
 
                 log_and_print(
-                    "The configuration for {} was modified. A new monitor with "
-                    "the latest configuration will be started.".format(
+                    "The configuration for {} was modified. It will be applied "
+                    "to the running monitor, or a new monitor with the latest "
+                    "configuration will be started.".format(
                         modified_configs[config_id]['name']), self.logger)
 
-                self._create_and_start_monitor_process(node_config, config_id,
-                                                       EVMNodeMonitor,
-                                                       base_chain, sub_chain)
+                self._reconfigure_or_restart_monitor_process(
+                    node_config, config_id, EVMNodeMonitor, base_chain,
+                    sub_chain)
                 correct_nodes_configs[config_id] = config
 
             removed_configs = get_removed_configs(
@@ -653,7 +683,7 @@ class NodeMonitorsManager(MonitorsManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s. Now processing.", sent_configs)
 
@@ -697,6 +727,9 @@ class NodeMonitorsManager(MonitorsManager):
         self.process_and_send_monitorable_data_generic(
             base_chain, monitorable_type)
 
+    def _get_monitor_pipeline(self, process_details: Dict) -> Optional[str]:
+        return _NODE_MONITOR_PIPELINES.get(process_details['monitor_type'])
+
     def _process_ping(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
@@ -726,6 +759,7 @@ class NodeMonitorsManager(MonitorsManager):
                     self._create_and_start_monitor_process(
                         node_config, config_id, monitor_type, base_chain,
                         sub_chain, *args)
+            self._propagate_backpressure()
             heartbeat['timestamp'] = datetime.now().timestamp()
         except Exception as e:
             # If we encounter an error during processing log the error and
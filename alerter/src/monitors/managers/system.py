@@ -1,17 +1,18 @@
 import copy
-import json
 import logging
 import multiprocessing
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 
 from src.configs.system import SystemConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
 from src.monitors.managers.manager import MonitorsManager
 from src.monitors.starters import start_system_monitor
+from src.monitors.system import SystemMonitor
 from src.utils.configs import (get_newly_added_configs, get_modified_configs,
                                get_removed_configs)
 from src.utils.constants.configs import NODES_CONFIG
@@ -22,7 +23,7 @@ from src.utils.constants.rabbitmq import (
     SYS_MON_MAN_HEARTBEAT_QUEUE_NAME, SYS_MON_MAN_CONFIGS_ROUTING_KEY_GEN,
     SYS_MON_MAN_CONFIGS_ROUTING_KEY_CHAINS_SYS,
     NODES_CONFIGS_ROUTING_KEY_CHAINS, PING_ROUTING_KEY, TOPIC,
-    MONITORABLE_EXCHANGE)
+    MONITORABLE_EXCHANGE, SYSTEM_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
 from src.utils.types import str_to_bool
@@ -105,8 +106,10 @@ class SystemMonitorsManager(MonitorsManager):
             base_chain: str, sub_chain: str) -> None:
         log_and_print("Creating a new process for the monitor of {}"
                       .format(system_config.system_name), self.logger)
-        process = multiprocessing.Process(target=start_system_monitor,
-                                          args=(system_config,))
+        control_queue = self._create_control_queue()
+        process = multiprocessing.Process(
+            target=start_system_monitor, args=(system_config,),
+            kwargs={'control_queue': control_queue})
         # Kill children if parent is killed
         process.daemon = True
         process.start()
@@ -114,6 +117,7 @@ class SystemMonitorsManager(MonitorsManager):
         self._config_process_dict[config_id]['component_name'] = (
             SYSTEM_MONITOR_NAME_TEMPLATE.format(system_config.system_name))
         self._config_process_dict[config_id]['process'] = process
+        self._config_process_dict[config_id]['control_queue'] = control_queue
         self._config_process_dict[config_id]['chain'] = chain
         self._config_process_dict[config_id]['parent_id'] = (
             system_config.parent_id)
@@ -122,10 +126,42 @@ class SystemMonitorsManager(MonitorsManager):
         self._config_process_dict[config_id]['base_chain'] = base_chain
         self._config_process_dict[config_id]['sub_chain'] = sub_chain
 
+    def _reconfigure_or_restart_monitor_process(
+            self, system_config: SystemConfig, config_id: str, chain: str,
+            base_chain: str, sub_chain: str) -> None:
+        """
+        This function applies a modified configuration to the running monitor
+        of config_id without restarting it, so that the monitor keeps its
+        state. The monitor is restarted only if this is not possible, for
+        example if the monitor's name changed or its process is not alive.
+        :param system_config: The modified configuration
+        :param config_id: The id of the modified configuration
+        :param chain: The chain the configuration belongs to
+        :param base_chain: The name of the base chain
+        :param sub_chain: The name of the sub chain
+        :return: None
+        """
+        if self._reconfigure_monitor_process(
+                config_id, SYSTEM_MONITOR_NAME_TEMPLATE.format(
+                    system_config.system_name),
+                SystemMonitor, system_config):
+            self.config_process_dict[config_id]['parent_id'] = (
+                system_config.parent_id)
+            log_and_print("Sent the modified configuration of {} to its "
+                          "running monitor".format(system_config.system_name),
+                          self.logger)
+            return
+
+        previous_process = self.config_process_dict[config_id]['process']
+        previous_process.terminate()
+        previous_process.join()
+        self._create_and_start_monitor_process(system_config, config_id, chain,
+                                               base_chain, sub_chain)
+
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(body, properties)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -199,28 +235,24 @@ class SystemMonitorsManager(MonitorsManager):
                 monitor_system = str_to_bool(config['monitor_system'])
                 system_config = SystemConfig(system_id, parent_id, system_name,
                                              monitor_system, node_exporter_url)
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
 
                 # If we should not monitor the system, delete the previous
                 # process
                 # from the system and move to the next config
                 if not monitor_system:
-                    del self.config_process_dict[config_id]
+                    self._kill_monitor_process(config_id)
                     del correct_systems_configs[config_id]
                     log_and_print("Killed the monitor of {} ".format(
                         modified_configs[config_id]['name']), self.logger)
                     continue
 
                 log_and_print(
-                    "The configuration for {} was modified. A new monitor with "
-                    "the latest configuration will be started.".format(
+                    "The configuration for {} was modified. It will be applied "
+                    "to the running monitor, or a new monitor with the latest "
+                    "configuration will be started.".format(
                         modified_configs[config_id]['name']), self.logger)
-                self._create_and_start_monitor_process(system_config, config_id,
-                                                       chain, base_chain,
-                                                       sub_chain)
+                self._reconfigure_or_restart_monitor_process(
+                    system_config, config_id, chain, base_chain, sub_chain)
                 correct_systems_configs[config_id] = config
 
             removed_configs = get_removed_configs(sent_configs, current_configs)
@@ -260,6 +292,9 @@ class SystemMonitorsManager(MonitorsManager):
         self.process_and_send_monitorable_data_generic(
             base_chain, monitorable_type)
 
+    def _get_monitor_pipeline(self, process_details: Dict) -> Optional[str]:
+        return SYSTEM_RAW_DATA_ROUTING_KEY
+
     def _process_ping(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
@@ -296,6 +331,7 @@ class SystemMonitorsManager(MonitorsManager):
                                                  node_exporter_url)
                     self._create_and_start_monitor_process(
                         system_config, config_id, chain, base_chain, sub_chain)
+            self._propagate_backpressure()
             heartbeat['timestamp'] = datetime.now().timestamp()
         except Exception as e:
             # If we encounter an error during processing log the error and
@@ -1,30 +1,87 @@
+import json
 import logging
+import multiprocessing
+import queue
 import sys
 from abc import ABC, abstractmethod
 from types import FrameType
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Union, Optional
 
 import pika.exceptions
 import urllib3
 
 from src.abstract.publisher import PublisherComponent
+from src.data_store.redis import RedisApi, Keys
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
                                           TOPIC)
-from src.utils.exceptions import MessageWasNotDeliveredException
+from src.utils import env
+from src.utils.constants.starters import (
+    CONTROL_QUEUE_POLLING_PERIOD, MAX_MONITOR_ROUND_OFFSET,
+    MONITOR_DOWN_ROUNDS_BEFORE_BACKOFF, MONITOR_PERIOD_BACKOFF_FACTOR)
+from src.utils.exceptions import (
+    MessageWasNotDeliveredException, SystemIsDownException,
+    NodeIsDownException, CannotAccessGitHubPageException,
+    CannotAccessDockerHubPageException)
+from src.utils.backpressure import PressureLevel, get_period_multiplier
 from src.utils.logging import log_and_print
+from src.utils.timing import FixedRateScheduler, AdaptivePollingPolicy
+from src.utils.types import MonitorableConfig
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Retrieval errors which indicate that the monitored source is down
+DOWN_EXCEPTIONS = (SystemIsDownException, NodeIsDownException,
+                   CannotAccessGitHubPageException,
+                   CannotAccessDockerHubPageException)
+
 
 class Monitor(PublisherComponent, ABC):
+    # Whether the monitor can apply modified configurations in-place. Managers
+    # only send modified configurations to monitors which set this, and
+    # restart the other monitors instead.
+    supports_reconfiguration = False
 
     def __init__(self, monitor_name: str, logger: logging.Logger,
-                 monitor_period: int, rabbitmq: RabbitMQApi) -> None:
+                 monitor_period: int, rabbitmq: RabbitMQApi,
+                 redis: Optional[RedisApi] = None) -> None:
         self._monitor_name = monitor_name
         self._monitor_period = monitor_period
+
+        # If given, Redis is used to checkpoint the monitor's progress (for
+        # example the last height monitored) so that a restarted monitor
+        # resumes from where it stopped.
+        self._redis = redis
+        self._progress_loaded = False
+        self._last_saved_progress = None
+
+        # If given by the starter, the manager uses this queue to send modified
+        # configurations to the monitor so that they are applied in-place.
+        self._control_queue = None
+
+        # Monitoring rounds are run at a fixed rate. The first round is offset
+        # by an amount derived from the monitor's name so that monitors which
+        # are started together do not all poll at the same instant.
+        self._scheduler = FixedRateScheduler(monitor_name, monitor_period,
+                                             MAX_MONITOR_ROUND_OFFSET)
+
+        # The period of the next round is adapted to the outcome of the
+        # previous one. Sources which are persistently down are polled less
+        # often, and sources which need a closer watch are polled more often.
+        self._polling_policy = AdaptivePollingPolicy(
+            monitor_period, env.MONITOR_MIN_PERIOD_SECONDS,
+            env.MONITOR_MAX_PERIOD_SECONDS, MONITOR_PERIOD_BACKOFF_FACTOR,
+            MONITOR_DOWN_ROUNDS_BEFORE_BACKOFF)
+        self._round_sources_down = 0
+        self._round_sources_up = 0
+        self._closer_watch_requested = False
+
+        # The manager sends the backpressure level of the monitor's pipeline
+        # through the control queue. The monitoring period is stretched while
+        # the components downstream of the monitor are falling behind.
+        self._pressure_level = PressureLevel.NORMAL
         super().__init__(logger, rabbitmq)
 
     def __str__(self) -> str:
@@ -38,6 +95,29 @@ class Monitor(PublisherComponent, ABC):
     def monitor_name(self) -> str:
         return self._monitor_name
 
+    @property
+    def redis(self) -> Optional[RedisApi]:
+        return self._redis
+
+    @property
+    def scheduler(self) -> FixedRateScheduler:
+        return self._scheduler
+
+    @property
+    def polling_policy(self) -> AdaptivePollingPolicy:
+        return self._polling_policy
+
+    @property
+    def pressure_level(self) -> PressureLevel:
+        return self._pressure_level
+
+    @property
+    def control_queue(self) -> Optional[multiprocessing.Queue]:
+        return self._control_queue
+
+    def set_control_queue(self, control_queue: multiprocessing.Queue) -> None:
+        self._control_queue = control_queue
+
     @abstractmethod
     def _display_data(self, data: Dict) -> str:
         pass
@@ -59,6 +139,12 @@ class Monitor(PublisherComponent, ABC):
 
     def _process_data(self, data_retrieval_failed: bool,
                       failure_args: List[Any], success_args: List[Any]) -> Dict:
+        if data_retrieval_failed and failure_args and isinstance(
+                failure_args[0], DOWN_EXCEPTIONS):
+            self._round_sources_down += 1
+        else:
+            self._round_sources_up += 1
+
         if data_retrieval_failed:
             return self._process_error(*failure_args)
         else:
@@ -76,6 +162,200 @@ class Monitor(PublisherComponent, ABC):
     def _monitor(self) -> None:
         pass
 
+    def _get_progress(self) -> Dict:
+        """
+        Monitors which keep track of their progress between monitoring rounds
+        should override this function together with _set_progress.
+        :return: A compact, JSON serializable representation of the progress
+        """
+        return {}
+
+    def _set_progress(self, progress: Dict) -> None:
+        """
+        Restores the progress returned by a previous call to _get_progress.
+        :param progress: The progress loaded from Redis
+        """
+        pass
+
+    def _get_progress_id(self) -> Optional[str]:
+        """
+        Monitors which override _get_progress must override this function too.
+        :return: The id of the node or system whose progress is kept, which
+               : identifies the progress of the monitor across restarts and
+               : renames
+        """
+        return None
+
+    def _load_progress(self) -> None:
+        # The progress is loaded only once, because if the monitor is restarted
+        # by its starter the progress in memory is the most recent.
+        progress_id = self._get_progress_id()
+        if self.redis is None or progress_id is None or self._progress_loaded:
+            return
+
+        progress_key = Keys.get_monitor_progress(progress_id)
+        stored_progress = self.redis.get(progress_key)
+        self._progress_loaded = True
+        if stored_progress is None:
+            return
+
+        try:
+            progress = json.loads(stored_progress.decode('utf-8'))
+            self._set_progress(progress)
+            self._last_saved_progress = stored_progress.decode('utf-8')
+            self.logger.info("Restored the progress of %s: %s", self,
+                             progress)
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            self.logger.error("Could not restore the progress of %s from "
+                              "Redis. Starting from scratch.", self)
+            self.logger.exception(e)
+
+    def _save_progress(self) -> None:
+        progress_id = self._get_progress_id()
+        if self.redis is None or progress_id is None:
+            return
+
+        progress = self._get_progress()
+        if not progress:
+            return
+
+        # Do not write to Redis if nothing changed since the last checkpoint
+        serialised_progress = json.dumps(progress, separators=(',', ':'))
+        if serialised_progress == self._last_saved_progress:
+            return
+
+        progress_key = Keys.get_monitor_progress(progress_id)
+        if self.redis.set(progress_key, serialised_progress) is not None:
+            self._last_saved_progress = serialised_progress
+
+    @classmethod
+    def validate_reconfiguration(cls, config: MonitorableConfig,
+                                 *args) -> None:
+        """
+        Checks that a modified configuration can be applied in-place. Managers
+        call this function before sending the configuration to a running
+        monitor, and restart the monitor instead if it raises. Monitors whose
+        configurations may be invalid must override this function.
+        :param config: The modified configuration of the monitorable
+        :param args: Any other arguments the monitor was created with
+        :return: None
+        """
+        pass
+
+    def reconfigure(self, config: MonitorableConfig, *args) -> None:
+        """
+        Applies a modified configuration in-place, keeping the state built up
+        by previous monitoring rounds. Monitors which set
+        supports_reconfiguration must override this function.
+        :param config: The modified configuration of the monitorable
+        :param args: Any other arguments the monitor was created with
+        :return: None
+        """
+        pass
+
+    def _apply_reconfigurations(self) -> None:
+        if self.control_queue is None:
+            return
+
+        while True:
+            try:
+                update = self.control_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if 'pressure_level' in update:
+                self._set_pressure_level(update['pressure_level'])
+                continue
+
+            # A configuration which cannot be applied must not stop the
+            # monitor, which keeps monitoring with its previous configuration
+            try:
+                self.reconfigure(update['config'], *update['args'])
+            except Exception as e:
+                self.logger.error("Could not apply the modified "
+                                  "configuration of %s.", self)
+                self.logger.exception(e)
+                continue
+
+            self.logger.info("Applied the modified configuration of %s", self)
+
+    def _set_pressure_level(self, pressure_level: PressureLevel) -> None:
+        if pressure_level == self.pressure_level:
+            return
+
+        self.logger.info("The backpressure on %s changed from %s to %s.", self,
+                         self.pressure_level.name, pressure_level.name)
+        self._pressure_level = pressure_level
+
+    def _sleep_until_next_round(self) -> None:
+        time_left = self.scheduler.time_until_next_round()
+        while time_left > 0:
+            # If the manager can send modified configurations, sleep in small
+            # steps so that they are applied without waiting for the whole
+            # monitoring period.
+            if self.control_queue is not None:
+                time_left = min(time_left, CONTROL_QUEUE_POLLING_PERIOD)
+
+            # Use the BlockingConnection sleep to avoid dropped connections
+            self.rabbitmq.connection.sleep(time_left)
+            self._apply_reconfigurations()
+            time_left = self.scheduler.time_until_next_round()
+
+    def _request_closer_watch(self) -> None:
+        """
+        Monitors call this function when the data retrieved in the current
+        round indicates that the source must be polled more frequently.
+        """
+        self._closer_watch_requested = True
+
+    def _start_round(self) -> None:
+        self._round_sources_down = 0
+        self._round_sources_up = 0
+        self._closer_watch_requested = False
+        self.scheduler.round_started()
+
+    def _adapt_period(self) -> None:
+        # The source is considered down only if no data source could be
+        # reached in this round.
+        source_down = self._round_sources_down > 0 \
+                      and self._round_sources_up == 0
+        previous_period = self.scheduler.period
+        new_period = self.polling_policy.next_period(
+            source_down, self._closer_watch_requested)
+
+        # Under backpressure the period is stretched, but not beyond the
+        # maximum period unless the policy itself exceeds it
+        if self.pressure_level != PressureLevel.NORMAL:
+            new_period = min(
+                new_period * get_period_multiplier(
+                    self.pressure_level, env.BACKPRESSURE_PERIOD_FACTOR),
+                max(self.polling_policy.max_period, new_period))
+        if new_period != previous_period:
+            self.scheduler.set_period(new_period)
+            self.logger.info(
+                "The monitoring period of %s was changed from %s to %s "
+                "seconds.", self, previous_period, new_period)
+
+    def _finish_round(self) -> None:
+        self._adapt_period()
+        previous_overruns = self.scheduler.overruns
+        previous_skipped_rounds = self.scheduler.skipped_rounds
+        self.scheduler.round_finished()
+
+        if self.scheduler.overruns != previous_overruns:
+            self.logger.warning(
+                "The monitoring round of %s took %.3f seconds, which is longer "
+                "than the monitoring period of %s seconds. Skipped %s "
+                "round(s).", self, self.scheduler.last_round_duration,
+                self.scheduler.period,
+                self.scheduler.skipped_rounds - previous_skipped_rounds)
+
+        self.logger.debug(
+            "Monitoring round of %s took %.3f seconds and started %.3f seconds "
+            "late. Scheduling metrics: %s", self,
+            self.scheduler.last_round_duration, self.scheduler.last_lateness,
+            self.scheduler.metrics)
+
     def _send_heartbeat(self, data_to_send: dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=HEALTH_CHECK_EXCHANGE,
@@ -87,9 +367,19 @@ class Monitor(PublisherComponent, ABC):
 
     def start(self) -> None:
         self._initialise_rabbitmq()
+        self._load_progress()
+
+        # If the monitor is restarted after an error it keeps to its schedule
+        if self.scheduler.next_round_time is None:
+            self.scheduler.start()
+
         while True:
+            self._sleep_until_next_round()
+            self._start_round()
             try:
+                self._apply_reconfigurations()
                 self._monitor()
+                self._save_progress()
             except MessageWasNotDeliveredException as e:
                 # Log the fact that the message could not be sent. Sleep just
                 # because there is no use in consuming a lot of resources until
@@ -104,11 +394,8 @@ class Monitor(PublisherComponent, ABC):
             except Exception as e:
                 self.logger.exception(e)
                 raise e
-
-            self.logger.debug("Sleeping for %s seconds.", self.monitor_period)
-
-            # Use the BlockingConnection sleep to avoid dropped connections
-            self.rabbitmq.connection.sleep(self.monitor_period)
+            finally:
+                self._finish_round()
 
     def _on_terminate(self, signum: int, stack: FrameType) -> None:
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
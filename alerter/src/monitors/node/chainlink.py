@@ -26,6 +26,8 @@ from src.utils.timing import TimedTaskLimiter
 
 
 class ChainlinkNodeMonitor(Monitor):
+    supports_reconfiguration = True
+
     def __init__(self, monitor_name: str, node_config: ChainlinkNodeConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi) -> None:
@@ -61,6 +63,20 @@ class ChainlinkNodeMonitor(Monitor):
     def last_prometheus_source_used(self) -> str:
         return self._last_prometheus_source_used
 
+    @classmethod
+    def validate_reconfiguration(cls, config: ChainlinkNodeConfig,
+                                 *args) -> None:
+        config.enabled_sources_non_empty()
+
+    def reconfigure(self, config: ChainlinkNodeConfig, *args) -> None:
+        self.validate_reconfiguration(config, *args)
+        self._node_config = config
+
+        # Keep using the last source if it is still given, otherwise start
+        # from the first one.
+        if self.last_prometheus_source_used not in config.node_prometheus_urls:
+            self._last_prometheus_source_used = config.node_prometheus_urls[0]
+
     @property
     def currency_symbol_limiter(self) -> TimedTaskLimiter:
         return self._currency_symbol_limiter
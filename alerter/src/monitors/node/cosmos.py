@@ -12,6 +12,7 @@ from requests.exceptions import (ConnectionError as ReqConnectionError,
 from urllib3.exceptions import ProtocolError
 
 from src.configs.nodes.cosmos import CosmosNodeConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.cosmos import (
     CosmosMonitor, _REST_VERSION_COSMOS_SDK_0_42_6,
@@ -51,13 +52,16 @@ class CosmosNodeMonitor(CosmosMonitor):
     considered were v0.33.7, v0.33.8, v0.33.9, v0.34.11, v0.34.12, v0.34.14.
     """
 
+    supports_reconfiguration = True
+
     def __init__(self, monitor_name: str, node_config: CosmosNodeConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi,
-                 data_sources: List[CosmosNodeConfig]) -> None:
+                 data_sources: List[CosmosNodeConfig],
+                 redis: Optional[RedisApi] = None) -> None:
 
         super().__init__(monitor_name, data_sources, logger, monitor_period,
-                         rabbitmq)
+                         rabbitmq, redis)
         self._node_config = node_config
 
         # If for archive data retrieval the selected data source is not an
@@ -128,6 +132,31 @@ class CosmosNodeMonitor(CosmosMonitor):
     def validator_consensus_address(self) -> Optional[str]:
         return self._validator_consensus_address
 
+    def _get_progress_id(self) -> str:
+        return self.node_config.node_id
+
+    def _get_progress(self) -> Dict:
+        if self.last_height_monitored_cometbft is None:
+            return {}
+
+        return {'h': self.last_height_monitored_cometbft}
+
+    def _set_progress(self, progress: Dict) -> None:
+        # The restored height is still subject to the catch-up limits applied
+        # by _determine_last_height_monitored_cometbft
+        if self.last_height_monitored_cometbft is None and 'h' in progress:
+            self._last_height_monitored_cometbft = int(progress['h'])
+
+    def reconfigure(self, config: CosmosNodeConfig, *args) -> None:
+        # The heights monitored so far are kept, so that no blocks are
+        # re-traversed after the configuration is modified
+        data_sources = args[0]
+        self._node_config = config
+        self._data_sources = data_sources
+        self._archive_nodes = [
+            node for node in self.data_sources if node.is_archive_node
+        ]
+
     @staticmethod
     def _parse_validator_status(validator_status: Union[str, int]) -> str:
         """
@@ -905,6 +934,14 @@ class CosmosNodeMonitor(CosmosMonitor):
             }
         }
 
+        # If the validator missed a block or was slashed, poll it more
+        # frequently until it recovers.
+        historical = data.get('historical') or []
+        if any((block['active_in_prev_block']
+                and not block['signed_prev_block']) or block['slashed']
+               for block in historical):
+            self._request_closer_watch()
+
         return processed_data
 
     def _process_retrieved_prometheus_data(self, data: Dict) -> Dict:
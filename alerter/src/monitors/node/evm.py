@@ -21,6 +21,8 @@ from src.utils.exceptions import (PANICException, NodeIsDownException,
 
 
 class EVMNodeMonitor(Monitor):
+    supports_reconfiguration = True
+
     def __init__(self, monitor_name: str, node_config: EVMNodeConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi) -> None:
@@ -42,6 +44,11 @@ class EVMNodeMonitor(Monitor):
     def w3_interface(self) -> Web3:
         return self._w3_interface
 
+    def reconfigure(self, config: EVMNodeConfig, *args) -> None:
+        self._node_config = config
+        self._w3_interface = Web3(Web3.HTTPProvider(
+            self.node_config.node_http_url, request_kwargs={'timeout': 2}))
+
     def _display_data(self, data: Dict) -> str:
         # This function assumes that the data has been obtained and processed
         # successfully by the node monitor
@@ -7,6 +7,7 @@ from typing import List, Optional, Dict, Callable
 import pika
 
 from src.configs.nodes.substrate import SubstrateNodeConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.substrate import (
     SubstrateMonitor, _VERSION_INCOMPATIBILITY_EXCEPTIONS)
@@ -26,12 +27,15 @@ class SubstrateNodeMonitor(SubstrateMonitor):
     by obtaining data from the Substrate-API docker service.
     """
 
+    supports_reconfiguration = True
+
     def __init__(self, monitor_name: str, node_config: SubstrateNodeConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi,
-                 data_sources: List[SubstrateNodeConfig]) -> None:
+                 data_sources: List[SubstrateNodeConfig],
+                 redis: Optional[RedisApi] = None) -> None:
         super().__init__(monitor_name, data_sources, logger, monitor_period,
-                         rabbitmq)
+                         rabbitmq, redis)
         self._node_config = node_config
 
         # If for archive data retrieval the selected data source is not an
@@ -95,6 +99,31 @@ class SubstrateNodeMonitor(SubstrateMonitor):
     def system_properties(self) -> Dict:
         return self._system_properties
 
+    def _get_progress_id(self) -> str:
+        return self.node_config.node_id
+
+    def _get_progress(self) -> Dict:
+        if self.last_height_monitored_websocket is None:
+            return {}
+
+        return {'h': self.last_height_monitored_websocket}
+
+    def _set_progress(self, progress: Dict) -> None:
+        # The restored height is still subject to the catch-up limits applied
+        # by _determine_last_height_monitored_websocket
+        if self.last_height_monitored_websocket is None and 'h' in progress:
+            self._last_height_monitored_websocket = int(progress['h'])
+
+    def reconfigure(self, config: SubstrateNodeConfig, *args) -> None:
+        # The heights monitored so far are kept, so that no blocks are
+        # re-traversed after the configuration is modified
+        data_sources = args[0]
+        self._node_config = config
+        self._data_sources = data_sources
+        self._archive_nodes = [
+            node for node in self.data_sources if node.is_archive_node
+        ]
+
     def _get_websocket_direct_data(self) -> Dict:
         """
         This function retrieves node specific metrics directly from the node
@@ -1,6 +1,7 @@
 import logging
+import multiprocessing
 import time
-from typing import TypeVar, Type, List
+from typing import TypeVar, Type, List, Optional
 
 import pika.exceptions
 
@@ -10,6 +11,7 @@ from src.configs.nodes.node import NodeConfig
 from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.configs.repo import GitHubRepoConfig, DockerHubRepoConfig
 from src.configs.system import SystemConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.contracts.chainlink import ChainlinkContractsMonitor
 from src.monitors.dockerhub import DockerHubMonitor
@@ -17,6 +19,8 @@ from src.monitors.github import GitHubMonitor
 from src.monitors.monitor import Monitor
 from src.monitors.network.cosmos import CosmosNetworkMonitor
 from src.monitors.network.substrate import SubstrateNetworkMonitor
+from src.monitors.node.cosmos import CosmosNodeMonitor
+from src.monitors.node.substrate import SubstrateNodeMonitor
 from src.monitors.system import SystemMonitor
 from src.utils import env
 from src.utils.constants.names import (
@@ -34,6 +38,9 @@ from src.utils.types import MonitorableConfig
 # Restricts the generic to Monitor or subclasses
 T = TypeVar('T', bound=Monitor)
 
+# Monitors which checkpoint their progress in Redis
+_PROGRESS_PERSISTING_MONITOR_TYPES = (CosmosNodeMonitor, SubstrateNodeMonitor)
+
 
 def _initialise_monitor_logger(monitor_display_name: str,
                                monitor_module_name: str) -> logging.Logger:
@@ -57,11 +64,35 @@ def _initialise_monitor_logger(monitor_display_name: str,
     return monitor_logger
 
 
+def _initialise_monitor_redis(monitor_display_name: str,
+                              monitor_logger: logging.Logger) -> RedisApi:
+    # Try initialising the Redis API until successful. This had to be done
+    # separately to avoid instances when Redis creation failed and we
+    # attempt to use it.
+    while True:
+        try:
+            redis = RedisApi(logger=monitor_logger.getChild(
+                RedisApi.__name__), db=env.REDIS_DB, host=env.REDIS_IP,
+                port=env.REDIS_PORT, namespace=env.UNIQUE_ALERTER_IDENTIFIER)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(monitor_display_name, e)
+            log_and_print(msg, monitor_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return redis
+
+
 def _initialise_monitor(
         monitor_type: Type[T], monitor_display_name: str,
         monitoring_period: int, config: MonitorableConfig, *args) -> T:
     monitor_logger = _initialise_monitor_logger(monitor_display_name,
                                                 monitor_type.__name__)
+    monitor_kwargs = {}
+    if issubclass(monitor_type, _PROGRESS_PERSISTING_MONITOR_TYPES):
+        monitor_kwargs['redis'] = _initialise_monitor_redis(
+            monitor_display_name, monitor_logger)
 
     # Try initialising the monitor until successful
     while True:
@@ -70,7 +101,8 @@ def _initialise_monitor(
                 logger=monitor_logger.getChild(RabbitMQApi.__name__),
                 host=env.RABBIT_IP)
             monitor = monitor_type(monitor_display_name, config, monitor_logger,
-                                   monitoring_period, rabbitmq, *args)
+                                   monitoring_period, rabbitmq, *args,
+                                   **monitor_kwargs)
             log_and_print("Successfully initialised {}".format(
                 monitor_display_name), monitor_logger)
             break
@@ -89,6 +121,7 @@ def _initialise_chainlink_contracts_monitor(
         parent_id: str) -> ChainlinkContractsMonitor:
     monitor_logger = _initialise_monitor_logger(
         monitor_display_name, ChainlinkContractsMonitor.__name__)
+    redis = _initialise_monitor_redis(monitor_display_name, monitor_logger)
 
     # Try initialising the monitor until successful
     while True:
@@ -98,7 +131,7 @@ def _initialise_chainlink_contracts_monitor(
                 host=env.RABBIT_IP)
             monitor = ChainlinkContractsMonitor(
                 monitor_display_name, weiwatchers_url, evm_nodes, node_configs,
-                monitor_logger, monitoring_period, rabbitmq, parent_id)
+                monitor_logger, monitoring_period, rabbitmq, parent_id, redis)
             log_and_print("Successfully initialised {}".format(
                 monitor_display_name), monitor_logger)
             break
@@ -169,17 +202,21 @@ def _initialise_substrate_network_monitor(
     return monitor
 
 
-def start_system_monitor(system_config: SystemConfig) -> None:
+def start_system_monitor(
+        system_config: SystemConfig,
+        control_queue: Optional[multiprocessing.Queue] = None) -> None:
     # Monitor display name based on system
     monitor_display_name = SYSTEM_MONITOR_NAME_TEMPLATE.format(
         system_config.system_name)
     system_monitor = _initialise_monitor(SystemMonitor, monitor_display_name,
                                          env.SYSTEM_MONITOR_PERIOD_SECONDS,
                                          system_config)
-    start_monitor(system_monitor)
+    start_monitor(system_monitor, control_queue)
 
 
-def start_github_monitor(repo_config: GitHubRepoConfig) -> None:
+def start_github_monitor(
+        repo_config: GitHubRepoConfig,
+        control_queue: Optional[multiprocessing.Queue] = None) -> None:
     # Monitor display name based on repo name. The '/' are replaced with spaces,
     # and the last space is removed.
     monitor_display_name = GITHUB_MONITOR_NAME_TEMPLATE.format(
@@ -187,10 +224,12 @@ def start_github_monitor(repo_config: GitHubRepoConfig) -> None:
     github_monitor = _initialise_monitor(GitHubMonitor, monitor_display_name,
                                          env.GITHUB_MONITOR_PERIOD_SECONDS,
                                          repo_config)
-    start_monitor(github_monitor)
+    start_monitor(github_monitor, control_queue)
 
 
-def start_dockerhub_monitor(repo_config: DockerHubRepoConfig) -> None:
+def start_dockerhub_monitor(
+        repo_config: DockerHubRepoConfig,
+        control_queue: Optional[multiprocessing.Queue] = None) -> None:
     # Monitor display name based on repo name. The '/' are replaced with spaces,
     # and the last space is removed.
     monitor_display_name = DOCKERHUB_MONITOR_NAME_TEMPLATE.format(
@@ -198,18 +237,19 @@ def start_dockerhub_monitor(repo_config: DockerHubRepoConfig) -> None:
     dockerhub_monitor = _initialise_monitor(
         DockerHubMonitor, monitor_display_name,
         env.DOCKERHUB_MONITOR_PERIOD_SECONDS, repo_config)
-    start_monitor(dockerhub_monitor)
+    start_monitor(dockerhub_monitor, control_queue)
 
 
-def start_node_monitor(node_config: NodeConfig, monitor_type: Type[T],
-                       *args) -> None:
+def start_node_monitor(
+        node_config: NodeConfig, monitor_type: Type[T], *args,
+        control_queue: Optional[multiprocessing.Queue] = None) -> None:
     # Monitor display name based on node
     monitor_display_name = NODE_MONITOR_NAME_TEMPLATE.format(
         node_config.node_name)
     node_monitor = _initialise_monitor(monitor_type, monitor_display_name,
                                        env.NODE_MONITOR_PERIOD_SECONDS,
                                        node_config, *args)
-    start_monitor(node_monitor)
+    start_monitor(node_monitor, control_queue)
 
 
 def start_chainlink_contracts_monitor(
@@ -245,7 +285,14 @@ def start_substrate_network_monitor(
     start_monitor(node_monitor)
 
 
-def start_monitor(monitor: Monitor) -> None:
+def start_monitor(
+        monitor: Monitor,
+        control_queue: Optional[multiprocessing.Queue] = None) -> None:
+    # If a control queue is given, the monitor's manager can send modified
+    # configurations to the monitor without restarting it.
+    if control_queue is not None:
+        monitor.set_control_queue(control_queue)
+
     while True:
         try:
             log_and_print("{} started.".format(monitor), monitor.logger)
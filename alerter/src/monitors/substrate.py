@@ -11,6 +11,7 @@ from urllib3.exceptions import ProtocolError
 
 from src.api_wrappers.substrate import SubstrateApiWrapper
 from src.configs.nodes.substrate import SubstrateNodeConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
 from src.utils import env
@@ -26,14 +27,16 @@ class SubstrateMonitor(Monitor, ABC):
     def __init__(self, monitor_name: str,
                  data_sources: List[SubstrateNodeConfig],
                  logger: logging.Logger, monitor_period: int,
-                 rabbitmq: RabbitMQApi) -> None:
+                 rabbitmq: RabbitMQApi,
+                 redis: Optional[RedisApi] = None) -> None:
         # An exception is raised if the monitor is not given enough data
         # sources.
         if len(data_sources) == 0:
             raise ComponentNotGivenEnoughDataSourcesException(monitor_name,
                                                               'data_sources')
 
-        super().__init__(monitor_name, logger, monitor_period, rabbitmq)
+        super().__init__(monitor_name, logger, monitor_period, rabbitmq,
+                         redis)
         self._data_sources = data_sources
         self._substrate_api_wrapper = SubstrateApiWrapper(
             env.SUBSTRATE_API_IP, env.SUBSTRATE_API_PORT, self.logger)
@@ -24,6 +24,8 @@ from src.utils.exceptions import (MetricNotFoundException,
 
 
 class SystemMonitor(Monitor):
+    supports_reconfiguration = True
+
     def __init__(self, monitor_name: str, system_config: SystemConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi) -> None:
@@ -54,6 +56,9 @@ class SystemMonitor(Monitor):
     def metrics_to_monitor(self) -> Dict[str, str]:
         return self._metrics_to_monitor
 
+    def reconfigure(self, config: SystemConfig, *args) -> None:
+        self._system_config = config
+
     def _display_data(self, data: Dict) -> str:
         # This function assumes that the data has been obtained and processed
         # successfully by the system monitor
@@ -0,0 +1,72 @@
+from enum import Enum
+from typing import Optional
+
+
+class PressureLevel(Enum):
+    NORMAL = 0
+    ELEVATED = 1
+    HIGH = 2
+
+
+class BackpressureGauge:
+    """
+    This class derives the pressure level of a pipeline from the depth of its
+    most backed-up queue. A level is entered as soon as the depth reaches its
+    threshold, but it is only left once the depth falls below a fraction
+    (release_ratio) of that threshold. This hysteresis stops the level from
+    oscillating when the depth hovers around a threshold.
+    """
+
+    def __init__(self, elevated_depth: int, high_depth: int,
+                 release_ratio: float) -> None:
+        self._thresholds = {
+            PressureLevel.ELEVATED: elevated_depth,
+            PressureLevel.HIGH: max(high_depth, elevated_depth),
+        }
+        self._release_ratio = release_ratio
+        self._level = PressureLevel.NORMAL
+
+    @property
+    def level(self) -> PressureLevel:
+        return self._level
+
+    def threshold(self, level: PressureLevel) -> int:
+        return self._thresholds[level]
+
+    def update(self, queue_depth: Optional[int]) -> PressureLevel:
+        """
+        Updates the pressure level given the current depth.
+        :param queue_depth: The depth of the most backed-up queue of the
+                          : pipeline, or None if it could not be determined
+        :return: The new pressure level
+        """
+        # If the depth is not known the level is left as it is
+        if queue_depth is None:
+            return self._level
+
+        reached_level = PressureLevel.NORMAL
+        for level, threshold in self._thresholds.items():
+            if queue_depth >= threshold:
+                reached_level = level
+
+        if reached_level.value > self._level.value:
+            self._level = reached_level
+            return self._level
+
+        # Levels are released one at a time, and only once the depth is well
+        # below the threshold of the current level
+        while self._level != PressureLevel.NORMAL and queue_depth < \
+                self._thresholds[self._level] * self._release_ratio:
+            self._level = PressureLevel(self._level.value - 1)
+
+        return self._level
+
+
+def get_period_multiplier(level: PressureLevel, factor: float) -> float:
+    """
+    :param level: The pressure level of a pipeline
+    :param factor: The factor by which the period is stretched per level
+    :return: The factor by which the periods of the pipeline's monitors must be
+           : multiplied
+    """
+    return factor ** level.value
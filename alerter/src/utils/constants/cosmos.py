@@ -21,3 +21,10 @@ ProposalStatus = Literal[
     PROPOSAL_STATUS_VOTING_PERIOD, PROPOSAL_STATUS_PASSED,
     PROPOSAL_STATUS_REJECTED, PROPOSAL_STATUS_FAILED, PROPOSAL_STATUS_INVALID
 ]
+
+# Pagination limits used when retrieving list endpoints. The Cosmos REST limit
+# is only a request, as servers may cap the page size lower. Cometbft caps the
+# per_page parameter at 100.
+COSMOS_REST_MAX_PAGE_LIMIT = 1000
+COMETBFT_MAX_PER_PAGE = 100
+MAX_PARALLEL_PAGE_REQUESTS = 4
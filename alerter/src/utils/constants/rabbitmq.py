@@ -10,6 +10,11 @@ MONITORABLE_EXCHANGE = 'monitorable'
 TOPIC = 'topic'
 DIRECT = 'direct'
 
+# Queue arguments. The queues consuming alerts are priority queues, so that
+# more severe alerts overtake less severe ones waiting in the same queue.
+ALERT_QUEUE_MAX_PRIORITY = 10
+ALERT_QUEUE_ARGUMENTS = {'x-max-priority': ALERT_QUEUE_MAX_PRIORITY}
+
 # Queues
 CONFIGS_MANAGER_HEARTBEAT_QUEUE = "configs_manager_heartbeat_queue"
 GH_MON_MAN_HEARTBEAT_QUEUE_NAME = 'github_monitors_manager_heartbeat_queue'
@@ -109,6 +114,48 @@ SUBSTRATE_NETWORK_RAW_DATA_ROUTING_KEY = 'network.substrate'
 GITHUB_RAW_DATA_ROUTING_KEY = 'github'
 DOCKERHUB_RAW_DATA_ROUTING_KEY = 'dockerhub'
 
+# The input queues of the components downstream of each monitoring pipeline,
+# keyed by the routing key with which the pipeline's monitors publish raw data.
+# The depth of these queues determines the backpressure on the monitors.
+PIPELINE_INPUT_QUEUES = {
+    SYSTEM_RAW_DATA_ROUTING_KEY: [
+        SYSTEM_DT_INPUT_QUEUE_NAME, SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        SYSTEM_STORE_INPUT_QUEUE_NAME],
+    CHAINLINK_NODE_RAW_DATA_ROUTING_KEY: [
+        CL_NODE_DT_INPUT_QUEUE_NAME, CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        CL_NODE_STORE_INPUT_QUEUE_NAME],
+    COSMOS_NODE_RAW_DATA_ROUTING_KEY: [
+        COSMOS_NODE_DT_INPUT_QUEUE_NAME,
+        COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        COSMOS_NODE_STORE_INPUT_QUEUE_NAME],
+    SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY: [
+        SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME,
+        SUBSTRATE_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        SUBSTRATE_NODE_STORE_INPUT_QUEUE_NAME],
+    EVM_NODE_RAW_DATA_ROUTING_KEY: [
+        EVM_NODE_DT_INPUT_QUEUE_NAME,
+        EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        EVM_NODE_STORE_INPUT_QUEUE_NAME],
+    CHAINLINK_CONTRACTS_RAW_DATA_ROUTING_KEY: [
+        CL_CONTRACTS_DT_INPUT_QUEUE_NAME,
+        CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        CL_CONTRACT_STORE_INPUT_QUEUE_NAME],
+    COSMOS_NETWORK_RAW_DATA_ROUTING_KEY: [
+        COSMOS_NETWORK_DT_INPUT_QUEUE_NAME,
+        COSMOS_NETWORK_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        COSMOS_NETWORK_STORE_INPUT_QUEUE_NAME],
+    SUBSTRATE_NETWORK_RAW_DATA_ROUTING_KEY: [
+        SUBSTRATE_NETWORK_DT_INPUT_QUEUE_NAME,
+        SUBSTRATE_NETWORK_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+        SUBSTRATE_NETWORK_STORE_INPUT_QUEUE_NAME],
+    GITHUB_RAW_DATA_ROUTING_KEY: [
+        GITHUB_DT_INPUT_QUEUE_NAME, GITHUB_ALERTER_INPUT_QUEUE_NAME,
+        GITHUB_STORE_INPUT_QUEUE_NAME],
+    DOCKERHUB_RAW_DATA_ROUTING_KEY: [
+        DOCKERHUB_DT_INPUT_QUEUE_NAME, DOCKERHUB_ALERTER_INPUT_QUEUE_NAME,
+        DOCKERHUB_STORE_INPUT_QUEUE_NAME],
+}
+
 GITHUB_TRANSFORMED_DATA_ROUTING_KEY = 'transformed_data.github'
 DOCKERHUB_TRANSFORMED_DATA_ROUTING_KEY = 'transformed_data.dockerhub'
 SYSTEM_TRANSFORMED_DATA_ROUTING_KEY = 'transformed_data.system'
@@ -1,3 +1,22 @@
 # Sleep periods
 RESTART_SLEEPING_PERIOD = 10
 RE_INITIALISE_SLEEPING_PERIOD = 10
+
+# The period at which a sleeping monitor checks whether its manager sent it a
+# modified configuration
+CONTROL_QUEUE_POLLING_PERIOD = 1
+
+# The maximum offset (in seconds) of a monitor's first round. Monitors are
+# spread out over min(monitoring period, this value) so that those started
+# together do not poll at the same time.
+MAX_MONITOR_ROUND_OFFSET = 60
+
+# If the source polled by a monitor is down for more than this many
+# consecutive rounds, the monitoring period is multiplied by the back-off
+# factor at every further round, up to MONITOR_MAX_PERIOD_SECONDS.
+MONITOR_DOWN_ROUNDS_BEFORE_BACKOFF = 3
+MONITOR_PERIOD_BACKOFF_FACTOR = 2
+
+# A backpressure level is released once the depth of the pipeline's queues
+# falls below this fraction of the level's threshold
+BACKPRESSURE_RELEASE_RATIO = 0.5
@@ -1,3 +1,6 @@
+import json
+import math
+import struct
 from typing import List, Dict
 
 import bech32
@@ -7,6 +10,17 @@ from src.monitorables.networks.cosmos import CosmosNetwork
 from src.monitorables.nodes.cosmos_node import CosmosNode
 from src.utils.types import convert_to_float, convert_to_int
 
+# Packed metrics start with a NUL byte, which distinguishes them from the JSON
+# form in which they were previously saved
+_PACKED_MARKER = b'\x00'
+
+# The total count and the number of missed heights of packed missed blocks
+# metrics, and the slashed flag and the number of slashed heights of packed
+# slashed metrics. The header is followed by the heights as int64 values, and
+# for slashed metrics by the amounts as float64 values, all little-endian.
+_MISSED_BLOCKS_HEADER = struct.Struct('<QI')
+_SLASHED_HEADER = struct.Struct('<?I')
+
 
 def bech32_to_address(bech32_str: str) -> str:
     _, decoded = bech32.bech32_decode(bech32_str)
@@ -117,16 +131,19 @@ def get_load_dict_state_helper(cosmos_node: CosmosNode) -> List[Dict]:
     information on how each dict metric needs to be loaded from Redis.
     :param cosmos_node: The node to consider
     :return: [{'state_value': bool, 'setter': attribute_setting_fn,
-               'redis_key': fn_from_store_keys}]
+               'redis_key': fn_from_store_keys,
+               'unpack_fn': fn_converting_the_redis_value}]
     """
     node_id = cosmos_node.node_id
     return [
         {'state_value': cosmos_node.slashed,
          'setter': cosmos_node.set_slashed,
-         'redis_key': Keys.get_cosmos_node_slashed(node_id)},
+         'redis_key': Keys.get_cosmos_node_slashed(node_id),
+         'unpack_fn': unpack_slashed},
         {'state_value': cosmos_node.missed_blocks,
          'setter': cosmos_node.set_missed_blocks,
-         'redis_key': Keys.get_cosmos_node_missed_blocks(node_id)},
+         'redis_key': Keys.get_cosmos_node_missed_blocks(node_id),
+         'unpack_fn': unpack_missed_blocks},
     ]
 
 
@@ -138,3 +155,75 @@ def get_load_list_of_dicts_state_helper(
          'setter': cosmos_network.set_proposals,
          'redis_key': Keys.get_cosmos_network_proposals(parent_id)},
     ]
+
+
+def pack_missed_blocks(missed_blocks: Dict) -> bytes:
+    """
+    Packs the missed blocks metric of a cosmos node, i.e. of the form
+    {'total_count': int, 'missed_heights': [int]}, into the bytes saved in
+    Redis.
+    """
+    missed_heights = missed_blocks['missed_heights']
+    count = len(missed_heights)
+    return (_PACKED_MARKER
+            + _MISSED_BLOCKS_HEADER.pack(missed_blocks['total_count'], count)
+            + struct.pack('<{}q'.format(count), *missed_heights))
+
+
+def unpack_missed_blocks(packed: bytes) -> Dict:
+    """
+    Unpacks the missed blocks metric of a cosmos node saved in Redis, which
+    may also be in the JSON form it was previously saved in.
+    """
+    if not packed.startswith(_PACKED_MARKER):
+        return json.loads(packed.decode('utf-8'))
+
+    offset = len(_PACKED_MARKER)
+    total_count, count = _MISSED_BLOCKS_HEADER.unpack_from(packed, offset)
+    offset += _MISSED_BLOCKS_HEADER.size
+    return {
+        'total_count': total_count,
+        'missed_heights': list(struct.unpack_from('<{}q'.format(count),
+                                                  packed, offset)),
+    }
+
+
+def pack_slashed(slashed: Dict) -> bytes:
+    """
+    Packs the slashed metric of a cosmos node, i.e. of the form
+    {'slashed': bool, 'amount_map': {str(height): Optional[float]}}, into the
+    bytes saved in Redis. Heights are packed as integers and amounts as floats,
+    with a NaN standing for an amount which is not available.
+    """
+    amount_map = slashed['amount_map']
+    count = len(amount_map)
+    heights = [int(height) for height in amount_map]
+    amounts = [math.nan if amount is None else amount
+               for amount in amount_map.values()]
+    return (_PACKED_MARKER
+            + _SLASHED_HEADER.pack(slashed['slashed'], count)
+            + struct.pack('<{}q'.format(count), *heights)
+            + struct.pack('<{}d'.format(count), *amounts))
+
+
+def unpack_slashed(packed: bytes) -> Dict:
+    """
+    Unpacks the slashed metric of a cosmos node saved in Redis, which may also
+    be in the JSON form it was previously saved in.
+    """
+    if not packed.startswith(_PACKED_MARKER):
+        return json.loads(packed.decode('utf-8'))
+
+    offset = len(_PACKED_MARKER)
+    slashed, count = _SLASHED_HEADER.unpack_from(packed, offset)
+    offset += _SLASHED_HEADER.size
+    heights = struct.unpack_from('<{}q'.format(count), packed, offset)
+    offset += 8 * count
+    amounts = struct.unpack_from('<{}d'.format(count), packed, offset)
+    return {
+        'slashed': slashed,
+        'amount_map': {
+            str(height): None if math.isnan(amount) else amount
+            for height, amount in zip(heights, amounts)
+        },
+    }
@@ -0,0 +1,70 @@
+from typing import Dict, Optional, Set
+
+# The meta_data key which marks transformed data holding only the metrics which
+# changed since the previous monitoring round
+DELTA_KEY = 'is_delta'
+
+
+def changed_metrics(metrics_for_alerting: Dict) -> Set[str]:
+    """
+    Given the metrics of transformed data processed for alerting, i.e. of the
+    form {metric: {'current': ..., 'previous': ...}}, this function returns the
+    metrics whose current value differs from the previous one.
+    """
+    return {metric for metric, values in metrics_for_alerting.items()
+            if 'previous' not in values
+            or values['current'] != values['previous']}
+
+
+def as_delta(data: Dict, metrics: Set[str]) -> Dict:
+    """
+    Returns a copy of the given transformed result, i.e. of the form
+    {'result': {'meta_data': {...}, 'data': {...}}}, which only holds the
+    given metrics and whose meta_data is marked as a delta. The metric values
+    are shared with the given data.
+    """
+    result = data['result']
+    return {
+        'result': {
+            'meta_data': {**result['meta_data'], DELTA_KEY: True},
+            'data': {metric: value for metric, value in result['data'].items()
+                     if metric in metrics},
+        }
+    }
+
+
+def is_delta(meta_data: Dict) -> bool:
+    return meta_data.get(DELTA_KEY, False)
+
+
+class LatestMetrics:
+    """
+    This class keeps the latest metrics received for each monitorable, so that
+    a component receiving deltas can obtain the full set of metrics. Since
+    deltas only make sense relative to a full snapshot, no metrics can be
+    obtained for a monitorable from a delta until a full snapshot of that
+    monitorable is received.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Dict] = {}
+
+    def merge(self, monitorable_id: str, metrics: Dict,
+              delta: bool) -> Optional[Dict]:
+        """
+        Records the received metrics of a monitorable.
+        :param monitorable_id: The id of the monitorable
+        :param metrics: The received metrics
+        :param delta: Whether the metrics are a delta or a full snapshot
+        :return: The full metrics of the monitorable, or None if a delta was
+               : received before any full snapshot. The returned dict must not
+               : be modified.
+        """
+        if not delta:
+            self._metrics[monitorable_id] = dict(metrics)
+        elif monitorable_id in self._metrics:
+            self._metrics[monitorable_id].update(metrics)
+        else:
+            return None
+
+        return self._metrics[monitorable_id]
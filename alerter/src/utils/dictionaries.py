@@ -1,4 +1,4 @@
-from typing import Dict, List, Hashable
+from typing import Dict, List, Hashable, Tuple
 
 
 def dict_remove_key(a: Dict, key: Hashable) -> Dict:
@@ -9,6 +9,28 @@ def dict_remove_key(a: Dict, key: Hashable) -> Dict:
     return {k: v for k, v in a.items() if k != key}
 
 
+def dict_copy_paths(a: Dict, *paths: Tuple[Hashable, ...]) -> Dict:
+    """
+    Returns a copy of the given dictionary in which only the dictionaries along
+    the given key paths are copied, and only shallowly. All other values are
+    shared with the given dictionary, therefore the copy must only be modified
+    along the given paths.
+    E.g., if d = {'result': {'meta_data': {...}, 'data': {...}}}, then
+    f(d, ('result', 'meta_data')) copies d, d['result'] and
+    d['result']['meta_data'], but d['result']['data'] is shared.
+    """
+    copied = dict(a)
+    for path in paths:
+        source, target = a, copied
+        for key in path:
+            if not isinstance(source.get(key), dict):
+                break
+            if target[key] is source[key]:
+                target[key] = dict(source[key])
+            source, target = source[key], target[key]
+    return copied
+
+
 def dict_key_diff(a: Dict, b: Dict) -> Dict:
     """
     Returns the items in a given dictionary which do not share keys with
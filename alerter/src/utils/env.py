@@ -26,6 +26,15 @@ REDIS_DB = int(os.environ['REDIS_DB'])
 # RabbitMQ configuration
 RABBIT_IP = os.environ['RABBIT_IP']
 RABBIT_PORT = int(os.environ['RABBIT_PORT'])
+RABBIT_MESSAGE_CODEC = os.environ['RABBIT_MESSAGE_CODEC']
+RABBIT_COMPRESSION = os.environ['RABBIT_COMPRESSION']
+RABBIT_COMPRESSION_THRESHOLD_BYTES = int(
+    os.environ['RABBIT_COMPRESSION_THRESHOLD_BYTES'])
+RABBIT_TRANSPORT = os.environ['RABBIT_TRANSPORT']
+LOCAL_BUS_HOST = os.environ['LOCAL_BUS_HOST']
+LOCAL_BUS_PORT = int(os.environ['LOCAL_BUS_PORT'])
+LOCAL_BUS_AUTHKEY = os.environ['LOCAL_BUS_AUTHKEY']
+LOCAL_BUS_DATA_DIRECTORY = os.environ['LOCAL_BUS_DATA_DIRECTORY']
 
 # Substrate API IP
 SUBSTRATE_API_IP = os.environ['SUBSTRATE_API_IP']
@@ -62,6 +71,8 @@ CHAINLINK_CONTRACTS_MONITOR_PERIOD_SECONDS = int(
     os.environ['CHAINLINK_CONTRACTS_MONITOR_PERIOD_SECONDS'])
 NETWORK_MONITOR_PERIOD_SECONDS = int(
     os.environ['NETWORK_MONITOR_PERIOD_SECONDS'])
+MONITOR_MIN_PERIOD_SECONDS = int(os.environ['MONITOR_MIN_PERIOD_SECONDS'])
+MONITOR_MAX_PERIOD_SECONDS = int(os.environ['MONITOR_MAX_PERIOD_SECONDS'])
 # These define how often a monitor runs an iteration of its monitoring loop
 
 # Publishers limits
@@ -74,6 +85,44 @@ ALERT_ROUTER_PUBLISHING_QUEUE_SIZE = int(
     os.environ['ALERT_ROUTER_PUBLISHING_QUEUE_SIZE'])
 CONFIG_PUBLISHING_QUEUE_SIZE = int(
     os.environ['CONFIG_PUBLISHING_QUEUE_SIZE'])
+PUBLISHING_SPILL_DIRECTORY = os.environ['PUBLISHING_SPILL_DIRECTORY']
+PUBLISHING_SPILL_MAX_SIZE = int(os.environ['PUBLISHING_SPILL_MAX_SIZE'])
+PUBLISHING_SPILL_RETENTION_LIMITS = \
+    os.environ['PUBLISHING_SPILL_RETENTION_LIMITS']
+RAW_DATA_COALESCING = os.environ['RAW_DATA_COALESCING'].lower() in [
+    "true", "yes", "y"]
+TRANSFORMED_DATA_DELTAS = os.environ['TRANSFORMED_DATA_DELTAS'].lower() in [
+    "true", "yes", "y"]
+TRANSFORMED_DATA_FULL_SNAPSHOT_INTERVAL_SECONDS = float(
+    os.environ['TRANSFORMED_DATA_FULL_SNAPSHOT_INTERVAL_SECONDS'])
+COSMOS_NODE_HEIGHTS_RETENTION = int(
+    os.environ['COSMOS_NODE_HEIGHTS_RETENTION'])
+TRANSFORMER_STAGE_TIMINGS = os.environ[
+    'TRANSFORMER_STAGE_TIMINGS'].lower() in ["true", "yes", "y"]
+TRANSFORMER_STAGE_TIMINGS_SAMPLE_EVERY = int(
+    os.environ['TRANSFORMER_STAGE_TIMINGS_SAMPLE_EVERY'])
+TRANSFORMER_STAGE_TIMINGS_LOG_INTERVAL_SECONDS = float(
+    os.environ['TRANSFORMER_STAGE_TIMINGS_LOG_INTERVAL_SECONDS'])
+TRANSFORMER_WORKERS = int(os.environ['TRANSFORMER_WORKERS'])
+PREFETCH_TUNING = os.environ['PREFETCH_TUNING'].lower() in [
+    "true", "yes", "y"]
+PREFETCH_MIN_COUNT = int(os.environ['PREFETCH_MIN_COUNT'])
+PREFETCH_MAX_COUNT = int(os.environ['PREFETCH_MAX_COUNT'])
+PREFETCH_TARGET_BUFFER_SECONDS = float(
+    os.environ['PREFETCH_TARGET_BUFFER_SECONDS'])
+PREFETCH_TUNING_INTERVAL = float(os.environ['PREFETCH_TUNING_INTERVAL'])
+HEARTBEAT_INTERVAL_SECONDS = float(os.environ['HEARTBEAT_INTERVAL_SECONDS'])
+BACKPRESSURE = os.environ['BACKPRESSURE'].lower() in ["true", "yes", "y"]
+BACKPRESSURE_ELEVATED_QUEUE_DEPTH = int(
+    os.environ['BACKPRESSURE_ELEVATED_QUEUE_DEPTH'])
+BACKPRESSURE_HIGH_QUEUE_DEPTH = int(
+    os.environ['BACKPRESSURE_HIGH_QUEUE_DEPTH'])
+BACKPRESSURE_PERIOD_FACTOR = float(os.environ['BACKPRESSURE_PERIOD_FACTOR'])
+STATE_SNAPSHOT_DIRECTORY = os.environ['STATE_SNAPSHOT_DIRECTORY']
+STATE_SNAPSHOT_INTERVAL_SECONDS = float(
+    os.environ['STATE_SNAPSHOT_INTERVAL_SECONDS'])
+STATE_SNAPSHOT_MAX_AGE_SECONDS = float(
+    os.environ['STATE_SNAPSHOT_MAX_AGE_SECONDS'])
 
 # Console Output
 ENABLE_CONSOLE_ALERTS: bool = \
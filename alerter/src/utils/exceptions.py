@@ -354,3 +354,33 @@ class SubstrateNetworkDataCouldNotBeObtained(PANICException):
             "data source can be given, please disable network monitoring."
         )
         super().__init__(message, self.code)
+
+
+class UnsupportedContentTypeException(PANICException):
+    code = 5035
+
+    def __init__(self, content_type: str) -> None:
+        message = ("Cannot decode a message with content type {}. Please "
+                   "install the codec library or change the codec of the "
+                   "producer.".format(content_type))
+        super().__init__(message, self.code)
+
+
+class UnsupportedContentEncodingException(PANICException):
+    code = 5036
+
+    def __init__(self, content_encoding: str) -> None:
+        message = ("Cannot decompress a message with content encoding {}. "
+                   "Please install the compression library or change the "
+                   "compression of the producer.".format(content_encoding))
+        super().__init__(message, self.code)
+
+
+class UnavailableMessagingOptionException(PANICException):
+    code = 5037
+
+    def __init__(self, setting: str, option: str) -> None:
+        message = ("{} is set to {}, which is not supported or whose optional "
+                   "library is not installed. Please install the library or "
+                   "choose another option.".format(setting, option))
+        super().__init__(message, self.code)
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+from typing import Dict
+
+from src.utils.timing import TimedTaskLimiter
+
+
+class HeartbeatAggregator:
+    """
+    Counts the messages processed by a component and limits its heartbeats to
+    one per interval. Each heartbeat carries the number of messages which were
+    processed successfully and with errors since the previous heartbeat.
+    """
+
+    def __init__(self, interval: timedelta) -> None:
+        self._limiter = TimedTaskLimiter(interval)
+        self._processed_messages = 0
+        self._errored_messages = 0
+
+    @property
+    def interval(self) -> timedelta:
+        return self._limiter.time_interval
+
+    @property
+    def processed_messages(self) -> int:
+        return self._processed_messages
+
+    @property
+    def errored_messages(self) -> int:
+        return self._errored_messages
+
+    def record_message(self, processing_error: bool) -> None:
+        """
+        Counts a message which was processed.
+        :param processing_error: Whether an error occurred while processing the
+        message
+        :return: None
+        """
+        if processing_error:
+            self._errored_messages += 1
+        else:
+            self._processed_messages += 1
+
+    def heartbeat_due(self) -> bool:
+        return self._limiter.can_do_task()
+
+    def create_heartbeat(self, component_name: str) -> Dict:
+        return {
+            'component_name': component_name,
+            'is_alive': True,
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': self._processed_messages,
+            'errored_messages': self._errored_messages,
+        }
+
+    def heartbeat_sent(self) -> None:
+        """
+        Resets the message counts and restarts the interval once a heartbeat
+        was sent.
+        :return: None
+        """
+        self._processed_messages = 0
+        self._errored_messages = 0
+        self._limiter.did_task()
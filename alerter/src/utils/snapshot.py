@@ -0,0 +1,92 @@
+import os
+import pickle
+import re
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Optional, Tuple
+
+from src.utils import env
+
+_SNAPSHOT_SUFFIX = '.snapshot'
+
+
+class StateSnapshotter:
+    """
+    This class periodically saves the in-memory state of a component to a
+    local file, so that a restarted component can restore its state instead
+    of rebuilding it. A snapshot is written to a temporary file which then
+    atomically replaces the previous snapshot, therefore a component which
+    stops while saving never leaves a partially written snapshot behind.
+    """
+
+    def __init__(self, path: str, interval: timedelta) -> None:
+        self._path = path
+        self._interval = interval
+        self._last_saved = datetime.min
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def snapshot_due(self) -> bool:
+        return datetime.now() >= self._last_saved + self._interval
+
+    def save(self, state: Any) -> None:
+        """
+        Saves the state together with the time the snapshot was taken.
+        :param state: The state to save, which must be picklable
+        :return: None
+        """
+        # The snapshot is not retried before the next interval if it fails
+        self._last_saved = datetime.now()
+
+        directory = os.path.dirname(self._path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as snapshot_file:
+                pickle.dump({
+                    'timestamp': self._last_saved.timestamp(),
+                    'state': state,
+                }, snapshot_file, pickle.HIGHEST_PROTOCOL)
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(temp_path, self._path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def load(self, max_age: timedelta) -> Optional[Tuple[float, Any]]:
+        """
+        Loads the latest snapshot.
+        :param max_age: Snapshots older than this are ignored
+        :return: The timestamp of the snapshot and the saved state, or None if
+               : there is no snapshot which is recent enough
+        """
+        if not os.path.isfile(self._path):
+            return None
+
+        with open(self._path, 'rb') as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+
+        timestamp = snapshot['timestamp']
+        if datetime.now().timestamp() - timestamp > max_age.total_seconds():
+            return None
+
+        return timestamp, snapshot['state']
+
+
+def create_state_snapshotter(
+        component_name: str) -> Optional[StateSnapshotter]:
+    """
+    :param component_name: The name of the component whose state is saved
+    :return: The snapshotter of the component, or None if no snapshot
+           : directory is configured
+    """
+    if not env.STATE_SNAPSHOT_DIRECTORY:
+        return None
+
+    path = os.path.join(env.STATE_SNAPSHOT_DIRECTORY, re.sub(
+        r'[^\w.-]+', '_', component_name) + _SNAPSHOT_SUFFIX)
+    return StateSnapshotter(
+        path, timedelta(seconds=env.STATE_SNAPSHOT_INTERVAL_SECONDS))
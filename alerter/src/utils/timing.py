@@ -1,6 +1,11 @@
+import bisect
+import functools
+import hashlib
+import math
+import time
 from datetime import datetime, timedelta
 from queue import Queue
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable, List
 
 from src.utils.datetime import strfdelta
 
@@ -183,6 +188,20 @@ class OccurrencesInTimePeriodTracker:
 
         return True
 
+    def __getstate__(self) -> Dict:
+        # A Queue cannot be pickled, therefore only the occurrences are
+        # pickled so that the tracker can be saved in state snapshots.
+        state = self.__dict__.copy()
+        state['_occurrences_queue'] = list(self._occurrences_queue.queue)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        occurrences = state.pop('_occurrences_queue')
+        self.__dict__.update(state)
+        self._occurrences_queue = Queue()
+        for occurrence in occurrences:
+            self._occurrences_queue.put(occurrence)
+
     @property
     def time_period(self) -> timedelta:
         return self._time_period
@@ -211,3 +230,355 @@ class OccurrencesInTimePeriodTracker:
 
     def reset(self) -> None:
         self._occurrences_queue.queue.clear()
+
+
+class FixedRateScheduler:
+    """
+    This class schedules periodic rounds at a fixed rate. Round n is due at
+    start + offset + n * period irrespective of how long each round takes, so
+    that the effective period does not drift. If a round overruns into the
+    next ones the missed rounds are skipped, not executed back to back. The
+    offset is derived deterministically from the scheduler's name so that
+    components which are started together are spread out across the period.
+    All times are in seconds as given by time.monotonic().
+    """
+
+    def __init__(self, name: str, period: float,
+                 max_offset: Optional[float] = None) -> None:
+        super().__init__()
+
+        self._name = name
+        self._period = period
+        self._max_offset = max_offset
+        self._offset = self.compute_offset(name, period, max_offset)
+        self._next_round_time = None
+        self._round_start_time = None
+
+        # Scheduling metrics
+        self._rounds = 0
+        self._skipped_rounds = 0
+        self._overruns = 0
+        self._last_lateness = 0.0
+        self._max_lateness = 0.0
+        self._last_round_duration = 0.0
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__dict__ == other.__dict__
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def period(self) -> float:
+        return self._period
+
+    @property
+    def offset(self) -> float:
+        return self._offset
+
+    @property
+    def next_round_time(self) -> Optional[float]:
+        return self._next_round_time
+
+    @property
+    def rounds(self) -> int:
+        return self._rounds
+
+    @property
+    def skipped_rounds(self) -> int:
+        return self._skipped_rounds
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    @property
+    def last_lateness(self) -> float:
+        return self._last_lateness
+
+    @property
+    def max_lateness(self) -> float:
+        return self._max_lateness
+
+    @property
+    def last_round_duration(self) -> float:
+        return self._last_round_duration
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'period': self.period,
+            'offset': self.offset,
+            'rounds': self.rounds,
+            'skipped_rounds': self.skipped_rounds,
+            'overruns': self.overruns,
+            'last_lateness': self.last_lateness,
+            'max_lateness': self.max_lateness,
+            'last_round_duration': self.last_round_duration,
+        }
+
+    @staticmethod
+    def compute_offset(name: str, period: float,
+                       max_offset: Optional[float] = None) -> float:
+        """
+        Given a name, this function computes an offset in [0, period). Python's
+        hash() is salted per process, therefore a digest is used instead so
+        that the same name always gets the same offset.
+        :param name: The name of the scheduled component
+        :param period: The scheduling period
+        :param max_offset: If given, the offset is also kept below this value
+        :return: The offset of the first round
+        """
+        spread = period if max_offset is None else min(period, max_offset)
+        if spread <= 0:
+            return 0.0
+
+        digest = hashlib.sha256(name.encode('utf-8')).digest()
+        fraction = int.from_bytes(digest[:8], 'big') / 2 ** 64
+        return fraction * spread
+
+    def set_period(self, period: float) -> None:
+        """
+        Changes the period. The change takes effect from the round scheduled
+        after the one which is currently due.
+        :param period: The new period
+        """
+        self._period = period
+
+    def start(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.monotonic()
+
+        self._next_round_time = now + self.offset
+        self._round_start_time = None
+
+    def time_until_next_round(self, now: Optional[float] = None) -> float:
+        if self.next_round_time is None:
+            return 0.0
+
+        if now is None:
+            now = time.monotonic()
+
+        return max(0.0, self.next_round_time - now)
+
+    def round_started(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.monotonic()
+
+        if self.next_round_time is None:
+            self._next_round_time = now
+
+        self._round_start_time = now
+        self._last_lateness = max(0.0, now - self.next_round_time)
+        self._max_lateness = max(self.max_lateness, self.last_lateness)
+
+    def round_finished(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.monotonic()
+
+        if self._round_start_time is not None:
+            self._last_round_duration = now - self._round_start_time
+        self._round_start_time = None
+        self._rounds += 1
+
+        if self.period <= 0:
+            self._next_round_time = now
+            return
+
+        self._next_round_time += self.period
+        if now >= self.next_round_time:
+            # The round overran into the next round(s). Skip the rounds whose
+            # time has passed and keep to the original phase.
+            missed_rounds = math.floor(
+                (now - self.next_round_time) / self.period) + 1
+            self._overruns += 1
+            self._skipped_rounds += missed_rounds
+            self._next_round_time += missed_rounds * self.period
+
+
+class AdaptivePollingPolicy:
+    """
+    This class determines the period of the next round of a periodic task
+    from the outcome of the previous round. If the polled source was down for
+    a number of consecutive rounds, the period is multiplied by a back-off
+    factor at every further round so that a persistently down source is polled
+    less often, but still polled so that its recovery is detected. If a closer
+    watch was requested the minimum period is used, otherwise the base period.
+    The period is always kept within [min_period, max_period].
+    """
+
+    def __init__(self, base_period: float, min_period: float,
+                 max_period: float, backoff_factor: float = 2.0,
+                 down_rounds_before_backoff: int = 1) -> None:
+        super().__init__()
+
+        self._base_period = base_period
+        self._min_period = min(min_period, base_period)
+        self._max_period = max(max_period, base_period)
+        self._backoff_factor = backoff_factor
+        self._down_rounds_before_backoff = down_rounds_before_backoff
+        self._consecutive_down_rounds = 0
+        self._period = base_period
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__dict__ == other.__dict__
+
+    @property
+    def base_period(self) -> float:
+        return self._base_period
+
+    @property
+    def min_period(self) -> float:
+        return self._min_period
+
+    @property
+    def max_period(self) -> float:
+        return self._max_period
+
+    @property
+    def consecutive_down_rounds(self) -> int:
+        return self._consecutive_down_rounds
+
+    @property
+    def period(self) -> float:
+        return self._period
+
+    def next_period(self, source_down: bool, closer_watch: bool) -> float:
+        """
+        Given the outcome of the last round, this function computes the period
+        of the next round.
+        :param source_down: Whether the polled source was down in the last
+                          : round
+        :param closer_watch: Whether the last round asked for a closer watch
+        :return: The period of the next round
+        """
+        if source_down:
+            self._consecutive_down_rounds += 1
+            if self.consecutive_down_rounds > self._down_rounds_before_backoff:
+                period = max(self.period, self.base_period) * \
+                         self._backoff_factor
+            else:
+                period = self.base_period
+        else:
+            self._consecutive_down_rounds = 0
+            period = self.min_period if closer_watch else self.base_period
+
+        self._period = max(self.min_period, min(self.max_period, period))
+        return self.period
+
+
+class StageTimings:
+    """
+    This class records how long each stage of processing a message takes. The
+    durations of every stage are counted in a histogram whose buckets double
+    in width, from 1 microsecond up to about 1 second, together with the
+    number of times the stage ran and the total time it took. To keep the
+    overhead low, only one in every `sample_every` messages is timed, and
+    the stages are timed through wrappers which do nothing else for messages
+    which are not sampled. All times are in seconds.
+    """
+
+    # The upper bounds of the histogram buckets. Durations above the last
+    # bound are counted in an extra overflow bucket.
+    BUCKET_BOUNDS = tuple(1e-6 * 2 ** power for power in range(21))
+
+    def __init__(self, sample_every: int = 1) -> None:
+        super().__init__()
+
+        self._sample_every = max(sample_every, 1)
+        self._messages = 0
+        self._sampled_messages = 0
+        self._sampling = False
+        self._stages: Dict[str, List] = {}
+
+    @property
+    def sample_every(self) -> int:
+        return self._sample_every
+
+    @property
+    def messages(self) -> int:
+        return self._messages
+
+    @property
+    def sampled_messages(self) -> int:
+        return self._sampled_messages
+
+    @property
+    def sampling(self) -> bool:
+        return self._sampling
+
+    def message_received(self) -> bool:
+        """
+        Decides whether the stages of the received message are timed.
+        :return: True if the message is sampled, False otherwise
+        """
+        self._messages += 1
+        self._sampling = self._messages % self._sample_every == 0
+        if self._sampling:
+            self._sampled_messages += 1
+        return self._sampling
+
+    def record(self, stage: str, duration: float) -> None:
+        # Every stage is recorded as [count, total, histogram]
+        stats = self._stages.get(stage)
+        if stats is None:
+            stats = [0, 0.0, [0] * (len(self.BUCKET_BOUNDS) + 1)]
+            self._stages[stage] = stats
+        stats[0] += 1
+        stats[1] += duration
+        stats[2][bisect.bisect_left(self.BUCKET_BOUNDS, duration)] += 1
+
+    def timed(self, stage: str, function: Callable) -> Callable:
+        """
+        :param stage: The stage which the function performs
+        :param function: The function to time
+        :return: A function which calls the given function, recording how
+               : long it takes if the current message is sampled
+        """
+
+        @functools.wraps(function)
+        def timed_function(*args, **kwargs) -> Any:
+            if not self._sampling:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+
+        return timed_function
+
+    def _percentile(self, histogram: List[int], count: int,
+                    fraction: float) -> float:
+        # The upper bound of the bucket holding the percentile. Durations in
+        # the overflow bucket are reported as infinite.
+        rank = math.ceil(fraction * count)
+        seen = 0
+        for bound, bucket_count in zip(self.BUCKET_BOUNDS, histogram):
+            seen += bucket_count
+            if seen >= rank:
+                return bound
+        return math.inf
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        :return: The count, total time and mean time of every stage recorded,
+               : and the upper bounds of their 50th and 99th percentiles
+        """
+        return {
+            stage: {
+                'count': count,
+                'total': total,
+                'mean': total / count,
+                'p50': self._percentile(histogram, count, 0.5),
+                'p99': self._percentile(histogram, count, 0.99),
+            }
+            for stage, (count, total, histogram) in self._stages.items()
+        }
+
+    def reset(self) -> None:
+        self._messages = 0
+        self._sampled_messages = 0
+        self._stages = {}
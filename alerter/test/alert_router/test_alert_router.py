@@ -21,7 +21,8 @@ from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (
     CONFIG_EXCHANGE, STORE_EXCHANGE, ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
-    ALERT_ROUTER_CONFIGS_QUEUE_NAME, ALERT_ROUTER_INPUT_QUEUE_NAME,
+    ALERT_QUEUE_ARGUMENTS, ALERT_ROUTER_CONFIGS_QUEUE_NAME,
+    ALERT_ROUTER_INPUT_QUEUE_NAME,
     ALERT_ROUTER_HEARTBEAT_QUEUE_NAME, PING_ROUTING_KEY,
     CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE,
     CONSOLE_HANDLER_INPUT_ROUTING_KEY, LOG_HANDLER_INPUT_ROUTING_KEY,
@@ -69,7 +70,7 @@ class TestAlertRouter(unittest.TestCase):
         self.rabbitmq.queue_declare(ALERT_ROUTER_CONFIGS_QUEUE_NAME, False,
                                     True, False, False)
         self.rabbitmq.queue_declare(ALERT_ROUTER_INPUT_QUEUE_NAME, False, True,
-                                    False, False)
+                                    False, False, ALERT_QUEUE_ARGUMENTS)
         self.rabbitmq.queue_declare(ALERT_ROUTER_HEARTBEAT_QUEUE_NAME, False,
                                     True, False, False)
 
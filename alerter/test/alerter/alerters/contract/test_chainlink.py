@@ -27,6 +27,7 @@ from src.configs.alerts.contract.chainlink import ChainlinkContractAlertsConfig
 from src.configs.factory.alerts.chainlink_alerts import (
     ChainlinkContractAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
     CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY, HEALTH_CHECK_EXCHANGE,
@@ -35,7 +36,7 @@ from src.utils.env import RABBIT_IP
 from src.utils.exceptions import PANICException
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
-    disconnect_from_rabbit)
+    disconnect_from_rabbit, envelope_to_dict)
 
 
 class TestChainlinkContractAlerter(unittest.TestCase):
@@ -531,23 +532,25 @@ class TestChainlinkContractAlerter(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': CL_CONTRACT_ALERT_ROUTING_KEY,
             'data': 'data_1',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_2 = {
             'exchange': ALERT_EXCHANGE,
             'routing_key': CL_CONTRACT_ALERT_ROUTING_KEY,
             'data': 'data_2',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         self.test_contract_alerter._place_latest_data_on_queue(test_data)
         self.assertEqual(2,
                          self.test_contract_alerter.publishing_queue.qsize())
-        self.assertEqual(expected_data_1,
-                         self.test_contract_alerter.publishing_queue.get())
-        self.assertEqual(expected_data_2,
-                         self.test_contract_alerter.publishing_queue.get())
+        self.assertEqual(expected_data_1, envelope_to_dict(
+            self.test_contract_alerter.publishing_queue.get()))
+        self.assertEqual(expected_data_2, envelope_to_dict(
+            self.test_contract_alerter.publishing_queue.get()))
 
     def test_place_latest_data_on_queue_removes_old_data_if_full_then_places(
             self) -> None:
@@ -567,11 +570,12 @@ class TestChainlinkContractAlerter(unittest.TestCase):
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': CL_CONTRACT_ALERT_ROUTING_KEY,
                 'data': 'data_2',
-                'properties': pika.BasicProperties(delivery_mode=2),
+                'properties': pika.BasicProperties(
+                    delivery_mode=2, content_type=JSON_CONTENT_TYPE),
                 'mandatory': True
             }
-            self.assertEqual(expected_data,
-                             self.test_contract_alerter.publishing_queue.get())
+            self.assertEqual(expected_data, envelope_to_dict(
+                self.test_contract_alerter.publishing_queue.get()))
 
     @mock.patch.object(ChainlinkContractAlertingFactory,
                        "classify_error_alert")
@@ -1015,7 +1019,9 @@ class TestChainlinkContractAlerter(unittest.TestCase):
         test_hb = {
             'component_name': self.test_alerter_name,
             'is_alive': True,
-            'timestamp': datetime.datetime.now().timestamp()
+            'timestamp': datetime.datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_once_with(test_hb)
 
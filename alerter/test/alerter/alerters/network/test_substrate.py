@@ -22,6 +22,7 @@ from src.configs.alerts.network.substrate import SubstrateNetworkAlertsConfig
 from src.configs.factory.alerts.substrate_alerts import (
     SubstrateNetworkAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.utils.constants.rabbitmq import (
     CONFIG_EXCHANGE, HEALTH_CHECK_EXCHANGE, ALERT_EXCHANGE,
     SUBSTRATE_NETWORK_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
@@ -33,7 +34,7 @@ from src.utils.exceptions import (
     SubstrateNetworkDataCouldNotBeObtained, SubstrateApiIsNotReachableException)
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, disconnect_from_rabbit,
-    delete_exchange_if_exists)
+    delete_exchange_if_exists, envelope_to_dict)
 
 
 class TestSubstrateNetworkAlerter(unittest.TestCase):
@@ -561,23 +562,25 @@ class TestSubstrateNetworkAlerter(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': SUBSTRATE_NETWORK_ALERT_ROUTING_KEY,
             'data': 'data_1',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_2 = {
             'exchange': ALERT_EXCHANGE,
             'routing_key': SUBSTRATE_NETWORK_ALERT_ROUTING_KEY,
             'data': 'data_2',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         self.test_alerter._place_latest_data_on_queue(test_data)
         self.assertEqual(2,
                          self.test_alerter.publishing_queue.qsize())
-        self.assertEqual(expected_data_1,
-                         self.test_alerter.publishing_queue.get())
-        self.assertEqual(expected_data_2,
-                         self.test_alerter.publishing_queue.get())
+        self.assertEqual(expected_data_1, envelope_to_dict(
+            self.test_alerter.publishing_queue.get()))
+        self.assertEqual(expected_data_2, envelope_to_dict(
+            self.test_alerter.publishing_queue.get()))
 
     def test_place_latest_data_on_queue_removes_old_data_if_full_then_places(
             self) -> None:
@@ -597,11 +600,12 @@ class TestSubstrateNetworkAlerter(unittest.TestCase):
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': SUBSTRATE_NETWORK_ALERT_ROUTING_KEY,
                 'data': 'data_2',
-                'properties': pika.BasicProperties(delivery_mode=2),
+                'properties': pika.BasicProperties(
+                    delivery_mode=2, content_type=JSON_CONTENT_TYPE),
                 'mandatory': True
             }
-            self.assertEqual(expected_data,
-                             self.test_alerter.publishing_queue.get())
+            self.assertEqual(expected_data, envelope_to_dict(
+                self.test_alerter.publishing_queue.get()))
 
     @parameterized.expand([
         ([{}, {}], True, True),
@@ -1051,7 +1055,9 @@ class TestSubstrateNetworkAlerter(unittest.TestCase):
         test_hb = {
             'component_name': self.test_alerter_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_once_with(test_hb)
 
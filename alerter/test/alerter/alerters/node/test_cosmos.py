@@ -19,6 +19,7 @@ from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
 from src.configs.factory.alerts.cosmos_alerts import (
     CosmosNodeAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.utils.constants.cosmos import BOND_STATUS_BONDED
 from src.utils.constants.rabbitmq import (
     CONFIG_EXCHANGE, HEALTH_CHECK_EXCHANGE, ALERT_EXCHANGE,
@@ -31,7 +32,7 @@ from src.utils.exceptions import (
     CosmosRestServerDataCouldNotBeObtained, CometbftRPCDataCouldNotBeObtained)
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
-    disconnect_from_rabbit)
+    disconnect_from_rabbit, envelope_to_dict)
 
 
 class TestCosmosNodeAlerter(unittest.TestCase):
@@ -567,23 +568,25 @@ class TestCosmosNodeAlerter(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': COSMOS_NODE_ALERT_ROUTING_KEY,
             'data': 'data_1',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_2 = {
             'exchange': ALERT_EXCHANGE,
             'routing_key': COSMOS_NODE_ALERT_ROUTING_KEY,
             'data': 'data_2',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         self.test_alerter._place_latest_data_on_queue(test_data)
         self.assertEqual(2,
                          self.test_alerter.publishing_queue.qsize())
-        self.assertEqual(expected_data_1,
-                         self.test_alerter.publishing_queue.get())
-        self.assertEqual(expected_data_2,
-                         self.test_alerter.publishing_queue.get())
+        self.assertEqual(expected_data_1, envelope_to_dict(
+            self.test_alerter.publishing_queue.get()))
+        self.assertEqual(expected_data_2, envelope_to_dict(
+            self.test_alerter.publishing_queue.get()))
 
     def test_place_latest_data_on_queue_removes_old_data_if_full_then_places(
             self) -> None:
@@ -603,11 +606,12 @@ class TestCosmosNodeAlerter(unittest.TestCase):
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': COSMOS_NODE_ALERT_ROUTING_KEY,
                 'data': 'data_2',
-                'properties': pika.BasicProperties(delivery_mode=2),
+                'properties': pika.BasicProperties(
+                    delivery_mode=2, content_type=JSON_CONTENT_TYPE),
                 'mandatory': True
             }
-            self.assertEqual(expected_data,
-                             self.test_alerter.publishing_queue.get())
+            self.assertEqual(expected_data, envelope_to_dict(
+                self.test_alerter.publishing_queue.get()))
 
     @mock.patch.object(CosmosNodeAlertingFactory, "classify_error_alert")
     @mock.patch.object(CosmosNodeAlertingFactory, "classify_no_change_in_alert")
@@ -1696,7 +1700,9 @@ class TestCosmosNodeAlerter(unittest.TestCase):
         test_hb = {
             'component_name': self.test_alerter_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_once_with(test_hb)
 
@@ -24,6 +24,7 @@ from src.alerter.grouped_alerts_metric_code.node.evm_node_metric_code \
     import GroupedEVMNodeAlertsMetricCode
 from src.configs.factory.alerts.evm_alerts import EVMNodeAlertsConfigsFactory
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.utils.constants.rabbitmq import (
     CONFIG_EXCHANGE, EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
     HEALTH_CHECK_EXCHANGE, ALERT_EXCHANGE,
@@ -33,7 +34,7 @@ from src.utils.env import RABBIT_IP
 from src.utils.exceptions import PANICException, NodeIsDownException
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
-    disconnect_from_rabbit)
+    disconnect_from_rabbit, envelope_to_dict)
 
 
 class TestEVMNodeAlerter(unittest.TestCase):
@@ -392,23 +393,25 @@ class TestEVMNodeAlerter(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': EVM_NODE_ALERT_ROUTING_KEY,
             'data': 'data_1',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_2 = {
             'exchange': ALERT_EXCHANGE,
             'routing_key': EVM_NODE_ALERT_ROUTING_KEY,
             'data': 'data_2',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         self.test_node_alerter._place_latest_data_on_queue(test_data)
         self.assertEqual(2,
                          self.test_node_alerter.publishing_queue.qsize())
-        self.assertEqual(expected_data_1,
-                         self.test_node_alerter.publishing_queue.get())
-        self.assertEqual(expected_data_2,
-                         self.test_node_alerter.publishing_queue.get())
+        self.assertEqual(expected_data_1, envelope_to_dict(
+            self.test_node_alerter.publishing_queue.get()))
+        self.assertEqual(expected_data_2, envelope_to_dict(
+            self.test_node_alerter.publishing_queue.get()))
 
     def test_place_latest_data_on_queue_removes_old_data_if_full_then_places(
             self) -> None:
@@ -428,11 +431,12 @@ class TestEVMNodeAlerter(unittest.TestCase):
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': EVM_NODE_ALERT_ROUTING_KEY,
                 'data': 'data_2',
-                'properties': pika.BasicProperties(delivery_mode=2),
+                'properties': pika.BasicProperties(
+                    delivery_mode=2, content_type=JSON_CONTENT_TYPE),
                 'mandatory': True
             }
-            self.assertEqual(expected_data,
-                             self.test_node_alerter.publishing_queue.get())
+            self.assertEqual(expected_data, envelope_to_dict(
+                self.test_node_alerter.publishing_queue.get()))
 
     @mock.patch.object(EVMNodeAlertingFactory, "classify_downtime_alert")
     @mock.patch.object(EVMNodeAlertingFactory, "classify_error_alert")
@@ -839,7 +843,9 @@ class TestEVMNodeAlerter(unittest.TestCase):
         test_hb = {
             'component_name': self.test_alerter_name,
             'is_alive': True,
-            'timestamp': datetime.datetime.now().timestamp()
+            'timestamp': datetime.datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_once_with(test_hb)
 
@@ -2,6 +2,9 @@ import copy
 import datetime
 import json
 import logging
+import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import call
@@ -18,18 +21,22 @@ from src.alerter.grouped_alerts_metric_code.system \
     import GroupedSystemAlertsMetricCode as MetricCode
 from src.configs.factory.alerts.system_alerts import SystemAlertsConfigsFactory
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.utils.constants.rabbitmq import (
     CONFIG_EXCHANGE, SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
     HEALTH_CHECK_EXCHANGE, ALERT_EXCHANGE,
     SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
     SYSTEM_ALERT_ROUTING_KEY, ALERTS_CONFIGS_ROUTING_KEY_GEN)
+from src.utils import env
+from src.utils.deltas import as_delta
 from src.utils.env import RABBIT_IP
 from src.utils.exceptions import (
     PANICException, SystemIsDownException, InvalidUrlException,
     MetricNotFoundException)
+from src.utils.snapshot import StateSnapshotter
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
-    disconnect_from_rabbit)
+    disconnect_from_rabbit, envelope_to_dict)
 
 
 class TestSystemAlerter(unittest.TestCase):
@@ -173,6 +180,37 @@ class TestSystemAlerter(unittest.TestCase):
         self.assertEqual(self.test_alerting_factory,
                          self.test_system_alerter.alerting_factory)
 
+    def test_restore_state_snapshot_restores_alerting_state_and_configs(
+            self) -> None:
+        parsed_routing_key = self.test_configs_routing_key.split('.')
+        chain = parsed_routing_key[1] + ' ' + parsed_routing_key[2]
+        del self.received_configurations['DEFAULT']
+        self.test_configs_factory.add_new_config(
+            chain, self.received_configurations)
+        parent_id = self.test_configs_factory.get_parent_id(chain)
+        self.test_system_alerter.alerting_factory.create_alerting_state(
+            parent_id, self.test_system_id,
+            self.test_configs_factory.configs[chain])
+        snapshot_directory = tempfile.mkdtemp()
+        snapshotter = StateSnapshotter(
+            os.path.join(snapshot_directory, 'test.snapshot'),
+            datetime.timedelta(seconds=60))
+        self.test_system_alerter._snapshotter = snapshotter
+        self.test_system_alerter._save_state_snapshot()
+
+        restarted_alerter = SystemAlerter(
+            self.test_alerter_name, self.dummy_logger,
+            SystemAlertsConfigsFactory(), self.rabbitmq, self.test_queue_size)
+        restarted_alerter._snapshotter = snapshotter
+        restarted_alerter._restore_state_snapshot()
+
+        self.assertEqual(
+            self.test_system_alerter.alerting_factory.alerting_state,
+            restarted_alerter.alerting_factory.alerting_state)
+        self.assertEqual(self.test_configs_factory.configs,
+                         restarted_alerter.alerts_configs_factory.configs)
+        shutil.rmtree(snapshot_directory)
+
     def test_initialise_rabbitmq_initialises_everything_as_expected(
             self) -> None:
         # To make sure that there is no connection/channel already
@@ -381,23 +419,25 @@ class TestSystemAlerter(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': SYSTEM_ALERT_ROUTING_KEY,
             'data': 'data_1',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_2 = {
             'exchange': ALERT_EXCHANGE,
             'routing_key': SYSTEM_ALERT_ROUTING_KEY,
             'data': 'data_2',
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         self.test_system_alerter._place_latest_data_on_queue(test_data)
         self.assertEqual(2,
                          self.test_system_alerter.publishing_queue.qsize())
-        self.assertEqual(expected_data_1,
-                         self.test_system_alerter.publishing_queue.get())
-        self.assertEqual(expected_data_2,
-                         self.test_system_alerter.publishing_queue.get())
+        self.assertEqual(expected_data_1, envelope_to_dict(
+            self.test_system_alerter.publishing_queue.get()))
+        self.assertEqual(expected_data_2, envelope_to_dict(
+            self.test_system_alerter.publishing_queue.get()))
 
     def test_place_latest_data_on_queue_removes_old_data_if_full_then_places(
             self) -> None:
@@ -417,11 +457,23 @@ class TestSystemAlerter(unittest.TestCase):
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': SYSTEM_ALERT_ROUTING_KEY,
                 'data': 'data_2',
-                'properties': pika.BasicProperties(delivery_mode=2),
+                'properties': pika.BasicProperties(
+                    delivery_mode=2, content_type=JSON_CONTENT_TYPE),
                 'mandatory': True
             }
-            self.assertEqual(expected_data,
-                             self.test_system_alerter.publishing_queue.get())
+            self.assertEqual(expected_data, envelope_to_dict(
+                self.test_system_alerter.publishing_queue.get()))
+
+    def test_place_latest_data_on_queue_sets_priority_from_alert_severity(
+            self) -> None:
+        test_data = [{'severity': 'INFO'}, {'severity': 'CRITICAL'}]
+
+        self.test_system_alerter._place_latest_data_on_queue(test_data)
+
+        self.assertEqual(2, self.test_system_alerter.publishing_queue.get()
+                         .properties.priority)
+        self.assertEqual(10, self.test_system_alerter.publishing_queue.get()
+                         .properties.priority)
 
     @mock.patch.object(SystemAlertingFactory, "classify_downtime_alert")
     @mock.patch.object(SystemAlertingFactory, "classify_error_alert")
@@ -624,6 +676,29 @@ class TestSystemAlerter(unittest.TestCase):
         mock_reverse.assert_not_called()
         mock_thresh_per_alert.assert_not_called()
 
+    @mock.patch.object(SystemAlertingFactory, "classify_thresholded_alert")
+    def test_process_result_classifies_deltas_with_the_latest_metrics(
+            self, mock_thresh_alert) -> None:
+        parsed_routing_key = self.test_configs_routing_key.split('.')
+        chain = parsed_routing_key[1] + ' ' + parsed_routing_key[2]
+        del self.received_configurations['DEFAULT']
+        self.test_configs_factory.add_new_config(
+            chain, self.received_configurations)
+        delta = as_delta({'result': self.test_result_data},
+                         {'system_cpu_usage'})['result']
+        delta['data']['system_cpu_usage'] = {'current': 97, 'previous': 96}
+
+        # Before a full snapshot, only the metrics in the delta are known
+        self.test_system_alerter._process_result(delta, [])
+        self.assertEqual([97], [
+            args[0][0] for args in mock_thresh_alert.call_args_list])
+
+        mock_thresh_alert.reset_mock()
+        self.test_system_alerter._process_result(self.test_result_data, [])
+        self.test_system_alerter._process_result(delta, [])
+        self.assertEqual([96, 96, 96, 96, 96, 97, 96, 96], [
+            args[0][0] for args in mock_thresh_alert.call_args_list])
+
     @mock.patch.object(SystemAlertingFactory, "classify_downtime_alert")
     @mock.patch.object(SystemAlertingFactory, "classify_error_alert")
     def test_process_error_classifies_correctly_if_data_valid(
@@ -776,10 +851,43 @@ class TestSystemAlerter(unittest.TestCase):
         test_hb = {
             'component_name': self.test_alerter_name,
             'is_alive': True,
-            'timestamp': datetime.datetime.now().timestamp()
+            'timestamp': datetime.datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_once_with(test_hb)
 
+    @mock.patch.object(SystemAlerter, "_send_heartbeat")
+    def test_send_heartbeat_if_due_sends_one_hb_per_interval_with_counts(
+            self, mock_send_hb) -> None:
+        with freeze_time("2012-01-01 00:00:00") as frozen_time:
+            self.test_system_alerter._send_heartbeat_if_due(False)
+            self.test_system_alerter._send_heartbeat_if_due(False)
+            self.test_system_alerter._send_heartbeat_if_due(True)
+            self.test_system_alerter._send_heartbeat_if_due(False)
+            frozen_time.tick(datetime.timedelta(
+                seconds=env.HEARTBEAT_INTERVAL_SECONDS))
+            self.test_system_alerter._send_heartbeat_if_due(True)
+            self.test_system_alerter._send_heartbeat_if_due(False)
+
+            self.assertEqual([
+                call({
+                    'component_name': self.test_alerter_name,
+                    'is_alive': True,
+                    'timestamp': datetime.datetime(2012, 1, 1).timestamp(),
+                    'processed_messages': 1,
+                    'errored_messages': 0
+                }),
+                call({
+                    'component_name': self.test_alerter_name,
+                    'is_alive': True,
+                    'timestamp': datetime.datetime(2012, 1, 1).timestamp() +
+                                 env.HEARTBEAT_INTERVAL_SECONDS,
+                    'processed_messages': 3,
+                    'errored_messages': 2
+                }),
+            ], mock_send_hb.call_args_list)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(SystemAlerter, "_process_result")
     @mock.patch.object(SystemAlerter, "_send_data")
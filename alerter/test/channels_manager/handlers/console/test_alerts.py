@@ -19,6 +19,7 @@ from src.channels_manager.handlers.console.alerts import (
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (
+    ALERT_QUEUE_ARGUMENTS,
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
     HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, CONSOLE_HANDLER_INPUT_ROUTING_KEY)
@@ -174,7 +175,8 @@ class TestConsoleAlertsHandler(unittest.TestCase):
             # Re-declare queue to get the number of messages
             res = self.test_console_alerts_handler.rabbitmq.queue_declare(
                 self.test_console_alerts_handler._console_alerts_handler_queue,
-                False, True, False, False)
+                False, True, False, False,
+                ALERT_QUEUE_ARGUMENTS)
             self.assertEqual(0, res.method.message_count)
         except Exception as e:
             self.fail("Test failed: {}".format(e))
@@ -301,7 +303,9 @@ class TestConsoleAlertsHandler(unittest.TestCase):
             expected_heartbeat = {
                 'component_name': self.test_handler_name,
                 'is_alive': True,
-                'timestamp': datetime.now().timestamp()
+                'timestamp': datetime.now().timestamp(),
+                'processed_messages': 1,
+                'errored_messages': 0
             }
             mock_send_heartbeat.assert_called_once_with(expected_heartbeat)
         except Exception as e:
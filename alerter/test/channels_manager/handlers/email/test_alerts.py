@@ -21,6 +21,7 @@ from src.channels_manager.handlers import EmailAlertsHandler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (
+    ALERT_QUEUE_ARGUMENTS,
     HEALTH_CHECK_EXCHANGE, ALERT_EXCHANGE, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
     CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
     CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE)
@@ -212,7 +213,8 @@ class TestEmailAlertsHandler(unittest.TestCase):
             # Re-declare queue to get the number of messages
             res = self.test_email_alerts_handler.rabbitmq.queue_declare(
                 self.test_email_alerts_handler._email_alerts_handler_queue,
-                False, True, False, False)
+                False, True, False, False,
+                ALERT_QUEUE_ARGUMENTS)
             self.assertEqual(0, res.method.message_count)
         except Exception as e:
             self.fail("Test failed: {}".format(e))
@@ -462,7 +464,9 @@ class TestEmailAlertsHandler(unittest.TestCase):
             expected_heartbeat = {
                 'component_name': self.test_handler_name,
                 'is_alive': True,
-                'timestamp': datetime.now().timestamp()
+                'timestamp': datetime.now().timestamp(),
+                'processed_messages': 1,
+                'errored_messages': 0
             }
             mock_send_heartbeat.assert_called_once_with(expected_heartbeat)
         except Exception as e:
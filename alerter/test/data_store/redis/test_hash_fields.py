@@ -0,0 +1,26 @@
+import unittest
+
+from src.data_store.redis import RedisHashFields
+
+
+class TestRedisHashFields(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_fields = RedisHashFields({
+            'key1': b'val1',
+            'key2': None,
+            'key3': b'None',
+        })
+        self.default = b'DEFAULT'
+
+    def test_get_returns_the_read_value(self) -> None:
+        self.assertEqual(b'val1', self.test_fields.get('key1', self.default))
+
+    def test_get_returns_default_for_fields_which_do_not_exist(self) -> None:
+        self.assertEqual(self.default,
+                         self.test_fields.get('key2', self.default))
+
+    def test_get_returns_none_for_none_string(self) -> None:
+        self.assertIsNone(self.test_fields.get('key3', self.default))
+
+    def test_get_raises_key_error_for_fields_which_were_not_read(self) -> None:
+        self.assertRaises(KeyError, self.test_fields.get, 'key4')
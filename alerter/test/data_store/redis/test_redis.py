@@ -194,6 +194,17 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
             self.redis.hget_unsafe(self.hash_name, self.key1,
                                    default=self.default_str))
 
+    def test_hmget_unsafe_returns_values_in_order_and_none_if_unset(self):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, self.key2, self.val2)
+        self.assertEqual(
+            self.redis.hmget_unsafe(self.hash_name,
+                                    [self.key2, self.key3, self.key1]),
+            [self.val2_bytes, None, self.val1_bytes])
+
+    def test_hmget_unsafe_returns_empty_list_for_no_keys(self):
+        self.assertEqual(self.redis.hmget_unsafe(self.hash_name, []), [])
+
     def test_get_int_unsafe_returns_set_integer(self):
         self.redis.set_unsafe(self.key3, self.val3_int)
         self.assertEqual(
@@ -318,6 +329,24 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         keys_list = self.redis.get_keys_unsafe('aa*')
         self.assertSetEqual(set(keys_list), {prefixed_key1, prefixed_key3})
 
+    def test_scan_keys_unsafe_gets_only_keys_that_match_prefix_pattern(self):
+        prefixed_key1 = 'aaa' + self.key1
+        prefixed_key2 = 'bbb' + self.key2
+        prefixed_key3 = 'aa' + self.key3
+        self.redis.set_unsafe(prefixed_key1, self.val1)
+        self.redis.set_unsafe(prefixed_key2, self.val2)
+        self.redis.set_unsafe(prefixed_key3, self.val3_int)
+
+        keys_list = self.redis.scan_keys_unsafe('aa*')
+        self.assertSetEqual(set(keys_list), {prefixed_key1, prefixed_key3})
+
+    def test_hscan_unsafe_returns_only_fields_that_match_pattern(self):
+        self.redis.hset_unsafe(self.hash_name, 'aaa' + self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, 'bbb' + self.key2, self.val2)
+        self.assertEqual(
+            self.redis.hscan_unsafe(self.hash_name, 'aa*'),
+            {'aaa' + self.key1: self.val1_bytes})
+
     def test_remove_unsafe_does_nothing_if_key_does_not_exists(self):
         self.redis.remove_unsafe(self.key1)
         self.assertFalse(self.redis.exists_unsafe(self.key1))
@@ -483,6 +512,19 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
             self.redis.hget(self.hash_name, self.key1,
                             default=self.default_str), self.default_str)
 
+    def test_hmget_returns_values_in_order_and_none_if_unset(self):
+        self.redis.hset(self.hash_name, self.key1, self.val1)
+        self.assertEqual(
+            self.redis.hmget(self.hash_name, [self.key1, self.key2]),
+            [self.val1_bytes, None])
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hmget_returns_nones_if_redis_down(self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertEqual(
+            self.redis.hmget(self.hash_name, [self.key1, self.key2]),
+            [None, None])
+
     def test_get_int_returns_set_integer(self):
         self.redis.set(self.key3, self.val3_int)
         self.assertEqual(
@@ -791,6 +833,10 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
         self.assertRaises(RedisConnectionError, self.redis.hget_unsafe,
                           self.hash_name, self.key)
 
+    def test_hmget_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError, self.redis.hmget_unsafe,
+                          self.hash_name, [self.key])
+
     def test_get_int_unsafe_throws_connection_exception(self):
         self.assertRaises(RedisConnectionError, self.redis.get_int_unsafe,
                           self.key)
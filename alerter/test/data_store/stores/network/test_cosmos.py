@@ -341,7 +341,9 @@ class TestCosmosNetworkStore(unittest.TestCase):
         test_hb = {
             'component_name': self.test_store_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_once_with(test_hb)
 
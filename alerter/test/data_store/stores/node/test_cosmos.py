@@ -22,6 +22,7 @@ from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
     COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
     COSMOS_NODE_STORE_INPUT_QUEUE_NAME)
+from src.utils.cosmos import unpack_missed_blocks, unpack_slashed
 from src.utils.exceptions import (PANICException, NodeIsDownException,
                                   MessageWasNotDeliveredException)
 from src.utils.types import convert_to_int, convert_to_float, str_to_bool
@@ -632,16 +633,15 @@ class TestCosmosNodeStore(unittest.TestCase):
             ))
         self.assertEqual(
             data['data']['slashed'],
-            json.loads((self.redis.hget(
-                redis_hash,
-                Keys.get_cosmos_node_slashed(self.node_id)).decode('utf-8')))
+            unpack_slashed(self.redis.hget(
+                redis_hash, Keys.get_cosmos_node_slashed(self.node_id)))
         )
         self.assertEqual(
             data['data']['missed_blocks'],
-            json.loads(self.redis.hget(
+            unpack_missed_blocks(self.redis.hget(
                 redis_hash,
                 Keys.get_cosmos_node_missed_blocks(self.node_id)
-            ).decode('utf-8')))
+            )))
         self.assertEqual(
             data['data']['is_syncing'],
             str_to_bool(self.redis.hget(
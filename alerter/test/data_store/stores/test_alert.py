@@ -814,7 +814,9 @@ class TestAlertStore(unittest.TestCase):
             heartbeat_test = {
                 'component_name': self.test_store_name,
                 'is_alive': True,
-                'timestamp': datetime(2012, 1, 1).timestamp()
+                'timestamp': datetime(2012, 1, 1).timestamp(),
+                'processed_messages': 1,
+                'errored_messages': 0
             }
 
             _, _, body = self.test_rabbit_manager.basic_get(
@@ -1476,7 +1478,9 @@ class TestAlertStore(unittest.TestCase):
         test_hb = {
             'component_name': self.test_store_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_ack.assert_called_once()
         mock_send_hb.assert_called_once_with(test_hb)
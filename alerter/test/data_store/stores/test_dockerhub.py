@@ -459,7 +459,9 @@ class TestDockerhubStore(unittest.TestCase):
         heartbeat_test = {
             'component_name': self.test_store_name,
             'is_alive': True,
-            'timestamp': datetime(2012, 1, 1).timestamp()
+            'timestamp': datetime(2012, 1, 1).timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
 
         _, _, body = self.test_rabbit_manager.basic_get(
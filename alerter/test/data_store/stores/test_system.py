@@ -22,6 +22,7 @@ from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
 from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE, SYSTEM_STORE_INPUT_QUEUE_NAME, TOPIC,
     HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, SYSTEM_TRANSFORMED_DATA_ROUTING_KEY)
+from src.utils.deltas import as_delta
 from src.utils.exceptions import (PANICException,
                                   ReceivedUnexpectedDataException)
 from test.test_utils.utils import (
@@ -371,6 +372,21 @@ class TestSystemStore(unittest.TestCase):
                 str(meta_data['last_monitored'])})
         mock_hset_multiple.assert_has_calls([call_1])
 
+    @mock.patch.object(RedisApi, "hset_multiple")
+    def test_process_redis_store_saves_only_the_metrics_in_a_delta(
+            self, mock_hset_multiple) -> None:
+        data = as_delta(self.system_data_1, {'system_cpu_usage'})
+
+        self.test_store._process_redis_store(data)
+
+        mock_hset_multiple.assert_called_once_with(
+            Keys.get_hash_parent(self.parent_id), {
+                Keys.get_system_system_cpu_usage(self.system_id): str(
+                    self.system_data_1['result']['data']['system_cpu_usage']),
+                Keys.get_system_last_monitored(self.system_id): str(
+                    self.last_monitored),
+            })
+
     @mock.patch.object(RedisApi, "hset")
     def test_process_redis_store_calls_hset_on_error(self, mock_hset) -> None:
         self.test_store._process_redis_store(self.system_data_error)
@@ -665,7 +681,9 @@ class TestSystemStore(unittest.TestCase):
             heartbeat_test = {
                 'component_name': self.test_store_name,
                 'is_alive': True,
-                'timestamp': datetime(2012, 1, 1).timestamp()
+                'timestamp': datetime(2012, 1, 1).timestamp(),
+                'processed_messages': 1,
+                'errored_messages': 0
             }
 
             _, _, body = self.test_rabbit_manager.basic_get(
@@ -724,6 +742,28 @@ class TestSystemStore(unittest.TestCase):
             self.system_data_1['result'])
         mock_update_one.assert_called_once()
 
+    @mock.patch.object(MongoApi, "update_one")
+    def test_process_mongo_store_saves_deltas_merged_into_full_snapshot(
+            self, mock_update_one) -> None:
+        delta = as_delta(self.system_data_2, {'system_cpu_usage'})
+
+        # Without a full snapshot, the other metrics of the round are unknown
+        self.test_store._process_mongo_result_store(delta['result'])
+        mock_update_one.assert_not_called()
+
+        self.test_store._process_mongo_result_store(
+            self.system_data_1['result'])
+        self.test_store._process_mongo_result_store(delta['result'])
+        self.assertEqual(2, mock_update_one.call_count)
+        saved_metrics = mock_update_one.call_args[0][2]['$push'][
+            self.system_id]
+        self.assertEqual(
+            str(self.system_data_2['result']['data']['system_cpu_usage']),
+            saved_metrics['system_cpu_usage'])
+        self.assertEqual(
+            str(self.system_data_1['result']['data']['system_ram_usage']),
+            saved_metrics['system_ram_usage'])
+
     def test_process_mongo_store_raises_exception_on_unexpected_key(
             self) -> None:
         self.assertRaises(ReceivedUnexpectedDataException,
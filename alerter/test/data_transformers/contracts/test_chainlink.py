@@ -17,6 +17,7 @@ from src.data_transformers.contracts.chainlink import (
     ChainlinkContractsDataTransformer
 )
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.monitorables.contracts.chainlink.v3 import V3ChainlinkContract
 from src.monitorables.contracts.chainlink.v4 import V4ChainlinkContract
 from src.utils import env
@@ -30,7 +31,8 @@ from src.utils.exceptions import (
     MessageWasNotDeliveredException)
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, disconnect_from_rabbit,
-    delete_exchange_if_exists, save_chainlink_contract_to_redis)
+    delete_exchange_if_exists, save_chainlink_contract_to_redis,
+    envelope_to_dict)
 
 
 class TestChainlinkContractsDataTransformer(unittest.TestCase):
@@ -1139,14 +1141,16 @@ class TestChainlinkContractsDataTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY,
             'data': self.test_data_for_alerting_result_v3,
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY,
             'data': self.transformed_data_example_result_v3,
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
 
@@ -1154,10 +1158,12 @@ class TestChainlinkContractsDataTransformer(unittest.TestCase):
             2, self.test_data_transformer.publishing_queue.qsize())
         self.assertDictEqual(
             expected_data_for_alerting,
-            self.test_data_transformer.publishing_queue.queue[0])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[0]))
         self.assertDictEqual(
             expected_data_for_saving,
-            self.test_data_transformer.publishing_queue.queue[1])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[1]))
 
     @parameterized.expand(
         [(V3ChainlinkContract, 3,), (V4ChainlinkContract, 4,), ])
@@ -1592,6 +1598,8 @@ class TestChainlinkContractsDataTransformer(unittest.TestCase):
             'component_name': self.test_data_transformer.transformer_name,
             'is_alive': True,
             'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
 
         # Load the state to avoid loading data from redis.
@@ -14,6 +14,7 @@ from pika.exceptions import AMQPConnectionError, AMQPChannelError
 from src.data_store.redis import RedisApi
 from src.data_transformers.networks.cosmos import CosmosNetworkTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.monitorables.networks.cosmos import CosmosNetwork
 from src.utils import env
 from src.utils.constants.cosmos import (
@@ -28,7 +29,7 @@ from src.utils.exceptions import (
     MessageWasNotDeliveredException)
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
-    disconnect_from_rabbit, save_cosmos_network_to_redis)
+    disconnect_from_rabbit, save_cosmos_network_to_redis, envelope_to_dict)
 
 
 class TestCosmosNetworkTransformer(unittest.TestCase):
@@ -753,14 +754,16 @@ class TestCosmosNetworkTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': COSMOS_NETWORK_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_alerting),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': COSMOS_NETWORK_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_saving),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
 
@@ -768,10 +771,12 @@ class TestCosmosNetworkTransformer(unittest.TestCase):
             2, self.test_network_transformer.publishing_queue.qsize())
         self.assertDictEqual(
             expected_data_for_alerting,
-            self.test_network_transformer.publishing_queue.queue[0])
+            envelope_to_dict(
+                self.test_network_transformer.publishing_queue.queue[0]))
         self.assertDictEqual(
             expected_data_for_saving,
-            self.test_network_transformer.publishing_queue.queue[1])
+            envelope_to_dict(
+                self.test_network_transformer.publishing_queue.queue[1]))
 
     @parameterized.expand([
         ({
@@ -1243,7 +1248,9 @@ class TestCosmosNetworkTransformer(unittest.TestCase):
         test_heartbeat = {
             'component_name': self.transformer_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_with(test_heartbeat)
 
@@ -14,6 +14,7 @@ from pika.exceptions import AMQPConnectionError, AMQPChannelError
 from src.data_store.redis import RedisApi
 from src.data_transformers.networks.substrate import SubstrateNetworkTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.monitorables.networks.substrate import SubstrateNetwork
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -27,7 +28,7 @@ from src.utils.exceptions import (
     MessageWasNotDeliveredException)
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
-    disconnect_from_rabbit, save_substrate_network_to_redis)
+    disconnect_from_rabbit, save_substrate_network_to_redis, envelope_to_dict)
 
 
 class TestSubstrateNetworkTransformer(unittest.TestCase):
@@ -1029,14 +1030,16 @@ class TestSubstrateNetworkTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': SUBSTRATE_NETWORK_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_alerting),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': SUBSTRATE_NETWORK_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_saving),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
 
@@ -1044,10 +1047,12 @@ class TestSubstrateNetworkTransformer(unittest.TestCase):
             2, self.test_network_transformer.publishing_queue.qsize())
         self.assertDictEqual(
             expected_data_for_alerting,
-            self.test_network_transformer.publishing_queue.queue[0])
+            envelope_to_dict(
+                self.test_network_transformer.publishing_queue.queue[0]))
         self.assertDictEqual(
             expected_data_for_saving,
-            self.test_network_transformer.publishing_queue.queue[1])
+            envelope_to_dict(
+                self.test_network_transformer.publishing_queue.queue[1]))
 
     @parameterized.expand([
         ({
@@ -1524,7 +1529,9 @@ class TestSubstrateNetworkTransformer(unittest.TestCase):
         test_heartbeat = {
             'component_name': self.transformer_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_with(test_heartbeat)
 
@@ -15,6 +15,7 @@ from pika.exceptions import AMQPConnectionError, AMQPChannelError
 from src.data_store.redis import RedisApi
 from src.data_transformers.node.chainlink import ChainlinkNodeDataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.monitorables.nodes.chainlink_node import ChainlinkNode
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -26,7 +27,7 @@ from src.utils.exceptions import (PANICException, NodeIsDownException,
                                   MessageWasNotDeliveredException)
 from test.test_utils.utils import (
     connect_to_rabbit, disconnect_from_rabbit, delete_exchange_if_exists,
-    delete_queue_if_exists, save_chainlink_node_to_redis)
+    delete_queue_if_exists, save_chainlink_node_to_redis, envelope_to_dict)
 
 
 class TestChainlinkNodeDataTransformer(unittest.TestCase):
@@ -1032,14 +1033,16 @@ class TestChainlinkNodeDataTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': CL_NODE_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_alerting),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': CL_NODE_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_saving),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
 
@@ -1047,10 +1050,12 @@ class TestChainlinkNodeDataTransformer(unittest.TestCase):
             2, self.test_data_transformer.publishing_queue.qsize())
         self.assertDictEqual(
             expected_data_for_alerting,
-            self.test_data_transformer.publishing_queue.queue[0])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[0]))
         self.assertDictEqual(
             expected_data_for_saving,
-            self.test_data_transformer.publishing_queue.queue[1])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[1]))
 
     @parameterized.expand([
         ({
@@ -1619,7 +1624,9 @@ class TestChainlinkNodeDataTransformer(unittest.TestCase):
         test_heartbeat = {
             'component_name': self.transformer_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_with(test_heartbeat)
 
@@ -11,9 +11,10 @@ from freezegun import freeze_time
 from parameterized import parameterized
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
-from src.data_store.redis import RedisApi
+from src.data_store.redis import RedisApi, Keys
 from src.data_transformers.node.cosmos import CosmosNodeDataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.monitorables.nodes.cosmos_node import CosmosNode
 from src.utils import env
 from src.utils.constants.cosmos import BOND_STATUS_BONDED
@@ -27,7 +28,7 @@ from src.utils.exceptions import (
     MessageWasNotDeliveredException)
 from test.test_utils.utils import (
     connect_to_rabbit, disconnect_from_rabbit, delete_exchange_if_exists,
-    delete_queue_if_exists, save_cosmos_node_to_redis)
+    delete_queue_if_exists, save_cosmos_node_to_redis, envelope_to_dict)
 
 
 class TestCosmosNodeDataTransformer(unittest.TestCase):
@@ -916,6 +917,27 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
         # Clean test db
         self.redis.delete_all()
 
+    def test_load_state_loads_slashed_and_missed_blocks_saved_as_json(
+            self) -> None:
+        # The slashed and missed blocks metrics used to be saved as JSON
+        # rather than packed
+        self.redis.delete_all()
+        save_cosmos_node_to_redis(self.redis, self.node_1)
+        redis_hash = Keys.get_hash_parent(self.node_1.parent_id)
+        node_id = self.node_1.node_id
+        self.redis.hset(redis_hash, Keys.get_cosmos_node_slashed(node_id),
+                        json.dumps(self.node_1.slashed))
+        self.redis.hset(redis_hash,
+                        Keys.get_cosmos_node_missed_blocks(node_id),
+                        json.dumps(self.node_1.missed_blocks))
+        expected_loaded_node = copy.deepcopy(self.node_1)
+        self.node_1.reset()
+
+        loaded_cosmos_node = self.test_data_transformer.load_state(self.node_1)
+
+        self.assertEqual(expected_loaded_node, loaded_cosmos_node)
+        self.redis.delete_all()
+
     def test_load_state_keeps_same_state_if_node_in_redis_and_redis_offline(
             self) -> None:
         """
@@ -1027,6 +1049,21 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
         # Clean test db
         self.redis.delete_all()
 
+    @mock.patch.object(env, 'COSMOS_NODE_HEIGHTS_RETENTION', 1)
+    def test_transform_data_keeps_only_last_heights_within_retention(
+            self) -> None:
+        self.node_1.reset()
+        self.test_data_transformer._state = copy.deepcopy(self.test_state)
+
+        trans_data, _, _ = self.test_data_transformer._transform_data(
+            self.raw_data_example_result_all)
+
+        metrics = trans_data['cometbft_rpc']['result']['data']
+        self.assertEqual({'slashed': True, 'amount_map': {'4498': None}},
+                         metrics['slashed'])
+        self.assertEqual({'total_count': 2, 'missed_heights': [4497]},
+                         metrics['missed_blocks'])
+
     @parameterized.expand([
         ({'prometheus': {}, 'cosmos_rest': {}, 'cometbft_rpc': {}},),
         ({'prometheus': 'bad_val', 'cosmos_rest': {}, 'cometbft_rpc': {}},),
@@ -1277,14 +1314,16 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_alerting),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_saving),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
 
@@ -1292,10 +1331,12 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
             2, self.test_data_transformer.publishing_queue.qsize())
         self.assertDictEqual(
             expected_data_for_alerting,
-            self.test_data_transformer.publishing_queue.queue[0])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[0]))
         self.assertDictEqual(
             expected_data_for_saving,
-            self.test_data_transformer.publishing_queue.queue[1])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[1]))
 
     @parameterized.expand([
         ({
@@ -1891,7 +1932,9 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
         test_heartbeat = {
             'component_name': self.transformer_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_with(test_heartbeat)
 
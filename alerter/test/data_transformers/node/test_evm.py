@@ -15,6 +15,7 @@ from parameterized import parameterized
 from src.data_store.redis import RedisApi
 from src.data_transformers.node.evm import EVMNodeDataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.monitorables.nodes.evm_node import EVMNode
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -26,7 +27,7 @@ from src.utils.exceptions import (PANICException, NodeIsDownException,
                                   MessageWasNotDeliveredException)
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, disconnect_from_rabbit,
-    delete_exchange_if_exists, save_evm_node_to_redis)
+    delete_exchange_if_exists, save_evm_node_to_redis, envelope_to_dict)
 
 
 class TestEVMNodeDataTransformer(unittest.TestCase):
@@ -637,24 +638,28 @@ class TestEVMNodeDataTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_alerting),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_saving),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
 
         self.assertEqual(2, self.test_data_transformer.publishing_queue.qsize())
         self.assertDictEqual(
             expected_data_for_alerting,
-            self.test_data_transformer.publishing_queue.queue[0])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[0]))
         self.assertDictEqual(
             expected_data_for_saving,
-            self.test_data_transformer.publishing_queue.queue[1])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[1]))
 
     @parameterized.expand([({}, False,), ('self.test_state', True), ])
     @mock.patch.object(EVMNodeDataTransformer, "_transform_data")
@@ -966,6 +971,8 @@ class TestEVMNodeDataTransformer(unittest.TestCase):
             'component_name': self.test_data_transformer.transformer_name,
             'is_alive': True,
             'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
 
         # Load the state to avoid having the node already in redis, hence
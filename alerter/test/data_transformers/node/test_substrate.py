@@ -14,7 +14,9 @@ from pika.exceptions import AMQPConnectionError, AMQPChannelError
 from src.data_store.redis import RedisApi
 from src.data_transformers.node.substrate import SubstrateNodeDataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.monitorables.nodes.substrate_node import SubstrateNode
+from src.monitorables.slots import get_slot_values
 from src.utils import env
 from src.utils.constants.rabbitmq import (
     SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, HEALTH_CHECK_EXCHANGE,
@@ -26,7 +28,7 @@ from src.utils.exceptions import (
     MessageWasNotDeliveredException)
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, disconnect_from_rabbit,
-    delete_exchange_if_exists, save_substrate_node_to_redis)
+    delete_exchange_if_exists, save_substrate_node_to_redis, envelope_to_dict)
 
 
 class TestSubstrateNodeDataTransformer(unittest.TestCase):
@@ -643,8 +645,8 @@ class TestSubstrateNodeDataTransformer(unittest.TestCase):
         loaded_substrate_node = self.test_data_transformer.load_state(
             self.node_1)
 
-        self.assertEqual(expected_loaded_node.__dict__,
-                         loaded_substrate_node.__dict__)
+        self.assertEqual(get_slot_values(expected_loaded_node),
+                         get_slot_values(loaded_substrate_node))
 
         # Now for when default values are stored in redis. Note that at this
         # point node_1 has all the loaded metrics. This is important to confirm
@@ -976,14 +978,16 @@ class TestSubstrateNodeDataTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_alerting),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_saving),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
 
@@ -991,10 +995,12 @@ class TestSubstrateNodeDataTransformer(unittest.TestCase):
             2, self.test_data_transformer.publishing_queue.qsize())
         self.assertDictEqual(
             expected_data_for_alerting,
-            self.test_data_transformer.publishing_queue.queue[0])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[0]))
         self.assertDictEqual(
             expected_data_for_saving,
-            self.test_data_transformer.publishing_queue.queue[1])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[1]))
 
     @parameterized.expand([
         ({
@@ -1510,7 +1516,9 @@ class TestSubstrateNodeDataTransformer(unittest.TestCase):
         test_heartbeat = {
             'component_name': self.transformer_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         mock_send_hb.assert_called_with(test_heartbeat)
 
@@ -0,0 +1,105 @@
+import unittest
+
+from src.data_transformers.coalescing import (find_superseded,
+                                              get_coalescing_key)
+from src.utils.constants.rabbitmq import (
+    SYSTEM_RAW_DATA_ROUTING_KEY, COSMOS_NODE_RAW_DATA_ROUTING_KEY,
+    GITHUB_RAW_DATA_ROUTING_KEY)
+
+
+class TestCoalescing(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_system_id = 'test_system_id'
+        self.test_node_id = 'test_node_id'
+        self.test_system_data = {
+            'result': {
+                'meta_data': {'system_id': self.test_system_id},
+                'data': {'system_cpu_usage': 7.85},
+            }
+        }
+        self.test_system_error = {
+            'error': {
+                'meta_data': {'system_id': self.test_system_id},
+                'code': 5004,
+            }
+        }
+        self.test_prometheus_data = {
+            'result': {
+                'meta_data': {'node_id': self.test_node_id},
+                'data': {'current_height': 5},
+            }
+        }
+        self.test_prometheus_error = {
+            'error': {
+                'meta_data': {'node_id': self.test_node_id},
+                'code': 5000,
+            }
+        }
+        self.test_cometbft_data = {
+            'result': {
+                'meta_data': {'node_id': self.test_node_id},
+                'data': {'historical': [{'height': 5}]},
+            }
+        }
+
+    def test_get_coalescing_key_returns_key_of_snapshot_messages(
+            self) -> None:
+        self.assertEqual(
+            (SYSTEM_RAW_DATA_ROUTING_KEY, self.test_system_id,
+             frozenset([''])),
+            get_coalescing_key(SYSTEM_RAW_DATA_ROUTING_KEY,
+                               self.test_system_data))
+        self.assertEqual(
+            (COSMOS_NODE_RAW_DATA_ROUTING_KEY, self.test_node_id,
+             frozenset(['prometheus'])),
+            get_coalescing_key(COSMOS_NODE_RAW_DATA_ROUTING_KEY, {
+                'prometheus': self.test_prometheus_data, 'cosmos_rest': {},
+                'cometbft_rpc': {}
+            }))
+
+    def test_get_coalescing_key_returns_none_if_message_has_event_data(
+            self) -> None:
+        self.assertIsNone(get_coalescing_key(
+            COSMOS_NODE_RAW_DATA_ROUTING_KEY, {
+                'prometheus': self.test_prometheus_data, 'cosmos_rest': {},
+                'cometbft_rpc': self.test_cometbft_data
+            }))
+        self.assertIsNone(get_coalescing_key(GITHUB_RAW_DATA_ROUTING_KEY,
+                                             self.test_system_data))
+
+    def test_get_coalescing_key_returns_none_if_message_has_an_error(
+            self) -> None:
+        self.assertIsNone(get_coalescing_key(SYSTEM_RAW_DATA_ROUTING_KEY,
+                                             self.test_system_error))
+        self.assertIsNone(get_coalescing_key(
+            COSMOS_NODE_RAW_DATA_ROUTING_KEY, {
+                'prometheus': self.test_prometheus_error,
+                'cosmos_rest': {}, 'cometbft_rpc': {}
+            }))
+
+    def test_get_coalescing_key_returns_none_if_message_is_unexpected(
+            self) -> None:
+        self.assertIsNone(get_coalescing_key(SYSTEM_RAW_DATA_ROUTING_KEY,
+                                             None))
+        self.assertIsNone(get_coalescing_key(SYSTEM_RAW_DATA_ROUTING_KEY,
+                                             {'result': {'data': {}}}))
+        self.assertIsNone(get_coalescing_key(
+            COSMOS_NODE_RAW_DATA_ROUTING_KEY,
+            {'prometheus': {}, 'cosmos_rest': {}, 'cometbft_rpc': {}}))
+
+    def test_find_superseded_keeps_only_the_newest_message_of_each_key(
+            self) -> None:
+        key_1 = (SYSTEM_RAW_DATA_ROUTING_KEY, 'system_1', frozenset(['']))
+        key_2 = (SYSTEM_RAW_DATA_ROUTING_KEY, 'system_2', frozenset(['']))
+
+        self.assertEqual(
+            [True, True, False, False, False, False],
+            find_superseded([key_1, key_2, None, key_1, None, key_2]))
+        self.assertEqual([], find_superseded([]))
+
+    def test_error_is_not_superseded_by_newer_result(self) -> None:
+        keys = [get_coalescing_key(SYSTEM_RAW_DATA_ROUTING_KEY, raw_data)
+                for raw_data in [self.test_system_error,
+                                 self.test_system_data]]
+
+        self.assertEqual([False, False], find_superseded(keys))
@@ -16,7 +16,9 @@ from parameterized import parameterized
 from src.data_store.redis import RedisApi
 from src.data_transformers.github import GitHubDataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
 from src.monitorables.repo import GitHubRepo
+from src.monitorables.slots import get_slot_values
 from src.utils import env
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE, STORE_EXCHANGE,
                                           ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -28,7 +30,7 @@ from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE, STORE_EXCHANGE,
 from src.utils.exceptions import (PANICException,
                                   ReceivedUnexpectedDataException,
                                   MessageWasNotDeliveredException)
-from test.test_utils.utils import save_github_repo_to_redis
+from test.test_utils.utils import save_github_repo_to_redis, envelope_to_dict
 
 
 class TestGitHubDataTransformer(unittest.TestCase):
@@ -505,8 +507,8 @@ class TestGitHubDataTransformer(unittest.TestCase):
         # will be compared
         for repo_id in expected_state.keys():
             self.assertDictEqual(
-                expected_state[repo_id].__dict__,
-                self.test_data_transformer.state[repo_id].__dict__)
+                get_slot_values(expected_state[repo_id]),
+                get_slot_values(self.test_data_transformer.state[repo_id]))
 
     @parameterized.expand([
         ('result', 'self.transformed_data_example_result'),
@@ -545,8 +547,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
 
         # Check that the repo's state values have been modified correctly
         self.assertDictEqual(
-            eval(expected_state).__dict__,
-            self.test_data_transformer._state[self.test_repo_id].__dict__)
+            get_slot_values(eval(expected_state)),
+            get_slot_values(
+                self.test_data_transformer._state[self.test_repo_id]))
 
     @parameterized.expand([
         ('self.transformed_data_example_result',
@@ -650,24 +653,28 @@ class TestGitHubDataTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': GITHUB_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_alerting),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': GITHUB_TRANSFORMED_DATA_ROUTING_KEY,
             'data': eval(data_for_saving),
-            'properties': pika.BasicProperties(delivery_mode=2),
+            'properties': pika.BasicProperties(
+                delivery_mode=2, content_type=JSON_CONTENT_TYPE),
             'mandatory': True
         }
 
         self.assertEqual(2, self.test_data_transformer.publishing_queue.qsize())
         self.assertDictEqual(
             expected_data_for_alerting,
-            self.test_data_transformer.publishing_queue.queue[0])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[0]))
         self.assertDictEqual(
             expected_data_for_saving,
-            self.test_data_transformer.publishing_queue.queue[1])
+            envelope_to_dict(
+                self.test_data_transformer.publishing_queue.queue[1]))
 
     @parameterized.expand([({}, False,), ('self.test_state', True), ])
     @mock.patch.object(GitHubDataTransformer, "_transform_data")
@@ -828,8 +835,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
             self.assertEqual(self.test_data_str,
                              self.test_data_transformer._state['repo2'])
             self.assertEqual(
-                expected_data.__dict__,
-                self.test_data_transformer._state[self.test_repo_id].__dict__)
+                get_slot_values(expected_data),
+                get_slot_values(
+                    self.test_data_transformer._state[self.test_repo_id]))
 
             # To reset the state as if the repo was not already added
             del self.test_data_transformer._state[self.test_repo_id]
@@ -848,8 +856,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
             expected_data = GitHubRepo(self.test_repo_name, self.test_repo_id,
                                        self.test_repo_parent_id)
             self.assertEqual(
-                expected_data.__dict__,
-                self.test_data_transformer._state[self.test_repo_id].__dict__)
+                get_slot_values(expected_data),
+                get_slot_values(
+                    self.test_data_transformer._state[self.test_repo_id]))
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
@@ -892,8 +901,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
             self.assertEqual(self.test_data_str,
                              self.test_data_transformer._state['repo2'])
             self.assertEqual(
-                self.test_repo_new_metrics.__dict__,
-                self.test_data_transformer._state[self.test_repo_id].__dict__)
+                get_slot_values(self.test_repo_new_metrics),
+                get_slot_values(
+                    self.test_data_transformer._state[self.test_repo_id]))
 
             # Reset state for error path
             self.test_data_transformer._state = copy.deepcopy(self.test_state)
@@ -911,8 +921,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
             self.assertEqual(self.test_data_str,
                              self.test_data_transformer._state['repo2'])
             self.assertEqual(
-                self.test_repo.__dict__,
-                self.test_data_transformer._state[self.test_repo_id].__dict__)
+                get_slot_values(self.test_repo),
+                get_slot_values(
+                    self.test_data_transformer._state[self.test_repo_id]))
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
@@ -952,8 +963,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
             expected_data = copy.deepcopy(self.test_repo)
             self.assertEqual(1, len(self.test_data_transformer._state.keys()))
             self.assertEqual(
-                expected_data.__dict__,
-                self.test_data_transformer._state[self.test_repo_id].__dict__)
+                get_slot_values(expected_data),
+                get_slot_values(
+                    self.test_data_transformer._state[self.test_repo_id]))
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
@@ -998,8 +1010,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
             expected_data = copy.deepcopy(self.test_repo)
             self.assertEqual(1, len(self.test_data_transformer._state.keys()))
             self.assertEqual(
-                expected_data.__dict__,
-                self.test_data_transformer._state[self.test_repo_id].__dict__)
+                get_slot_values(expected_data),
+                get_slot_values(
+                    self.test_data_transformer._state[self.test_repo_id]))
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
@@ -1042,8 +1055,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
             expected_data = copy.deepcopy(self.test_repo)
             self.assertEqual(1, len(self.test_data_transformer._state.keys()))
             self.assertEqual(
-                expected_data.__dict__,
-                self.test_data_transformer._state[self.test_repo_id].__dict__)
+                get_slot_values(expected_data),
+                get_slot_values(
+                    self.test_data_transformer._state[self.test_repo_id]))
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
@@ -1332,7 +1346,9 @@ class TestGitHubDataTransformer(unittest.TestCase):
         test_hb = {
             'component_name': self.transformer_name,
             'is_alive': True,
-            'timestamp': datetime.now().timestamp()
+            'timestamp': datetime.now().timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 0
         }
         try:
             # We must initialise rabbit to the environment and parameters needed
@@ -1354,8 +1370,8 @@ class TestGitHubDataTransformer(unittest.TestCase):
             self.test_data_transformer._process_raw_data(blocking_channel,
                                                          method, properties,
                                                          body_error)
-            # Check that send_heartbeat was called
-            self.assertEqual(2, mock_send_hb.call_count)
+            # Heartbeats are rate limited, the second message is only counted
+            self.assertEqual(1, mock_send_hb.call_count)
             args, _ = mock_send_hb.call_args
             self.assertDictEqual(test_hb, args[0])
             self.assertEqual(1, len(args))
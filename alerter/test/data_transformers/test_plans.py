@@ -0,0 +1,88 @@
+import unittest
+
+from src.data_store.redis import Keys, RedisHashFields
+from src.data_transformers.plans import (CL_NODE_PLAN, EVM_NODE_PLAN,
+                                         SYSTEM_PLAN, convert_to_str)
+from src.monitorables.nodes.chainlink_node import ChainlinkNode
+from src.monitorables.nodes.evm_node import EVMNode
+from src.monitorables.system import System
+
+
+class TestTransformationPlan(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_node_id = 'test_node_id'
+        self.test_evm_node = EVMNode('test_node', self.test_node_id,
+                                     'test_parent_id')
+        self.test_evm_node.set_current_height(100)
+        self.test_evm_node.set_last_monitored(10.0)
+
+    def test_plans_cover_all_the_metric_attributes(self) -> None:
+        cl_node = ChainlinkNode('test_node', self.test_node_id,
+                                'test_parent_id')
+
+        self.assertEqual(['current_height', 'went_down_at', 'last_monitored',
+                          'syncing'], EVM_NODE_PLAN.metrics)
+        self.assertEqual(
+            set(cl_node.get_all_prometheus_metric_attributes())
+            - set(cl_node.get_dict_prometheus_metric_attributes()),
+            set(CL_NODE_PLAN.metrics))
+        self.assertEqual(15, len(SYSTEM_PLAN.metrics))
+        self.assertEqual(
+            [Keys.get_evm_node_current_height(self.test_node_id),
+             Keys.get_evm_node_went_down_at(self.test_node_id),
+             Keys.get_evm_node_last_monitored(self.test_node_id),
+             Keys.get_evm_node_syncing(self.test_node_id)],
+            EVM_NODE_PLAN.get_state_keys(self.test_node_id))
+
+    def test_load_state_converts_redis_values_and_keeps_missing_ones(
+            self) -> None:
+        state_fields = RedisHashFields({
+            Keys.get_evm_node_current_height(self.test_node_id): b'200',
+            Keys.get_evm_node_went_down_at(self.test_node_id): b'None',
+            Keys.get_evm_node_last_monitored(self.test_node_id): None,
+            Keys.get_evm_node_syncing(self.test_node_id): b'True',
+        })
+
+        EVM_NODE_PLAN.load_state(self.test_evm_node, self.test_node_id,
+                                 state_fields)
+
+        self.assertEqual(200, self.test_evm_node.current_height)
+        self.assertIsNone(self.test_evm_node.went_down_at)
+        self.assertEqual(10.0, self.test_evm_node.last_monitored)
+        self.assertTrue(self.test_evm_node.syncing)
+
+    def test_get_alerting_metrics_adds_previous_values_of_alerted_metrics(
+            self) -> None:
+        metrics = {'current_height': 101, 'syncing': False,
+                   'went_down_at': None, 'new_metric': 5}
+
+        self.assertEqual({
+            'current_height': {'current': 101, 'previous': 100},
+            'syncing': {'current': False, 'previous': None},
+            'went_down_at': {'current': None, 'previous': None},
+            'new_metric': {'current': 5},
+        }, EVM_NODE_PLAN.get_alerting_metrics(metrics, self.test_evm_node))
+
+    def test_get_saving_fields_maps_metrics_to_their_redis_keys(self) -> None:
+        self.assertEqual({
+            Keys.get_system_system_cpu_usage('test_system_id'): '7.85',
+            Keys.get_system_went_down_at('test_system_id'): 'None',
+        }, SYSTEM_PLAN.get_saving_fields(
+            'test_system_id', {'system_cpu_usage': 7.85,
+                               'went_down_at': None}))
+
+    def test_convert_to_str_converts_none_strings_only(self) -> None:
+        self.assertIsNone(convert_to_str('None', None))
+        self.assertEqual('prometheus_url', convert_to_str('prometheus_url',
+                                                          None))
+
+    def test_system_plan_loads_every_system_metric(self) -> None:
+        system = System('test_system', 'test_system_id', 'test_parent_id')
+        state_fields = RedisHashFields({
+            key: b'5.0' for key in SYSTEM_PLAN.get_state_keys('test_system_id')
+        })
+
+        SYSTEM_PLAN.load_state(system, 'test_system_id', state_fields)
+
+        for metric in SYSTEM_PLAN.metrics:
+            self.assertEqual(5.0, getattr(system, metric))
@@ -306,16 +306,16 @@ class TestDataTransformersStarters(unittest.TestCase):
     @mock.patch("src.data_transformers.starters._initialise_transformer_logger")
     @mock.patch("src.data_transformers.starters._initialise_transformer_redis")
     @mock.patch('src.data_transformers.starters.RabbitMQApi')
-    @mock.patch('src.abstract.publisher_subscriber.Queue')
+    @mock.patch('src.abstract.publisher_subscriber.create_publishing_queue')
     def test_initialise_data_transformer_creates_data_transformer_correctly(
             self, transformer_class, transformer_display_name, publishing_queue,
-            expected_data_transformer, mock_queue, mock_rabbit, mock_init_redis,
-            mock_init_logger) -> None:
+            expected_data_transformer, mock_create_queue, mock_rabbit,
+            mock_init_redis, mock_init_logger) -> None:
         mock_init_logger.return_value = self.dummy_logger
         mock_init_redis.return_value = self.redis
         mock_rabbit.return_value = self.rabbitmq
         mock_rabbit.__name__ = RabbitMQApi.__name__
-        mock_queue.return_value = eval(publishing_queue)
+        mock_create_queue.return_value = eval(publishing_queue)
 
         actual_output = _initialise_data_transformer(
             transformer_class, eval(transformer_display_name))
@@ -0,0 +1,122 @@
+import copy
+import json
+import unittest
+from datetime import datetime
+from typing import Dict
+
+import pika
+
+from src.data_transformers.system import SystemDataTransformer
+from src.data_transformers.workers import TransformationWorkerPool
+from src.monitorables.system import System
+
+
+def _system_result(system_id: str, time: float, cpu_total: float) -> Dict:
+    return {
+        'result': {
+            'meta_data': {
+                'monitor_name': 'test_monitor',
+                'system_name': 'test_system',
+                'system_id': system_id,
+                'system_parent_id': 'test_parent_id',
+                'time': time
+            },
+            'data': {
+                'process_cpu_seconds_total': cpu_total,
+                'process_memory_usage': 56,
+                'virtual_memory_usage': 118513664.0,
+                'open_file_descriptors': 0.78125,
+                'system_cpu_usage': 7.85,
+                'system_ram_usage': 34.09,
+                'system_storage_usage': 44.37,
+                'network_transmit_bytes_total': cpu_total * 1000,
+                'network_receive_bytes_total': cpu_total * 2000,
+                'disk_io_time_seconds_total': cpu_total * 10,
+            },
+        }
+    }
+
+
+class TestTransformationWorkerPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_pool = TransformationWorkerPool(
+            SystemDataTransformer, 'test_system_data_transformer', 2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.test_pool.shutdown()
+
+    def setUp(self) -> None:
+        self.test_time = datetime(2012, 1, 1).timestamp()
+        self.test_state = {}
+        for system_id in ['system_1', 'system_2', 'system_3']:
+            system = System('test_system', system_id, 'test_parent_id')
+            system.set_last_monitored(self.test_time)
+            system.set_network_transmit_bytes_total(1000)
+            system.set_network_receive_bytes_total(2000)
+            system.set_disk_io_time_seconds_total(10)
+            self.test_state[system_id] = system
+        self.test_jobs = [
+            ('system_1', _system_result('system_1', self.test_time + 60, 2)),
+            ('system_2', _system_result('system_2', self.test_time + 60, 3)),
+            ('system_1', _system_result('system_1', self.test_time + 120, 5)),
+            ('system_3', _system_result('system_3', self.test_time + 60, 4)),
+        ]
+
+    def _transform_one_by_one(self) -> list:
+        replica = SystemDataTransformer.create_worker_replica(
+            'test_system_data_transformer')
+        replica.state.update(copy.deepcopy(self.test_state))
+        outputs = []
+        for _, raw_data in self.test_jobs:
+            output = replica._transform_data(raw_data)
+            replica._update_state(output[0])
+            outputs.append(output)
+        return outputs
+
+    def test_partition_of_is_stable_and_within_the_workers(self) -> None:
+        partitions = [self.test_pool.partition_of('system_{}'.format(index))
+                      for index in range(20)]
+
+        self.assertTrue(all(0 <= partition < 2 for partition in partitions))
+        self.assertEqual(partitions, [
+            self.test_pool.partition_of('system_{}'.format(index))
+            for index in range(20)])
+
+    def test_decode_decodes_messages_in_order(self) -> None:
+        properties = pika.spec.BasicProperties()
+        messages = [(json.dumps(raw_data).encode('utf-8'), properties)
+                    for _, raw_data in self.test_jobs]
+        messages.insert(1, (b'not json', properties))
+
+        decoded = self.test_pool.decode(messages)
+
+        expected = [raw_data for _, raw_data in self.test_jobs]
+        expected.insert(1, None)
+        self.assertEqual(expected, decoded)
+        self.assertEqual([], self.test_pool.decode([]))
+
+    def test_transform_gives_the_outputs_of_transforming_one_by_one(
+            self) -> None:
+        state = copy.deepcopy(self.test_state)
+
+        outputs = self.test_pool.transform(self.test_jobs, state)
+
+        self.assertEqual(self._transform_one_by_one(), outputs)
+        self.assertEqual(self.test_time, state['system_1'].last_monitored)
+
+    def test_transform_skips_later_results_of_system_if_one_fails(
+            self) -> None:
+        del self.test_jobs[0][1]['result']['data']['system_cpu_usage']
+
+        outputs = self.test_pool.transform(self.test_jobs, self.test_state)
+
+        # The later result of system_1 is left to the transformer, so that it
+        # is transformed after the failed result is processed
+        self.assertIsNone(outputs[0])
+        self.assertIsNone(outputs[2])
+        self.assertEqual(
+            'system_2', outputs[1][0]['result']['meta_data']['system_id'])
+        self.assertEqual(
+            'system_3', outputs[3][0]['result']['meta_data']['system_id'])
@@ -0,0 +1,225 @@
+import logging
+import shutil
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+import pika
+import pika.exceptions
+
+from src.message_broker.local_bus.broker import LocalBroker, topic_matches
+from src.message_broker.local_bus.connection import LocalBusConnection
+from src.message_broker.local_bus.manager import (connect_to_local_bus,
+                                                   start_local_bus)
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import decode_message
+from src.message_broker.rabbitmq.rabbitmq_api import LOCAL_TRANSPORT
+from src.utils import env
+from src.utils.constants.rabbitmq import TOPIC
+
+
+class TestLocalBroker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_data_directory = tempfile.mkdtemp()
+        self.test_broker = LocalBroker()
+        self.test_connection = LocalBusConnection(self.test_broker)
+        self.test_channel = self.test_connection.channel()
+        self.test_exchange = 'test_exchange'
+        self.test_queue = 'test_queue'
+        self.test_routing_key = 'transformed_data.system.*'
+        self.test_channel.exchange_declare(self.test_exchange, TOPIC)
+        self.test_channel.queue_declare(self.test_queue)
+        self.test_channel.queue_bind(self.test_queue, self.test_exchange,
+                                     self.test_routing_key)
+        self.test_properties = pika.BasicProperties(delivery_mode=2)
+
+    def tearDown(self) -> None:
+        self.test_connection.close()
+        shutil.rmtree(self.test_data_directory)
+
+    def _publish(self, body: bytes,
+                 routing_key: str = 'transformed_data.system.1',
+                 mandatory: bool = True) -> None:
+        self.test_channel.basic_publish(self.test_exchange, routing_key, body,
+                                        self.test_properties, mandatory)
+
+    def _get_bodies(self, channel) -> list:
+        bodies = []
+        while True:
+            method, _, body = channel.basic_get(self.test_queue)
+            if method is None:
+                return bodies
+            bodies.append(body)
+            channel.basic_ack(method.delivery_tag)
+
+    def test_topic_matches_handles_single_and_multiple_word_wildcards(
+            self) -> None:
+        self.assertTrue(topic_matches('alert.*', 'alert.system'))
+        self.assertFalse(topic_matches('alert.*', 'alert.system.1'))
+        self.assertTrue(topic_matches('alert.#', 'alert.system.1'))
+        self.assertTrue(topic_matches('alert.#', 'alert'))
+        self.assertTrue(topic_matches('#', 'alert.system'))
+        self.assertFalse(topic_matches('alert.system', 'alert.github'))
+
+    def test_messages_are_routed_by_binding_key_in_order(self) -> None:
+        self._publish(b'1')
+        self._publish(b'2', routing_key='transformed_data.github.1',
+                      mandatory=False)
+        self._publish(b'3')
+
+        self.assertEqual([b'1', b'3'], self._get_bodies(self.test_channel))
+
+    def test_consumers_receive_messages_up_to_the_prefetch_limit(
+            self) -> None:
+        for index in range(3):
+            self._publish(str(index).encode())
+        received = []
+
+        def callback(channel, method, properties, body) -> None:
+            received.append((method.delivery_tag, body))
+            if len(received) == 2:
+                channel.stop_consuming()
+
+        self.test_channel.basic_qos(prefetch_count=2)
+        self.test_channel.basic_consume(self.test_queue, callback)
+        self.test_channel.start_consuming()
+
+        self.assertEqual([(1, b'0'), (2, b'1')], received)
+        self.assertIsNone(self.test_broker.next_delivery(
+            self.test_channel.channel_number, 0))
+
+    def test_nacked_and_unacked_messages_are_requeued_first(self) -> None:
+        self._publish(b'1')
+        self._publish(b'2')
+        self._publish(b'3')
+        method, _, body = self.test_channel.basic_get(self.test_queue)
+        self.assertEqual(b'1', body)
+        self.test_channel.basic_nack(method.delivery_tag)
+
+        other_channel = self.test_connection.channel()
+        method, _, body = other_channel.basic_get(self.test_queue)
+        self.assertEqual(b'1', body)
+        self.assertTrue(method.redelivered)
+        other_channel.close()
+
+        self.assertEqual([b'1', b'2', b'3'],
+                         self._get_bodies(self.test_channel))
+
+    def test_declaring_a_missing_queue_passively_closes_the_channel(
+            self) -> None:
+        with self.assertRaises(
+                pika.exceptions.ChannelClosedByBroker) as context:
+            self.test_channel.queue_declare('missing_queue', passive=True)
+
+        self.assertEqual(404, context.exception.reply_code)
+        self.assertTrue(self.test_channel.is_closed)
+
+    def test_unroutable_mandatory_messages_are_reported_if_confirming(
+            self) -> None:
+        routing_key = 'transformed_data.github.1'
+        self._publish(b'1', routing_key=routing_key)
+
+        self.test_channel.confirm_delivery()
+        self.assertRaises(pika.exceptions.UnroutableError, self._publish,
+                          b'1', routing_key)
+
+    def test_exclusive_queues_are_deleted_with_their_channel(self) -> None:
+        other_channel = self.test_connection.channel()
+        other_channel.queue_declare('exclusive_queue', exclusive=True)
+        other_channel.close()
+
+        self.assertRaises(pika.exceptions.ChannelClosedByBroker,
+                          self.test_channel.queue_declare, 'exclusive_queue',
+                          True)
+
+    def test_durable_queues_keep_their_messages_after_a_restart(
+            self) -> None:
+        broker = LocalBroker(self.test_data_directory, 1)
+        channel = LocalBusConnection(broker).channel()
+        channel.exchange_declare(self.test_exchange, TOPIC)
+        channel.queue_declare(self.test_queue, durable=True)
+        channel.queue_bind(self.test_queue, self.test_exchange,
+                           self.test_routing_key)
+        for index in range(3):
+            channel.basic_publish(self.test_exchange,
+                                  'transformed_data.system.1',
+                                  str(index).encode(), self.test_properties)
+        method, _, _ = channel.basic_get(self.test_queue)
+        channel.basic_ack(method.delivery_tag)
+        channel.close()
+
+        broker = LocalBroker(self.test_data_directory, 1)
+        channel = LocalBusConnection(broker).channel()
+        channel.queue_declare(self.test_queue, durable=True)
+
+        self.assertEqual([b'1', b'2'], self._get_bodies(channel))
+
+
+class TestLocalBusTransport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        with socket.socket() as free_socket:
+            free_socket.bind(('localhost', 0))
+            self.test_port = free_socket.getsockname()[1]
+        self.test_authkey = 'test_authkey'
+        self.local_bus = start_local_bus('localhost', self.test_port,
+                                         self.test_authkey)
+        self.env_patches = [
+            mock.patch.object(env, 'LOCAL_BUS_HOST', 'localhost'),
+            mock.patch.object(env, 'LOCAL_BUS_PORT', self.test_port),
+            mock.patch.object(env, 'LOCAL_BUS_AUTHKEY', self.test_authkey),
+        ]
+        for patch in self.env_patches:
+            patch.start()
+        self.rabbitmq = RabbitMQApi(self.dummy_logger, env.RABBIT_IP,
+                                    transport=LOCAL_TRANSPORT)
+        self.test_exchange = 'test_exchange'
+        self.test_queue = 'test_queue'
+
+    def tearDown(self) -> None:
+        if self.rabbitmq.connection is not None:
+            self.rabbitmq.disconnect()
+        for patch in self.env_patches:
+            patch.stop()
+        self.local_bus.shutdown()
+
+    def test_rabbitmq_api_publishes_and_consumes_through_the_local_bus(
+            self) -> None:
+        self.rabbitmq.connect()
+        self.rabbitmq.exchange_declare(self.test_exchange, TOPIC)
+        self.rabbitmq.queue_declare(self.test_queue)
+        self.rabbitmq.queue_bind(self.test_queue, self.test_exchange,
+                                 'alert.#')
+        self.rabbitmq.confirm_delivery()
+        self.rabbitmq.basic_publish_confirm(
+            self.test_exchange, 'alert.system.1', {'alert': 1},
+            is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2), mandatory=True)
+        received = []
+
+        def callback(channel, method, properties, body) -> None:
+            received.append(decode_message(body, properties))
+            self.rabbitmq.basic_ack(method.delivery_tag)
+            self.rabbitmq.stop_consuming()
+
+        self.rabbitmq.basic_consume(self.test_queue, callback)
+        self.rabbitmq.start_consuming()
+
+        self.assertTrue(self.rabbitmq.is_connected)
+        self.assertEqual([{'alert': 1}], received)
+
+    def test_connect_fails_if_the_local_bus_is_not_running(self) -> None:
+        self.local_bus.shutdown()
+
+        self.assertRaises(pika.exceptions.AMQPConnectionError,
+                          self.rabbitmq.connect)
+        self.local_bus = start_local_bus('localhost', self.test_port,
+                                         self.test_authkey)
+
+    def test_local_bus_is_not_served_or_used_without_a_key(self) -> None:
+        self.assertRaises(ValueError, start_local_bus, 'localhost',
+                          self.test_port, '')
+        self.assertRaises(ValueError, connect_to_local_bus, 'localhost',
+                          self.test_port, '')
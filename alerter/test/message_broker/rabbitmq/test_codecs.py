@@ -0,0 +1,96 @@
+import json
+import unittest
+from unittest import mock
+
+import pika
+from parameterized import parameterized
+
+from src.message_broker.rabbitmq.codecs import (
+    JSON_CODEC, ORJSON_CODEC, MSGPACK_CODEC, JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE, JsonCodec, MsgPackCodec, get_codec,
+    get_default_codec, encode_message, decode_message, msgpack, orjson)
+from src.utils.exceptions import UnsupportedContentTypeException
+
+
+class TestCodecs(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_body = {
+            'result': {
+                'meta_data': {'node_name': 'test_node', 'time': 1.5},
+                'data': {'historical': [
+                    {'height': 50, 'signed_prev_block': True,
+                     'slashed_amount': None}
+                ]},
+            }
+        }
+
+    def test_default_codec_is_json(self) -> None:
+        self.assertEqual(JSON_CODEC, get_default_codec().name)
+        self.assertEqual(JSON_CONTENT_TYPE, get_default_codec().content_type)
+
+    @parameterized.expand([
+        (JSON_CODEC, True,),
+        (ORJSON_CODEC, orjson is not None,),
+        (MSGPACK_CODEC, msgpack is not None,),
+        ('unknown_codec', False,),
+    ])
+    def test_get_codec_returns_codec_only_if_available(
+            self, name, expected_available) -> None:
+        codec = get_codec(name)
+        if expected_available:
+            self.assertEqual(name, codec.name)
+        else:
+            self.assertIsNone(codec)
+
+    def test_encode_message_encodes_as_json_by_default(self) -> None:
+        body, content_type = encode_message(self.test_body,
+                                            get_default_codec())
+        self.assertEqual(JSON_CONTENT_TYPE, content_type)
+        self.assertEqual(self.test_body, json.loads(body))
+
+    @parameterized.expand([(OverflowError,), (TypeError,)])
+    @mock.patch.object(MsgPackCodec, "encode", autospec=True)
+    def test_encode_message_falls_back_to_json_if_codec_cannot_encode(
+            self, error, mock_encode) -> None:
+        mock_encode.side_effect = error
+        body, content_type = encode_message(self.test_body, MsgPackCodec())
+        self.assertEqual(JSON_CONTENT_TYPE, content_type)
+        self.assertEqual(self.test_body, json.loads(body))
+
+    @parameterized.expand([
+        (None,), (pika.BasicProperties(),),
+        (pika.BasicProperties(content_type=JSON_CONTENT_TYPE),),
+    ])
+    def test_decode_message_decodes_json_if_no_or_json_content_type(
+            self, properties) -> None:
+        self.assertEqual(self.test_body, decode_message(
+            json.dumps(self.test_body), properties))
+
+    def test_decode_message_raises_exception_if_content_type_unsupported(
+            self) -> None:
+        properties = pika.BasicProperties(content_type='application/xml')
+        self.assertRaises(UnsupportedContentTypeException, decode_message,
+                          b'<xml/>', properties)
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack_encoded_message_is_decoded_according_to_content_type(
+            self) -> None:
+        encoded, content_type = encode_message(self.test_body,
+                                               MsgPackCodec())
+        self.assertEqual(MSGPACK_CONTENT_TYPE, content_type)
+        self.assertEqual(self.test_body, decode_message(
+            encoded, pika.BasicProperties(content_type=content_type)))
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack_decodes_dict_keys_as_strings_like_json(self) -> None:
+        body = {**self.test_body, 5: 'integer_key', True: 'boolean_key'}
+        encoded, content_type = encode_message(body, MsgPackCodec())
+        self.assertEqual(json.loads(json.dumps(body)), decode_message(
+            encoded, pika.BasicProperties(content_type=content_type)))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_encoded_message_is_decoded_as_json(self) -> None:
+        encoded, content_type = encode_message(self.test_body,
+                                               get_codec(ORJSON_CODEC))
+        self.assertEqual(JSON_CONTENT_TYPE, content_type)
+        self.assertEqual(self.test_body, JsonCodec().decode(encoded))
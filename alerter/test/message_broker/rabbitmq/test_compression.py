@@ -0,0 +1,98 @@
+import json
+import unittest
+import zlib
+
+import pika
+from parameterized import parameterized
+
+from src.message_broker.rabbitmq.codecs import decode_message
+from src.message_broker.rabbitmq.compression import (
+    ZLIB_ENCODING, ZSTD_ENCODING, CompressionMetrics, ZlibCompressor,
+    ZstdCompressor, get_compressor, compress_body, decompress_body,
+    zstandard)
+from src.utils.exceptions import UnsupportedContentEncodingException
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_body = json.dumps({
+            'historical': [
+                {'height': height, 'signed_prev_block': True}
+                for height in range(100)
+            ]
+        }).encode('utf-8')
+        self.test_threshold = 100
+        self.test_compressor = ZlibCompressor()
+
+    @parameterized.expand([
+        (ZLIB_ENCODING, True,),
+        (ZSTD_ENCODING, zstandard is not None,),
+        ('unknown_encoding', False,),
+    ])
+    def test_get_compressor_returns_compressor_only_if_available(
+            self, content_encoding, expected_available) -> None:
+        compressor = get_compressor(content_encoding)
+        if expected_available:
+            self.assertEqual(content_encoding, compressor.content_encoding)
+        else:
+            self.assertIsNone(compressor)
+
+    def test_compress_body_compresses_bodies_above_the_threshold(
+            self) -> None:
+        body, content_encoding = compress_body(
+            self.test_body, self.test_compressor, self.test_threshold)
+        self.assertEqual(ZLIB_ENCODING, content_encoding)
+        self.assertLess(len(body), len(self.test_body))
+        self.assertEqual(self.test_body, zlib.decompress(body))
+
+    @parameterized.expand([
+        (b'{"small": true}', ZlibCompressor(),),
+        (b'a' * 1000, None,),
+        (bytes(range(256)), ZlibCompressor(),),
+    ])
+    def test_compress_body_does_not_compress_if_not_worth_it(
+            self, body, compressor) -> None:
+        # Small bodies, disabled compression, and bodies which do not shrink
+        # are all sent as they are
+        self.assertEqual((body, None),
+                         compress_body(body, compressor, self.test_threshold))
+
+    def test_decompress_body_returns_body_if_not_compressed(self) -> None:
+        self.assertEqual(self.test_body,
+                         decompress_body(self.test_body, None))
+
+    def test_decompress_body_raises_exception_if_encoding_unsupported(
+            self) -> None:
+        self.assertRaises(UnsupportedContentEncodingException,
+                          decompress_body, self.test_body, 'unknown_encoding')
+
+    def test_decode_message_decompresses_body_according_to_encoding(
+            self) -> None:
+        body, content_encoding = compress_body(
+            self.test_body, self.test_compressor, self.test_threshold)
+        properties = pika.BasicProperties(content_type='application/json',
+                                          content_encoding=content_encoding)
+        self.assertEqual(json.loads(self.test_body),
+                         decode_message(body, properties))
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_compressed_body_is_decompressed(self) -> None:
+        body, content_encoding = compress_body(
+            self.test_body, ZstdCompressor(), self.test_threshold)
+        self.assertEqual(ZSTD_ENCODING, content_encoding)
+        self.assertEqual(self.test_body,
+                         decompress_body(body, content_encoding))
+
+    def test_compression_metrics_records_the_compression_ratio(self) -> None:
+        metrics = CompressionMetrics()
+        self.assertIsNone(metrics.compression_ratio)
+
+        metrics.record(1000, 100)
+        metrics.record(500, 200)
+
+        self.assertEqual({
+            'compressed_messages': 2,
+            'uncompressed_bytes': 1500,
+            'compressed_bytes': 300,
+            'compression_ratio': 5.0,
+        }, metrics.metrics)
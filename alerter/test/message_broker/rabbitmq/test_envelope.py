@@ -0,0 +1,74 @@
+import logging
+import unittest
+
+import pika
+
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import JSON_CONTENT_TYPE
+from src.message_broker.rabbitmq.compression import (ZLIB_ENCODING,
+                                                     ZlibCompressor)
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+from src.utils import env
+
+
+class TestPublishingEnvelope(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.rabbitmq = RabbitMQApi(
+            self.dummy_logger, env.RABBIT_IP, compressor=ZlibCompressor(),
+            compression_threshold=100)
+        self.test_exchange = 'test_exchange'
+        self.test_routing_key = 'test_routing_key'
+        self.test_properties = pika.BasicProperties(delivery_mode=2)
+        self.test_data = {
+            'meta_data': {'system_name': 'system_1'},
+            'data': {'system_cpu_usage': 7.85},
+        }
+
+    def _create_envelope(self, data) -> PublishingEnvelope:
+        body, properties = self.rabbitmq.encode_body(
+            data, self.test_properties)
+        return PublishingEnvelope(self.test_exchange, self.test_routing_key,
+                                  body, properties, True)
+
+    def test_envelope_is_not_affected_by_later_modifications_of_the_data(
+            self) -> None:
+        envelope = self._create_envelope(self.test_data)
+        expected_data = {
+            'meta_data': {'system_name': 'system_1'},
+            'data': {'system_cpu_usage': 7.85},
+        }
+        self.test_data['data']['system_cpu_usage'] = 100
+
+        self.assertEqual(expected_data, envelope.data)
+
+    def test_encode_body_does_not_modify_the_given_properties(self) -> None:
+        envelope = self._create_envelope(self.test_data)
+
+        self.assertEqual(JSON_CONTENT_TYPE, envelope.properties.content_type)
+        self.assertEqual(2, envelope.properties.delivery_mode)
+        self.assertIsNone(self.test_properties.content_type)
+        self.assertIsNot(self.test_properties, envelope.properties)
+
+    def test_envelope_data_decompresses_large_bodies(self) -> None:
+        large_data = {'historical': [{'height': height, 'signed': True}
+                                     for height in range(100)]}
+        envelope = self._create_envelope(large_data)
+
+        self.assertEqual(ZLIB_ENCODING, envelope.properties.content_encoding)
+        self.assertEqual(large_data, envelope.data)
+
+    def test_envelopes_with_the_same_contents_are_equal(self) -> None:
+        self.assertEqual(self._create_envelope(self.test_data),
+                         self._create_envelope(self.test_data))
+        self.assertNotEqual(self._create_envelope(self.test_data),
+                            self._create_envelope({'other': 'data'}))
+
+    def test_envelope_is_immutable(self) -> None:
+        envelope = self._create_envelope(self.test_data)
+
+        with self.assertRaises(AttributeError):
+            envelope.body = b'{}'
+        with self.assertRaises(AttributeError):
+            envelope.new_attribute = True
@@ -0,0 +1,65 @@
+import unittest
+from queue import Queue
+
+import pika
+
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+from src.message_broker.rabbitmq.lane_queue import LaneQueue, discard_oldest
+from src.utils.constants.rabbitmq import ALERT_EXCHANGE, STORE_EXCHANGE
+
+
+class TestLaneQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_max_size = 4
+        self.test_queue = LaneQueue(self.test_max_size, [ALERT_EXCHANGE])
+
+    @staticmethod
+    def _create_envelope(exchange: str, index: int) -> PublishingEnvelope:
+        return PublishingEnvelope(
+            exchange, 'routing_key', str(index).encode(),
+            pika.BasicProperties(delivery_mode=2), True)
+
+    def _get_all(self):
+        envelopes = []
+        while not self.test_queue.empty():
+            envelopes.append(self.test_queue.get())
+        return envelopes
+
+    def test_priority_envelopes_are_returned_first_in_order(self) -> None:
+        envelopes = [self._create_envelope(STORE_EXCHANGE, 0),
+                     self._create_envelope(ALERT_EXCHANGE, 1),
+                     self._create_envelope(STORE_EXCHANGE, 2),
+                     self._create_envelope(ALERT_EXCHANGE, 3)]
+        for envelope in envelopes:
+            self.test_queue.put(envelope)
+
+        self.assertEqual(envelopes[1], self.test_queue.queue[0])
+        self.assertEqual(2, self.test_queue.priority_size)
+        self.assertEqual([envelopes[1], envelopes[3], envelopes[0],
+                          envelopes[2]], self._get_all())
+        self.assertEqual(0, self.test_queue.priority_size)
+
+    def test_discard_oldest_discards_other_envelopes_first(self) -> None:
+        envelopes = [self._create_envelope(ALERT_EXCHANGE, 0),
+                     self._create_envelope(STORE_EXCHANGE, 1),
+                     self._create_envelope(ALERT_EXCHANGE, 2),
+                     self._create_envelope(STORE_EXCHANGE, 3)]
+        for envelope in envelopes:
+            self.test_queue.put(envelope)
+        self.assertTrue(self.test_queue.full())
+
+        self.assertEqual(envelopes[1], discard_oldest(self.test_queue))
+        self.assertEqual(envelopes[3], discard_oldest(self.test_queue))
+        self.assertEqual(envelopes[0], discard_oldest(self.test_queue))
+        self.assertEqual([envelopes[2]], self._get_all())
+
+    def test_discard_oldest_gets_the_first_envelope_of_other_queues(
+            self) -> None:
+        queue = Queue()
+        envelopes = [self._create_envelope(ALERT_EXCHANGE, 0),
+                     self._create_envelope(STORE_EXCHANGE, 1)]
+        for envelope in envelopes:
+            queue.put(envelope)
+
+        self.assertEqual(envelopes[0], discard_oldest(queue))
+        self.assertEqual(1, queue.qsize())
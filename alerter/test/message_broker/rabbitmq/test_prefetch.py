@@ -0,0 +1,47 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.message_broker.rabbitmq.prefetch import PrefetchTuner
+
+
+class TestPrefetchTuner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_tuner = PrefetchTuner(200, 10, 1000, 2)
+
+    def test_init_bounds_the_initial_prefetch_count(self) -> None:
+        self.assertEqual(200, self.test_tuner.prefetch_count)
+        self.assertEqual(10, PrefetchTuner(0, 10, 1000, 2).prefetch_count)
+        self.assertEqual(1000, PrefetchTuner(5000, 10, 1000, 2).prefetch_count)
+        self.assertEqual(1, PrefetchTuner(0, 0, 1000, 2).min_prefetch_count)
+
+    def test_record_processing_time_keeps_a_moving_average(self) -> None:
+        self.assertIsNone(self.test_tuner.average_processing_time)
+        self.test_tuner.record_processing_time(1.0)
+        self.assertEqual(1.0, self.test_tuner.average_processing_time)
+        self.test_tuner.record_processing_time(2.0)
+        self.assertAlmostEqual(1.2, self.test_tuner.average_processing_time)
+
+    def test_tune_keeps_prefetch_count_if_nothing_was_processed(self) -> None:
+        self.assertEqual(200, self.test_tuner.tune(5000, 0.0))
+
+    @parameterized.expand([
+        (0.1, None, 0.0, 20,),
+        (0.001, None, 0.0, 1000,),
+        (0.001, 300, 0.0, 500,),
+        (0.001, 0, 0.0, 200,),
+        (0.005, None, 0.5, 200,),
+        (0.005, None, 0.75, 100,),
+        (0.005, None, 1.0, 10,),
+        (10, None, 0.0, 10,),
+        (0.0095, None, 0.0, 200,),
+    ])
+    def test_tune_chooses_prefetch_count_from_observations(
+            self, processing_time: float, queue_depth: int,
+            publishing_queue_fill: float, expected_prefetch_count: int) -> None:
+        self.test_tuner.record_processing_time(processing_time)
+
+        self.assertEqual(expected_prefetch_count, self.test_tuner.tune(
+            queue_depth, publishing_queue_fill))
+        self.assertEqual(expected_prefetch_count,
+                         self.test_tuner.prefetch_count)
@@ -8,10 +8,14 @@ import pika.exceptions
 from parameterized import parameterized
 
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.codecs import (
+    JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE, JsonCodec, MsgPackCodec)
+from src.message_broker.rabbitmq.compression import (ZLIB_ENCODING,
+                                                     ZlibCompressor)
 from src.utils import env
 from src.utils.exceptions import (
     ConnectionNotInitialisedException, BlankCredentialException,
-    MessageWasNotDeliveredException
+    MessageWasNotDeliveredException, UnavailableMessagingOptionException
 )
 from src.utils.timing import TimedTaskLimiter
 from test.test_utils.utils import TestConnection, dummy_function
@@ -65,6 +69,17 @@ class TestRabbitMQApi(TestCase):
         )
         self.assertFalse(rabbit.is_connected)
 
+    @parameterized.expand([
+        ('RABBIT_MESSAGE_CODEC', 'unknown_codec',),
+        ('RABBIT_COMPRESSION', 'unknown_compression',),
+    ])
+    def test_rabbit_object_rejects_unavailable_messaging_options(
+            self, setting: str, option: str) -> None:
+        with mock.patch.object(env, setting, option):
+            self.assertRaises(
+                UnavailableMessagingOptionException, RabbitMQApi,
+                self.rabbit_logger, self.rabbit_ip, self.rabbit_port)
+
     @parameterized.expand([
         ("started with true", True), ("started with false", False)
     ])
@@ -569,6 +584,23 @@ class TestRabbitMQApi(TestCase):
             ["test_queue", False, True, True, False], -1
         )
 
+    @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_queue_declare_forwards_arguments_if_given(
+            self, mock_safe: MagicMock, mock_connection_initialised: MagicMock,
+            mock_channel: PropertyMock
+    ):
+        mock_connection_initialised.return_value = True
+        self.rabbit.queue_declare(
+            "test_queue", passive=False, durable=True, exclusive=False,
+            auto_delete=False, arguments={'x-max-priority': 10})
+        mock_safe.assert_called_once_with(
+            self.rabbit, mock_channel.return_value.queue_declare,
+            ["test_queue", False, True, False, False,
+             {'x-max-priority': 10}], -1
+        )
+
     @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
     @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
     def test_queue_declare_does_nothing_if_not_connection_initialised(
@@ -602,6 +634,27 @@ class TestRabbitMQApi(TestCase):
             ["test_queue", False, True, True, False], -1
         )
 
+    @mock.patch.object(RabbitMQApi, "connection", new_callable=PropertyMock)
+    def test_queue_depth_declares_queue_passively_on_side_channel(
+            self, mock_connection: PropertyMock
+    ):
+        side_channel = mock_connection.return_value.channel.return_value
+        side_channel.is_closed = False
+        side_channel.queue_declare.return_value.method.message_count = 7
+        self.assertEqual(7, self.rabbit._queue_depth_on_side_channel(
+            "test_queue"))
+        side_channel.queue_declare.assert_called_once_with("test_queue", True)
+
+        # If the queue does not exist the broker closes the side channel,
+        # which is re-opened when it is next used
+        side_channel.queue_declare.side_effect = \
+            pika.exceptions.ChannelClosedByBroker(404, "NOT_FOUND")
+        self.assertIsNone(self.rabbit._queue_depth_on_side_channel(
+            "test_queue"))
+        side_channel.is_closed = True
+        self.rabbit._queue_depth_on_side_channel("test_queue")
+        self.assertEqual(2, mock_connection.return_value.channel.call_count)
+
     @parameterized.expand([(0,), (None,), (1,), (-1,)])
     @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
     @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
@@ -678,6 +731,83 @@ class TestRabbitMQApi(TestCase):
              pika.BasicProperties(), True], -1
         )
 
+    @parameterized.expand([(None,), (pika.BasicProperties(delivery_mode=2),)])
+    @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_basic_publish_encodes_dict_body_and_sets_content_type(
+            self, properties: Optional[pika.BasicProperties],
+            mock_safe: MagicMock, mock_connection_initialised: MagicMock,
+            mock_channel: PropertyMock
+    ):
+        mock_connection_initialised.return_value = True
+        body = {'test_key': 'test_value'}
+        self.rabbit.basic_publish(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, body, is_body_dict=True,
+            properties=properties, mandatory=True
+        )
+
+        args = mock_safe.call_args[0][2]
+        self.assertEqual(JsonCodec().encode(body), args[2])
+        self.assertEqual(JSON_CONTENT_TYPE, args[3].content_type)
+        self.assertIsNone(args[3].content_encoding)
+        if properties is not None:
+            self.assertEqual(2, args[3].delivery_mode)
+
+    @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_basic_publish_compresses_dict_body_above_threshold(
+            self, mock_safe: MagicMock, mock_connection_initialised: MagicMock,
+            mock_channel: PropertyMock
+    ):
+        mock_connection_initialised.return_value = True
+        rabbit = RabbitMQApi(
+            self.rabbit_logger, self.rabbit_ip, self.rabbit_port, self.username,
+            self.password, self.connection_check_time_interval, JsonCodec(),
+            ZlibCompressor(), 100
+        )
+        body = {'historical': [{'height': height} for height in range(100)]}
+        rabbit.basic_publish(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, body, is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2), mandatory=True
+        )
+
+        args = mock_safe.call_args[0][2]
+        encoded_body = JsonCodec().encode(body)
+        self.assertEqual(ZlibCompressor().compress(encoded_body), args[2])
+        self.assertEqual(ZLIB_ENCODING, args[3].content_encoding)
+        self.assertEqual(JSON_CONTENT_TYPE, args[3].content_type)
+        self.assertEqual(1, rabbit.compression_metrics.compressed_messages)
+        self.assertEqual(len(encoded_body),
+                         rabbit.compression_metrics.uncompressed_bytes)
+        self.assertEqual(len(args[2]),
+                         rabbit.compression_metrics.compressed_bytes)
+
+    @mock.patch.object(MsgPackCodec, "encode", autospec=True)
+    @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_basic_publish_encodes_dict_body_using_the_given_codec(
+            self, mock_safe: MagicMock, mock_connection_initialised: MagicMock,
+            mock_channel: PropertyMock, mock_encode: MagicMock
+    ):
+        mock_connection_initialised.return_value = True
+        mock_encode.return_value = b'encoded'
+        rabbit = RabbitMQApi(
+            self.rabbit_logger, self.rabbit_ip, self.rabbit_port, self.username,
+            self.password, self.connection_check_time_interval, MsgPackCodec()
+        )
+        rabbit.basic_publish(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, {'test_key': 1},
+            is_body_dict=True, properties=pika.BasicProperties(),
+            mandatory=True
+        )
+
+        args = mock_safe.call_args[0][2]
+        self.assertEqual(b'encoded', args[2])
+        self.assertEqual(MSGPACK_CONTENT_TYPE, args[3].content_type)
+
     @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
     @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
     def test_basic_publish_does_nothing_if_not_connection_initialised(
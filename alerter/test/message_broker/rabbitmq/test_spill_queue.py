@@ -0,0 +1,240 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import pika
+
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
+from src.message_broker.rabbitmq.lane_queue import LaneQueue
+from src.message_broker.rabbitmq.spill_queue import (
+    SpillQueue, create_publishing_queue, parse_retention_limits)
+
+
+class TestSpillQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_directory = tempfile.mkdtemp()
+        self.test_memory_size = 2
+        self.test_max_size = 10
+        self.test_routing_key_1 = 'transformed_data.system'
+        self.test_routing_key_2 = 'alert.system'
+        self.test_queue = self._create_queue()
+
+    def tearDown(self) -> None:
+        self.test_queue.close()
+        shutil.rmtree(self.test_directory)
+
+    def _create_queue(self, **kwargs) -> SpillQueue:
+        return SpillQueue(self.test_directory, self.test_max_size,
+                          self.test_memory_size, **kwargs)
+
+    def _reopen_queue(self, **kwargs) -> None:
+        self.test_queue.close()
+        self.test_queue = self._create_queue(**kwargs)
+
+    def _segment_files(self):
+        return sorted(os.listdir(self.test_directory))
+
+    @staticmethod
+    def _create_envelope(index: int,
+                         routing_key: str = 'transformed_data.system') \
+            -> PublishingEnvelope:
+        return PublishingEnvelope(
+            'store', routing_key, '{{"index": {}}}'.format(index).encode(),
+            pika.BasicProperties(delivery_mode=2,
+                                 content_type='application/json'), True)
+
+    def _get_all(self):
+        envelopes = []
+        while not self.test_queue.empty():
+            envelopes.append(self.test_queue.get())
+            self.test_queue.task_done()
+        return envelopes
+
+    def test_envelopes_are_returned_in_order_and_memory_is_bounded(
+            self) -> None:
+        envelopes = [self._create_envelope(index) for index in range(5)]
+        for envelope in envelopes:
+            self.test_queue.put(envelope)
+
+        self.assertEqual(5, self.test_queue.qsize())
+        self.assertEqual(self.test_memory_size, len(self.test_queue.queue))
+        self.assertEqual(3, self.test_queue.spilled_size)
+        self.assertEqual(envelopes[0], self.test_queue.queue[0])
+        self.assertEqual(envelopes, self._get_all())
+
+    def test_full_respects_the_max_size_and_not_the_memory_size(self) -> None:
+        for index in range(self.test_max_size - 1):
+            self.test_queue.put(self._create_envelope(index))
+        self.assertFalse(self.test_queue.full())
+
+        self.test_queue.put(self._create_envelope(self.test_max_size))
+        self.assertTrue(self.test_queue.full())
+
+    def test_unsent_envelopes_are_loaded_in_order_after_a_restart(
+            self) -> None:
+        envelopes = [self._create_envelope(index) for index in range(5)]
+        for envelope in envelopes:
+            self.test_queue.put(envelope)
+        self.test_queue.get()
+        self.test_queue.task_done()
+
+        self._reopen_queue()
+
+        self.assertEqual(4, self.test_queue.qsize())
+        self.assertEqual(4, self.test_queue.unfinished_tasks)
+        self.assertEqual(envelopes[1:], self._get_all())
+        self.assertEqual(0, self.test_queue.unfinished_tasks)
+
+    def test_envelopes_put_after_a_restart_are_returned_after_loaded_ones(
+            self) -> None:
+        envelopes = [self._create_envelope(index) for index in range(4)]
+        self.test_queue.put(envelopes[0])
+        self.test_queue.put(envelopes[1])
+        self._reopen_queue()
+        self.test_queue.put(envelopes[2])
+        self.test_queue.put(envelopes[3])
+
+        self.assertEqual(envelopes, self._get_all())
+
+    def test_segments_are_deleted_once_all_envelopes_are_sent(self) -> None:
+        self._reopen_queue(segment_max_bytes=1)
+        for index in range(5):
+            self.test_queue.put(self._create_envelope(index))
+        segment_files = self._segment_files()
+        self.assertEqual(5, len(segment_files))
+
+        self.test_queue.get()
+        self.test_queue.get()
+        self.assertFalse(set(segment_files[:2]) & set(self._segment_files()))
+        self.assertTrue(set(segment_files[2:]) <= set(self._segment_files()))
+
+        self._get_all()
+        self.assertEqual([], self._segment_files())
+
+    def test_removed_envelopes_stay_removed_when_segments_are_deleted(
+            self) -> None:
+        # Every record starts a new segment, therefore the removal records are
+        # stored in newer segments than the envelopes they refer to.
+        self._reopen_queue(segment_max_bytes=1)
+        envelopes = [self._create_envelope(index) for index in range(4)]
+        for envelope in envelopes:
+            self.test_queue.put(envelope)
+        self.test_queue.get()
+        self.test_queue.get()
+
+        self._reopen_queue(segment_max_bytes=1)
+
+        self.assertEqual(envelopes[2:], self._get_all())
+
+    def test_retention_limits_discard_the_oldest_envelopes_of_a_routing_key(
+            self) -> None:
+        self._reopen_queue(retention_limits={self.test_routing_key_1: 2})
+        envelopes = [
+            self._create_envelope(0, self.test_routing_key_1),
+            self._create_envelope(1, self.test_routing_key_2),
+            self._create_envelope(2, self.test_routing_key_1),
+            self._create_envelope(3, self.test_routing_key_2),
+            self._create_envelope(4, self.test_routing_key_1),
+        ]
+        for envelope in envelopes:
+            self.test_queue.put(envelope)
+
+        self.assertEqual(4, self.test_queue.unfinished_tasks)
+        self.assertEqual(envelopes[1:], self._get_all())
+
+    def test_lowered_retention_limits_are_applied_when_loading(self) -> None:
+        envelopes = [self._create_envelope(index) for index in range(4)]
+        for envelope in envelopes:
+            self.test_queue.put(envelope)
+
+        self._reopen_queue(retention_limits={self.test_routing_key_1: 1})
+
+        self.assertEqual(1, self.test_queue.unfinished_tasks)
+        self.assertEqual(envelopes[3:], self._get_all())
+
+    def test_a_partially_written_record_is_discarded_when_loading(
+            self) -> None:
+        envelopes = [self._create_envelope(index) for index in range(2)]
+        for envelope in envelopes:
+            self.test_queue.put(envelope)
+        self.test_queue.close()
+        segment_path = os.path.join(self.test_directory,
+                                    self._segment_files()[-1])
+        with open(segment_path, 'ab') as segment_file:
+            segment_file.write(b'A\x00\x00')
+
+        self._reopen_queue()
+        self.test_queue.put(self._create_envelope(2))
+
+        self.assertEqual(envelopes + [self._create_envelope(2)],
+                         self._get_all())
+
+    def test_envelopes_are_kept_in_memory_if_segments_cannot_be_written(
+            self) -> None:
+        envelopes = [self._create_envelope(index) for index in range(2)]
+        with mock.patch.object(SpillQueue, '_append',
+                               side_effect=OSError('No space left')):
+            for envelope in envelopes:
+                self.test_queue.put(envelope)
+
+        self.assertEqual(0, self.test_queue.spilled_size)
+        self.assertEqual(envelopes, self._get_all())
+        self.assertEqual(0, self.test_queue.unfinished_tasks)
+
+    def test_the_oldest_envelope_is_discarded_if_writing_fails_and_memory_full(
+            self) -> None:
+        envelopes = [self._create_envelope(index) for index in range(4)]
+        for envelope in envelopes[:3]:
+            self.test_queue.put(envelope)
+        with mock.patch.object(SpillQueue, '_append',
+                               side_effect=OSError('No space left')):
+            self.test_queue.put(envelopes[3])
+
+            self.assertEqual(3, self.test_queue.qsize())
+            self.assertEqual(3, self.test_queue.unfinished_tasks)
+            self.assertEqual([envelopes[1], envelopes[3], envelopes[2]],
+                             self._get_all())
+
+    def test_a_segment_is_written_again_once_the_disk_recovers(
+            self) -> None:
+        with mock.patch.object(SpillQueue, '_append',
+                               side_effect=OSError('No space left')):
+            self.test_queue.put(self._create_envelope(0))
+        self.test_queue.put(self._create_envelope(1))
+
+        self._reopen_queue()
+
+        self.assertEqual([self._create_envelope(1)], self._get_all())
+
+    def test_parse_retention_limits_parses_routing_key_limit_pairs(
+            self) -> None:
+        self.assertEqual({}, parse_retention_limits(''))
+        self.assertEqual(
+            {'transformed_data.system': 500, 'alert.system': 100},
+            parse_retention_limits(
+                'transformed_data.system=500, alert.system=100'))
+        self.assertRaises(ValueError, parse_retention_limits, 'alert.system')
+
+    def test_create_publishing_queue_spills_only_if_configured(self) -> None:
+        with mock.patch('src.message_broker.rabbitmq.spill_queue.env') \
+                as mock_env:
+            mock_env.PUBLISHING_SPILL_DIRECTORY = ''
+            self.assertIs(LaneQueue,
+                          type(create_publishing_queue(5, 'alerter')))
+
+            mock_env.PUBLISHING_SPILL_DIRECTORY = self.test_directory
+            mock_env.PUBLISHING_SPILL_MAX_SIZE = 100
+            mock_env.PUBLISHING_SPILL_RETENTION_LIMITS = 'alert.system=10'
+            self.assertIs(LaneQueue, type(create_publishing_queue(5, None)))
+            queue = create_publishing_queue(5, 'System alerter (chain 1)')
+
+        self.assertIsInstance(queue, SpillQueue)
+        self.assertEqual(100, queue.maxsize)
+        self.assertEqual(5, queue.memory_size)
+        self.assertEqual({'alert.system': 10}, queue.retention_limits)
+        self.assertEqual(
+            os.path.join(self.test_directory, 'System_alerter_chain_1_'),
+            queue.directory)
+        queue.close()
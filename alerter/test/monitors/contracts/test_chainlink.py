@@ -253,6 +253,32 @@ class TestChainlinkContractsMonitor(unittest.TestCase):
         self.assertEqual(self.test_data_dict,
                          self.test_monitor.last_round_observed)
 
+    def test_get_progress_returns_last_blocks_and_rounds(self) -> None:
+        self.assertEqual({}, self.test_monitor._get_progress())
+
+        self.test_monitor._last_block_monitored = {
+            self.node_id_1: {'proxy_1': 100}}
+        self.test_monitor._last_round_observed = {
+            self.node_id_1: {'proxy_1': 5}}
+        self.assertEqual({
+            'b': {self.node_id_1: {'proxy_1': 100}},
+            'r': {self.node_id_1: {'proxy_1': 5}}
+        }, self.test_monitor._get_progress())
+
+    def test_set_progress_restores_progress_of_monitored_nodes_only(
+            self) -> None:
+        self.test_monitor._set_progress({
+            'b': {self.node_id_1: {'proxy_1': 100},
+                  'removed_node_id': {'proxy_1': 100}},
+            'r': {self.node_id_1: {'proxy_1': None},
+                  'removed_node_id': {'proxy_1': 5}}
+        })
+
+        self.assertEqual({self.node_id_1: {'proxy_1': 100}},
+                         self.test_monitor.last_block_monitored)
+        self.assertEqual({self.node_id_1: {'proxy_1': None}},
+                         self.test_monitor.last_round_observed)
+
     def test_wei_watchers_retrieval_limiter_returns_weiwatchers_limiter(
             self) -> None:
         self.test_monitor._wei_watchers_retrieval_limiter = self.test_data_dict
@@ -52,6 +52,7 @@ class TestDockerHubMonitorsManager(unittest.TestCase):
         self.dummy_process2.daemon = True
         self.dummy_process3 = Process(target=infinite_fn, args=())
         self.dummy_process3.daemon = True
+        self.control_queue = multiprocessing.Queue()
         self.config_process_dict_example = {
             'config_id1': {
                 'component_name':
@@ -161,6 +162,7 @@ class TestDockerHubMonitorsManager(unittest.TestCase):
         self.dummy_process1 = None
         self.dummy_process2 = None
         self.dummy_process3 = None
+        self.control_queue = None
 
     def test_str_returns_manager_name(self) -> None:
         self.assertEqual(self.manager_name, str(self.test_manager))
@@ -297,12 +299,14 @@ class TestDockerHubMonitorsManager(unittest.TestCase):
             self.test_queue_name)
         self.assertEqual(self.test_heartbeat, json.loads(body))
 
+    @mock.patch.object(DockerHubMonitorsManager, "_create_control_queue")
     @mock.patch.object(multiprocessing.Process, "start")
     @mock.patch.object(multiprocessing, 'Process')
     def test_create_and_start_monitor_process_stores_the_correct_process_info(
-            self, mock_init, mock_start) -> None:
+            self, mock_init, mock_start, mock_create_control_queue) -> None:
         mock_start.return_value = None
         mock_init.return_value = self.dummy_process3
+        mock_create_control_queue.return_value = self.control_queue
         self.test_manager._config_process_dict = \
             self.config_process_dict_example
         expected_output = {
@@ -339,6 +343,7 @@ class TestDockerHubMonitorsManager(unittest.TestCase):
         new_entry['chain'] = self.chain_example_new
         new_entry['parent_id'] = self.parent_id_new
         new_entry['process'] = self.dummy_process3
+        new_entry['control_queue'] = self.control_queue
 
         self.test_manager._create_and_start_monitor_process(
             self.repo_config_example, self.repo_id_new, self.chain_example_new,
@@ -360,6 +365,8 @@ class TestDockerHubMonitorsManager(unittest.TestCase):
         self.assertTrue(new_entry_process.daemon)
         self.assertEqual(1, len(new_entry_process._args))
         self.assertEqual(self.repo_config_example, new_entry_process._args[0])
+        self.assertEqual({'control_queue': new_entry['control_queue']},
+                         new_entry_process._kwargs)
         self.assertEqual(start_dockerhub_monitor, new_entry_process._target)
         mock_start.assert_called_once()
 
@@ -338,6 +338,8 @@ class TestGitHubMonitorsManager(unittest.TestCase):
         self.assertTrue(new_entry_process.daemon)
         self.assertEqual(1, len(new_entry_process._args))
         self.assertEqual(self.repo_config_example, new_entry_process._args[0])
+        self.assertEqual({'control_queue': new_entry['control_queue']},
+                         new_entry_process._kwargs)
         self.assertEqual(start_github_monitor, new_entry_process._target)
 
     @mock.patch("src.monitors.starters.create_logger")
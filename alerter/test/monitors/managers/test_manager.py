@@ -1,4 +1,5 @@
 import logging
+import queue
 import unittest
 from abc import ABC
 from datetime import timedelta, datetime
@@ -17,10 +18,11 @@ from src.monitors.managers.manager import MonitorsManager
 from src.monitors.node.chainlink import ChainlinkNodeMonitor
 from src.monitors.node.evm import EVMNodeMonitor
 from src.utils import env
+from src.utils.backpressure import PressureLevel
 from src.utils.constants.monitorables import MonitorableType
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY,
-    MONITORABLE_EXCHANGE)
+    MONITORABLE_EXCHANGE, PIPELINE_INPUT_QUEUES, SYSTEM_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import PANICException
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
@@ -666,3 +668,38 @@ class TestMonitorsManager(unittest.TestCase):
 
         mock_push.assert_has_calls(calls)
         self.assertEqual(2, mock_send_data.call_count)
+
+    @mock.patch.object(MonitorManagerInstance, "_get_monitor_pipeline")
+    @mock.patch.object(RabbitMQApi, "queue_depth")
+    def test_propagate_backpressure_sends_level_changes_to_monitors(
+            self, mock_queue_depth, mock_get_pipeline) -> None:
+        mock_get_pipeline.return_value = SYSTEM_RAW_DATA_ROUTING_KEY
+        control_queue_1 = queue.Queue()
+        control_queue_2 = queue.Queue()
+        self.test_manager._config_process_dict = {
+            'config_id_1': {'control_queue': control_queue_1},
+            'config_id_2': {'control_queue': control_queue_2},
+            'config_id_3': {},
+        }
+
+        # No level is sent while there is no backpressure. The queues of the
+        # pipeline are checked once for all of its monitors.
+        mock_queue_depth.return_value = 0
+        self.test_manager._propagate_backpressure()
+        self.assertTrue(control_queue_1.empty())
+        self.assertTrue(control_queue_2.empty())
+        self.assertEqual(len(PIPELINE_INPUT_QUEUES[
+                                 SYSTEM_RAW_DATA_ROUTING_KEY]),
+                         mock_queue_depth.call_count)
+
+        # Queues which do not exist are ignored, and the new level is only
+        # sent once
+        mock_queue_depth.side_effect = [
+            None, env.BACKPRESSURE_HIGH_QUEUE_DEPTH, 0, None,
+            env.BACKPRESSURE_HIGH_QUEUE_DEPTH, 0]
+        self.test_manager._propagate_backpressure()
+        self.test_manager._propagate_backpressure()
+        for control_queue in [control_queue_1, control_queue_2]:
+            self.assertEqual({'pressure_level': PressureLevel.HIGH},
+                             control_queue.get_nowait())
+            self.assertTrue(control_queue.empty())
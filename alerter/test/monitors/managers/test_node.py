@@ -2,6 +2,7 @@ import copy
 import json
 import logging
 import multiprocessing
+import queue
 import unittest
 from datetime import timedelta, datetime
 from multiprocessing import Process
@@ -775,17 +776,21 @@ class TestNodeMonitorsManager(unittest.TestCase):
         _, _, body = self.test_manager.rabbitmq.basic_get(self.test_queue_name)
         self.assertEqual(self.test_heartbeat, json.loads(body))
 
+    @mock.patch.object(NodeMonitorsManager, "_create_control_queue")
     @mock.patch.object(multiprocessing.Process, "start")
     @mock.patch.object(multiprocessing, 'Process')
     def test_create_and_start_monitor_process_stores_the_correct_process_info(
-            self, mock_init, mock_start) -> None:
+            self, mock_init, mock_start, mock_create_control_queue) -> None:
         mock_start.return_value = None
         mock_init.return_value = self.dummy_process1
+        control_queue = queue.Queue()
+        mock_create_control_queue.return_value = control_queue
         expected_output = {
             self.node_config_1.node_id: {
                 'component_name': NODE_MONITOR_NAME_TEMPLATE.format(
                     self.node_config_1.node_name),
                 'process': self.dummy_process1,
+                'control_queue': control_queue,
                 'monitor_type': ChainlinkNodeMonitor,
                 'node_config': self.node_config_1,
                 'base_chain': '',
@@ -818,9 +823,120 @@ class TestNodeMonitorsManager(unittest.TestCase):
         self.assertEqual(ChainlinkNodeMonitor, new_entry_process._args[1])
         self.assertEqual('extra_arg1', new_entry_process._args[2])
         self.assertEqual('extra_arg2', new_entry_process._args[3])
+        self.assertEqual({'control_queue': new_entry['control_queue']},
+                         new_entry_process._kwargs)
         self.assertEqual(start_node_monitor, new_entry_process._target)
         mock_start.assert_called_once()
 
+    def _set_running_monitor_process(self, monitor_type, is_alive) -> None:
+        # Stores the details of a running monitor of node 1, whose process
+        # liveness is determined by is_alive
+        mock_process = mock.MagicMock()
+        mock_process.is_alive.return_value = is_alive
+        self.test_manager._config_process_dict = {
+            self.node_config_1.node_id: {
+                'component_name': NODE_MONITOR_NAME_TEMPLATE.format(
+                    self.node_config_1.node_name),
+                'process': mock_process,
+                'control_queue': queue.Queue(),
+                'monitor_type': monitor_type,
+                'node_config': self.node_config_2,
+                'base_chain': 'chainlink',
+                'sub_chain': 'ethereum',
+                'source_name': self.node_config_1.node_name,
+                'parent_id': 'old_parent_id',
+                'args': ('old_arg',)
+            },
+        }
+
+    @mock.patch.object(NodeMonitorsManager, "_create_and_start_monitor_process")
+    def test_reconfigure_or_restart_sends_config_to_running_monitor(
+            self, mock_create_and_start) -> None:
+        self._set_running_monitor_process(ChainlinkNodeMonitor, True)
+        process_details = self.test_manager.config_process_dict[
+            self.node_config_1.node_id]
+
+        self.test_manager._reconfigure_or_restart_monitor_process(
+            self.node_config_1, self.node_config_1.node_id,
+            ChainlinkNodeMonitor, 'chainlink', 'ethereum', 'new_arg')
+
+        self.assertEqual(
+            {'config': self.node_config_1, 'args': ('new_arg',)},
+            process_details['control_queue'].get_nowait())
+        self.assertEqual(self.node_config_1, process_details['node_config'])
+        self.assertEqual(self.node_config_1.parent_id,
+                         process_details['parent_id'])
+        self.assertEqual(('new_arg',), process_details['args'])
+        process_details['process'].terminate.assert_not_called()
+        mock_create_and_start.assert_not_called()
+
+    @parameterized.expand([
+        (ChainlinkNodeMonitor, False, 'node_name_1',),
+        (EVMNodeMonitor, True, 'node_name_1',),
+        (ChainlinkNodeMonitor, True, 'changed_node_name',),
+    ])
+    @mock.patch.object(NodeMonitorsManager, "_create_and_start_monitor_process")
+    def test_reconfigure_or_restart_restarts_monitor_if_cannot_reconfigure(
+            self, stored_monitor_type, is_alive, component_node_name,
+            mock_create_and_start) -> None:
+        # The monitor must be restarted if it is dead, if the monitor type
+        # changed, or if the monitor's name changed.
+        self._set_running_monitor_process(stored_monitor_type, is_alive)
+        process_details = self.test_manager.config_process_dict[
+            self.node_config_1.node_id]
+        process_details['component_name'] = NODE_MONITOR_NAME_TEMPLATE.format(
+            component_node_name)
+        self.node_config_1.set_node_name('node_name_1')
+
+        self.test_manager._reconfigure_or_restart_monitor_process(
+            self.node_config_1, self.node_config_1.node_id,
+            ChainlinkNodeMonitor, 'chainlink', 'ethereum', 'new_arg')
+
+        self.assertTrue(process_details['control_queue'].empty())
+        process_details['process'].terminate.assert_called_once()
+        process_details['process'].join.assert_called_once()
+        mock_create_and_start.assert_called_once_with(
+            self.node_config_1, self.node_config_1.node_id,
+            ChainlinkNodeMonitor, 'chainlink', 'ethereum', 'new_arg')
+
+    @mock.patch.object(NodeMonitorsManager, "_create_and_start_monitor_process")
+    def test_reconfigure_or_restart_restarts_monitor_if_config_is_invalid(
+            self, mock_create_and_start) -> None:
+        # The monitor would reject a config whose enabled sources are empty,
+        # therefore it is restarted instead.
+        self._set_running_monitor_process(ChainlinkNodeMonitor, True)
+        process_details = self.test_manager.config_process_dict[
+            self.node_config_1.node_id]
+        self.node_config_1.set_monitor_prometheus(True)
+        self.node_config_1.set_node_prometheus_urls([])
+
+        self.test_manager._reconfigure_or_restart_monitor_process(
+            self.node_config_1, self.node_config_1.node_id,
+            ChainlinkNodeMonitor, 'chainlink', 'ethereum', 'new_arg')
+
+        self.assertTrue(process_details['control_queue'].empty())
+        process_details['process'].terminate.assert_called_once()
+        mock_create_and_start.assert_called_once_with(
+            self.node_config_1, self.node_config_1.node_id,
+            ChainlinkNodeMonitor, 'chainlink', 'ethereum', 'new_arg')
+
+    @mock.patch.object(NodeMonitorsManager, "_create_and_start_monitor_process")
+    def test_reconfigure_or_restart_restarts_monitor_if_it_is_not_supported(
+            self, mock_create_and_start) -> None:
+        self._set_running_monitor_process(ChainlinkNodeMonitor, True)
+        process_details = self.test_manager.config_process_dict[
+            self.node_config_1.node_id]
+
+        with mock.patch.object(ChainlinkNodeMonitor,
+                               'supports_reconfiguration', False):
+            self.test_manager._reconfigure_or_restart_monitor_process(
+                self.node_config_1, self.node_config_1.node_id,
+                ChainlinkNodeMonitor, 'chainlink', 'ethereum', 'new_arg')
+
+        self.assertTrue(process_details['control_queue'].empty())
+        process_details['process'].terminate.assert_called_once()
+        mock_create_and_start.assert_called_once()
+
     @parameterized.expand([
         ("self.node_config_6", "self.sent_configs_example_cosmos",
          ["self.node_config_7", "self.node_config_6"]),
@@ -1106,6 +1222,8 @@ class TestNodeMonitorsManager(unittest.TestCase):
                 'component_name': NODE_MONITOR_NAME_TEMPLATE.format(
                     modified_node_7_config.node_name),
                 'process': self.dummy_process7,
+                'control_queue': self.test_manager.config_process_dict[
+                    modified_node_7_config.node_id]['control_queue'],
                 'monitor_type': CosmosNodeMonitor,
                 'node_config': modified_node_7_config,
                 'base_chain': '',
@@ -1118,6 +1236,8 @@ class TestNodeMonitorsManager(unittest.TestCase):
                 'component_name': NODE_MONITOR_NAME_TEMPLATE.format(
                     self.node_config_8.node_name),
                 'process': self.dummy_process8,
+                'control_queue': self.test_manager.config_process_dict[
+                    self.node_config_8.node_id]['control_queue'],
                 'monitor_type': CosmosNodeMonitor,
                 'node_config': self.node_config_8,
                 'base_chain': '',
@@ -1511,6 +1631,8 @@ class TestNodeMonitorsManager(unittest.TestCase):
                 'component_name': NODE_MONITOR_NAME_TEMPLATE.format(
                     modified_node_10_config),
                 'process': self.dummy_process10,
+                'control_queue': self.test_manager.config_process_dict[
+                    modified_node_10_config.node_id]['control_queue'],
                 'monitor_type': SubstrateNodeMonitor,
                 'node_config': modified_node_10_config,
                 'base_chain': '',
@@ -1523,6 +1645,8 @@ class TestNodeMonitorsManager(unittest.TestCase):
                 'component_name': NODE_MONITOR_NAME_TEMPLATE.format(
                     self.node_config_11.node_name),
                 'process': self.dummy_process11,
+                'control_queue': self.test_manager.config_process_dict[
+                    self.node_config_11.node_id]['control_queue'],
                 'monitor_type': SubstrateNodeMonitor,
                 'node_config': self.node_config_11,
                 'base_chain': '',
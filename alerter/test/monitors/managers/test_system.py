@@ -2,6 +2,7 @@ import copy
 import json
 import logging
 import multiprocessing
+import queue
 import unittest
 from datetime import timedelta, datetime
 from multiprocessing import Process
@@ -420,8 +421,55 @@ class TestSystemMonitorsManager(unittest.TestCase):
         self.assertTrue(new_entry_process.daemon)
         self.assertEqual(1, len(new_entry_process._args))
         self.assertEqual(self.system_config_3, new_entry_process._args[0])
+        self.assertEqual({'control_queue': new_entry['control_queue']},
+                         new_entry_process._kwargs)
         self.assertEqual(start_system_monitor, new_entry_process._target)
 
+    @parameterized.expand([
+        (True, True,),
+        (False, False,),
+    ])
+    @mock.patch.object(SystemMonitorsManager,
+                       "_create_and_start_monitor_process")
+    def test_reconfigure_or_restart_reconfigures_only_running_monitors(
+            self, is_alive, reconfigured_in_place,
+            mock_create_and_start) -> None:
+        mock_process = mock.MagicMock()
+        mock_process.is_alive.return_value = is_alive
+        control_queue = queue.Queue()
+        self.test_manager._config_process_dict = {
+            self.system_id_3: {
+                'component_name': SYSTEM_MONITOR_NAME_TEMPLATE.format(
+                    self.system_name_3),
+                'process': mock_process,
+                'control_queue': control_queue,
+                'chain': self.chain_3,
+                'parent_id': 'old_parent_id',
+                'source_name': self.system_name_3,
+                'base_chain': self.base_chain_3,
+                'sub_chain': self.sub_chain_3,
+            }
+        }
+
+        self.test_manager._reconfigure_or_restart_monitor_process(
+            self.system_config_3, self.system_id_3, self.chain_3,
+            self.base_chain_3, self.sub_chain_3)
+
+        if reconfigured_in_place:
+            self.assertEqual({'config': self.system_config_3, 'args': ()},
+                             control_queue.get_nowait())
+            self.assertEqual(self.parent_id_3,
+                             self.test_manager.config_process_dict[
+                                 self.system_id_3]['parent_id'])
+            mock_process.terminate.assert_not_called()
+            mock_create_and_start.assert_not_called()
+        else:
+            self.assertTrue(control_queue.empty())
+            mock_process.terminate.assert_called_once()
+            mock_create_and_start.assert_called_once_with(
+                self.system_config_3, self.system_id_3, self.chain_3,
+                self.base_chain_3, self.sub_chain_3)
+
     @mock.patch.object(multiprocessing.Process, "start")
     def test_create_and_start_monitor_process_starts_the_process(
             self, mock_start) -> None:
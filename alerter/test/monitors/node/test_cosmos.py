@@ -17,6 +17,7 @@ from urllib3.exceptions import ProtocolError
 
 from src.api_wrappers.cosmos import (CosmosRestServerApiWrapper,
                                      CometbftRpcApiWrapper)
+from src.data_store.redis import Keys
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.node.cosmos import CosmosNodeMonitor
 from src.utils import env
@@ -328,6 +329,96 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.assertEqual(500,
                          self.test_monitor.last_height_monitored_cometbft)
 
+    def test_get_progress_returns_empty_dict_if_nothing_monitored_yet(
+            self) -> None:
+        self.assertEqual({}, self.test_monitor._get_progress())
+
+    def test_get_progress_returns_last_height_monitored_cometbft(
+            self) -> None:
+        self.test_monitor._last_height_monitored_cometbft = 500
+        self.assertEqual({'h': 500}, self.test_monitor._get_progress())
+
+    def test_set_progress_restores_last_height_if_not_set(self) -> None:
+        self.test_monitor._set_progress({'h': 500})
+        self.assertEqual(500,
+                         self.test_monitor.last_height_monitored_cometbft)
+
+    def test_set_progress_does_not_overwrite_progress_in_memory(self) -> None:
+        self.test_monitor._last_height_monitored_cometbft = 600
+        self.test_monitor._set_progress({'h': 500})
+        self.assertEqual(600,
+                         self.test_monitor.last_height_monitored_cometbft)
+
+    def test_reconfigure_updates_config_and_data_sources_and_keeps_state(
+            self) -> None:
+        self.test_monitor._last_height_monitored_cometbft = 600
+        new_data_sources = [self.data_sources[0], self.data_sources[2]]
+
+        self.test_monitor.reconfigure(self.data_sources[2], new_data_sources)
+
+        self.assertEqual(self.data_sources[2], self.test_monitor.node_config)
+        self.assertEqual(new_data_sources, self.test_monitor.data_sources)
+        self.assertEqual([self.data_sources[2]],
+                         self.test_monitor.archive_nodes)
+        self.assertEqual(600,
+                         self.test_monitor.last_height_monitored_cometbft)
+
+    def test_load_progress_restores_progress_stored_in_redis(self) -> None:
+        mock_redis = mock.MagicMock()
+        mock_redis.get.return_value = b'{"h":500}'
+        self.test_monitor._redis = mock_redis
+
+        self.test_monitor._load_progress()
+
+        mock_redis.get.assert_called_once_with(
+            Keys.get_monitor_progress(self.data_sources[2].node_id))
+        self.assertEqual(500,
+                         self.test_monitor.last_height_monitored_cometbft)
+
+    def test_progress_is_kept_for_node_if_monitor_is_renamed(self) -> None:
+        mock_redis = mock.MagicMock()
+        self.test_monitor._redis = mock_redis
+        self.test_monitor._last_height_monitored_cometbft = 500
+        self.test_monitor._save_progress()
+        renamed_monitor = CosmosNodeMonitor(
+            'renamed_monitor', self.data_sources[2], self.dummy_logger,
+            self.monitoring_period, self.rabbitmq, self.data_sources)
+        renamed_monitor._redis = mock_redis
+        mock_redis.get.return_value = mock_redis.set.call_args[0][1].encode(
+            'utf-8')
+
+        renamed_monitor._load_progress()
+
+        self.assertEqual(mock_redis.set.call_args[0][0],
+                         mock_redis.get.call_args[0][0])
+        self.assertEqual(500, renamed_monitor.last_height_monitored_cometbft)
+
+    def test_load_progress_ignores_corrupted_progress(self) -> None:
+        mock_redis = mock.MagicMock()
+        mock_redis.get.return_value = b'not json'
+        self.test_monitor._redis = mock_redis
+
+        self.test_monitor._load_progress()
+
+        self.assertIsNone(self.test_monitor.last_height_monitored_cometbft)
+
+    def test_save_progress_stores_progress_only_if_changed(self) -> None:
+        mock_redis = mock.MagicMock()
+        self.test_monitor._redis = mock_redis
+        self.test_monitor._last_height_monitored_cometbft = 500
+
+        self.test_monitor._save_progress()
+        self.test_monitor._save_progress()
+        self.test_monitor._last_height_monitored_cometbft = 501
+        self.test_monitor._save_progress()
+
+        progress_key = Keys.get_monitor_progress(
+            self.data_sources[2].node_id)
+        self.assertEqual([
+            mock.call(progress_key, '{"h":500}'),
+            mock.call(progress_key, '{"h":501}')
+        ], mock_redis.set.call_args_list)
+
     def test_validator_consensus_address_returns_validator_consensus_address(
             self) -> None:
         # Test that on init, validator_consensus_address is None
@@ -1814,6 +1905,40 @@ class TestCosmosNodeMonitor(unittest.TestCase):
             self.test_data_dict)
         self.assertEqual(expected_ret, actual_ret)
 
+    @parameterized.expand([
+        (True, True, False, False,),
+        (True, False, False, True,),
+        (False, False, True, True,),
+        (True, True, True, True,),
+    ])
+    def test_process_retrieved_cometbft_rpc_data_requests_closer_watch_if_validator_misses_blocks_or_is_slashed(
+            self, active, signed, slashed, expected_closer_watch) -> None:
+        data = {
+            'historical': [{
+                'height': 50,
+                'active_in_prev_block': active,
+                'signed_prev_block': signed,
+                'slashed': slashed,
+                'slashed_amount': None,
+            }],
+            'is_syncing': self.test_is_syncing,
+        }
+        self.test_monitor._closer_watch_requested = False
+
+        self.test_monitor._process_retrieved_cometbft_rpc_data(data)
+
+        self.assertEqual(expected_closer_watch,
+                         self.test_monitor._closer_watch_requested)
+
+    def test_process_retrieved_cometbft_rpc_data_does_not_request_closer_watch_without_historical_data(
+            self) -> None:
+        self.test_monitor._closer_watch_requested = False
+
+        self.test_monitor._process_retrieved_cometbft_rpc_data(
+            {'historical': None, 'is_syncing': self.test_is_syncing})
+
+        self.assertFalse(self.test_monitor._closer_watch_requested)
+
     @freeze_time("2012-01-01")
     def test_process_retrieved_cometbft_rpc_data_returns_expected_data_when_node_is_mev(
             self) -> None:
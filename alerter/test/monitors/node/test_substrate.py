@@ -239,6 +239,20 @@ class TestSubstrateNodeMonitor(unittest.TestCase):
         self.test_monitor._last_height_monitored_websocket = 500
         self.assertEqual(500, self.test_monitor.last_height_monitored_websocket)
 
+    def test_get_progress_returns_last_height_monitored_websocket(
+            self) -> None:
+        self.assertEqual({}, self.test_monitor._get_progress())
+
+        self.test_monitor._last_height_monitored_websocket = 500
+        self.assertEqual({'h': 500}, self.test_monitor._get_progress())
+
+    def test_set_progress_restores_last_height_only_if_not_set(self) -> None:
+        self.test_monitor._set_progress({'h': 500})
+        self.assertEqual(500, self.test_monitor.last_height_monitored_websocket)
+
+        self.test_monitor._set_progress({'h': 400})
+        self.assertEqual(500, self.test_monitor.last_height_monitored_websocket)
+
     @mock.patch.object(SubstrateApiWrapper, 'get_finalized_head')
     @mock.patch.object(SubstrateApiWrapper, 'get_sync_state')
     @mock.patch.object(SubstrateApiWrapper, 'get_header')
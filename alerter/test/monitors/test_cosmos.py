@@ -20,6 +20,8 @@ from src.configs.nodes.cosmos import CosmosNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.cosmos import CosmosMonitor
 from src.utils import env
+from src.utils.constants.cosmos import (
+    COSMOS_REST_MAX_PAGE_LIMIT, COMETBFT_MAX_PER_PAGE)
 from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
@@ -665,10 +667,17 @@ class TestCosmosMonitor(unittest.TestCase):
         node_name = self.data_sources[0].node_name
         test_args = ['arg_1', 'arg_2']
         test_params = {'param_1': 'param_1_val', 'param_2': 'param_2_val'}
-        test_args_first = ['arg_1', 'arg_2', test_params]
+        test_args_first = [
+            'arg_1', 'arg_2', {
+                **test_params,
+                'pagination.limit': COSMOS_REST_MAX_PAGE_LIMIT,
+                'pagination.count_total': 'true'
+            }
+        ]
         test_args_second = [
             'arg_1', 'arg_2', {
                 **test_params,
+                'pagination.limit': COSMOS_REST_MAX_PAGE_LIMIT,
                 'pagination.key': "ASDFG9a7gfas79fg90as"
             }
         ]
@@ -682,6 +691,69 @@ class TestCosmosMonitor(unittest.TestCase):
             call(test_fn, test_args_second, node_name, self.sdk_version_0_42_6),
         ])
 
+    @mock.patch.object(CosmosRestServerApiWrapper, 'execute_with_checks')
+    def test_get_rest_data_with_pagination_keys_uses_offsets_if_total_known(
+            self, mock_execute) -> None:
+        """
+        In this test we will be checking that if the first page returns the
+        total number of entries, the remaining pages are retrieved using
+        offsets based on the page size returned by the server.
+        """
+
+        def test_fn():
+            return self.test_data_dict
+
+        first_page = {
+            'validators': ['val_1', 'val_2'],
+            'pagination': {'next_key': 'key_1', 'total': '5'}
+        }
+        second_page = {
+            'validators': ['val_3', 'val_4'],
+            'pagination': {'next_key': 'key_2', 'total': '0'}
+        }
+        third_page = {
+            'validators': ['val_5'],
+            'pagination': {'next_key': None, 'total': '0'}
+        }
+        mock_execute.side_effect = [first_page, second_page, third_page]
+        node_name = self.data_sources[0].node_name
+        actual_ret = self.test_monitor._get_rest_data_with_pagination_keys(
+            test_fn, ['arg_1'], {}, node_name, self.sdk_version_0_42_6)
+
+        self.assertEqual([first_page, second_page, third_page], actual_ret)
+        self.assertEqual(3, len(mock_execute.call_args_list))
+        mock_execute.assert_has_calls([
+            call(test_fn, ['arg_1', {
+                'pagination.limit': COSMOS_REST_MAX_PAGE_LIMIT,
+                'pagination.count_total': 'true'
+            }], node_name, self.sdk_version_0_42_6),
+            call(test_fn, ['arg_1', {
+                'pagination.limit': 2, 'pagination.offset': 2
+            }], node_name, self.sdk_version_0_42_6),
+            call(test_fn, ['arg_1', {
+                'pagination.limit': 2, 'pagination.offset': 4
+            }], node_name, self.sdk_version_0_42_6),
+        ], any_order=True)
+
+    @mock.patch.object(CosmosRestServerApiWrapper, 'execute_with_checks')
+    def test_get_rest_data_with_pagination_keys_single_call_if_one_page(
+            self, mock_execute) -> None:
+        """
+        In this test we will be checking that if the first page has no next
+        key, no other API calls are performed
+        """
+
+        def test_fn():
+            return self.test_data_dict
+
+        mock_execute.return_value = self.rest_ret_2
+        node_name = self.data_sources[0].node_name
+        actual_ret = self.test_monitor._get_rest_data_with_pagination_keys(
+            test_fn, [], {}, node_name, self.sdk_version_0_42_6)
+
+        self.assertEqual([self.rest_ret_2], actual_ret)
+        mock_execute.assert_called_once()
+
     @mock.patch.object(CometbftRpcApiWrapper, 'execute_with_checks')
     def test_get_cometbft_data_with_count_returns_correctly(
             self, mock_execute) -> None:
@@ -719,8 +791,10 @@ class TestCosmosMonitor(unittest.TestCase):
         node_name = self.data_sources[0].node_name
         test_args = ['arg_1', 'arg_2']
         test_params = {'param_1': 'param_1_val', 'param_2': 'param_2_val'}
-        test_args_first = ['arg_1', 'arg_2', {**test_params, 'page': 1}]
-        test_args_second = ['arg_1', 'arg_2', {**test_params, 'page': 2}]
+        test_args_first = ['arg_1', 'arg_2', {
+            **test_params, 'page': 1, 'per_page': COMETBFT_MAX_PER_PAGE}]
+        test_args_second = ['arg_1', 'arg_2', {
+            **test_params, 'page': 2, 'per_page': COMETBFT_MAX_PER_PAGE}]
         self.test_monitor._get_cometbft_data_with_count(
             test_fn, test_args, test_params, node_name)
 
@@ -731,6 +805,55 @@ class TestCosmosMonitor(unittest.TestCase):
             call(test_fn, test_args_second, node_name),
         ])
 
+    @mock.patch.object(CometbftRpcApiWrapper, 'execute_with_checks')
+    def test_get_cometbft_data_with_count_uses_page_size_returned_by_node(
+            self, mock_execute) -> None:
+        """
+        In this test we will be checking that if the node caps per_page, the
+        number of pages is derived from the count returned in the first page
+        """
+
+        def test_fn():
+            return self.test_data_dict
+
+        pages = [
+            {'result': {'data': 'val_{}'.format(page), 'count': 30,
+                        'total': 75}}
+            for page in range(1, 4)
+        ]
+        mock_execute.side_effect = pages
+        node_name = self.data_sources[0].node_name
+        actual_ret = self.test_monitor._get_cometbft_data_with_count(
+            test_fn, [], {}, node_name)
+
+        self.assertEqual(3, len(actual_ret))
+        self.assertEqual(3, len(mock_execute.call_args_list))
+        mock_execute.assert_has_calls([
+            call(test_fn, [{'page': page, 'per_page': COMETBFT_MAX_PER_PAGE}],
+                 node_name)
+            for page in range(1, 4)
+        ], any_order=True)
+
+    @mock.patch.object(CometbftRpcApiWrapper, 'execute_with_checks')
+    def test_get_cometbft_data_with_count_single_call_if_one_page(
+            self, mock_execute) -> None:
+        """
+        In this test we will be checking that if all entries fit in the first
+        page, no other API calls are performed
+        """
+
+        def test_fn():
+            return self.test_data_dict
+
+        single_page = {'result': {'data': 'val_1', 'count': 60, 'total': 60}}
+        mock_execute.return_value = single_page
+        node_name = self.data_sources[0].node_name
+        actual_ret = self.test_monitor._get_cometbft_data_with_count(
+            test_fn, [], {}, node_name)
+
+        self.assertEqual([single_page], actual_ret)
+        mock_execute.assert_called_once()
+
     def test_display_data_returns_the_correct_string(self) -> None:
         expected_output = json.dumps(self.test_data_dict)
         actual_output = self.test_monitor._display_data(self.test_data_dict)
@@ -9,6 +9,7 @@ from src.configs.nodes.chainlink import ChainlinkNodeConfig
 from src.configs.nodes.evm import EVMNodeConfig
 from src.configs.repo import GitHubRepoConfig, DockerHubRepoConfig
 from src.configs.system import SystemConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.contracts.chainlink import ChainlinkContractsMonitor
 from src.monitors.dockerhub import DockerHubMonitor
@@ -48,6 +49,9 @@ class TestMonitorStarters(unittest.TestCase):
         self.rabbitmq = RabbitMQApi(
             self.dummy_logger, self.rabbit_ip,
             connection_check_time_interval=self.connection_check_time_interval)
+        self.redis = RedisApi(
+            self.dummy_logger, env.REDIS_DB, env.REDIS_IP, env.REDIS_PORT, '',
+            env.UNIQUE_ALERTER_IDENTIFIER)
 
         # Github monitor
         self.github_monitor_name = 'test_github_monitor'
@@ -128,7 +132,8 @@ class TestMonitorStarters(unittest.TestCase):
             self.node_monitoring_period, self.rabbitmq)
         self.test_cosmos_node_monitor = CosmosNodeMonitor(
             self.node_monitor_name, self.cosmos_node_config, self.dummy_logger,
-            self.node_monitoring_period, self.rabbitmq, self.data_sources)
+            self.node_monitoring_period, self.rabbitmq, self.data_sources,
+            redis=self.redis)
 
         # Chainlink Contracts Monitor
         self.cl_contracts_monitor_name = 'chainlink_contracts_monitor'
@@ -142,7 +147,7 @@ class TestMonitorStarters(unittest.TestCase):
             self.cl_contracts_monitor_name, self.weiwatchers_url,
             self.evm_nodes, self.node_configs, self.dummy_logger,
             self.chainlink_contracts_monitoring_period, self.rabbitmq,
-            self.cl_contracts_parent_id)
+            self.cl_contracts_parent_id, self.redis)
 
         # Cosmos Network Monitor
         self.cosmos_test_nodes = CosmosTestNodes()
@@ -271,13 +276,15 @@ class TestMonitorStarters(unittest.TestCase):
          ['self.data_sources'], 'self.test_cosmos_node_monitor',),
     ])
     @mock.patch('src.monitors.node.evm.Web3')
+    @mock.patch('src.monitors.starters._initialise_monitor_redis')
     @mock.patch('src.monitors.starters.RabbitMQApi')
     @mock.patch("src.monitors.starters._initialise_monitor_logger")
     def test_initialise_monitor_creates_monitor_correctly(
             self, monitor_type, monitor_display_name, monitoring_period, config,
-            other_args, monitor, mock_init_logger, mock_rabbit,
+            other_args, monitor, mock_init_logger, mock_rabbit, mock_init_redis,
             mock_web3) -> None:
         mock_init_logger.return_value = self.dummy_logger
+        mock_init_redis.return_value = self.redis
         mock_web3.return_value = self.test_evm_node_monitor.w3_interface
         mock_rabbit.return_value = self.rabbitmq
         mock_rabbit.__name__ = RabbitMQApi.__name__
@@ -390,7 +397,8 @@ class TestMonitorStarters(unittest.TestCase):
 
         start_system_monitor(self.system_config)
 
-        mock_start_monitor.assert_called_once_with(self.test_system_monitor)
+        mock_start_monitor.assert_called_once_with(
+            self.test_system_monitor, None)
         mock_initialise_monitor.assert_called_once_with(
             SystemMonitor,
             SYSTEM_MONITOR_NAME_TEMPLATE.format(
@@ -407,7 +415,8 @@ class TestMonitorStarters(unittest.TestCase):
 
         start_github_monitor(self.github_repo_config)
 
-        mock_start_monitor.assert_called_once_with(self.test_github_monitor)
+        mock_start_monitor.assert_called_once_with(
+            self.test_github_monitor, None)
         mock_initialise_monitor.assert_called_once_with(
             GitHubMonitor,
             GITHUB_MONITOR_NAME_TEMPLATE.format(
@@ -424,7 +433,8 @@ class TestMonitorStarters(unittest.TestCase):
 
         start_dockerhub_monitor(self.dockerhub_repo_config)
 
-        mock_start_monitor.assert_called_once_with(self.test_dockerhub_monitor)
+        mock_start_monitor.assert_called_once_with(
+            self.test_dockerhub_monitor, None)
         mock_initialise_monitor.assert_called_once_with(
             DockerHubMonitor,
             DOCKERHUB_MONITOR_NAME_TEMPLATE.format(
@@ -454,7 +464,7 @@ class TestMonitorStarters(unittest.TestCase):
 
         start_node_monitor(eval(node_config), monitor_type, *evaluated_args)
 
-        mock_start_monitor.assert_called_once_with(eval(monitor))
+        mock_start_monitor.assert_called_once_with(eval(monitor), None)
         mock_initialise_monitor.assert_called_once_with(
             monitor_type, NODE_MONITOR_NAME_TEMPLATE.format(
                 eval(node_config).node_name), env.NODE_MONITOR_PERIOD_SECONDS,
@@ -1,10 +1,12 @@
 import json
 import logging
+import queue
 import unittest
 from datetime import datetime
 from datetime import timedelta
 from http.client import IncompleteRead
 from unittest import mock
+from unittest.mock import call
 
 import pika
 import pika.exceptions
@@ -16,16 +18,22 @@ from urllib3.exceptions import ProtocolError
 
 from src.configs.system import SystemConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.monitor import Monitor
 from src.monitors.system import SystemMonitor
 from src.utils import env
+from src.utils.backpressure import PressureLevel
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
                                           SYSTEM_RAW_DATA_ROUTING_KEY, TOPIC)
+from src.utils.constants.starters import (
+    CONTROL_QUEUE_POLLING_PERIOD, MONITOR_DOWN_ROUNDS_BEFORE_BACKOFF,
+    MONITOR_PERIOD_BACKOFF_FACTOR)
 from src.utils.exceptions import (PANICException, SystemIsDownException,
                                   DataReadingException, InvalidUrlException,
                                   MetricNotFoundException,
                                   MessageWasNotDeliveredException)
+from src.utils.timing import FixedRateScheduler
 
 
 class TestSystemMonitor(unittest.TestCase):
@@ -197,6 +205,184 @@ class TestSystemMonitor(unittest.TestCase):
         self.assertEqual(self.metrics_to_monitor,
                          self.test_monitor.metrics_to_monitor)
 
+    def test_reconfigure_replaces_the_system_config(self) -> None:
+        new_system_config = SystemConfig(
+            self.system_id, 'new_parent_id', self.system_name,
+            self.monitor_system, 'new_url')
+
+        self.test_monitor.reconfigure(new_system_config)
+
+        self.assertEqual(new_system_config, self.test_monitor.system_config)
+
+    def test_apply_reconfigurations_does_nothing_if_no_control_queue(
+            self) -> None:
+        self.test_monitor._apply_reconfigurations()
+        self.assertEqual(self.system_config, self.test_monitor.system_config)
+
+    def test_apply_reconfigurations_applies_all_updates_in_order(
+            self) -> None:
+        control_queue = queue.Queue()
+        self.test_monitor.set_control_queue(control_queue)
+        first_config = SystemConfig(self.system_id, self.parent_id,
+                                    self.system_name, self.monitor_system,
+                                    'first_url')
+        second_config = SystemConfig(self.system_id, self.parent_id,
+                                     self.system_name, self.monitor_system,
+                                     'second_url')
+        control_queue.put({'config': first_config, 'args': ()})
+        control_queue.put({'config': second_config, 'args': ()})
+        self.test_monitor._apply_reconfigurations()
+
+        self.assertEqual(second_config.node_exporter_url,
+                         self.test_monitor.system_config.node_exporter_url)
+        self.assertTrue(control_queue.empty())
+
+    def test_apply_reconfigurations_keeps_the_config_if_it_cannot_be_applied(
+            self) -> None:
+        control_queue = queue.Queue()
+        self.test_monitor.set_control_queue(control_queue)
+        new_config = SystemConfig(self.system_id, self.parent_id,
+                                  self.system_name, self.monitor_system,
+                                  'new_url')
+        control_queue.put({'config': new_config, 'args': ()})
+        control_queue.put({'config': new_config, 'args': ()})
+
+        with mock.patch.object(
+                SystemMonitor, 'reconfigure',
+                side_effect=[Exception('invalid'), None]) as mock_reconfigure:
+            self.test_monitor._apply_reconfigurations()
+
+        self.assertEqual(2, mock_reconfigure.call_count)
+        self.assertEqual(self.system_config, self.test_monitor.system_config)
+        self.assertTrue(control_queue.empty())
+
+    def test_supports_reconfiguration_only_if_monitor_sets_it(self) -> None:
+        self.assertTrue(SystemMonitor.supports_reconfiguration)
+        self.assertFalse(Monitor.supports_reconfiguration)
+
+    @mock.patch.object(FixedRateScheduler, "time_until_next_round")
+    @mock.patch.object(RabbitMQApi, "connection")
+    def test_sleep_until_next_round_sleeps_until_round_is_due_if_no_queue(
+            self, mock_connection, mock_time_until_next_round) -> None:
+        mock_time_until_next_round.side_effect = [7.5, 0.0]
+
+        self.test_monitor._sleep_until_next_round()
+
+        mock_connection.sleep.assert_called_once_with(7.5)
+
+    @mock.patch.object(FixedRateScheduler, "time_until_next_round")
+    @mock.patch.object(RabbitMQApi, "connection")
+    def test_sleep_until_next_round_does_not_sleep_if_round_is_due(
+            self, mock_connection, mock_time_until_next_round) -> None:
+        mock_time_until_next_round.return_value = 0.0
+
+        self.test_monitor._sleep_until_next_round()
+
+        mock_connection.sleep.assert_not_called()
+
+    @mock.patch.object(FixedRateScheduler, "time_until_next_round")
+    @mock.patch.object(RabbitMQApi, "connection")
+    def test_sleep_until_next_round_applies_configurations_while_sleeping(
+            self, mock_connection, mock_time_until_next_round) -> None:
+        control_queue = queue.Queue()
+        self.test_monitor.set_control_queue(control_queue)
+        new_system_config = SystemConfig(
+            self.system_id, self.parent_id, self.system_name,
+            self.monitor_system, 'new_url')
+        mock_time_until_next_round.side_effect = [7.5, 6.5, 0.0]
+        mock_connection.sleep.side_effect = \
+            lambda _: control_queue.put({'config': new_system_config,
+                                         'args': ()})
+
+        self.test_monitor._sleep_until_next_round()
+
+        # The monitor must sleep in small steps, applying the modified
+        # configurations received while sleeping, until the next round is due
+        self.assertEqual(
+            [call(CONTROL_QUEUE_POLLING_PERIOD),
+             call(CONTROL_QUEUE_POLLING_PERIOD)],
+            mock_connection.sleep.call_args_list)
+        self.assertEqual(new_system_config, self.test_monitor.system_config)
+        self.assertTrue(control_queue.empty())
+
+    def test_scheduler_is_offset_deterministically_within_the_period(
+            self) -> None:
+        other_monitor = SystemMonitor(self.monitor_name, self.system_config,
+                                      self.dummy_logger,
+                                      self.monitoring_period, self.rabbitmq)
+        self.assertEqual(self.test_monitor.scheduler.offset,
+                         other_monitor.scheduler.offset)
+        self.assertEqual(self.monitoring_period,
+                         self.test_monitor.scheduler.period)
+        self.assertTrue(0 <= self.test_monitor.scheduler.offset <
+                        self.monitoring_period)
+
+    def test_process_data_counts_down_and_up_sources(self) -> None:
+        self.test_monitor._start_round()
+
+        self.test_monitor._process_data(
+            True, [SystemIsDownException(self.system_name)], [])
+        self.assertEqual(1, self.test_monitor._round_sources_down)
+        self.assertEqual(0, self.test_monitor._round_sources_up)
+
+        self.test_monitor._process_data(
+            True, [self.test_exception], [])
+        self.assertEqual(1, self.test_monitor._round_sources_down)
+        self.assertEqual(1, self.test_monitor._round_sources_up)
+
+    def test_finish_round_backs_off_period_if_system_stays_down(
+            self) -> None:
+        self.test_monitor.scheduler.start()
+        expected_period = self.monitoring_period
+        for round_no in range(MONITOR_DOWN_ROUNDS_BEFORE_BACKOFF + 2):
+            self.test_monitor._start_round()
+            self.test_monitor._process_data(
+                True, [SystemIsDownException(self.system_name)], [])
+            self.test_monitor._finish_round()
+            if round_no >= MONITOR_DOWN_ROUNDS_BEFORE_BACKOFF:
+                expected_period *= MONITOR_PERIOD_BACKOFF_FACTOR
+            self.assertEqual(expected_period,
+                             self.test_monitor.scheduler.period)
+
+        # Once the system is reachable again the base period is restored
+        self.test_monitor._start_round()
+        self.test_monitor._process_data(False, [],
+                                        [self.retrieved_metrics_example])
+        self.test_monitor._finish_round()
+        self.assertEqual(self.monitoring_period,
+                         self.test_monitor.scheduler.period)
+
+    def test_finish_round_uses_min_period_if_closer_watch_requested(
+            self) -> None:
+        self.test_monitor.scheduler.start()
+        self.test_monitor._start_round()
+        self.test_monitor._request_closer_watch()
+        self.test_monitor._finish_round()
+
+        self.assertEqual(env.MONITOR_MIN_PERIOD_SECONDS,
+                         self.test_monitor.scheduler.period)
+
+    def test_finish_round_stretches_period_under_backpressure(self) -> None:
+        control_queue = queue.Queue()
+        self.test_monitor.set_control_queue(control_queue)
+        self.test_monitor.scheduler.start()
+
+        for level in [PressureLevel.ELEVATED, PressureLevel.HIGH,
+                      PressureLevel.NORMAL]:
+            control_queue.put({'pressure_level': level})
+            self.test_monitor._apply_reconfigurations()
+            self.test_monitor._start_round()
+            self.test_monitor._finish_round()
+
+            self.assertEqual(level, self.test_monitor.pressure_level)
+            self.assertEqual(
+                self.monitoring_period *
+                env.BACKPRESSURE_PERIOD_FACTOR ** level.value,
+                self.test_monitor.scheduler.period)
+
+        # The configuration is left untouched
+        self.assertEqual(self.system_config, self.test_monitor.system_config)
+
     def test_initialise_rabbitmq_initialises_everything_as_expected(
             self) -> None:
         try:
@@ -1,7 +1,7 @@
 import copy
 import json
 from time import sleep
-from typing import Union
+from typing import Union, Dict
 from unittest.mock import Mock
 
 import pika.exceptions
@@ -10,6 +10,7 @@ from src.alerter.alert_code import AlertCode
 from src.data_store.redis import RedisApi, Keys
 from src.data_store.stores.monitorable import MonitorableStore
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.envelope import PublishingEnvelope
 from src.monitorables.contracts.chainlink.v3 import V3ChainlinkContract
 from src.monitorables.contracts.chainlink.v4 import V4ChainlinkContract
 from src.monitorables.networks.cosmos import CosmosNetwork
@@ -21,6 +22,7 @@ from src.monitorables.nodes.substrate_node import SubstrateNode
 from src.monitorables.repo import (GitHubRepo, DockerHubRepo)
 from src.monitorables.system import System
 from src.utils.constants.monitorables import EMPTY_MONITORABLE_DATA
+from src.utils.cosmos import pack_missed_blocks, pack_slashed
 
 
 def infinite_fn() -> None:
@@ -81,6 +83,16 @@ class DummyAlertCode(AlertCode):
     TEST_ALERT_CODE = 'test_alert_code'
 
 
+def envelope_to_dict(envelope: PublishingEnvelope) -> Dict:
+    return {
+        'exchange': envelope.exchange,
+        'routing_key': envelope.routing_key,
+        'data': envelope.data,
+        'properties': envelope.properties,
+        'mandatory': envelope.mandatory
+    }
+
+
 def delete_queue_if_exists(rabbit: RabbitMQApi, queue_name: str) -> None:
     try:
         rabbit.queue_declare(queue_name, passive=True)
@@ -290,9 +302,9 @@ def save_cosmos_node_to_redis(redis: RedisApi,
             cosmos_node.bond_status,
         Keys.get_cosmos_node_jailed(cosmos_node_id): str(cosmos_node.jailed),
         Keys.get_cosmos_node_slashed(cosmos_node_id):
-            json.dumps(cosmos_node.slashed),
+            pack_slashed(cosmos_node.slashed),
         Keys.get_cosmos_node_missed_blocks(cosmos_node_id):
-            json.dumps(cosmos_node.missed_blocks),
+            pack_missed_blocks(cosmos_node.missed_blocks),
         Keys.get_cosmos_node_last_monitored_prometheus(cosmos_node_id):
             str(cosmos_node.last_monitored_prometheus),
         Keys.get_cosmos_node_last_monitored_cometbft_rpc(cosmos_node_id):
@@ -0,0 +1,43 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.utils.backpressure import (BackpressureGauge, PressureLevel,
+                                    get_period_multiplier)
+
+
+class TestBackpressureGauge(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_gauge = BackpressureGauge(100, 1000, 0.5)
+
+    def test_update_keeps_the_level_if_the_depth_is_unknown(self) -> None:
+        self.test_gauge.update(5000)
+        self.assertEqual(PressureLevel.HIGH, self.test_gauge.update(None))
+
+    @parameterized.expand([
+        ([0], PressureLevel.NORMAL,),
+        ([99], PressureLevel.NORMAL,),
+        ([100], PressureLevel.ELEVATED,),
+        ([1000], PressureLevel.HIGH,),
+        ([100, 60], PressureLevel.ELEVATED,),
+        ([100, 49], PressureLevel.NORMAL,),
+        ([1000, 600], PressureLevel.HIGH,),
+        ([1000, 400], PressureLevel.ELEVATED,),
+        ([1000, 10], PressureLevel.NORMAL,),
+        ([1000, 400, 999], PressureLevel.ELEVATED,),
+    ])
+    def test_update_raises_and_releases_levels_with_hysteresis(
+            self, queue_depths, expected_level) -> None:
+        for queue_depth in queue_depths:
+            self.test_gauge.update(queue_depth)
+
+        self.assertEqual(expected_level, self.test_gauge.level)
+
+    @parameterized.expand([
+        (PressureLevel.NORMAL, 1,),
+        (PressureLevel.ELEVATED, 2,),
+        (PressureLevel.HIGH, 4,),
+    ])
+    def test_get_period_multiplier_returns_factor_per_level(
+            self, level, expected_multiplier) -> None:
+        self.assertEqual(expected_multiplier, get_period_multiplier(level, 2))
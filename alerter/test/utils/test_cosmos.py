@@ -0,0 +1,46 @@
+import json
+import unittest
+
+from src.utils.cosmos import (pack_missed_blocks, pack_slashed,
+                              unpack_missed_blocks, unpack_slashed)
+
+
+class TestCosmosPacking(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_slashed = {
+            'slashed': True,
+            'amount_map': {'4500': 50.4, '4499': 23.4, '4498': None},
+        }
+        self.test_missed_blocks = {
+            'total_count': 10,
+            'missed_heights': [4498, 4497],
+        }
+
+    def test_unpack_slashed_restores_packed_slashed(self) -> None:
+        packed = pack_slashed(self.test_slashed)
+
+        self.assertEqual(self.test_slashed, unpack_slashed(packed))
+        self.assertEqual({'slashed': False, 'amount_map': {}}, unpack_slashed(
+            pack_slashed({'slashed': False, 'amount_map': {}})))
+
+    def test_unpack_missed_blocks_restores_packed_missed_blocks(
+            self) -> None:
+        packed = pack_missed_blocks(self.test_missed_blocks)
+
+        self.assertEqual(self.test_missed_blocks, unpack_missed_blocks(packed))
+        self.assertEqual({'total_count': 0, 'missed_heights': []},
+                         unpack_missed_blocks(pack_missed_blocks(
+                             {'total_count': 0, 'missed_heights': []})))
+
+    def test_packed_metrics_are_smaller_than_json(self) -> None:
+        missed_blocks = {'total_count': 1000,
+                         'missed_heights': list(range(10000000, 10001000))}
+
+        self.assertLess(len(pack_missed_blocks(missed_blocks)),
+                        len(json.dumps(missed_blocks)))
+
+    def test_unpack_loads_metrics_saved_as_json(self) -> None:
+        self.assertEqual(self.test_slashed, unpack_slashed(
+            json.dumps(self.test_slashed).encode('utf-8')))
+        self.assertEqual(self.test_missed_blocks, unpack_missed_blocks(
+            json.dumps(self.test_missed_blocks).encode('utf-8')))
@@ -0,0 +1,56 @@
+import unittest
+
+from src.utils.deltas import (DELTA_KEY, LatestMetrics, as_delta,
+                              changed_metrics, is_delta)
+
+
+class TestDeltas(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_data = {
+            'result': {
+                'meta_data': {'system_id': 'system_id_1',
+                              'last_monitored': 1.0},
+                'data': {'system_cpu_usage': 7.85, 'system_ram_usage': 34.09,
+                         'went_down_at': None},
+            }
+        }
+
+    def test_changed_metrics_returns_metrics_which_differ_from_previous(
+            self) -> None:
+        metrics_for_alerting = {
+            'system_cpu_usage': {'current': 7.85, 'previous': 7.0},
+            'system_ram_usage': {'current': 34.09, 'previous': 34.09},
+            'went_down_at': {'current': None, 'previous': None},
+            'process_memory_usage': {'current': 56},
+        }
+
+        self.assertEqual({'system_cpu_usage', 'process_memory_usage'},
+                         changed_metrics(metrics_for_alerting))
+
+    def test_as_delta_keeps_only_the_given_metrics_and_marks_the_delta(
+            self) -> None:
+        delta = as_delta(self.test_data, {'system_cpu_usage'})
+
+        self.assertEqual({
+            'result': {
+                'meta_data': {'system_id': 'system_id_1',
+                              'last_monitored': 1.0, DELTA_KEY: True},
+                'data': {'system_cpu_usage': 7.85},
+            }
+        }, delta)
+        self.assertTrue(is_delta(delta['result']['meta_data']))
+        self.assertFalse(is_delta(self.test_data['result']['meta_data']))
+
+    def test_latest_metrics_merges_deltas_into_the_latest_full_snapshot(
+            self) -> None:
+        latest_metrics = LatestMetrics()
+        full_metrics = self.test_data['result']['data']
+
+        self.assertIsNone(latest_metrics.merge(
+            'system_id_1', {'system_cpu_usage': 9.0}, True))
+        self.assertEqual(full_metrics, latest_metrics.merge(
+            'system_id_1', full_metrics, False))
+        self.assertEqual({**full_metrics, 'system_cpu_usage': 9.0},
+                         latest_metrics.merge(
+                             'system_id_1', {'system_cpu_usage': 9.0}, True))
+        self.assertEqual(7.85, full_metrics['system_cpu_usage'])
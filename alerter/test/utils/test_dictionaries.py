@@ -0,0 +1,47 @@
+import unittest
+
+from src.utils.dictionaries import dict_copy_paths
+
+
+class TestDictCopyPaths(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_data = {
+            'result': {
+                'meta_data': {'monitor_name': 'test_monitor', 'time': 1.0},
+                'data': {'historical': [{'height': 1}], 'went_down_at': None},
+            }
+        }
+
+    def test_dict_copy_paths_copies_only_the_dicts_along_the_paths(
+            self) -> None:
+        copied = dict_copy_paths(self.test_data, ('result', 'meta_data'))
+
+        self.assertEqual(self.test_data, copied)
+        self.assertIsNot(self.test_data, copied)
+        self.assertIsNot(self.test_data['result'], copied['result'])
+        self.assertIsNot(self.test_data['result']['meta_data'],
+                         copied['result']['meta_data'])
+        self.assertIs(self.test_data['result']['data'],
+                      copied['result']['data'])
+
+    def test_dict_copy_paths_leaves_the_given_dict_unmodified(self) -> None:
+        copied = dict_copy_paths(self.test_data, ('result', 'meta_data'),
+                                 ('result', 'data'))
+        del copied['result']['meta_data']['monitor_name']
+        copied['result']['data']['went_down_at'] = 2.0
+
+        self.assertEqual('test_monitor',
+                         self.test_data['result']['meta_data']['monitor_name'])
+        self.assertIsNone(self.test_data['result']['data']['went_down_at'])
+        self.assertIs(self.test_data['result']['data']['historical'],
+                      copied['result']['data']['historical'])
+
+    def test_dict_copy_paths_stops_at_values_which_are_not_dicts(
+            self) -> None:
+        copied = dict_copy_paths(self.test_data,
+                                 ('result', 'data', 'historical', 0),
+                                 ('error', 'meta_data'))
+
+        self.assertEqual(self.test_data, copied)
+        self.assertIs(self.test_data['result']['data']['historical'],
+                      copied['result']['data']['historical'])
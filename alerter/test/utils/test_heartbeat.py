@@ -0,0 +1,52 @@
+import unittest
+from datetime import datetime, timedelta
+
+from freezegun import freeze_time
+
+from src.utils.heartbeat import HeartbeatAggregator
+
+
+class TestHeartbeatAggregator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_component_name = 'test_component'
+        self.test_aggregator = HeartbeatAggregator(timedelta(seconds=10))
+
+    def tearDown(self) -> None:
+        self.test_aggregator = None
+
+    def test_record_message_counts_processed_and_errored_messages(
+            self) -> None:
+        self.test_aggregator.record_message(False)
+        self.test_aggregator.record_message(True)
+        self.test_aggregator.record_message(False)
+
+        self.assertEqual(2, self.test_aggregator.processed_messages)
+        self.assertEqual(1, self.test_aggregator.errored_messages)
+
+    @freeze_time("2012-01-01")
+    def test_create_heartbeat_carries_the_message_counts(self) -> None:
+        self.test_aggregator.record_message(False)
+        self.test_aggregator.record_message(True)
+
+        self.assertEqual({
+            'component_name': self.test_component_name,
+            'is_alive': True,
+            'timestamp': datetime(2012, 1, 1).timestamp(),
+            'processed_messages': 1,
+            'errored_messages': 1,
+        }, self.test_aggregator.create_heartbeat(self.test_component_name))
+
+    def test_heartbeat_is_due_once_per_interval(self) -> None:
+        with freeze_time("2012-01-01 00:00:00") as frozen_time:
+            self.assertTrue(self.test_aggregator.heartbeat_due())
+            self.test_aggregator.record_message(False)
+            self.test_aggregator.heartbeat_sent()
+
+            self.assertFalse(self.test_aggregator.heartbeat_due())
+            self.assertEqual(0, self.test_aggregator.processed_messages)
+            self.assertEqual(0, self.test_aggregator.errored_messages)
+
+            frozen_time.tick(timedelta(seconds=9))
+            self.assertFalse(self.test_aggregator.heartbeat_due())
+            frozen_time.tick(timedelta(seconds=1))
+            self.assertTrue(self.test_aggregator.heartbeat_due())
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from freezegun import freeze_time
+
+from src.utils.snapshot import StateSnapshotter, create_state_snapshotter
+
+
+class TestStateSnapshotter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_directory = tempfile.mkdtemp()
+        self.test_path = os.path.join(self.test_directory, 'states',
+                                      'test_component.snapshot')
+        self.test_state = {'parent_id': {'monitorable_id': [1, 2.5, None]}}
+        self.test_snapshotter = StateSnapshotter(self.test_path,
+                                                 timedelta(seconds=60))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_directory)
+
+    def test_load_returns_none_if_no_snapshot_was_saved(self) -> None:
+        self.assertIsNone(self.test_snapshotter.load(timedelta(hours=1)))
+
+    @freeze_time("2012-01-01")
+    def test_load_returns_the_saved_state_and_its_timestamp(self) -> None:
+        self.test_snapshotter.save(self.test_state)
+
+        self.assertEqual(
+            (datetime(2012, 1, 1).timestamp(), self.test_state),
+            self.test_snapshotter.load(timedelta(hours=1)))
+
+    def test_save_replaces_the_previous_snapshot_atomically(self) -> None:
+        self.test_snapshotter.save(self.test_state)
+        self.test_snapshotter.save({'new_state': True})
+
+        _, state = self.test_snapshotter.load(timedelta(hours=1))
+        self.assertEqual({'new_state': True}, state)
+        self.assertEqual(['test_component.snapshot'],
+                         os.listdir(os.path.dirname(self.test_path)))
+
+    def test_save_keeps_the_previous_snapshot_if_state_not_picklable(
+            self) -> None:
+        self.test_snapshotter.save(self.test_state)
+
+        self.assertRaises(Exception, self.test_snapshotter.save,
+                          {'lambda': lambda: None})
+
+        _, state = self.test_snapshotter.load(timedelta(hours=1))
+        self.assertEqual(self.test_state, state)
+        self.assertEqual(['test_component.snapshot'],
+                         os.listdir(os.path.dirname(self.test_path)))
+
+    def test_load_returns_none_if_snapshot_older_than_max_age(self) -> None:
+        with freeze_time("2012-01-01 00:00:00") as frozen_time:
+            self.test_snapshotter.save(self.test_state)
+            frozen_time.tick(timedelta(hours=2))
+
+            self.assertIsNone(self.test_snapshotter.load(timedelta(hours=1)))
+
+    def test_snapshot_is_due_once_per_interval(self) -> None:
+        with freeze_time("2012-01-01 00:00:00") as frozen_time:
+            self.assertTrue(self.test_snapshotter.snapshot_due())
+            self.test_snapshotter.save(self.test_state)
+            self.assertFalse(self.test_snapshotter.snapshot_due())
+
+            frozen_time.tick(timedelta(seconds=59))
+            self.assertFalse(self.test_snapshotter.snapshot_due())
+            frozen_time.tick(timedelta(seconds=1))
+            self.assertTrue(self.test_snapshotter.snapshot_due())
+
+    def test_create_state_snapshotter_only_if_configured(self) -> None:
+        with mock.patch('src.utils.snapshot.env') as mock_env:
+            mock_env.STATE_SNAPSHOT_DIRECTORY = ''
+            self.assertIsNone(create_state_snapshotter('test_component'))
+
+            mock_env.STATE_SNAPSHOT_DIRECTORY = self.test_directory
+            mock_env.STATE_SNAPSHOT_INTERVAL_SECONDS = 60
+            snapshotter = create_state_snapshotter('System alerter (chain 1)')
+            self.assertEqual(
+                os.path.join(self.test_directory,
+                             'System_alerter_chain_1_.snapshot'),
+                snapshotter.path)
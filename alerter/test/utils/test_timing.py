@@ -0,0 +1,268 @@
+import math
+import pickle
+import unittest
+from datetime import datetime, timedelta
+
+from parameterized import parameterized
+
+from src.utils.timing import (FixedRateScheduler, AdaptivePollingPolicy,
+                              OccurrencesInTimePeriodTracker, StageTimings)
+
+
+class TestFixedRateScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_name = 'test_monitor'
+        self.test_period = 10.0
+        self.test_scheduler = FixedRateScheduler(self.test_name,
+                                                 self.test_period)
+
+    def tearDown(self) -> None:
+        self.test_scheduler = None
+
+    def test_offset_is_deterministic_and_within_the_period(self) -> None:
+        other_scheduler = FixedRateScheduler(self.test_name, self.test_period)
+        self.assertEqual(self.test_scheduler.offset, other_scheduler.offset)
+        self.assertTrue(0 <= self.test_scheduler.offset < self.test_period)
+
+    def test_offsets_of_different_names_are_spread_across_the_period(
+            self) -> None:
+        offsets = [
+            FixedRateScheduler.compute_offset('monitor_{}'.format(i),
+                                              self.test_period)
+            for i in range(100)
+        ]
+        self.assertTrue(all(0 <= offset < self.test_period
+                            for offset in offsets))
+        self.assertTrue(min(offsets) < self.test_period / 4)
+        self.assertTrue(max(offsets) > 3 * self.test_period / 4)
+
+    @parameterized.expand([
+        (5.0, 5.0,),
+        (60.0, 10.0,),
+        (0.0, 0.0,),
+    ])
+    def test_offset_is_bounded_by_max_offset(self, max_offset,
+                                             expected_bound) -> None:
+        offset = FixedRateScheduler.compute_offset(
+            self.test_name, self.test_period, max_offset)
+        self.assertTrue(0 <= offset <= expected_bound)
+
+    def test_time_until_next_round_is_zero_if_not_started(self) -> None:
+        self.assertEqual(0.0, self.test_scheduler.time_until_next_round(100.0))
+
+    def test_start_schedules_first_round_after_the_offset(self) -> None:
+        self.test_scheduler.start(100.0)
+        self.assertEqual(100.0 + self.test_scheduler.offset,
+                         self.test_scheduler.next_round_time)
+        self.assertAlmostEqual(
+            self.test_scheduler.offset,
+            self.test_scheduler.time_until_next_round(100.0))
+
+    def test_rounds_are_run_at_a_fixed_rate_regardless_of_duration(
+            self) -> None:
+        self.test_scheduler.start(100.0)
+        first_round_time = self.test_scheduler.next_round_time
+
+        # A round taking 3 seconds must not delay the next round
+        self.test_scheduler.round_started(first_round_time)
+        self.test_scheduler.round_finished(first_round_time + 3.0)
+
+        self.assertEqual(first_round_time + self.test_period,
+                         self.test_scheduler.next_round_time)
+        self.assertAlmostEqual(7.0, self.test_scheduler.time_until_next_round(
+            first_round_time + 3.0))
+        self.assertAlmostEqual(3.0, self.test_scheduler.last_round_duration)
+        self.assertEqual(1, self.test_scheduler.rounds)
+        self.assertEqual(0, self.test_scheduler.overruns)
+
+    def test_lateness_is_recorded_when_round_starts_late(self) -> None:
+        self.test_scheduler.start(100.0)
+        first_round_time = self.test_scheduler.next_round_time
+
+        self.test_scheduler.round_started(first_round_time + 0.5)
+        self.test_scheduler.round_finished(first_round_time + 1.0)
+        self.test_scheduler.round_started(
+            first_round_time + self.test_period + 0.2)
+
+        self.assertAlmostEqual(0.2, self.test_scheduler.last_lateness)
+        self.assertAlmostEqual(0.5, self.test_scheduler.max_lateness)
+
+    @parameterized.expand([
+        (12.0, 1, 2,),
+        (25.0, 2, 3,),
+        (10.0, 1, 2,),
+    ])
+    def test_overrun_rounds_are_skipped_not_stacked(
+            self, round_duration, expected_skipped,
+            expected_periods_to_next_round) -> None:
+        self.test_scheduler.start(100.0)
+        first_round_time = self.test_scheduler.next_round_time
+
+        self.test_scheduler.round_started(first_round_time)
+        self.test_scheduler.round_finished(first_round_time + round_duration)
+
+        self.assertEqual(1, self.test_scheduler.overruns)
+        self.assertEqual(expected_skipped, self.test_scheduler.skipped_rounds)
+        self.assertEqual(
+            first_round_time + expected_periods_to_next_round *
+            self.test_period, self.test_scheduler.next_round_time)
+
+    def test_set_period_takes_effect_from_the_next_scheduled_round(
+            self) -> None:
+        self.test_scheduler.start(100.0)
+        first_round_time = self.test_scheduler.next_round_time
+
+        self.test_scheduler.set_period(30.0)
+        self.test_scheduler.round_started(first_round_time)
+        self.test_scheduler.round_finished(first_round_time + 1.0)
+
+        self.assertEqual(first_round_time + 30.0,
+                         self.test_scheduler.next_round_time)
+
+    def test_metrics_returns_the_scheduling_metrics(self) -> None:
+        self.test_scheduler.start(100.0)
+        first_round_time = self.test_scheduler.next_round_time
+        self.test_scheduler.round_started(first_round_time + 1.0)
+        self.test_scheduler.round_finished(first_round_time + 12.0)
+
+        expected_metrics = {
+            'period': self.test_period,
+            'offset': self.test_scheduler.offset,
+            'rounds': 1,
+            'skipped_rounds': 1,
+            'overruns': 1,
+            'last_lateness': 1.0,
+            'max_lateness': 1.0,
+            'last_round_duration': 11.0,
+        }
+        self.assertEqual(expected_metrics, self.test_scheduler.metrics)
+
+
+class TestAdaptivePollingPolicy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_base_period = 10.0
+        self.test_min_period = 5.0
+        self.test_max_period = 60.0
+        self.test_policy = AdaptivePollingPolicy(
+            self.test_base_period, self.test_min_period, self.test_max_period,
+            2.0, 2)
+
+    def tearDown(self) -> None:
+        self.test_policy = None
+
+    @parameterized.expand([
+        (10.0, 20.0, 30.0, 10.0, 30.0,),
+        (10.0, 5.0, 5.0, 5.0, 10.0,),
+    ])
+    def test_init_keeps_the_base_period_within_the_bounds(
+            self, base_period, min_period, max_period, expected_min,
+            expected_max) -> None:
+        policy = AdaptivePollingPolicy(base_period, min_period, max_period)
+        self.assertEqual(expected_min, policy.min_period)
+        self.assertEqual(expected_max, policy.max_period)
+        self.assertEqual(base_period, policy.period)
+
+    def test_next_period_is_the_base_period_if_source_is_up(self) -> None:
+        self.assertEqual(self.test_base_period,
+                         self.test_policy.next_period(False, False))
+
+    def test_next_period_is_the_min_period_if_closer_watch_requested(
+            self) -> None:
+        self.assertEqual(self.test_min_period,
+                         self.test_policy.next_period(False, True))
+        self.assertEqual(self.test_base_period,
+                         self.test_policy.next_period(False, False))
+
+    def test_next_period_backs_off_up_to_max_period_if_source_stays_down(
+            self) -> None:
+        periods = [self.test_policy.next_period(True, False)
+                   for _ in range(6)]
+        self.assertEqual([10.0, 10.0, 20.0, 40.0, 60.0, 60.0], periods)
+        self.assertEqual(6, self.test_policy.consecutive_down_rounds)
+
+    def test_next_period_resets_to_base_period_when_source_recovers(
+            self) -> None:
+        for _ in range(4):
+            self.test_policy.next_period(True, False)
+
+        self.assertEqual(self.test_base_period,
+                         self.test_policy.next_period(False, False))
+        self.assertEqual(0, self.test_policy.consecutive_down_rounds)
+        self.assertEqual(self.test_base_period,
+                         self.test_policy.next_period(True, False))
+
+
+class TestOccurrencesInTimePeriodTracker(unittest.TestCase):
+    def test_tracker_can_be_pickled_with_its_occurrences(self) -> None:
+        test_tracker = OccurrencesInTimePeriodTracker(timedelta(seconds=60))
+        test_tracker.add_occurrence(datetime(2012, 1, 1, 0, 0, 0))
+        test_tracker.add_occurrence(datetime(2012, 1, 1, 0, 0, 30))
+
+        unpickled_tracker = pickle.loads(pickle.dumps(test_tracker))
+
+        self.assertEqual(test_tracker, unpickled_tracker)
+        self.assertEqual(2, unpickled_tracker.no_of_occurrences())
+        unpickled_tracker.remove_old_occurrences(
+            datetime(2012, 1, 1, 0, 1, 15))
+        self.assertEqual(1, unpickled_tracker.no_of_occurrences())
+
+
+class TestStageTimings(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_timings = StageTimings(sample_every=3)
+
+    def test_one_in_every_sample_every_messages_is_sampled(self) -> None:
+        sampled = [self.test_timings.message_received() for _ in range(7)]
+
+        self.assertEqual([False, False, True, False, False, True, False],
+                         sampled)
+        self.assertEqual(7, self.test_timings.messages)
+        self.assertEqual(2, self.test_timings.sampled_messages)
+
+    def test_timed_function_is_only_timed_for_sampled_messages(self) -> None:
+        timed_function = self.test_timings.timed('stage', lambda x: x * 2)
+
+        for message in range(6):
+            self.test_timings.message_received()
+            self.assertEqual(message * 2, timed_function(message))
+
+        self.assertEqual(2, self.test_timings.summary()['stage']['count'])
+
+    def test_timed_function_is_timed_even_if_it_raises(self) -> None:
+        def failing_function() -> None:
+            raise ValueError()
+
+        timed_function = self.test_timings.timed('stage', failing_function)
+        for _ in range(3):
+            self.test_timings.message_received()
+
+        self.assertRaises(ValueError, timed_function)
+        self.assertEqual(1, self.test_timings.summary()['stage']['count'])
+
+    def test_summary_gives_the_percentile_bucket_bounds(self) -> None:
+        for _ in range(98):
+            self.test_timings.record('stage', 1.5e-6)
+        self.test_timings.record('stage', 3e-6)
+        self.test_timings.record('stage', 10.0)
+
+        summary = self.test_timings.summary()['stage']
+
+        self.assertEqual(100, summary['count'])
+        self.assertAlmostEqual(98 * 1.5e-6 + 3e-6 + 10.0, summary['total'])
+        self.assertAlmostEqual(summary['total'] / 100, summary['mean'])
+        self.assertAlmostEqual(2e-6, summary['p50'])
+        self.assertAlmostEqual(4e-6, summary['p99'])
+
+        self.test_timings.record('stage', 10.0)
+        self.assertEqual(math.inf, self.test_timings.summary()['stage']['p99'])
+
+    def test_reset_clears_the_messages_and_stages(self) -> None:
+        for _ in range(3):
+            self.test_timings.message_received()
+        self.test_timings.record('stage', 1e-3)
+
+        self.test_timings.reset()
+
+        self.assertEqual(0, self.test_timings.messages)
+        self.assertEqual(0, self.test_timings.sampled_messages)
+        self.assertEqual({}, self.test_timings.summary())